@@ -15,6 +15,7 @@ from fastapi.responses import StreamingResponse
 
 from gcp_adapter.auth import authorize_request
 from gcp_adapter.stores import abac_allowed, get_control_plane_stores, is_action_allowed
+from retikon_core.audit.layout import audit_root_uri, list_audit_files
 from retikon_core.auth import AuthContext
 from retikon_core.auth.rbac import (
     ACTION_ACCESS_EXPORT,
@@ -25,7 +26,7 @@ from retikon_core.logging import configure_logging, get_logger
 from retikon_core.privacy import (
     PrivacyContext,
     PrivacyPolicy,
-    redact_text_for_context,
+    PrivacyRedactor,
 )
 from retikon_core.query_engine.warm_start import get_secure_connection
 from retikon_core.services.fastapi_scaffolding import (
@@ -163,6 +164,30 @@ def _resolve_parquet_files(
     glob_start = time.monotonic()
     matches = sorted(fs.glob(path))
     glob_ms = int((time.monotonic() - glob_start) * 1000)
+    return _localize_parquet_files(fs, matches, glob_ms=glob_ms)
+
+
+def _resolve_audit_files(
+    base_uri: str,
+    *,
+    org_id: str | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> tuple[list[str], tempfile.TemporaryDirectory | None]:
+    glob_start = time.monotonic()
+    files = list_audit_files(base_uri, org_id=org_id, since=since, until=until)
+    glob_ms = int((time.monotonic() - glob_start) * 1000)
+    fs, _ = fsspec.core.url_to_fs(audit_root_uri(base_uri))
+    matches = [fsspec.core.url_to_fs(item.uri)[1] for item in files]
+    return _localize_parquet_files(fs, matches, glob_ms=glob_ms)
+
+
+def _localize_parquet_files(
+    fs: fsspec.AbstractFileSystem,
+    matches: list[str],
+    *,
+    glob_ms: int,
+) -> tuple[list[str], tempfile.TemporaryDirectory | None]:
     original_count = len(matches)
     limit = _parquet_limit()
     if limit is not None:
@@ -202,6 +227,13 @@ def _resolve_parquet_files(
     return local_paths, tmpdir
 
 
+# Partition directories are pruned before the scan; keep date=/tenant= out of
+# the row shape. Time filters still skip row groups via created_at stats.
+_READ_PARQUET_SQL = (
+    "SELECT * FROM read_parquet(?, union_by_name=true, hive_partitioning=false)"
+)
+
+
 def _parse_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -230,19 +262,15 @@ def _serialize_value(value: object) -> object:
 def _redact_record(
     record: dict[str, object],
     *,
-    policies: list[PrivacyPolicy] | None,
+    redactor: PrivacyRedactor | None,
     context: PrivacyContext | None,
 ) -> dict[str, object]:
-    if not policies or context is None:
+    if redactor is None or context is None:
         return record
     updated: dict[str, object] = {}
     for key, value in record.items():
         if isinstance(value, str):
-            updated[key] = redact_text_for_context(
-                value,
-                policies=policies,
-                context=context,
-            )
+            updated[key] = redactor.redact(value, context)
         else:
             updated[key] = value
     return updated
@@ -290,17 +318,17 @@ def _build_filters(
 
 def _query_rows(
     *,
-    uri_pattern: str,
+    files: tuple[list[str], tempfile.TemporaryDirectory | None],
     where_clauses: list[str],
     values: list[object],
     limit: int | None,
 ) -> list[dict[str, object]]:
-    local_paths, tmpdir = _resolve_parquet_files(uri_pattern)
+    local_paths, tmpdir = files
     if not local_paths:
         return []
     conn = _open_local_conn()
     try:
-        query = "SELECT * FROM read_parquet(?, union_by_name=true)"
+        query = _READ_PARQUET_SQL
         params: list[object] = [local_paths]
         if where_clauses:
             query += " WHERE " + " AND ".join(where_clauses)
@@ -337,18 +365,18 @@ def _query_rows(
 
 def _stream_query(
     *,
-    uri_pattern: str,
+    files: tuple[list[str], tempfile.TemporaryDirectory | None],
     where_clauses: list[str],
     values: list[object],
     format: str,
     policies: list[PrivacyPolicy] | None = None,
     privacy_context: PrivacyContext | None = None,
 ) -> Iterator[str]:
-    local_paths, tmpdir = _resolve_parquet_files(uri_pattern)
+    local_paths, tmpdir = files
     if not local_paths:
         return iter(())
     conn = _open_local_conn()
-    query = "SELECT * FROM read_parquet(?, union_by_name=true)"
+    query = _READ_PARQUET_SQL
     params: list[object] = [local_paths]
     if where_clauses:
         query += " WHERE " + " AND ".join(where_clauses)
@@ -363,6 +391,7 @@ def _stream_query(
     )
     description = cursor.description or []
     columns = [col[0] for col in description]
+    redactor = PrivacyRedactor(policies) if policies else None
 
     def _write_csv_row(row: Iterable[object]) -> str:
         output = io.StringIO()
@@ -385,7 +414,7 @@ def _stream_query(
                         }
                         redacted = _redact_record(
                             record,
-                            policies=policies,
+                            redactor=redactor,
                             context=privacy_context,
                         )
                         yield _write_csv_row([redacted[col] for col in columns])
@@ -401,7 +430,7 @@ def _stream_query(
                         }
                         redacted = _redact_record(
                             record,
-                            policies=policies,
+                            redactor=redactor,
                             context=privacy_context,
                         )
                         yield json.dumps(redacted) + "\n"
@@ -413,10 +442,6 @@ def _stream_query(
     return _iter_rows()
 
 
-def _audit_pattern(base_uri: str) -> str:
-    return join_uri(base_uri, "vertices", "AuditLog", "core", "*.parquet")
-
-
 def _usage_pattern(base_uri: str) -> str:
     return join_uri(base_uri, "vertices", "UsageEvent", "core", "*.parquet")
 
@@ -464,6 +489,8 @@ async def audit_logs(
     _enforce_access(ACTION_AUDIT_LOGS_READ, auth_context)
     base_uri = _graph_uri()
     limit = max(1, min(limit, 1000))
+    since_ts = _parse_timestamp(since)
+    until_ts = _parse_timestamp(until)
     where, values = _build_filters(
         org_id=org_id,
         site_id=site_id,
@@ -471,11 +498,13 @@ async def audit_logs(
         api_key_id=api_key_id,
         action=action,
         decision=decision,
-        since=_parse_timestamp(since),
-        until=_parse_timestamp(until),
+        since=since_ts,
+        until=until_ts,
     )
     rows = _query_rows(
-        uri_pattern=_audit_pattern(base_uri),
+        files=_resolve_audit_files(
+            base_uri, org_id=org_id, since=since_ts, until=until_ts
+        ),
         where_clauses=where,
         values=values,
         limit=limit,
@@ -517,7 +546,9 @@ async def audit_export(
     if fmt not in {"jsonl", "csv"}:
         raise HTTPException(status_code=400, detail="format must be jsonl or csv")
     generator = _stream_query(
-        uri_pattern=_audit_pattern(base_uri),
+        files=_resolve_audit_files(
+            base_uri, org_id=org_id, since=since_ts, until=until_ts
+        ),
         where_clauses=where,
         values=values,
         format=fmt,
@@ -564,7 +595,7 @@ async def access_export(
     if fmt not in {"jsonl", "csv"}:
         raise HTTPException(status_code=400, detail="format must be jsonl or csv")
     generator = _stream_query(
-        uri_pattern=_usage_pattern(base_uri),
+        files=_resolve_parquet_files(_usage_pattern(base_uri)),
         where_clauses=where,
         values=values,
         format=fmt,
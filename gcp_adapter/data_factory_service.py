@@ -1,8 +1,11 @@
+import asyncio
 import base64
 import json
 import os
 import time
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request
@@ -16,9 +19,11 @@ from gcp_adapter.office_conversion import (
     create_job_record,
     decode_payload,
     enqueue_conversion,
+    get_conversion_pool,
     load_conversion_record,
     publish_conversion_dlq,
     save_conversion_record,
+    shutdown_conversion_pool,
     update_job_record,
     validate_payload_size,
     write_conversion_output,
@@ -71,7 +76,24 @@ configure_logging(
 )
 logger = get_logger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if conversion_backend() == "libreoffice":
+        try:
+            await asyncio.to_thread(get_conversion_pool().warm)
+        except RecoverableError as exc:
+            logger.warning(
+                "Office conversion pool warm-up failed",
+                extra={"error_message": str(exc)},
+            )
+    try:
+        yield
+    finally:
+        shutdown_conversion_pool()
+
+
+app = FastAPI(lifespan=lifespan)
 apply_cors_middleware(app)
 
 
@@ -883,7 +905,8 @@ async def convert_office(
     try:
         content = decode_payload(payload.content_base64)
         validate_payload_size(content)
-        output_bytes = convert_office_bytes(
+        output_bytes = await asyncio.to_thread(
+            convert_office_bytes,
             filename=payload.filename,
             content=content,
             backend=conversion_backend(),
@@ -968,7 +991,8 @@ async def office_conversion_worker(request: Request) -> dict[str, str]:
     try:
         content = decode_payload(content_base64)
         validate_payload_size(content)
-        output_bytes = convert_office_bytes(
+        output_bytes = await asyncio.to_thread(
+            convert_office_bytes,
             filename=filename,
             content=content,
             backend=conversion_backend(),
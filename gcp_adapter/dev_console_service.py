@@ -50,9 +50,9 @@ from retikon_core.services.fastapi_scaffolding import (
     apply_cors_middleware,
     build_health_response,
 )
+from retikon_core.storage.manifest_catalog import list_manifest_uris, list_manifests
 from retikon_core.storage.paths import (
     graph_root,
-    join_uri,
     manifest_uri,
     normalize_bucket_uri,
 )
@@ -182,20 +182,12 @@ def _graph_settings() -> tuple[str, str]:
     return bucket, prefix
 
 
-def _glob_files(pattern: str) -> list[str]:
-    fs, path = fsspec.core.url_to_fs(pattern)
-    matches = sorted(fs.glob(path))
-    protocol = fs.protocol[0] if isinstance(fs.protocol, tuple) else fs.protocol
-    if protocol in {"file", "local"}:
-        return matches
-    return [f"{protocol}://{match}" for match in matches]
 
 
 def _manifest_uris() -> list[str]:
     bucket, prefix = _graph_settings()
     base_uri = graph_root(normalize_bucket_uri(bucket, scheme="gs"), prefix)
-    manifest_glob = join_uri(base_uri, "manifests", "*", "manifest.json")
-    return _glob_files(manifest_glob)
+    return list_manifest_uris(base_uri)
 
 
 def _raw_bucket() -> str:
@@ -425,28 +417,20 @@ def _image_vectors_for_media(
 ) -> list[dict[str, object]]:
     bucket, prefix = _graph_settings()
     base_uri = graph_root(normalize_bucket_uri(bucket, scheme="gs"), prefix)
-    manifest_uri = join_uri(base_uri, "manifests", "*", "manifest.json")
-
-    manifest_fs, manifest_path = fsspec.core.url_to_fs(manifest_uri)
-    manifest_files = sorted(manifest_fs.glob(manifest_path))
-    if not manifest_files:
+    manifests = list_manifests(base_uri)
+    if not manifests:
         return []
 
     results: list[dict[str, object]] = []
     seen_ids: set[str] = set()
 
-    for manifest_file in manifest_files:
+    for manifest in manifests:
         if limit > 0 and len(results) >= limit:
             break
-        try:
-            with manifest_fs.open(manifest_file, "r") as handle:
-                manifest = json.load(handle)
-        except (OSError, json.JSONDecodeError):
-            continue
         image_core_uri = None
         image_vector_uri = None
-        for item in manifest.get("files", []):
-            uri = item.get("uri", "")
+        for item in manifest.files:
+            uri = str(item.get("uri") or "")
             if "/vertices/ImageAsset/core/" in uri:
                 image_core_uri = uri
             elif "/vertices/ImageAsset/vector/" in uri:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import mimetypes
 import os
 import uuid
@@ -22,7 +24,7 @@ from retikon_core.auth.rbac import (
     ACTION_EDGE_CONFIG_UPDATE,
     ACTION_EDGE_UPLOAD,
 )
-from retikon_core.edge.buffer import BufferItem, EdgeBuffer
+from retikon_core.edge.buffer import BufferItem, ByteSource, EdgeBuffer
 from retikon_core.edge.policies import AdaptiveBatchPolicy, BackpressurePolicy
 from retikon_core.logging import configure_logging, get_logger
 from retikon_core.services.fastapi_scaffolding import (
@@ -40,6 +42,10 @@ configure_logging(
 )
 logger = get_logger(__name__)
 
+_READ_CHUNK_BYTES = 1024 * 1024
+# Resumable upload chunks must be a multiple of 256 KiB.
+_UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+
 app = FastAPI()
 apply_cors_middleware(app)
 
@@ -53,6 +59,7 @@ class UploadResponse(BaseModel):
     stream_id: str | None = None
     site_id: str | None = None
     modality: str | None = None
+    sha256: str | None = None
     trace_id: str
 
 
@@ -86,6 +93,26 @@ class ConfigUpdate(BaseModel):
     backpressure_hard_limit: int | None = None
 
 
+class PayloadTooLargeError(Exception):
+    pass
+
+
+class _LimitedReader:
+    """Read-through wrapper that fails once more than ``limit`` bytes pass."""
+
+    def __init__(self, source: ByteSource, limit: int) -> None:
+        self._source = source
+        self._limit = limit
+        self.bytes_read = 0
+
+    def read(self, size: int = _READ_CHUNK_BYTES) -> bytes:
+        chunk = self._source.read(size if size > 0 else _READ_CHUNK_BYTES)
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self._limit:
+            raise PayloadTooLargeError(f"Payload exceeds {self._limit} bytes")
+        return chunk
+
+
 @dataclass
 class GatewayState:
     buffer: EdgeBuffer
@@ -272,27 +299,47 @@ def _object_path(
 
 
 def _write_to_store(
-    payload: bytes,
+    source: ByteSource,
     dest_uri: str,
     *,
     content_type: str | None,
     filename: str,
-) -> int:
+) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    size_bytes = 0
+    chunks = iter(lambda: source.read(_READ_CHUNK_BYTES), b"")
     if dest_uri.startswith("gs://"):
         bucket, name = _split_gs_uri(dest_uri)
         resolved = _resolve_content_type(filename, content_type)
         blob = storage.Client().bucket(bucket).blob(name)
-        blob.upload_from_string(payload, content_type=resolved)
-        return len(payload)
+        writer = blob.open(
+            "wb", chunk_size=_UPLOAD_CHUNK_BYTES, content_type=resolved
+        )
+        # Close only on success: closing finalizes the object, while an
+        # abandoned resumable session never becomes visible.
+        for chunk in chunks:
+            digest.update(chunk)
+            writer.write(chunk)
+            size_bytes += len(chunk)
+        writer.close()
+        return size_bytes, digest.hexdigest()
     fs, path = fsspec.core.url_to_fs(dest_uri)
     fs.makedirs(os.path.dirname(path), exist_ok=True)
-    with fs.open(path, "wb") as handle:
-        handle.write(payload)
-    return len(payload)
+    try:
+        with fs.open(path, "wb") as handle:
+            for chunk in chunks:
+                digest.update(chunk)
+                handle.write(chunk)
+                size_bytes += len(chunk)
+    except BaseException:
+        if fs.exists(path):
+            fs.rm(path)
+        raise
+    return size_bytes, digest.hexdigest()
 
 
 def _store_payload(
-    payload: bytes,
+    source: ByteSource,
     *,
     filename: str,
     modality: str,
@@ -300,7 +347,7 @@ def _store_payload(
     stream_id: str | None,
     site_id: str | None,
     content_type: str | None,
-) -> tuple[str, int]:
+) -> tuple[str, int, str]:
     base_uri = _raw_base_uri().rstrip("/")
     dest_path = _object_path(
         modality=modality,
@@ -310,17 +357,17 @@ def _store_payload(
         site_id=site_id,
     )
     dest_uri = f"{base_uri}/{dest_path}"
-    bytes_written = _write_to_store(
-        payload,
+    bytes_written, sha256 = _write_to_store(
+        source,
         dest_uri,
         content_type=content_type,
         filename=filename,
     )
-    return dest_uri, bytes_written
+    return dest_uri, bytes_written, sha256
 
 
 def _buffer_payload(
-    payload: bytes,
+    source: ByteSource,
     *,
     filename: str,
     content_type: str | None,
@@ -337,22 +384,22 @@ def _buffer_payload(
         "stream_id": stream_id,
         "site_id": site_id,
     }
-    return STATE.buffer.add_bytes(payload, metadata)
+    return STATE.buffer.add_stream(source, metadata)
 
 
 def _replay_item(item: BufferItem) -> bool:
     meta = item.metadata
-    payload = item.read_bytes()
     try:
-        _store_payload(
-            payload,
-            filename=meta.get("filename", "payload.bin"),
-            modality=meta.get("modality", "unknown"),
-            device_id=meta.get("device_id"),
-            stream_id=meta.get("stream_id"),
-            site_id=meta.get("site_id"),
-            content_type=meta.get("content_type"),
-        )
+        with item.open() as source:
+            _store_payload(
+                source,
+                filename=meta.get("filename", "payload.bin"),
+                modality=meta.get("modality", "unknown"),
+                device_id=meta.get("device_id"),
+                stream_id=meta.get("stream_id"),
+                site_id=meta.get("site_id"),
+                content_type=meta.get("content_type"),
+            )
     except Exception as exc:
         logger.warning("Replay failed", extra={"error_message": str(exc)})
         return False
@@ -473,17 +520,21 @@ async def upload(
     backlog = STATE.buffer.stats().count
     if not STATE.backpressure.should_accept(backlog):
         raise HTTPException(status_code=429, detail="Gateway backpressure active")
-    payload = await file.read()
-    if len(payload) > _max_raw_bytes():
+    limit = _max_raw_bytes()
+    # The multipart parser spools file parts to disk, so the payload is copied
+    # out in chunks on a worker thread rather than read into memory.
+    if file.size is not None and file.size > limit:
         raise HTTPException(status_code=413, detail="Payload too large")
+    filename = file.filename or "payload.bin"
 
     trace_id = str(uuid.uuid4())
     try:
         if _force_buffer():
             raise RuntimeError("Forced buffering enabled")
-        uri, bytes_written = _store_payload(
-            payload,
-            filename=file.filename or "payload.bin",
+        uri, bytes_written, sha256 = await asyncio.to_thread(
+            _store_payload,
+            _LimitedReader(file.file, limit),
+            filename=filename,
             modality=modality,
             device_id=device_id,
             stream_id=stream_id,
@@ -495,6 +546,7 @@ async def upload(
             extra={
                 "uri": uri,
                 "bytes_written": bytes_written,
+                "sha256": sha256,
                 "device_id": device_id,
                 "stream_id": stream_id,
                 "site_id": site_id,
@@ -509,30 +561,39 @@ async def upload(
             stream_id=stream_id,
             site_id=site_id,
             modality=modality,
+            sha256=sha256,
             trace_id=trace_id,
         )
+    except PayloadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail="Payload too large") from exc
     except Exception as exc:
         logger.warning(
             "Edge upload buffering",
             extra={"error_message": str(exc)},
         )
-        _buffer_payload(
-            payload,
-            filename=file.filename or "payload.bin",
+    await asyncio.to_thread(file.file.seek, 0)
+    try:
+        item = await asyncio.to_thread(
+            _buffer_payload,
+            _LimitedReader(file.file, limit),
+            filename=filename,
             content_type=file.content_type,
             modality=modality,
             device_id=device_id,
             stream_id=stream_id,
             site_id=site_id,
         )
-        return UploadResponse(
-            status="buffered",
-            uri=None,
-            buffered=True,
-            bytes_written=len(payload),
-            device_id=device_id,
-            stream_id=stream_id,
-            site_id=site_id,
-            modality=modality,
-            trace_id=trace_id,
-        )
+    except PayloadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail="Payload too large") from exc
+    return UploadResponse(
+        status="buffered",
+        uri=None,
+        buffered=True,
+        bytes_written=item.size_bytes,
+        device_id=device_id,
+        stream_id=stream_id,
+        site_id=site_id,
+        modality=modality,
+        sha256=item.sha256,
+        trace_id=trace_id,
+    )
@@ -68,7 +68,11 @@ STREAM_INGEST = _optional_stream_ingest()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with query_service.lifespan(app), audit_service.lifespan(app):
+    async with (
+        query_service.lifespan(app),
+        audit_service.lifespan(app),
+        webhook_service.lifespan(app),
+    ):
         if STREAM_INGEST is not None:
             await STREAM_INGEST._start_flush_loop()
         try:
@@ -3,8 +3,12 @@ from __future__ import annotations
 import base64
 import json
 import os
+import queue
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
@@ -15,9 +19,19 @@ import fsspec
 
 from gcp_adapter.queue_pubsub import PubSubPublisher
 from retikon_core.errors import PermanentError, RecoverableError
+from retikon_core.logging import get_logger
 from retikon_core.storage.paths import join_uri
 
+logger = get_logger(__name__)
+
 _STUB_PDF_BYTES = b"%PDF-1.4\n1 0 obj<<>>endobj\ntrailer<<>>\n%%EOF\n"
+_UNO_CONTEXT = "urp;StarOffice.ComponentContext"
+# Export filters by document service; anything else goes through Writer.
+_PDF_FILTERS = (
+    ("com.sun.star.presentation.PresentationDocument", "impress_pdf_Export"),
+    ("com.sun.star.sheet.SpreadsheetDocument", "calc_pdf_Export"),
+    ("com.sun.star.drawing.DrawingDocument", "draw_pdf_Export"),
+)
 
 
 @dataclass(frozen=True)
@@ -97,18 +111,7 @@ def convert_office_bytes(
         return _STUB_PDF_BYTES
     if backend != "libreoffice":
         raise PermanentError(f"Unsupported conversion backend: {backend}")
-
-    converter = _libreoffice_bin()
-    suffix = Path(filename).suffix or ".doc"
-    with tempfile.TemporaryDirectory() as tmpdir:
-        in_path = Path(tmpdir) / f"input{suffix}"
-        in_path.write_bytes(content)
-        out_dir = Path(tmpdir)
-        _run_libreoffice(converter, in_path, out_dir)
-        out_path = out_dir / f"{in_path.stem}.pdf"
-        if not out_path.exists():
-            raise PermanentError("LibreOffice did not produce PDF output")
-        return out_path.read_bytes()
+    return get_conversion_pool().convert(filename=filename, content=content)
 
 
 def _libreoffice_bin() -> str:
@@ -118,17 +121,329 @@ def _libreoffice_bin() -> str:
     return "soffice"
 
 
-def _run_libreoffice(binary: str, input_path: Path, out_dir: Path) -> None:
+def _load_uno() -> Any | None:
+    try:
+        import uno  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return uno
+
+
+def _uno_props(uno: Any, **values: Any) -> tuple[Any, ...]:
+    props = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
+
+
+def _pdf_filter(document: Any) -> str:
+    for service, filter_name in _PDF_FILTERS:
+        if document.supportsService(service):
+            return filter_name
+    return "writer_pdf_Export"
+
+
+class _OfficeWorker:
+    """One LibreOffice instance bound to its own user profile.
+
+    With the ``uno`` bridge installed the instance stays resident and takes
+    documents over a private pipe. Without it each job runs a one-shot
+    ``--convert-to`` against the worker's already-initialized profile, which
+    still skips first-run profile setup and keeps concurrent jobs apart.
+    """
+
+    def __init__(
+        self,
+        binary: str,
+        profile_dir: Path,
+        *,
+        resident: bool,
+        startup_timeout_s: float,
+    ) -> None:
+        self.binary = binary
+        self.profile_dir = profile_dir
+        self.resident = resident
+        self.startup_timeout_s = startup_timeout_s
+        self.jobs = 0
+        self._pipe = f"retikon-office-{uuid.uuid4().hex}"
+        self._process: subprocess.Popen[bytes] | None = None
+        self._desktop: Any = None
+
+    def _base_cmd(self) -> list[str]:
+        return [
+            self.binary,
+            "--headless",
+            "--norestore",
+            "--nologo",
+            "--nodefault",
+            "--nolockcheck",
+            f"-env:UserInstallation={self.profile_dir.as_uri()}",
+        ]
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        if not self.resident or (self.running and self._desktop is not None):
+            return
+        self.stop()
+        uno = _load_uno()
+        if uno is None:
+            raise RecoverableError("LibreOffice UNO bridge is not installed")
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self._process = subprocess.Popen(
+            [*self._base_cmd(), f"--accept=pipe,name={self._pipe};{_UNO_CONTEXT}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        deadline = time.monotonic() + self.startup_timeout_s
+        while True:
+            if not self.running:
+                self.stop()
+                raise RecoverableError("LibreOffice exited during startup")
+            try:
+                ctx = resolver.resolve(f"uno:pipe,name={self._pipe};{_UNO_CONTEXT}")
+                break
+            except Exception as exc:
+                if time.monotonic() >= deadline:
+                    self.stop()
+                    raise RecoverableError(
+                        "LibreOffice did not accept connections within "
+                        f"{self.startup_timeout_s}s"
+                    ) from exc
+                time.sleep(0.1)
+        self._desktop = ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", ctx
+        )
+
+    def stop(self) -> None:
+        self._desktop = None
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.kill()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def reset(self, *, wipe_profile: bool) -> None:
+        self.stop()
+        self.jobs = 0
+        if wipe_profile:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def convert(self, input_path: Path, output_path: Path, timeout_s: float) -> None:
+        if self.resident:
+            self._convert_resident(input_path, output_path, timeout_s)
+        else:
+            _run_libreoffice(
+                self._base_cmd(), input_path, output_path.parent, timeout_s
+            )
+        self.jobs += 1
+
+    def _convert_resident(
+        self, input_path: Path, output_path: Path, timeout_s: float
+    ) -> None:
+        self.start()
+        uno = _load_uno()
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            self.stop()
+
+        # UNO calls block without a deadline; killing the instance unblocks
+        # them with a disposed-bridge error.
+        timer = threading.Timer(timeout_s, _expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            document = self._desktop.loadComponentFromURL(
+                input_path.as_uri(),
+                "_blank",
+                0,
+                _uno_props(uno, Hidden=True, ReadOnly=True),
+            )
+            if document is None:
+                raise PermanentError("LibreOffice could not open the document")
+            try:
+                document.storeToURL(
+                    output_path.as_uri(),
+                    _uno_props(uno, FilterName=_pdf_filter(document)),
+                )
+            finally:
+                document.close(True)
+        except PermanentError:
+            raise
+        except Exception as exc:
+            if expired.is_set():
+                raise RecoverableError(
+                    f"LibreOffice conversion timed out after {timeout_s}s"
+                ) from exc
+            if not self.running:
+                raise RecoverableError(
+                    f"LibreOffice exited mid-conversion: {exc}"
+                ) from exc
+            raise PermanentError(
+                f"LibreOffice could not convert document: {exc}"
+            ) from exc
+        finally:
+            timer.cancel()
+
+
+class OfficeConversionPool:
+    """Bounded set of warm LibreOffice workers shared by conversion jobs.
+
+    Each job borrows an idle worker, waiting up to ``timeout_s`` for one.
+    Workers are restarted after ``max_jobs`` conversions and, with a fresh
+    profile, after a crash or timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        binary: str,
+        size: int,
+        max_jobs: int,
+        timeout_s: float,
+        startup_timeout_s: float = 30.0,
+        profile_root: str | None = None,
+        resident: bool | None = None,
+    ) -> None:
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        self.timeout_s = timeout_s
+        self.resident = _load_uno() is not None if resident is None else resident
+        self._owns_root = profile_root is None
+        self._root = Path(profile_root or tempfile.mkdtemp(prefix="retikon-office-"))
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._workers = [
+            _OfficeWorker(
+                binary,
+                self._root / f"worker-{idx}",
+                resident=self.resident,
+                startup_timeout_s=startup_timeout_s,
+            )
+            for idx in range(self.size)
+        ]
+        self._idle: queue.Queue[_OfficeWorker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def warm(self) -> None:
+        for worker in self._workers:
+            worker.start()
+
+    def convert(self, *, filename: str, content: bytes) -> bytes:
+        try:
+            worker = self._idle.get(timeout=self.timeout_s)
+        except queue.Empty as exc:
+            raise RecoverableError(
+                f"No LibreOffice worker became idle within {self.timeout_s}s"
+            ) from exc
+        try:
+            return self._convert_with(worker, filename, content)
+        finally:
+            if worker.jobs >= self.max_jobs:
+                worker.reset(wipe_profile=False)
+            self._idle.put(worker)
+
+    def _convert_with(
+        self, worker: _OfficeWorker, filename: str, content: bytes
+    ) -> bytes:
+        suffix = Path(filename).suffix or ".doc"
+        started = time.monotonic()
+        with tempfile.TemporaryDirectory(dir=self._root) as tmpdir:
+            in_path = Path(tmpdir) / f"input{suffix}"
+            in_path.write_bytes(content)
+            out_path = Path(tmpdir) / f"{in_path.stem}.pdf"
+            try:
+                worker.convert(in_path, out_path, self.timeout_s)
+            except RecoverableError:
+                worker.reset(wipe_profile=True)
+                raise
+            if not out_path.exists():
+                raise PermanentError("LibreOffice did not produce PDF output")
+            output = out_path.read_bytes()
+        logger.info(
+            "Office document converted",
+            extra={
+                "office_worker": worker.profile_dir.name,
+                "office_worker_jobs": worker.jobs,
+                "office_resident": worker.resident,
+                "duration_ms": int((time.monotonic() - started) * 1000),
+            },
+        )
+        return output
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        if self._owns_root:
+            shutil.rmtree(self._root, ignore_errors=True)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+_POOL: OfficeConversionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_conversion_pool() -> OfficeConversionPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = OfficeConversionPool(
+                binary=_libreoffice_bin(),
+                size=_env_int("OFFICE_POOL_SIZE", 2),
+                max_jobs=_env_int("OFFICE_POOL_MAX_JOBS", 200),
+                timeout_s=_env_int("OFFICE_CONVERSION_TIMEOUT_S", 120),
+            )
+        return _POOL
+
+
+def shutdown_conversion_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
+
+
+def _run_libreoffice(
+    command: list[str], input_path: Path, out_dir: Path, timeout_s: float
+) -> None:
     cmd = [
-        binary,
-        "--headless",
+        *command,
         "--convert-to",
         "pdf",
         "--outdir",
         out_dir.as_posix(),
         input_path.as_posix(),
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, check=False, timeout=timeout_s
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise RecoverableError(
+            f"LibreOffice conversion timed out after {timeout_s}s"
+        ) from exc
     if result.returncode != 0:
         message = (result.stderr or result.stdout).strip()
         raise RecoverableError(
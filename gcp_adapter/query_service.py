@@ -31,7 +31,7 @@ from retikon_core.ingestion.rate_limit import (
     enforce_rate_limit,
 )
 from retikon_core.logging import configure_logging, get_logger
-from retikon_core.privacy import PrivacyContext, redact_text_for_context
+from retikon_core.privacy import PrivacyContext, PrivacyRedactor
 from retikon_core.query_engine import (
     QueryResult,
     download_snapshot,
@@ -62,6 +62,7 @@ from retikon_core.services.query_service_core import (
     validate_query_payload,
     warm_query_models,
 )
+from retikon_core.storage.manifest_catalog import list_manifest_uris
 from retikon_core.storage.paths import graph_root, join_uri, normalize_bucket_uri
 
 SERVICE_NAME = "retikon-query"
@@ -364,16 +365,13 @@ def _apply_privacy_redaction(
     if not policies:
         return results
     context = PrivacyContext(action="query", scope=scope, is_admin=is_admin)
+    redactor = PrivacyRedactor(policies)
     redacted: list[QueryResult] = []
     for item in results:
         if item.snippet is None:
             redacted.append(item)
             continue
-        snippet = redact_text_for_context(
-            item.snippet,
-            policies=policies,
-            context=context.with_modality(item.modality),
-        )
+        snippet = redactor.redact(item.snippet, context.with_modality(item.modality))
         if snippet == item.snippet:
             redacted.append(item)
         else:
@@ -418,20 +416,12 @@ def _graph_settings() -> tuple[str, str]:
     return graph_bucket, graph_prefix
 
 
-def _glob_files(pattern: str) -> list[str]:
-    fs, path = fsspec.core.url_to_fs(pattern)
-    matches = sorted(fs.glob(path))
-    protocol = fs.protocol[0] if isinstance(fs.protocol, tuple) else fs.protocol
-    if protocol in {"file", "local"}:
-        return matches
-    return [f"{protocol}://{match}" for match in matches]
 
 
 def _manifest_uris() -> list[str]:
     graph_bucket, graph_prefix = _graph_settings()
     base_uri = graph_root(normalize_bucket_uri(graph_bucket, scheme="gs"), graph_prefix)
-    manifest_glob = join_uri(base_uri, "manifests", "*", "manifest.json")
-    return _glob_files(manifest_glob)
+    return list_manifest_uris(base_uri)
 
 
 def _read_snapshot_report(snapshot_uri: str) -> dict[str, object] | None:
@@ -959,6 +949,7 @@ async def query(
             modalities=modalities,
             scope=scope,
             timings=timings,
+            snapshot_marker=_snapshot_marker(),
         )
     except InferenceTimeoutError as exc:
         raise HTTPException(status_code=504, detail=str(exc)) from exc
@@ -25,6 +25,7 @@ from gcp_adapter.idempotency_firestore import (
 )
 from gcp_adapter.queue_pubsub import PubSubPublisher, parse_pubsub_push
 from retikon_core.config import get_config
+from retikon_core.edge.policies import AdaptiveBatchPolicy, BackpressurePolicy
 from retikon_core.errors import PermanentError, RecoverableError, ValidationError
 from retikon_core.ingestion import process_event
 from retikon_core.ingestion.download import cleanup_tmp, download_to_tmp
@@ -59,6 +60,8 @@ add_correlation_id_middleware(app)
 
 _dlq_publisher: PubSubDlqPublisher | None = None
 _flush_task: asyncio.Task | None = None
+_flush_wakeup = asyncio.Event()
+_MIN_FLUSH_WAIT_S = 0.01
 
 
 def _manifest_metrics(manifest_uri: str, *, bucket: str, name: str) -> dict[str, object] | None:
@@ -99,6 +102,10 @@ class StreamStatusResponse(BaseModel):
     batch_latency_ms: int
     backlog_max: int
     queue_topic: str
+    adaptive: bool = False
+    target_batch: int | None = None
+    target_latency_ms: int | None = None
+    avg_batch_latency_ms: float | None = None
 
 
 def _stream_topic() -> str:
@@ -120,6 +127,33 @@ def _backlog_max() -> int:
     return int(os.getenv("STREAM_BACKLOG_MAX", "1000"))
 
 
+def _adaptive_enabled() -> bool:
+    return os.getenv("STREAM_BATCH_ADAPTIVE", "1") == "1"
+
+
+def _batch_policy() -> AdaptiveBatchPolicy:
+    target_latency_ms = int(os.getenv("STREAM_BATCH_TARGET_LATENCY_MS", "5000"))
+    return AdaptiveBatchPolicy(
+        min_batch=int(os.getenv("STREAM_BATCH_MIN", str(_batch_max()))),
+        max_batch=_batch_max(),
+        low_watermark=int(os.getenv("STREAM_BACKLOG_LOW", "10")),
+        high_watermark=int(os.getenv("STREAM_BACKLOG_HIGH", "100")),
+        min_delay_ms=int(
+            os.getenv("STREAM_BATCH_DELAY_MIN_MS", str(_batch_latency_ms()))
+        ),
+        max_delay_ms=_batch_latency_ms(),
+        target_latency_ms=target_latency_ms if target_latency_ms > 0 else None,
+    )
+
+
+def _backpressure_policy() -> BackpressurePolicy:
+    max_backlog = _backlog_max()
+    return BackpressurePolicy(
+        max_backlog=max_backlog,
+        hard_limit=int(os.getenv("STREAM_BACKLOG_HARD", str(max_backlog * 2))),
+    )
+
+
 def _flush_interval_s() -> float:
     latency_s = _batch_latency_ms() / 1000.0
     if latency_s <= 0:
@@ -132,6 +166,8 @@ def _init_pipeline() -> StreamIngestPipeline:
         max_batch_size=_batch_max(),
         max_latency_s=_batch_latency_ms() / 1000.0,
         max_backlog=_backlog_max(),
+        batch_policy=_batch_policy() if _adaptive_enabled() else None,
+        backpressure=_backpressure_policy() if _adaptive_enabled() else None,
     )
     publisher = PubSubPublisher()
     return StreamIngestPipeline(
@@ -444,7 +480,15 @@ PIPELINE = _init_pipeline()
 async def _flush_loop() -> None:
     interval = _flush_interval_s()
     while True:
-        await asyncio.sleep(interval)
+        # Sleep until the oldest queued event is due under the current
+        # targets; enqueues wake the loop so new deadlines are picked up.
+        due_in = PIPELINE.batcher.next_flush_in()
+        timeout = interval if due_in is None else min(interval, due_in)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                _flush_wakeup.wait(), timeout=max(_MIN_FLUSH_WAIT_S, timeout)
+            )
+        _flush_wakeup.clear()
         try:
             message_ids = PIPELINE.flush()
         except Exception:
@@ -485,12 +529,21 @@ async def health() -> HealthResponse:
 
 @app.get("/ingest/stream/status", response_model=StreamStatusResponse)
 async def stream_status() -> StreamStatusResponse:
+    batcher = PIPELINE.batcher
+    target_batch, target_latency_s = batcher.targets()
+    avg_latency_ms = batcher.avg_latency_ms
     return StreamStatusResponse(
-        backlog=PIPELINE.batcher.backlog,
+        backlog=batcher.backlog,
         batch_max=_batch_max(),
         batch_latency_ms=_batch_latency_ms(),
         backlog_max=_backlog_max(),
         queue_topic=_stream_topic(),
+        adaptive=batcher.batch_policy is not None,
+        target_batch=target_batch,
+        target_latency_ms=int(target_latency_s * 1000),
+        avg_batch_latency_ms=(
+            round(avg_latency_ms, 2) if avg_latency_ms is not None else None
+        ),
     )
 
 
@@ -525,6 +578,8 @@ async def ingest_stream(
             },
         )
         raise HTTPException(status_code=500, detail="Queue dispatch failed") from exc
+    if result.backlog:
+        _flush_wakeup.set()
 
     logger.info(
         "Stream enqueue accepted",
@@ -585,6 +640,7 @@ async def ingest_stream_push(request: Request) -> dict[str, Any]:
 
     processed = 0
     skipped = 0
+    batch_started = time.monotonic()
     for event in events:
         start_time = time.monotonic()
         scope_key = resolve_scope_key(event.org_id, event.site_id, event.stream_id)
@@ -782,6 +838,9 @@ async def ingest_stream_push(request: Request) -> dict[str, Any]:
             logger.exception("Stream ingest failed (unexpected)")
             raise HTTPException(status_code=500, detail="Unexpected error") from exc
 
+    # Feed downstream cost back into batch sizing so slow processing shrinks
+    # the batches this instance publishes.
+    PIPELINE.batcher.record_downstream((time.monotonic() - batch_started) * 1000.0)
     return {"status": "ok", "processed": processed, "skipped": skipped}
 
 
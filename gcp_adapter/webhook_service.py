@@ -1,8 +1,11 @@
+import asyncio
+import functools
 import os
+import threading
 import uuid
-from dataclasses import replace
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, Header, HTTPException, Request
 from pydantic import BaseModel, Field
@@ -10,7 +13,14 @@ from pydantic import BaseModel, Field
 from gcp_adapter.auth import authorize_request
 from gcp_adapter.pubsub_event_publisher import PubSubEventPublisher
 from gcp_adapter.stores import abac_allowed, is_action_allowed
-from retikon_core.alerts import evaluate_rules, load_alerts, register_alert
+from retikon_core.alerts import (
+    AlertRuleIndex,
+    alert_registry_version,
+    compile_rules,
+    evaluate_rules,
+    load_alerts,
+    register_alert,
+)
 from retikon_core.alerts.types import AlertDestination, AlertRule
 from retikon_core.audit import record_audit_log
 from retikon_core.auth import AuthContext
@@ -31,7 +41,8 @@ from retikon_core.services.fastapi_scaffolding import (
 from retikon_core.webhooks.delivery import (
     DeliveryOptions,
     DeliveryResult,
-    deliver_webhook,
+    deliver_webhooks,
+    get_delivery_engine,
 )
 from retikon_core.webhooks.logs import (
     WebhookDeliveryRecord,
@@ -49,7 +60,23 @@ configure_logging(
 )
 logger = get_logger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Retries run on the engine's scheduler thread, outliving the request
+    # that first attempted them.
+    engine = get_delivery_engine()
+    engine.start()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(
+            engine.close,
+            float(os.getenv("WEBHOOK_SHUTDOWN_DRAIN_S", "5")),
+        )
+
+
+app = FastAPI(lifespan=lifespan)
 add_correlation_id_middleware(app)
 
 
@@ -138,6 +165,7 @@ class EventDeliveryResponse(BaseModel):
     failures: int
     pubsub_published: int
     log_uri: str | None = None
+    retrying: int = 0
 
 
 def _require_admin() -> bool:
@@ -317,6 +345,7 @@ async def create_alert(request: Request, payload: AlertCreateRequest) -> AlertRe
         stream_id=payload.stream_id,
         status=payload.status or "active",
     )
+    _invalidate_alert_rule_index(config.graph_root_uri())
     _record_audit(
         request=request,
         auth_context=auth_context,
@@ -364,7 +393,7 @@ async def dispatch_event(
         source=payload.source,
     )
     webhooks = load_webhooks(config.graph_root_uri())
-    rules = load_alerts(config.graph_root_uri())
+    rules = _alert_rule_index(config.graph_root_uri())
 
     target_webhooks = _resolve_webhooks(
         webhooks,
@@ -375,31 +404,27 @@ async def dispatch_event(
     )
     pubsub_topics = _resolve_pubsub_topics(payload.pubsub_topics, rules, event)
 
-    options = _delivery_options()
-    results: list[DeliveryResult] = []
-    records: list[WebhookDeliveryRecord] = []
-    for webhook in target_webhooks:
-        hook_options = options
-        if webhook.timeout_s is not None:
-            hook_options = replace(options, timeout_s=webhook.timeout_s)
-        result, attempt_records = deliver_webhook(webhook, event, hook_options)
-        results.append(result)
-        records.extend(attempt_records)
+    results, records = await asyncio.to_thread(
+        deliver_webhooks,
+        target_webhooks,
+        event,
+        _delivery_options(),
+        on_retries_done=functools.partial(
+            _log_retried_deliveries, config.graph_root_uri()
+        ),
+    )
 
     published = _publish_pubsub(event, pubsub_topics)
 
     log_uri = None
     if records and _logs_enabled():
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-        run_id = f"webhook-{timestamp}-{uuid.uuid4()}"
-        log_uri = write_webhook_delivery_log(
-            base_uri=config.graph_root_uri(),
-            run_id=run_id,
-            records=records,
+        log_uri = await asyncio.to_thread(
+            _write_delivery_log, config.graph_root_uri(), records
         )
 
     successes = sum(1 for result in results if result.status == "success")
     failures = sum(1 for result in results if result.status == "failed")
+    retrying = sum(1 for result in results if result.status == "retrying")
 
     logger.info(
         "Event dispatched",
@@ -418,6 +443,7 @@ async def dispatch_event(
         failures=failures,
         pubsub_published=published,
         log_uri=log_uri,
+        retrying=retrying,
     )
 
 
@@ -433,13 +459,67 @@ def _delivery_options() -> DeliveryOptions:
         timeout_s=float(os.getenv("WEBHOOK_TIMEOUT_S", "10")),
         max_attempts=int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "3")),
         backoff_s=float(os.getenv("WEBHOOK_BACKOFF_S", "0.5")),
+        max_concurrency=int(os.getenv("WEBHOOK_MAX_CONCURRENCY", "8")),
+        jitter=float(os.getenv("WEBHOOK_RETRY_JITTER", "0.5")),
+        breaker_failures=int(os.getenv("WEBHOOK_BREAKER_FAILURES", "5")),
+        breaker_cooldown_s=float(os.getenv("WEBHOOK_BREAKER_COOLDOWN_S", "30")),
     )
 
 
+_RULE_INDEX_CACHE: dict[str, tuple[str, AlertRuleIndex]] = {}
+_RULE_INDEX_LOCK = threading.Lock()
+
+
+def _alert_rule_index(base_uri: str) -> AlertRuleIndex:
+    """Compiled alert rules, rebuilt only when the registry file changes."""
+    version = alert_registry_version(base_uri)
+    with _RULE_INDEX_LOCK:
+        cached = _RULE_INDEX_CACHE.get(base_uri)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    index = compile_rules(load_alerts(base_uri))
+    with _RULE_INDEX_LOCK:
+        _RULE_INDEX_CACHE[base_uri] = (version, index)
+    return index
+
+
+def _invalidate_alert_rule_index(base_uri: str) -> None:
+    # Coarse mtimes can miss a rewrite within the same tick; drop the entry
+    # whenever this process changes the registry.
+    with _RULE_INDEX_LOCK:
+        _RULE_INDEX_CACHE.pop(base_uri, None)
+
+
 def _logs_enabled() -> bool:
     return os.getenv("WEBHOOK_LOGS_ENABLED", "1") == "1"
 
 
+def _write_delivery_log(base_uri: str, records: list[WebhookDeliveryRecord]) -> str:
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    run_id = f"webhook-{timestamp}-{uuid.uuid4()}"
+    return write_webhook_delivery_log(
+        base_uri=base_uri,
+        run_id=run_id,
+        records=records,
+    )
+
+
+def _log_retried_deliveries(
+    base_uri: str,
+    results: list[DeliveryResult],
+    records: list[WebhookDeliveryRecord],
+) -> None:
+    logger.info(
+        "Webhook retries settled",
+        extra={
+            "deliveries": len(results),
+            "successes": sum(1 for result in results if result.status == "success"),
+        },
+    )
+    if records and _logs_enabled():
+        _write_delivery_log(base_uri, records)
+
+
 def _webhook_response(webhook: WebhookRegistration) -> WebhookResponse:
     return WebhookResponse(
         id=webhook.id,
@@ -488,7 +568,7 @@ def _resolve_webhooks(
     webhooks: list[WebhookRegistration],
     event_type: str,
     explicit_ids: list[str] | None,
-    rules: list[AlertRule],
+    rules: AlertRuleIndex,
     event: WebhookEvent,
 ) -> list[WebhookRegistration]:
     if explicit_ids:
@@ -521,7 +601,7 @@ def _resolve_webhooks(
 
 def _resolve_pubsub_topics(
     explicit_topics: list[str] | None,
-    rules: list[AlertRule],
+    rules: AlertRuleIndex,
     event: WebhookEvent,
 ) -> list[str]:
     if explicit_topics:
@@ -2,6 +2,7 @@ import json
 import os
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from typing import Any, Iterable
 from urllib.error import HTTPError, URLError
@@ -36,6 +37,8 @@ from retikon_core.workflows import (
     WorkflowRun,
     WorkflowSpec,
     WorkflowStep,
+    step_dependencies,
+    topological_order,
 )
 
 SERVICE_NAME = "retikon-workflows"
@@ -58,6 +61,7 @@ class WorkflowStepPayload(BaseModel):
     config: dict[str, object] | None = None
     retries: int | None = None
     timeout_seconds: int | None = None
+    depends_on: list[str] | None = None
 
 
 class WorkflowRequest(BaseModel):
@@ -236,9 +240,17 @@ def _step_from_payload(payload: WorkflowStepPayload) -> WorkflowStep:
         config=payload.config,
         retries=payload.retries,
         timeout_seconds=payload.timeout_seconds,
+        depends_on=tuple(payload.depends_on) if payload.depends_on else None,
     )
 
 
+def _validate_steps(steps: tuple[WorkflowStep, ...]) -> None:
+    try:
+        step_dependencies(steps)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 def _workflow_response(workflow: WorkflowSpec) -> WorkflowResponse:
     steps = [
         WorkflowStepPayload(
@@ -248,6 +260,7 @@ def _workflow_response(workflow: WorkflowSpec) -> WorkflowResponse:
             config=step.config,
             retries=step.retries,
             timeout_seconds=step.timeout_seconds,
+            depends_on=list(step.depends_on) if step.depends_on else None,
         )
         for step in workflow.steps
     ]
@@ -488,6 +501,15 @@ def _step_timeout(step: WorkflowStep) -> float:
         return 30.0
 
 
+def _max_parallel_steps() -> int:
+    raw = os.getenv("WORKFLOW_MAX_PARALLEL_STEPS", "4")
+    try:
+        value = int(raw)
+    except ValueError:
+        return 4
+    return max(1, value)
+
+
 def _coerce_str(value: object) -> str | None:
     if value is None:
         return None
@@ -719,6 +741,87 @@ def _update_run(
     return updated
 
 
+def _completed_step_results(run: WorkflowRun) -> dict[str, dict[str, object]]:
+    steps = (run.output or {}).get("steps")
+    if not isinstance(steps, list):
+        return {}
+    return {
+        str(item["id"]): item
+        for item in steps
+        if isinstance(item, dict)
+        and item.get("id")
+        and item.get("status") == "completed"
+    }
+
+
+def _skipped_step(step: WorkflowStep, reason: str) -> dict[str, object]:
+    return {
+        "id": step.id,
+        "name": step.name,
+        "kind": step.kind,
+        "status": "skipped",
+        "attempts": 0,
+        "error": reason,
+    }
+
+
+def _run_steps(
+    *,
+    base_uri: str,
+    workflow: WorkflowSpec,
+    run: WorkflowRun,
+    deps: dict[str, tuple[str, ...]],
+) -> tuple[WorkflowRun, list[dict[str, object]]]:
+    steps_by_id = {step.id: step for step in workflow.steps}
+    results = {
+        step_id: result
+        for step_id, result in _completed_step_results(run).items()
+        if step_id in steps_by_id
+    }
+    pending = [step_id for step_id in topological_order(deps) if step_id not in results]
+    cap = _max_parallel_steps()
+
+    def ordered() -> list[dict[str, object]]:
+        return [results[step.id] for step in workflow.steps if step.id in results]
+
+    in_flight: dict[Future[dict[str, object]], str] = {}
+    with ThreadPoolExecutor(max_workers=min(cap, max(1, len(pending)))) as executor:
+        while pending or in_flight:
+            # Pending ids stay in topological order, so one pass propagates
+            # skips down a failed branch and submits every runnable step.
+            for step_id in list(pending):
+                required = deps[step_id]
+                blocked = [
+                    dep
+                    for dep in required
+                    if results.get(dep, {}).get("status") in {"failed", "skipped"}
+                ]
+                if blocked:
+                    pending.remove(step_id)
+                    results[step_id] = _skipped_step(
+                        steps_by_id[step_id],
+                        f"Dependency {blocked[0]} did not complete",
+                    )
+                    continue
+                if len(in_flight) >= cap:
+                    continue
+                if all(
+                    results.get(dep, {}).get("status") == "completed"
+                    for dep in required
+                ):
+                    pending.remove(step_id)
+                    future = executor.submit(_execute_step, steps_by_id[step_id])
+                    in_flight[future] = step_id
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                step_id = in_flight.pop(future)
+                results[step_id] = future.result()
+            run = _update_run(base_uri=base_uri, run=run, output={"steps": ordered()})
+    return run, ordered()
+
+
 def _execute_workflow_run(
     *,
     base_uri: str,
@@ -737,12 +840,22 @@ def _execute_workflow_run(
     )
     step_results: list[dict[str, object]] = []
     error: str | None = None
-    for step in workflow.steps:
-        result = _execute_step(step)
-        step_results.append(result)
-        if result.get("status") != "completed":
-            error = str(result.get("error") or "Step failed")
-            break
+    try:
+        deps = step_dependencies(workflow.steps)
+    except ValueError as exc:
+        error = str(exc)
+    else:
+        running, step_results = _run_steps(
+            base_uri=base_uri, workflow=workflow, run=running, deps=deps
+        )
+        error = next(
+            (
+                str(result.get("error") or "Step failed")
+                for result in step_results
+                if result.get("status") == "failed"
+            ),
+            None,
+        )
     status = "completed" if error is None else "failed"
     finished = _update_run(
         base_uri=base_uri,
@@ -795,6 +908,7 @@ async def create_workflow(
         if payload.steps
         else ()
     )
+    _validate_steps(steps)
     workflow = _stores().workflows.register_workflow(
         name=payload.name,
         description=payload.description,
@@ -843,6 +957,7 @@ async def update_workflow_endpoint(
         if payload.steps is not None
         else existing.steps
     )
+    _validate_steps(steps)
     updated = WorkflowSpec(
         id=existing.id,
         name=payload.name or existing.name,
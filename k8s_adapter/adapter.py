@@ -17,6 +17,8 @@ from k8s_adapter.providers import (
     UnsupportedQueue,
     _redis_client_from_env,
 )
+from retikon_core.config import get_config
+from retikon_core.ingestion.idempotency import DedupeIndex, dedupe_index_from_env
 from retikon_core.providers import (
     ObjectStoreProvider,
     QueueProvider,
@@ -32,6 +34,7 @@ class K8sAdapter:
     queue: QueueProvider
     secrets: SecretsProvider
     state_store: StateStoreProvider
+    dedupe_index: DedupeIndex | None = None
 
     @classmethod
     def from_env(cls) -> "K8sAdapter":
@@ -40,12 +43,14 @@ class K8sAdapter:
         queue = _queue_from_env()
         secrets = _secrets_from_env()
         state_store = _state_store_from_env()
+        dedupe_index = _dedupe_index_from_env()
         return cls(
             namespace=namespace,
             object_store=object_store,
             queue=queue,
             secrets=secrets,
             state_store=state_store,
+            dedupe_index=dedupe_index,
         )
 
     def health(self) -> dict[str, object]:
@@ -55,6 +60,9 @@ class K8sAdapter:
             "queue": type(self.queue).__name__,
             "secrets": type(self.secrets).__name__,
             "state_store": type(self.state_store).__name__,
+            "dedupe_index": (
+                type(self.dedupe_index).__name__ if self.dedupe_index else None
+            ),
         }
 
 
@@ -126,6 +134,23 @@ def _state_store_from_env() -> StateStoreProvider:
     raise ValueError(f"Unsupported K8S_STATE_BACKEND: {backend}")
 
 
+def _dedupe_index_from_env() -> DedupeIndex | None:
+    # Pods share one index so replays landing on any replica skip re-embedding.
+    config = get_config()
+    state_dir = os.getenv("K8S_STATE_DIR", "/var/run/retikon/state")
+    if os.getenv("REDIS_URL") or config.redis_host:
+        default_backend = "redis"
+    elif os.path.isdir(state_dir):
+        default_backend = "sqlite"
+    else:
+        default_backend = "memory"
+    return dedupe_index_from_env(
+        config,
+        default_backend=default_backend,
+        default_sqlite_path=os.path.join(state_dir, "dedupe.sqlite"),
+    )
+
+
 def _has_redis_env() -> bool:
     if os.getenv("K8S_REDIS_URL") or os.getenv("REDIS_URL"):
         return True
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import mimetypes
 import os
+import time
 import uuid
 from pathlib import Path
 
@@ -9,11 +11,20 @@ from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 
 from retikon_core.auth.jwt import auth_context_from_claims, decode_jwt
-from retikon_core.config import get_config
+from retikon_core.config import Config, get_config
 from retikon_core.errors import AuthError, PermanentError
+from retikon_core.ingestion.idempotency import (
+    DedupeIndex,
+    content_hash_key,
+    dedupe_index_from_env,
+)
 from retikon_core.ingestion.router import (
     _check_size,
+    _dedupe_outcome,
+    _dedupe_scope_key,
     _ensure_allowed,
+    _find_dedupe_match,
+    _record_dedupe,
     _run_pipeline,
     _schema_version,
     pipeline_version,
@@ -75,6 +86,29 @@ def _prefix_for_modality(modality: str) -> str:
     raise PermanentError(f"Unsupported modality: {modality}")
 
 
+_DEDUPE_INDEXES: dict[tuple[object, ...], DedupeIndex | None] = {}
+
+
+def _dedupe_index(config: Config) -> DedupeIndex | None:
+    key = (
+        config.dedupe_cache_enabled,
+        config.local_graph_root,
+        os.getenv("DEDUPE_BACKEND"),
+        os.getenv("DEDUPE_SQLITE_PATH"),
+    )
+    if key not in _DEDUPE_INDEXES:
+        _DEDUPE_INDEXES[key] = dedupe_index_from_env(config, default_backend="sqlite")
+    return _DEDUPE_INDEXES[key]
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _extract_bearer_tokens(request: Request) -> list[str]:
     tokens: list[str] = []
     for header_name in (
@@ -125,6 +159,7 @@ async def ingest(payload: IngestRequest, request: Request) -> IngestResponse:
     _authorize(request)
     config = get_config()
     trace_id = str(uuid.uuid4())
+    started = time.monotonic()
 
     path = Path(payload.path)
     if not path.exists() or not path.is_file():
@@ -157,29 +192,58 @@ async def ingest(payload: IngestRequest, request: Request) -> IngestResponse:
     except PermanentError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    source = IngestSource(
-        bucket=event.bucket,
-        name=event.name,
-        generation=event.generation,
-        content_type=event.content_type,
-        size_bytes=event.size,
-        md5_hash=None,
-        crc32c=None,
-        local_path=str(path),
-        uri_scheme="file",
-    )
-
-    try:
-        outcome = _run_pipeline(
-            modality=modality,
-            source=source,
-            config=config,
-            output_uri=config.graph_root_uri(),
-            pipeline_version_value=pipeline_version(),
-            schema_version=_schema_version(),
+    # Hashing is far cheaper than decode + embed, so identical re-ingests of
+    # an already indexed file return the recorded outputs.
+    content_hash = _file_sha256(path)
+    dedupe = _dedupe_index(config)
+    scope_key = _dedupe_scope_key(None, config)
+    pipeline_version_value = pipeline_version()
+    match = None
+    if dedupe is not None:
+        match = _find_dedupe_match(
+            dedupe,
+            content_hash_key(scope_key, content_hash),
+            pipeline_version_value=pipeline_version_value,
+            size_bytes=event.size,
         )
-    except PermanentError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if match is not None:
+        outcome = _dedupe_outcome(
+            match, modality=modality, source="content_hash", started=started
+        )
+    else:
+        source = IngestSource(
+            bucket=event.bucket,
+            name=event.name,
+            generation=event.generation,
+            content_type=event.content_type,
+            size_bytes=event.size,
+            md5_hash=None,
+            crc32c=None,
+            local_path=str(path),
+            content_hash_sha256=content_hash,
+            uri_scheme="file",
+        )
+        try:
+            outcome = _run_pipeline(
+                modality=modality,
+                source=source,
+                config=config,
+                output_uri=config.graph_root_uri(),
+                pipeline_version_value=pipeline_version_value,
+                schema_version=_schema_version(),
+            )
+        except PermanentError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if dedupe is not None:
+            _record_dedupe(
+                dedupe,
+                outcome,
+                scope_key=scope_key,
+                pipeline_version_value=pipeline_version_value,
+                content_hash=content_hash,
+                checksum=None,
+                size_bytes=event.size,
+            )
 
     logger.info(
         "Local ingest completed",
@@ -187,6 +251,7 @@ async def ingest(payload: IngestRequest, request: Request) -> IngestResponse:
             "request_id": trace_id,
             "modality": modality,
             "media_asset_id": outcome.media_asset_id,
+            "cache_hit": match is not None,
         },
     )
 
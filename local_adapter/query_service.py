@@ -402,6 +402,7 @@ async def query(
             search_type=search_type,
             modalities=modalities,
             timings=timings,
+            snapshot_marker=_snapshot_marker(),
         )
     except InferenceTimeoutError as exc:
         raise HTTPException(status_code=504, detail=str(exc)) from exc
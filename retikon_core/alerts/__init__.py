@@ -1,5 +1,11 @@
-from retikon_core.alerts.rules import evaluate_rules, rule_matches
+from retikon_core.alerts.rules import (
+    AlertRuleIndex,
+    compile_rules,
+    evaluate_rules,
+    rule_matches,
+)
 from retikon_core.alerts.store import (
+    alert_registry_version,
     load_alerts,
     register_alert,
     save_alerts,
@@ -11,6 +17,9 @@ __all__ = [
     "AlertDestination",
     "AlertMatch",
     "AlertRule",
+    "AlertRuleIndex",
+    "alert_registry_version",
+    "compile_rules",
     "evaluate_rules",
     "load_alerts",
     "register_alert",
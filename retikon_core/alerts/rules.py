@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import bisect
+import itertools
+from dataclasses import dataclass
 from typing import Iterable
 
 from retikon_core.alerts.types import AlertMatch, AlertRule
 from retikon_core.webhooks.types import WebhookEvent
 
+_ANY = "*"
+_ANY_KEY = (_ANY,)
+
 
 def rule_matches(rule: AlertRule, event: WebhookEvent) -> bool:
     if not rule.enabled:
@@ -25,21 +31,172 @@ def rule_matches(rule: AlertRule, event: WebhookEvent) -> bool:
     return True
 
 
+@dataclass(frozen=True)
+class _CompiledRule:
+    position: int
+    rule: AlertRule
+    threshold: float | None
+    tags: frozenset[str] | None
+
+    def accepts(self, event: WebhookEvent) -> bool:
+        # Event type, modality, tenant and threshold are settled by the index;
+        # only the tag predicate is left per rule.
+        if self.tags is None:
+            return True
+        return not self.tags.isdisjoint(event.tags or ())
+
+
+class _ThresholdBucket:
+    """Rules sorted by min_confidence so one bisect finds every satisfied rule."""
+
+    def __init__(self) -> None:
+        self.unbounded: list[_CompiledRule] = []
+        self.thresholds: list[float] = []
+        self.bounded: list[_CompiledRule] = []
+
+    def add(self, compiled: _CompiledRule) -> None:
+        if compiled.threshold is None:
+            self.unbounded.append(compiled)
+            return
+        idx = bisect.bisect_right(self.thresholds, compiled.threshold)
+        self.thresholds.insert(idx, compiled.threshold)
+        self.bounded.insert(idx, compiled)
+
+    def remove(self, rule_id: str) -> None:
+        self.unbounded = [item for item in self.unbounded if item.rule.id != rule_id]
+        keep = [
+            (threshold, item)
+            for threshold, item in zip(self.thresholds, self.bounded, strict=True)
+            if item.rule.id != rule_id
+        ]
+        self.thresholds = [threshold for threshold, _ in keep]
+        self.bounded = [item for _, item in keep]
+
+    def candidates(self, confidence: float | None) -> Iterable[_CompiledRule]:
+        if confidence is None or not self.bounded:
+            return self.unbounded
+        end = bisect.bisect_right(self.thresholds, confidence)
+        return itertools.chain(self.unbounded, self.bounded[:end])
+
+    def __bool__(self) -> bool:
+        return bool(self.unbounded or self.bounded)
+
+
+class AlertRuleIndex:
+    """Rules compiled into buckets keyed by tenant, event type and modality.
+
+    Each event looks up a handful of buckets. Only the rules whose type,
+    modality, tenant and confidence threshold already hold are visited, so
+    cost follows the number of matching rules rather than the rule count.
+    Rules can be added or removed without rebuilding the index.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule] = ()) -> None:
+        # (event_type, modality) across all tenants, and the same keyed by
+        # tenant for scoped lookups.
+        self._buckets: dict[tuple[str, ...], _ThresholdBucket] = {}
+        self._tenant_buckets: dict[tuple[str, ...], _ThresholdBucket] = {}
+        self._keys: dict[str, list[tuple[str, ...]]] = {}
+        self._positions = itertools.count()
+        for rule in rules:
+            self.add(rule)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, rule: AlertRule) -> None:
+        if rule.id in self._keys:
+            self.remove(rule.id)
+        if not rule.enabled:
+            return
+        compiled = _CompiledRule(
+            position=next(self._positions),
+            rule=rule,
+            threshold=rule.min_confidence,
+            tags=frozenset(rule.tags) if rule.tags else None,
+        )
+        event_types = rule.event_types or _ANY_KEY
+        if _ANY in event_types:
+            event_types = _ANY_KEY
+        modalities = rule.modalities or _ANY_KEY
+        tenant = rule.org_id or _ANY
+        keys = [
+            (event_type, modality)
+            for event_type in dict.fromkeys(event_types)
+            for modality in dict.fromkeys(modalities)
+        ]
+        for key in keys:
+            self._buckets.setdefault(key, _ThresholdBucket()).add(compiled)
+            self._tenant_buckets.setdefault(
+                (tenant, *key), _ThresholdBucket()
+            ).add(compiled)
+        self._keys[rule.id] = [(tenant, *key) for key in keys]
+
+    def remove(self, rule_id: str) -> None:
+        for tenant_key in self._keys.pop(rule_id, []):
+            for buckets, key in (
+                (self._buckets, tenant_key[1:]),
+                (self._tenant_buckets, tenant_key),
+            ):
+                bucket = buckets.get(key)
+                if bucket is None:
+                    continue
+                bucket.remove(rule_id)
+                if not bucket:
+                    del buckets[key]
+
+    def evaluate(
+        self,
+        event: WebhookEvent,
+        *,
+        org_id: str | None = None,
+    ) -> list[AlertMatch]:
+        """Return matches in rule order.
+
+        Without `org_id`, rules of every tenant are considered, as with a
+        linear scan. With it, only that tenant's rules and rules without a
+        tenant apply.
+        """
+        event_types = (event.event_type, _ANY)
+        modalities = (event.modality, _ANY) if event.modality else _ANY_KEY
+        scope: tuple[tuple[str, ...], ...] = (
+            ((_ANY,), (org_id,)) if org_id else ((),)
+        )
+        buckets = self._tenant_buckets if org_id else self._buckets
+        matched: dict[int, _CompiledRule] = {}
+        keys = (
+            (*prefix, event_type, modality)
+            for prefix in scope
+            for event_type in event_types
+            for modality in modalities
+        )
+        for key in keys:
+            bucket = buckets.get(key)
+            if bucket is None:
+                continue
+            for compiled in bucket.candidates(event.confidence):
+                if compiled.position not in matched and compiled.accepts(event):
+                    matched[compiled.position] = compiled
+        return [
+            AlertMatch(
+                rule_id=compiled.rule.id,
+                event_id=event.id,
+                destinations=compiled.rule.destinations,
+            )
+            for _, compiled in sorted(matched.items())
+        ]
+
+
+def compile_rules(rules: Iterable[AlertRule]) -> AlertRuleIndex:
+    return AlertRuleIndex(rules)
+
+
 def evaluate_rules(
     event: WebhookEvent,
-    rules: Iterable[AlertRule],
+    rules: Iterable[AlertRule] | AlertRuleIndex,
 ) -> list[AlertMatch]:
-    matches: list[AlertMatch] = []
-    for rule in rules:
-        if rule_matches(rule, event):
-            matches.append(
-                AlertMatch(
-                    rule_id=rule.id,
-                    event_id=event.id,
-                    destinations=rule.destinations,
-                )
-            )
-    return matches
+    index = rules if isinstance(rules, AlertRuleIndex) else compile_rules(rules)
+    return index.evaluate(event)
 
 
 def _matches_type(event_types: tuple[str, ...], event_type: str) -> bool:
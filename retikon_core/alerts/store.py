@@ -16,6 +16,24 @@ def alert_registry_uri(base_uri: str) -> str:
     return join_uri(base_uri, "control", "alerts.json")
 
 
+def alert_registry_version(base_uri: str) -> str:
+    """Cheap change token for the registry: object generation/etag or mtime.
+
+    Returns an empty string when no registry has been written yet.
+    """
+    uri = alert_registry_uri(base_uri)
+    fs, path = fsspec.core.url_to_fs(uri)
+    try:
+        info = fs.info(path)
+    except FileNotFoundError:
+        return ""
+    for key in ("generation", "etag", "ETag", "mtime", "updated", "LastModified"):
+        value = info.get(key)
+        if value:
+            return f"{value}:{info.get('size', '')}"
+    return str(info.get("size", ""))
+
+
 def load_alerts(base_uri: str) -> list[AlertRule]:
     uri = alert_registry_uri(base_uri)
     fs, path = fsspec.core.url_to_fs(uri)
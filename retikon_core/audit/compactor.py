@@ -3,19 +3,21 @@ from __future__ import annotations
 import os
 import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 
 import fsspec
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from retikon_core.audit.compaction import (
     CompactionAuditRecord,
     write_compaction_audit_log,
 )
-from retikon_core.compaction.io import iter_tables, unify_schema, write_parquet_tables
+from retikon_core.audit.layout import audit_root_uri, write_audit_partitions
+from retikon_core.compaction.io import iter_tables, unify_schema
 from retikon_core.logging import get_logger
-from retikon_core.storage.paths import join_uri, vertex_part_uri
+from retikon_core.storage.paths import join_uri
 from retikon_core.storage.writer import WriteResult
 
 logger = get_logger(__name__)
@@ -84,6 +86,10 @@ class _AuditFile:
     size: int
     updated_at: datetime | None
 
+    @property
+    def partition(self) -> str:
+        return self.path.rsplit("/", 1)[0]
+
 
 def _info_timestamp(info: dict[str, object]) -> datetime | None:
     updated = info.get("updated") or info.get("mtime")
@@ -99,9 +105,13 @@ def _info_timestamp(info: dict[str, object]) -> datetime | None:
     return None
 
 
-def _glob_audit_files(uri_pattern: str) -> list[_AuditFile]:
-    fs, path = fsspec.core.url_to_fs(uri_pattern)
-    matches = sorted(fs.glob(path))
+def _glob_audit_files(uri_patterns: list[str]) -> list[_AuditFile]:
+    fs, _ = fsspec.core.url_to_fs(uri_patterns[0])
+    matches: list[str] = []
+    for pattern in uri_patterns:
+        _, path = fsspec.core.url_to_fs(pattern)
+        matches.extend(fs.glob(path))
+    matches.sort()
     protocol = fs.protocol[0] if isinstance(fs.protocol, tuple) else fs.protocol
     output: list[_AuditFile] = []
     for match in matches:
@@ -131,8 +141,32 @@ def _parquet_rows(uri: str) -> int:
         return int(metadata.num_rows) if metadata else 0
 
 
-def _audit_glob(base_uri: str) -> str:
-    return join_uri(base_uri, "vertices", "AuditLog", "core", "*.parquet")
+def _audit_globs(base_uri: str) -> list[str]:
+    root = audit_root_uri(base_uri)
+    # Partitioned files plus legacy unpartitioned ones, which rollup moves
+    # into their partitions.
+    return [
+        join_uri(root, "date=*", "tenant=*", "*.parquet"),
+        join_uri(root, "*.parquet"),
+    ]
+
+
+def _plan_partition_batches(
+    files: list[_AuditFile],
+    policy: AuditCompactionPolicy,
+) -> list[list[_AuditFile]]:
+    groups: dict[str, list[_AuditFile]] = {}
+    for item in files:
+        groups.setdefault(item.partition, []).append(item)
+    batches: list[list[_AuditFile]] = []
+    for partition in sorted(groups):
+        remaining = policy.max_batches - len(batches)
+        if remaining <= 0:
+            break
+        batches.extend(
+            _plan_batches(groups[partition], replace(policy, max_batches=remaining))
+        )
+    return batches
 
 
 def _plan_batches(
@@ -217,7 +251,7 @@ def compact_audit_logs(
     start_time = time.monotonic()
     run_id = f"audit-compaction-{started.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4()}"
 
-    all_files = _glob_audit_files(_audit_glob(base_uri))
+    all_files = _glob_audit_files(_audit_globs(base_uri))
     now = datetime.now(timezone.utc)
     eligible: list[_AuditFile] = []
     skipped_recent = 0
@@ -231,7 +265,7 @@ def compact_audit_logs(
             continue
         eligible.append(item)
 
-    batches = _plan_batches(eligible, policy)
+    batches = _plan_partition_batches(eligible, policy)
     outputs: list[WriteResult] = []
     removed: list[str] = []
     audit_records: list[CompactionAuditRecord] = []
@@ -253,37 +287,29 @@ def compact_audit_logs(
                     "sha256": "",
                 }
             )
-        dest_uri = vertex_part_uri(base_uri, "AuditLog", "core", str(uuid.uuid4()))
         started_at = datetime.now(timezone.utc).isoformat()
         try:
             if dry_run:
-                result = WriteResult(
-                    uri=dest_uri,
-                    rows=source_rows,
-                    bytes_written=source_bytes,
-                    sha256="",
-                )
+                results = [
+                    WriteResult(
+                        uri=batch[0].uri.rsplit("/", 1)[0],
+                        rows=source_rows,
+                        bytes_written=source_bytes,
+                        sha256="",
+                    )
+                ]
             else:
                 schema = unify_schema(source_uris)
-                tables = iter_tables(source_uris, schema)
-                write_result = write_parquet_tables(
-                    tables=tables,
-                    schema=schema,
-                    dest_uri=dest_uri,
-                )
-                result = WriteResult(
-                    uri=write_result.uri,
-                    rows=write_result.rows,
-                    bytes_written=write_result.bytes_written,
-                    sha256=write_result.sha256,
-                )
+                table = pa.concat_tables(iter_tables(source_uris, schema))
+                # Re-partitioning also sorts by created_at, so row-group
+                # statistics stay tight for time-range scans.
+                results = write_audit_partitions(base_uri, table)
 
-            if strict and result.rows != source_rows:
-                raise ValueError(
-                    f"Audit rows mismatch: {source_rows} -> {result.rows}"
-                )
+            rows_out = sum(result.rows for result in results)
+            if strict and rows_out != source_rows:
+                raise ValueError(f"Audit rows mismatch: {source_rows} -> {rows_out}")
 
-            outputs.append(result)
+            outputs.extend(results)
             if delete_source and not dry_run:
                 for uri in source_uris:
                     fs, path = fsspec.core.url_to_fs(uri)
@@ -304,11 +330,12 @@ def compact_audit_logs(
                             "bytes_written": result.bytes_written,
                             "sha256": result.sha256,
                         }
+                        for result in results
                     ],
                     rows_in=source_rows,
-                    rows_out=result.rows,
+                    rows_out=rows_out,
                     bytes_in=source_bytes,
-                    bytes_out=result.bytes_written,
+                    bytes_out=sum(result.bytes_written for result in results),
                     status="ok",
                     started_at=started_at,
                     completed_at=datetime.now(timezone.utc).isoformat(),
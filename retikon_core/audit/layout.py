@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from urllib.parse import quote, unquote
+
+import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from retikon_core.storage.paths import join_uri, part_filename, vertex_dir
+from retikon_core.storage.writer import StreamingParquetWriter, WriteResult
+
+AUDIT_VERTEX = "AuditLog"
+NO_TENANT = "_none"
+
+_DATE_PREFIX = "date="
+_TENANT_PREFIX = "tenant="
+# part-<min_ms>-<max_ms>-<uuid>.parquet; min/max are created_at epoch millis.
+_STATS_RE = re.compile(r"^part-(\d+)-(\d+)-[0-9a-fA-F-]+\.parquet$")
+
+
+@dataclass(frozen=True)
+class AuditFile:
+    uri: str
+    day: date | None
+    tenant: str | None
+    min_ms: int | None
+    max_ms: int | None
+
+    @property
+    def partition(self) -> tuple[date, str] | None:
+        if self.day is None or self.tenant is None:
+            return None
+        return (self.day, self.tenant)
+
+    def overlaps(self, since: datetime | None, until: datetime | None) -> bool:
+        if self.min_ms is None or self.max_ms is None:
+            return True
+        if since is not None and self.max_ms < _epoch_ms(since):
+            return False
+        if until is not None and self.min_ms > _epoch_ms(until):
+            return False
+        return True
+
+
+def audit_root_uri(base_uri: str) -> str:
+    return join_uri(base_uri, vertex_dir(AUDIT_VERTEX, "core"))
+
+
+def audit_partition_uri(base_uri: str, day: date, tenant: str | None) -> str:
+    return join_uri(
+        audit_root_uri(base_uri),
+        f"{_DATE_PREFIX}{day.isoformat()}",
+        f"{_TENANT_PREFIX}{quote(tenant or NO_TENANT, safe='')}",
+    )
+
+
+def audit_file_uri(
+    base_uri: str,
+    day: date,
+    tenant: str | None,
+    *,
+    min_ms: int,
+    max_ms: int,
+) -> str:
+    part_id = f"{min_ms}-{max_ms}-{uuid.uuid4()}"
+    return join_uri(audit_partition_uri(base_uri, day, tenant), part_filename(part_id))
+
+
+def write_audit_partitions(base_uri: str, table: pa.Table) -> list[WriteResult]:
+    """Write rows into date=/tenant= partitions, one time-sorted file each."""
+    if table.num_rows == 0:
+        return []
+    created = table.column("created_at").cast(pa.timestamp("ms", tz="UTC"))
+    days = pc.strftime(created, format="%Y-%m-%d").to_pylist()
+    tenants = table.column("org_id").to_pylist()
+    groups: dict[tuple[str, str | None], list[int]] = {}
+    for idx, key in enumerate(zip(days, tenants, strict=True)):
+        groups.setdefault(key, []).append(idx)
+
+    results: list[WriteResult] = []
+    for (day, tenant), indices in sorted(
+        groups.items(), key=lambda item: (item[0][0], item[0][1] or "")
+    ):
+        part = table.take(pa.array(indices)) if len(groups) > 1 else table
+        part = part.sort_by([("created_at", "ascending")])
+        stamps = part.column("created_at").cast(pa.timestamp("ms")).cast(pa.int64())
+        dest_uri = audit_file_uri(
+            base_uri,
+            date.fromisoformat(day),
+            tenant,
+            min_ms=int(pc.min(stamps).as_py()),
+            max_ms=int(pc.max(stamps).as_py()),
+        )
+        with StreamingParquetWriter(dest_uri, part.schema) as writer:
+            writer.write_table(part)
+        results.append(writer.close())
+    return results
+
+
+def list_audit_files(
+    base_uri: str,
+    *,
+    org_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> list[AuditFile]:
+    """List audit files that can hold rows for the tenant and time range.
+
+    Only date partitions inside the range are listed, and only the tenant's
+    partition within each date. Files whose names record a min/max
+    created_at outside the range are dropped. Legacy unpartitioned files
+    carry no stats and are always returned.
+    """
+    root = audit_root_uri(base_uri)
+    fs, root_path = fsspec.core.url_to_fs(root)
+    protocol = fs.protocol[0] if isinstance(fs.protocol, tuple) else fs.protocol
+    if not fs.exists(root_path):
+        return []
+
+    first_day = _utc(since).date() if since else None
+    last_day = _utc(until).date() if until else None
+    legacy: list[str] = []
+    partitions: list[tuple[date, str]] = []
+    for entry in fs.ls(root_path, detail=True):
+        name = str(entry["name"]).rstrip("/").rsplit("/", 1)[-1]
+        if entry.get("type") != "directory":
+            if name.endswith(".parquet"):
+                legacy.append(str(entry["name"]))
+            continue
+        if not name.startswith(_DATE_PREFIX):
+            continue
+        try:
+            day = date.fromisoformat(name[len(_DATE_PREFIX) :])
+        except ValueError:
+            continue
+        if first_day is not None and day < first_day:
+            continue
+        if last_day is not None and day > last_day:
+            continue
+        partitions.append((day, str(entry["name"]).rstrip("/")))
+
+    files: list[AuditFile] = [
+        AuditFile(
+            uri=_to_uri(path, protocol),
+            day=None,
+            tenant=None,
+            min_ms=None,
+            max_ms=None,
+        )
+        for path in sorted(legacy)
+    ]
+    for day, day_path in sorted(partitions):
+        if org_id:
+            tenant_dir = f"{_TENANT_PREFIX}{quote(org_id, safe='')}"
+            pattern = f"{day_path}/{tenant_dir}/*.parquet"
+        else:
+            pattern = f"{day_path}/{_TENANT_PREFIX}*/*.parquet"
+        for path in sorted(fs.glob(pattern)):
+            audit_file = _parse_audit_file(_to_uri(path, protocol), day)
+            if audit_file.overlaps(since, until):
+                files.append(audit_file)
+    return files
+
+
+def _parse_audit_file(uri: str, day: date) -> AuditFile:
+    parts = uri.rstrip("/").split("/")
+    filename = parts[-1]
+    tenant_part = parts[-2] if len(parts) > 1 else ""
+    tenant = (
+        unquote(tenant_part[len(_TENANT_PREFIX) :])
+        if tenant_part.startswith(_TENANT_PREFIX)
+        else None
+    )
+    match = _STATS_RE.match(filename)
+    return AuditFile(
+        uri=uri,
+        day=day,
+        tenant=tenant,
+        min_ms=int(match.group(1)) if match else None,
+        max_ms=int(match.group(2)) if match else None,
+    )
+
+
+def _to_uri(path: str, protocol: str | None) -> str:
+    if protocol in {None, "file", "local"}:
+        return path
+    return f"{protocol}://{path}"
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _epoch_ms(value: datetime) -> int:
+    return int(_utc(value).timestamp() * 1000)
@@ -7,10 +7,12 @@ import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 
+import pyarrow as pa
+
+from retikon_core.audit.layout import audit_partition_uri, write_audit_partitions
 from retikon_core.auth.types import AuthContext
-from retikon_core.storage.paths import vertex_part_uri
 from retikon_core.storage.schemas import schema_for
-from retikon_core.storage.writer import WriteResult, write_parquet
+from retikon_core.storage.writer import WriteResult
 from retikon_core.tenancy.types import TenantScope
 
 
@@ -112,10 +114,21 @@ def _batch_flush_seconds() -> float:
 def _write_audit_events(
     base_uri: str,
     events: list[AuditLogRecord],
+    event: AuditLogRecord,
 ) -> WriteResult:
     schema = schema_for("AuditLog", "core")
-    dest_uri = vertex_part_uri(base_uri, "AuditLog", "core", str(uuid.uuid4()))
-    return write_parquet([asdict(event) for event in events], schema, dest_uri)
+    table = pa.Table.from_pylist([asdict(item) for item in events], schema=schema)
+    results = write_audit_partitions(base_uri, table)
+    # A batch can span partitions; report the file holding `event`.
+    partition = audit_partition_uri(
+        base_uri,
+        event.created_at.astimezone(timezone.utc).date(),
+        event.org_id,
+    )
+    for result in results:
+        if result.uri.startswith(f"{partition}/"):
+            return result
+    return results[0]
 
 
 def _flush_audit_buffer(
@@ -124,7 +137,7 @@ def _flush_audit_buffer(
 ) -> WriteResult | None:
     if not buffer:
         return None
-    result = _write_audit_events(base_uri, buffer)
+    result = _write_audit_events(base_uri, buffer, buffer[-1])
     buffer.clear()
     return result
 
@@ -132,7 +145,7 @@ def _flush_audit_buffer(
 def _buffer_audit_log(base_uri: str, event: AuditLogRecord) -> WriteResult:
     batch_size = _batch_size()
     if batch_size <= 1:
-        return _write_audit_events(base_uri, [event])
+        return _write_audit_events(base_uri, [event], event)
 
     now = time.monotonic()
     flush_after = _batch_flush_seconds()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Iterable
@@ -8,6 +7,8 @@ from urllib.parse import urlparse
 
 import fsspec
 
+from retikon_core.storage.manifest_catalog import list_manifests
+
 
 @dataclass(frozen=True)
 class ManifestEntry:
@@ -28,12 +29,6 @@ class GCPlan:
     total_candidates_bytes: int | None
 
 
-def _parse_iso(ts: str) -> datetime:
-    if ts.endswith("Z"):
-        ts = f"{ts[:-1]}+00:00"
-    return datetime.fromisoformat(ts).astimezone(timezone.utc)
-
-
 def _normalize_graph_root(graph_root: str) -> str:
     return graph_root.rstrip("/")
 
@@ -59,44 +54,23 @@ def _path_to_uri(scheme: str, path: str) -> str:
     return f"{scheme}://{path}"
 
 
-def _load_manifest(
-    *,
-    fs: fsspec.AbstractFileSystem,
-    scheme: str,
-    manifest_path: str,
-) -> ManifestEntry | None:
-    try:
-        with fs.open(manifest_path, "r") as handle:
-            payload = json.load(handle)
-    except Exception:
-        return None
-    completed_at_raw = payload.get("completed_at") or payload.get("started_at")
-    if completed_at_raw:
-        completed_at = _parse_iso(completed_at_raw)
-    else:
-        completed_at = datetime.now(timezone.utc)
-    run_id = manifest_path.rstrip("/").split("/")[-2]
-    is_compaction = run_id.startswith("compaction-")
-    files = tuple(item.get("uri") for item in payload.get("files", []) if item.get("uri"))
-    return ManifestEntry(
-        uri=_path_to_uri(scheme, manifest_path),
-        run_id=run_id,
-        completed_at=completed_at,
-        is_compaction=is_compaction,
-        files=files,
-    )
-
-
 def collect_manifests(graph_root: str) -> tuple[ManifestEntry, ...]:
     graph_root = _normalize_graph_root(graph_root)
-    fs, root_path, scheme = _resolve_fs(graph_root)
-    manifest_glob = f"{root_path}/manifests/*/manifest.json"
-    manifest_paths = fs.glob(manifest_glob)
+    _, _, scheme = _resolve_fs(graph_root)
     manifests = []
-    for path in manifest_paths:
-        entry = _load_manifest(fs=fs, scheme=scheme, manifest_path=path)
-        if entry:
-            manifests.append(entry)
+    for record in list_manifests(graph_root):
+        _, manifest_path = fsspec.core.url_to_fs(record.uri)
+        manifests.append(
+            ManifestEntry(
+                uri=_path_to_uri(scheme, manifest_path),
+                run_id=record.run_id,
+                completed_at=record.completed_at,
+                is_compaction=record.is_compaction,
+                files=tuple(
+                    str(item["uri"]) for item in record.files if item.get("uri")
+                ),
+            )
+        )
     manifests.sort(key=lambda entry: entry.completed_at)
     return tuple(manifests)
 
@@ -153,6 +127,9 @@ def build_gc_plan(
     parquet_paths = fs.glob(f"{root_path}/**/*.parquet")
     candidates: list[str] = []
     for path in parquet_paths:
+        # The manifest catalog lives beside the manifests, not in the graph.
+        if path.startswith(f"{root_path}/manifests/"):
+            continue
         if exclude_prefixes and any(
             path.startswith(f"{root_path}/{prefix}") for prefix in exclude_prefixes
         ):
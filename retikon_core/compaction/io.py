@@ -1,45 +1,15 @@
 from __future__ import annotations
 
-import hashlib
-import os
-import shutil
-import tempfile
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Iterable
-from urllib.parse import urlparse
 
 import fsspec
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from retikon_core.storage.writer import StreamingParquetWriter, WriteResult
 
-@dataclass(frozen=True)
-class ParquetWriteResult:
-    uri: str
-    rows: int
-    bytes_written: int
-    sha256: str
-
-
-def _sha256_file(path: str) -> str:
-    digest = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
-def _write_local(src_path: str, dest_path: str) -> None:
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    os.replace(src_path, dest_path)
-
-
-def _write_remote(src_path: str, dest_uri: str) -> None:
-    fs, path = fsspec.core.url_to_fs(dest_uri)
-    fs.makedirs(os.path.dirname(path), exist_ok=True)
-    with fs.open(path, "wb") as handle, open(src_path, "rb") as src:
-        shutil.copyfileobj(src, handle)
+ParquetWriteResult = WriteResult
 
 
 def _open_uri(uri: str):
@@ -101,45 +71,44 @@ def iter_tables(uris: Iterable[str], schema: pa.Schema) -> Iterable[pa.Table]:
                 yield _align_table(table, schema)
 
 
+def read_columns(
+    uris: Iterable[str],
+    schema: pa.Schema,
+    columns: Iterable[str],
+) -> pa.Table:
+    """Read only `columns` from every file, aligned to `schema`, in order."""
+    subset = pa.schema([schema.field(name) for name in columns])
+    tables = []
+    for uri in uris:
+        fs, path = _open_uri(uri)
+        with fs.open(path, "rb") as handle:
+            parquet = pq.ParquetFile(handle)
+            available = set(parquet.schema_arrow.names)
+            present = [name for name in subset.names if name in available]
+            table = parquet.read(columns=present)
+        tables.append(_align_table(table, subset))
+    if not tables:
+        return subset.empty_table()
+    return pa.concat_tables(tables)
+
+
 def write_parquet_tables(
     *,
     tables: Iterable[pa.Table],
     schema: pa.Schema,
     dest_uri: str,
     compression: str = "zstd",
+    row_group_size: int | None = None,
 ) -> ParquetWriteResult:
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-        tmp_path = tmp.name
-
-    rows = 0
-    try:
-        writer = pq.ParquetWriter(tmp_path, schema, compression=compression)
-        try:
-            for table in tables:
-                writer.write_table(table)
-                rows += table.num_rows
-        finally:
-            writer.close()
-
-        bytes_written = os.path.getsize(tmp_path)
-        checksum = _sha256_file(tmp_path)
-        parsed = urlparse(dest_uri)
-        if parsed.scheme == "file":
-            _write_local(tmp_path, parsed.path)
-        elif parsed.scheme and parsed.netloc:
-            _write_remote(tmp_path, dest_uri)
-        else:
-            _write_local(tmp_path, dest_uri)
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-
-    return ParquetWriteResult(
-        uri=dest_uri,
-        rows=rows,
-        bytes_written=bytes_written,
-        sha256=checksum,
-    )
+    with StreamingParquetWriter(
+        dest_uri,
+        schema,
+        compression=compression,
+        row_group_size=row_group_size,
+    ) as writer:
+        for table in tables:
+            writer.write_table(table)
+    return writer.close()
 
 
 def delete_uri(uri: str) -> None:
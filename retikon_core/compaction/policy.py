@@ -12,6 +12,10 @@ class CompactionPolicy:
     target_min_bytes: int = 100 * 1024 * 1024
     target_max_bytes: int = 1024 * 1024 * 1024
     max_groups_per_batch: int = 50
+    target_row_group_rows: int = 0
+    cluster_by: tuple[str, ...] = ()
+    workers: int = 4
+    max_inflight_bytes: int = 2 * 1024 * 1024 * 1024
 
     @classmethod
     def from_env(cls) -> "CompactionPolicy":
@@ -32,6 +36,16 @@ class CompactionPolicy:
                 "COMPACTION_TARGET_MAX_BYTES", 1024 * 1024 * 1024
             ),
             max_groups_per_batch=_env_int("COMPACTION_MAX_GROUPS_PER_BATCH", 50),
+            target_row_group_rows=_env_int("COMPACTION_ROW_GROUP_ROWS", 0),
+            cluster_by=tuple(
+                item.strip()
+                for item in os.getenv("COMPACTION_CLUSTER_BY", "").split(",")
+                if item.strip()
+            ),
+            workers=max(1, _env_int("COMPACTION_WORKERS", 4)),
+            max_inflight_bytes=_env_int(
+                "COMPACTION_MAX_INFLIGHT_BYTES", 2 * 1024 * 1024 * 1024
+            ),
         )
 
     def plan(
@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-import json
 import os
 import time
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, Sequence
 from urllib.parse import urlparse
 
-import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from retikon_core.audit import CompactionAuditRecord, write_compaction_audit_log
 from retikon_core.compaction.io import (
     delete_uri,
     filter_existing_uris,
     iter_tables,
+    read_columns,
     relax_schema,
     unify_schema,
     uri_modified_at,
@@ -25,6 +27,7 @@ from retikon_core.compaction.io import (
 from retikon_core.compaction.policy import CompactionPolicy
 from retikon_core.compaction.types import (
     CompactionBatch,
+    CompactionBatchStats,
     CompactionGroup,
     CompactionOutput,
     CompactionReport,
@@ -34,12 +37,22 @@ from retikon_core.compaction.types import (
 from retikon_core.logging import configure_logging, get_logger
 from retikon_core.retention import RetentionPolicy
 from retikon_core.storage import build_manifest, manifest_uri, write_manifest
+from retikon_core.storage.manifest_catalog import (
+    COMPACTION_WATERMARK,
+    COMPACTION_WATERMARK_KEY,
+    CatalogWatermark,
+    ManifestRecord,
+    catalog_enabled,
+    consolidate_manifest_catalog,
+    list_manifests,
+    list_uncompacted_manifests,
+    write_watermark,
+)
 from retikon_core.storage.paths import (
     GraphPaths,
     backend_scheme,
     graph_root,
     has_uri_scheme,
-    join_uri,
     normalize_bucket_uri,
 )
 from retikon_core.storage.writer import WriteResult
@@ -56,33 +69,6 @@ class CompactionResult:
     counts: dict[str, int]
 
 
-def _glob_files(pattern: str) -> list[str]:
-    fs, path = fsspec.core.url_to_fs(pattern)
-    matches = sorted(fs.glob(path))
-    protocol = fs.protocol[0] if isinstance(fs.protocol, tuple) else fs.protocol
-    if protocol in {"file", "local"}:
-        return matches
-    return [f"{protocol}://{match}" for match in matches]
-
-
-def _read_manifest(uri: str) -> dict[str, object]:
-    fs, path = fsspec.core.url_to_fs(uri)
-    with fs.open(path, "rb") as handle:
-        payload = json.load(handle)
-    return payload if isinstance(payload, dict) else {}
-
-
-def _run_id_from_manifest_uri(uri: str) -> str:
-    parsed = urlparse(uri)
-    path = parsed.path if parsed.scheme else uri
-    parts = path.strip("/").split("/")
-    if "manifests" in parts:
-        idx = parts.index("manifests")
-        if len(parts) > idx + 1:
-            return parts[idx + 1]
-    return "unknown"
-
-
 def _parse_graph_uri(uri: str) -> tuple[bool, str, str] | None:
     parsed = urlparse(uri)
     path = parsed.path if parsed.scheme else uri
@@ -98,45 +84,35 @@ def _parse_graph_uri(uri: str) -> tuple[bool, str, str] | None:
     return None
 
 
-def load_manifests(base_uri: str) -> list[ManifestInfo]:
-    manifest_glob = join_uri(base_uri, "manifests", "*", "manifest.json")
-    manifest_uris = _glob_files(manifest_glob)
+def load_manifests(
+    base_uri: str,
+    *,
+    records: Iterable[ManifestRecord] | None = None,
+) -> list[ManifestInfo]:
     manifests: list[ManifestInfo] = []
-    for manifest_path in manifest_uris:
-        data = _read_manifest(manifest_path)
+    for record in list_manifests(base_uri) if records is None else records:
         files: list[ManifestFile] = []
-        files_raw = data.get("files")
-        if isinstance(files_raw, list):
-            for item in files_raw:
-                if not isinstance(item, dict):
-                    continue
-                uri = item.get("uri")
-                if not uri:
-                    continue
-                files.append(
-                    ManifestFile(
-                        uri=str(uri),
-                        rows=int(item.get("rows", 0)),
-                        bytes_written=int(item.get("bytes_written", 0)),
-                        sha256=str(item.get("sha256", "")),
-                    )
+        for item in record.files:
+            uri = item.get("uri")
+            if not uri:
+                continue
+            files.append(
+                ManifestFile(
+                    uri=str(uri),
+                    rows=int(item.get("rows") or 0),
+                    bytes_written=int(item.get("bytes_written") or 0),
+                    sha256=str(item.get("sha256") or ""),
                 )
-        counts_raw = data.get("counts")
-        counts: dict[str, int] = {}
-        if isinstance(counts_raw, dict):
-            for key, value in counts_raw.items():
-                try:
-                    counts[str(key)] = int(value)
-                except (TypeError, ValueError):
-                    continue
+            )
         manifests.append(
             ManifestInfo(
-                uri=manifest_path,
-                run_id=_run_id_from_manifest_uri(manifest_path),
-                pipeline_version=str(data.get("pipeline_version") or ""),
-                schema_version=str(data.get("schema_version") or ""),
-                counts=counts,
+                uri=record.uri,
+                run_id=record.run_id,
+                pipeline_version=record.pipeline_version,
+                schema_version=record.schema_version,
+                counts=dict(record.counts),
                 files=files,
+                seq=record.seq,
             )
         )
     return manifests
@@ -182,6 +158,129 @@ def _expected_kinds(groups: Iterable[CompactionGroup]) -> list[str]:
     return sorted(kinds)
 
 
+_BatchResult = tuple[
+    list[CompactionOutput],
+    list[str],
+    list[CompactionAuditRecord],
+    CompactionBatchStats,
+]
+
+
+_ClusterWindow = tuple[tuple[CompactionGroup, ...], pa.Array]
+
+
+def _cluster_windows(
+    groups: Sequence[CompactionGroup],
+    max_bytes: int,
+) -> list[tuple[CompactionGroup, ...]]:
+    """Split groups into consecutive runs of at most `max_bytes` per file kind.
+
+    A group larger than `max_bytes` forms a window of its own; `max_bytes <= 0`
+    keeps the whole batch in a single window.
+    """
+    if max_bytes <= 0:
+        return [tuple(groups)]
+    windows: list[tuple[CompactionGroup, ...]] = []
+    current: list[CompactionGroup] = []
+    running: dict[str, int] = defaultdict(int)
+    for group in groups:
+        group_bytes = group.bytes_by_kind()
+        projected = max(
+            (running[kind] + value for kind, value in group_bytes.items()),
+            default=0,
+        )
+        if current and projected > max_bytes:
+            windows.append(tuple(current))
+            current = []
+            running = defaultdict(int)
+        current.append(group)
+        for kind, value in group_bytes.items():
+            running[kind] += value
+    if current:
+        windows.append(tuple(current))
+    return windows
+
+
+def _cluster_order(
+    *,
+    batch: CompactionBatch,
+    cluster_by: Sequence[str],
+    skip_missing: bool,
+    window_bytes: int = 0,
+) -> tuple[list[_ClusterWindow], tuple[str, ...]]:
+    """Compute a sort order for each bounded window of the batch's groups.
+
+    Sort keys are only ever materialized for one window (at most
+    `window_bytes` of source data per file kind) at a time, so clustering
+    stays within the same memory budget as the rest of the batch. Rows are
+    sorted within each window rather than across the whole batch; only the
+    int64 take indices are kept for every window.
+    """
+    # GraphAr file kinds of one entity are row-aligned, so the sort order is
+    # computed once from the anchor file and applied to every kind.
+    anchor = "adj_list" if batch.is_edge else "core"
+    if anchor not in batch.file_kinds:
+        return [], ()
+    uris = [group.files[anchor].uri for group in batch.groups]
+    if skip_missing:
+        uris, _ = filter_existing_uris(uris)
+    if len(uris) < 2:
+        return [], ()
+    schema = unify_schema(uris)
+    keys = tuple(name for name in cluster_by if name in schema.names)
+    if not keys:
+        return [], ()
+    existing = set(uris)
+    windows: list[_ClusterWindow] = []
+    for groups in _cluster_windows(batch.groups, window_bytes):
+        window_uris = [
+            group.files[anchor].uri
+            for group in groups
+            if group.files[anchor].uri in existing
+        ]
+        table = read_columns(window_uris, schema, keys)
+        order = pc.sort_indices(
+            table,
+            sort_keys=[(name, "ascending") for name in keys],
+            null_placement="at_end",
+        )
+        windows.append((groups, order))
+    return windows, keys
+
+
+def _iter_clustered_tables(
+    *,
+    windows: Sequence[_ClusterWindow],
+    file_kind: str,
+    source_uris: Sequence[str],
+    schema: pa.Schema,
+    run_id: str,
+    entity_type: str,
+) -> Iterator[pa.Table]:
+    existing = set(source_uris)
+    for groups, order in windows:
+        uris = [
+            group.files[file_kind].uri
+            for group in groups
+            if group.files[file_kind].uri in existing
+        ]
+        if not uris:
+            continue
+        merged = pa.concat_tables(list(iter_tables(uris, schema)))
+        if merged.num_rows == len(order):
+            yield merged.take(order)
+            continue
+        logger.warning(
+            "Skipping clustering for misaligned file kind",
+            extra={
+                "run_id": run_id,
+                "entity": entity_type,
+                "file_kind": file_kind,
+            },
+        )
+        yield merged
+
+
 def _compact_batch(
     *,
     batch: CompactionBatch,
@@ -194,11 +293,24 @@ def _compact_batch(
     strict: bool,
     skip_missing: bool,
     relax_nulls: bool,
-) -> tuple[list[CompactionOutput], list[str], list[CompactionAuditRecord]]:
+    cluster_by: Sequence[str] = (),
+    row_group_rows: int | None = None,
+    cluster_window_bytes: int = 0,
+) -> _BatchResult:
     outputs: list[CompactionOutput] = []
     removed: list[str] = []
     audit_records: list[CompactionAuditRecord] = []
     paths = GraphPaths(base_uri=base_uri)
+    start_time = time.monotonic()
+    windows: list[_ClusterWindow] = []
+    clustered_by: tuple[str, ...] = ()
+    if cluster_by and not dry_run:
+        windows, clustered_by = _cluster_order(
+            batch=batch,
+            cluster_by=cluster_by,
+            skip_missing=skip_missing,
+            window_bytes=cluster_window_bytes,
+        )
 
     for file_kind in batch.file_kinds:
         source_files = [group.files[file_kind] for group in batch.groups]
@@ -269,11 +381,21 @@ def _compact_batch(
             schema = unify_schema(source_uris)
             if relax_nulls:
                 schema = relax_schema(schema)
-            tables = iter_tables(source_uris, schema)
+            tables: Iterable[pa.Table] = iter_tables(source_uris, schema)
+            if windows:
+                tables = _iter_clustered_tables(
+                    windows=windows,
+                    file_kind=file_kind,
+                    source_uris=source_uris,
+                    schema=schema,
+                    run_id=run_id,
+                    entity_type=batch.entity_type,
+                )
             write_result = write_parquet_tables(
                 tables=tables,
                 schema=schema,
                 dest_uri=dest_uri,
+                row_group_size=row_group_rows,
             )
             result = WriteResult(
                 uri=write_result.uri,
@@ -336,7 +458,64 @@ def _compact_batch(
             )
         )
 
-    return outputs, removed, audit_records
+    duration = time.monotonic() - start_time
+    rows = sum(output.result.rows for output in outputs)
+    bytes_in = sum(batch.bytes_by_kind().values())
+    bytes_out = sum(output.result.bytes_written for output in outputs)
+    stats = CompactionBatchStats(
+        entity_type=batch.entity_type,
+        is_edge=batch.is_edge,
+        groups=len(batch.groups),
+        rows=rows,
+        bytes_in=bytes_in,
+        bytes_out=bytes_out,
+        duration_seconds=duration,
+        rows_per_second=rows / duration if duration > 0 else 0.0,
+        bytes_per_second=bytes_in / duration if duration > 0 else 0.0,
+        clustered_by=clustered_by,
+    )
+    return outputs, removed, audit_records, stats
+
+
+def _run_batches(
+    batches: Sequence[CompactionBatch],
+    *,
+    compact: Callable[[CompactionBatch], _BatchResult],
+    workers: int,
+    max_inflight_bytes: int,
+) -> list[_BatchResult]:
+    """Run batches on a thread pool, preserving plan order in the results.
+
+    Memory is bounded by admitting a batch only while the summed source bytes
+    of in-flight batches stay under `max_inflight_bytes` (one batch is always
+    admitted so oversized batches still run, alone).
+    """
+    if workers <= 1 or len(batches) <= 1:
+        return [compact(batch) for batch in batches]
+    results: list[_BatchResult | None] = [None] * len(batches)
+    pending = deque(enumerate(batches))
+    inflight: dict[Future[_BatchResult], tuple[int, int]] = {}
+    inflight_bytes = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending or inflight:
+            while pending and len(inflight) < workers:
+                idx, batch = pending[0]
+                weight = max(batch.bytes_by_kind().values(), default=0)
+                if (
+                    inflight
+                    and max_inflight_bytes > 0
+                    and inflight_bytes + weight > max_inflight_bytes
+                ):
+                    break
+                pending.popleft()
+                inflight[executor.submit(compact, batch)] = (idx, weight)
+                inflight_bytes += weight
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, weight = inflight.pop(future)
+                inflight_bytes -= weight
+                results[idx] = future.result()
+    return [item for item in results if item is not None]
 
 
 def _schema_version_for(groups: Iterable[CompactionGroup]) -> str:
@@ -348,6 +527,33 @@ def _schema_version_for(groups: Iterable[CompactionGroup]) -> str:
     return "mixed"
 
 
+def _compaction_watermark(
+    manifests: Sequence[ManifestInfo],
+    groups: Iterable[CompactionGroup],
+    planned: Iterable[CompactionBatch],
+) -> CatalogWatermark | None:
+    """Cover the sequenced inputs, keeping runs with skipped groups pending."""
+    seqs = [item.seq for item in manifests if item.seq is not None]
+    if not seqs:
+        return None
+    compacted = {
+        (group.entity_type, group.is_edge, group.run_id)
+        for batch in planned
+        for group in batch.groups
+    }
+    pending = {
+        group.run_id
+        for group in groups
+        if (group.entity_type, group.is_edge, group.run_id) not in compacted
+    }
+    if pending:
+        logger.warning(
+            "Compaction left runs pending",
+            extra={"run_ids": sorted(pending)},
+        )
+    return CatalogWatermark(seq=max(seqs), pending=tuple(sorted(pending)))
+
+
 def run_compaction(
     *,
     base_uri: str,
@@ -378,7 +584,23 @@ def run_compaction(
     start_time = time.monotonic()
     run_id = f"compaction-{started.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4()}"
 
-    manifests = load_manifests(base_uri)
+    # Runs the watermark covers were inputs to an earlier compaction, whose
+    # own manifest carries their rows forward.
+    use_watermark = os.getenv("COMPACTION_WATERMARK_ENABLED", "1") == "1"
+    records = None
+    if use_watermark:
+        if catalog_enabled() and not dry_run:
+            # Sequence pending appends so every input can be covered.
+            consolidate_manifest_catalog(base_uri)
+        records = list_uncompacted_manifests(base_uri)
+    if records is None:
+        records = list_manifests(base_uri)
+    sequenced = use_watermark and any(record.seq is not None for record in records)
+    if sequenced:
+        # Unsequenced runs are left for the next compaction; the watermark
+        # could not cover them.
+        records = [record for record in records if record.seq is not None]
+    manifests = load_manifests(base_uri, records=records)
     if not manifests:
         completed = datetime.now(timezone.utc)
         return CompactionReport(
@@ -398,10 +620,10 @@ def run_compaction(
     for group in groups:
         grouped[(group.entity_type, group.is_edge)].append(group)
 
-    outputs: list[CompactionOutput] = []
-    removed_sources: list[str] = []
-    audit_records: list[CompactionAuditRecord] = []
-    counts: dict[str, int] = defaultdict(int)
+    planned: list[CompactionBatch] = []
+    entity_batches: dict[str, tuple[int, str]] = {}
+    candidates: list[tuple[str, list[str], list[CompactionGroup]]] = []
+    held_runs: set[str] = set()
 
     for (entity_type, is_edge), entity_groups in grouped.items():
         kinds = _expected_kinds(entity_groups)
@@ -412,50 +634,108 @@ def run_compaction(
                 "Skipping compaction with no core file",
                 extra={"entity": entity_type},
             )
+            held_runs.update(group.run_id for group in entity_groups)
             continue
         eligible = [
             group for group in entity_groups if set(kinds).issubset(group.file_kinds())
         ]
+        held_runs.update(
+            group.run_id
+            for group in entity_groups
+            if not set(kinds).issubset(group.file_kinds())
+        )
         if not eligible:
             logger.warning(
                 "No eligible groups for compaction",
                 extra={"entity": entity_type, "kinds": kinds},
             )
             continue
+        candidates.append((entity_type, kinds, eligible))
+
+    if sequenced and held_runs:
+        # A run is compacted whole or not at all, so the watermark can leave
+        # it pending without its other groups being merged twice.
+        logger.warning(
+            "Holding back runs with ineligible groups",
+            extra={"run_ids": sorted(held_runs)},
+        )
+        candidates = [
+            (
+                entity_type,
+                kinds,
+                [group for group in eligible if group.run_id not in held_runs],
+            )
+            for entity_type, kinds, eligible in candidates
+        ]
 
+    for entity_type, kinds, eligible in candidates:
+        if not eligible:
+            continue
         eligible.sort(key=lambda item: item.run_id)
         batches = policy.plan(groups=eligible, file_kinds=kinds)
-        schema_version = _schema_version_for(eligible)
+        planned.extend(batches)
+        entity_batches[entity_type] = (len(batches), _schema_version_for(eligible))
+
+    # Each worker's share of the in-flight budget bounds how much of a batch
+    # is materialized at once for clustering.
+    cluster_window_bytes = (
+        policy.max_inflight_bytes // policy.workers
+        if policy.max_inflight_bytes > 0
+        else 0
+    )
 
-        for batch in batches:
-            batch_outputs, removed, batch_audit = _compact_batch(
-                batch=batch,
-                base_uri=base_uri,
-                run_id=run_id,
-                delete_source=delete_source,
-                retention_policy=retention_policy,
-                retention_apply=retention_apply,
-                dry_run=dry_run,
-                strict=strict,
-                skip_missing=skip_missing,
-                relax_nulls=relax_nulls,
-            )
-            outputs.extend(batch_outputs)
-            removed_sources.extend(removed)
-            audit_records.extend(batch_audit)
+    def _compact(batch: CompactionBatch) -> _BatchResult:
+        return _compact_batch(
+            batch=batch,
+            base_uri=base_uri,
+            run_id=run_id,
+            delete_source=delete_source,
+            retention_policy=retention_policy,
+            retention_apply=retention_apply,
+            dry_run=dry_run,
+            strict=strict,
+            skip_missing=skip_missing,
+            relax_nulls=relax_nulls,
+            cluster_by=policy.cluster_by,
+            row_group_rows=policy.target_row_group_rows or None,
+            cluster_window_bytes=cluster_window_bytes,
+        )
 
-            rows_by_kind = batch.rows_by_kind()
-            if is_edge:
-                counts[entity_type] += rows_by_kind.get("adj_list", 0)
-            else:
-                counts[entity_type] += rows_by_kind.get("core", 0)
+    results = _run_batches(
+        planned,
+        compact=_compact,
+        workers=policy.workers,
+        max_inflight_bytes=policy.max_inflight_bytes,
+    )
 
+    outputs: list[CompactionOutput] = []
+    removed_sources: list[str] = []
+    audit_records: list[CompactionAuditRecord] = []
+    batch_stats: list[CompactionBatchStats] = []
+    counts: dict[str, int] = defaultdict(int)
+
+    for batch, (batch_outputs, removed, batch_audit, stats) in zip(
+        planned, results, strict=True
+    ):
+        outputs.extend(batch_outputs)
+        removed_sources.extend(removed)
+        audit_records.extend(batch_audit)
+        batch_stats.append(stats)
+
+        rows_by_kind = batch.rows_by_kind()
+        if batch.is_edge:
+            counts[batch.entity_type] += rows_by_kind.get("adj_list", 0)
+        else:
+            counts[batch.entity_type] += rows_by_kind.get("core", 0)
+
+    for entity_type, (batch_count, schema_version) in entity_batches.items():
         logger.info(
             "Compaction batches complete",
             extra={
                 "entity": entity_type,
-                "batches": len(batches),
+                "batches": batch_count,
                 "schema_version": schema_version,
+                "workers": policy.workers,
             },
         )
 
@@ -473,8 +753,20 @@ def run_compaction(
             started_at=started,
             completed_at=completed,
         )
+        watermark = (
+            _compaction_watermark(manifests, groups, planned)
+            if use_watermark
+            else None
+        )
+        if watermark is not None:
+            manifest[COMPACTION_WATERMARK_KEY] = watermark.to_payload()
         manifest_path = manifest_uri(base_uri, run_id)
         write_manifest(manifest, manifest_path)
+        if watermark is not None:
+            write_watermark(base_uri, COMPACTION_WATERMARK, watermark)
+
+    if catalog_enabled() and not dry_run:
+        consolidate_manifest_catalog(base_uri)
 
     if audit_records:
         audit_uri = write_compaction_audit_log(
@@ -493,6 +785,7 @@ def run_compaction(
         started_at=started.isoformat(),
         completed_at=completed.isoformat(),
         duration_seconds=duration,
+        batches=tuple(batch_stats),
     )
 
 
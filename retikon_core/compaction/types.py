@@ -22,6 +22,7 @@ class ManifestInfo:
     schema_version: str
     counts: dict[str, int]
     files: list[ManifestFile]
+    seq: int | None = None
 
 
 @dataclass(frozen=True)
@@ -75,6 +76,20 @@ class CompactionOutput:
     result: WriteResult
 
 
+@dataclass(frozen=True)
+class CompactionBatchStats:
+    entity_type: str
+    is_edge: bool
+    groups: int
+    rows: int
+    bytes_in: int
+    bytes_out: int
+    duration_seconds: float
+    rows_per_second: float
+    bytes_per_second: float
+    clustered_by: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True)
 class CompactionReport:
     run_id: str
@@ -86,3 +101,4 @@ class CompactionReport:
     started_at: str
     completed_at: str
     duration_seconds: float
+    batches: tuple[CompactionBatchStats, ...] = ()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
 import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, BinaryIO, Callable, Protocol
+
+_CHUNK_BYTES = 1024 * 1024
+
+
+class ByteSource(Protocol):
+    def read(self, size: int, /) -> bytes: ...
 
 
 @dataclass(frozen=True)
@@ -16,10 +24,14 @@ class BufferItem:
     size_bytes: int
     payload_path: str
     metadata: dict[str, Any]
+    sha256: str | None = None
 
     def read_bytes(self) -> bytes:
         return Path(self.payload_path).read_bytes()
 
+    def open(self) -> BinaryIO:
+        return open(self.payload_path, "rb")
+
 
 @dataclass(frozen=True)
 class BufferStats:
@@ -47,16 +59,21 @@ class EdgeBuffer:
         self.meta_dir.mkdir(parents=True, exist_ok=True)
 
     def add_bytes(self, payload: bytes, metadata: dict[str, Any]) -> BufferItem:
+        return self.add_stream(io.BytesIO(payload), metadata)
+
+    def add_stream(self, source: ByteSource, metadata: dict[str, Any]) -> BufferItem:
+        """Copy ``source`` into the buffer in chunks, hashing it on the way."""
         item_id = str(uuid.uuid4())
         created_at = self._now()
         payload_path = self.payload_dir / f"{item_id}.bin"
         meta_path = self.meta_dir / f"{item_id}.json"
 
-        _atomic_write_bytes(payload_path, payload)
+        size_bytes, sha256 = _atomic_write_stream(payload_path, source)
         meta_payload = {
             "item_id": item_id,
             "created_at": created_at,
-            "size_bytes": len(payload),
+            "size_bytes": size_bytes,
+            "sha256": sha256,
             "payload_path": str(payload_path),
             "metadata": metadata,
         }
@@ -66,9 +83,10 @@ class EdgeBuffer:
         return BufferItem(
             item_id=item_id,
             created_at=created_at,
-            size_bytes=len(payload),
+            size_bytes=size_bytes,
             payload_path=str(payload_path),
             metadata=metadata,
+            sha256=sha256,
         )
 
     def list_items(self) -> list[BufferItem]:
@@ -87,6 +105,7 @@ class EdgeBuffer:
                         size_bytes=int(data["size_bytes"]),
                         payload_path=str(payload_path),
                         metadata=dict(data.get("metadata", {})),
+                        sha256=data.get("sha256"),
                     )
                 )
             except (ValueError, KeyError):
@@ -158,11 +177,22 @@ class EdgeBuffer:
         meta_path.unlink(missing_ok=True)
 
 
-def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+def _atomic_write_stream(path: Path, source: ByteSource) -> tuple[int, str]:
     tmp_path = path.with_suffix(".tmp")
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path.write_bytes(payload)
+    digest = hashlib.sha256()
+    size_bytes = 0
+    try:
+        with open(tmp_path, "wb") as handle:
+            for chunk in iter(lambda: source.read(_CHUNK_BYTES), b""):
+                digest.update(chunk)
+                handle.write(chunk)
+                size_bytes += len(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     os.replace(tmp_path, path)
+    return size_bytes, digest.hexdigest()
 
 
 def _atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
@@ -11,6 +11,7 @@ class AdaptiveBatchPolicy:
     high_watermark: int = 100
     min_delay_ms: int = 0
     max_delay_ms: int = 2000
+    target_latency_ms: int | None = None
 
     def tune(
         self,
@@ -36,6 +37,10 @@ class AdaptiveBatchPolicy:
 
         if avg_latency_ms:
             delay = min(self.max_delay_ms, delay + int(avg_latency_ms * 0.25))
+            if self.target_latency_ms and avg_latency_ms > self.target_latency_ms:
+                # Downstream is slower than the target; smaller batches keep
+                # each flush within budget while the backlog drains.
+                batch = int(batch * self.target_latency_ms / avg_latency_ms)
 
         batch = max(self.min_batch, min(self.max_batch, batch))
         delay = max(self.min_delay_ms, min(self.max_delay_ms, delay))
@@ -1,7 +1,9 @@
 from retikon_core.embeddings.rerank_backend import (
     get_reranker,
     normalize_rerank_scores,
+    reset_rerank_score_cache,
     reset_reranker_cache,
+    score_with_cache,
 )
 from retikon_core.embeddings.stub import (
     StubAudioEmbedder,
@@ -37,5 +39,7 @@ __all__ = [
     "get_text_embedder",
     "normalize_rerank_scores",
     "reset_embedding_cache",
+    "reset_rerank_score_cache",
     "reset_reranker_cache",
+    "score_with_cache",
 ]
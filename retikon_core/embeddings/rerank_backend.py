@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import math
 import os
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Protocol, Sequence
@@ -53,6 +56,24 @@ def _doc_max_tokens() -> int:
     return max(1, value)
 
 
+def _max_batch_tokens() -> int:
+    raw = os.getenv("RERANK_MAX_BATCH_TOKENS", "2048")
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 2048
+    return max(1, value)
+
+
+def _score_cache_size() -> int:
+    raw = os.getenv("RERANK_SCORE_CACHE_SIZE", "10000")
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 10000
+    return max(0, value)
+
+
 def _model_name() -> str:
     return os.getenv("RERANK_MODEL_NAME", "cross-encoder/ms-marco-MiniLM-L-6-v2")
 
@@ -83,6 +104,49 @@ def _truncate_tokens(text: str, limit: int) -> str:
     return " ".join(parts[:limit])
 
 
+def length_bucketed_batches(
+    lengths: Sequence[int],
+    *,
+    batch_size: int,
+    max_batch_tokens: int,
+) -> list[list[int]]:
+    """Group indices of similar length so each batch pads to its own longest.
+
+    A batch closes at `batch_size` pairs or once padding every pair to the
+    batch's longest entry would exceed `max_batch_tokens`.
+    """
+    order = sorted(range(len(lengths)), key=lambda idx: lengths[idx])
+    batches: list[list[int]] = []
+    current: list[int] = []
+    for idx in order:
+        longest = max(lengths[idx], 1)
+        if current and (
+            len(current) >= batch_size
+            or (len(current) + 1) * longest > max_batch_tokens
+        ):
+            batches.append(current)
+            current = []
+        current.append(idx)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _pair_batches(
+    query: str,
+    documents: Sequence[str],
+) -> tuple[str, list[str], list[list[int]]]:
+    query_text = _truncate_tokens(query, _query_max_tokens())
+    query_len = len(query_text.split())
+    truncated_docs = [_truncate_tokens(text, _doc_max_tokens()) for text in documents]
+    batches = length_bucketed_batches(
+        [query_len + len(text.split()) for text in truncated_docs],
+        batch_size=_batch_size(),
+        max_batch_tokens=_max_batch_tokens(),
+    )
+    return query_text, truncated_docs, batches
+
+
 def _stub_overlap_score(query: str, document: str) -> float:
     q = _tokenize_words(query)
     d = _tokenize_words(document)
@@ -120,17 +184,17 @@ class HfReranker:
     def score(self, query: str, documents: Sequence[str]) -> list[float]:
         if not documents:
             return []
-        query_text = _truncate_tokens(query, _query_max_tokens())
-        pairs = [
-            (query_text, _truncate_tokens(text, _doc_max_tokens()))
-            for text in documents
-        ]
-        values = self._model.predict(
-            pairs,
-            batch_size=_batch_size(),
-            show_progress_bar=False,
-        )
-        return [float(value) for value in values]
+        query_text, truncated_docs, batches = _pair_batches(query, documents)
+        scores = [0.0] * len(documents)
+        for batch in batches:
+            values = self._model.predict(
+                [(query_text, truncated_docs[idx]) for idx in batch],
+                batch_size=len(batch),
+                show_progress_bar=False,
+            )
+            for idx, value in zip(batch, values, strict=False):
+                scores[idx] = float(value)
+        return scores
 
 
 class OnnxReranker:
@@ -154,19 +218,13 @@ class OnnxReranker:
         if not documents:
             return []
 
-        query_text = _truncate_tokens(query, _query_max_tokens())
-        truncated_docs = [
-            _truncate_tokens(text, _doc_max_tokens())
-            for text in documents
-        ]
-        scores: list[float] = []
-        batch_size = _batch_size()
+        query_text, truncated_docs, batches = _pair_batches(query, documents)
+        scores = [0.0] * len(documents)
         max_length = _query_max_tokens() + _doc_max_tokens()
-        for start in range(0, len(truncated_docs), batch_size):
-            batch = truncated_docs[start : start + batch_size]
+        for batch in batches:
             encoded = self._tokenizer(
                 [query_text] * len(batch),
-                list(batch),
+                [truncated_docs[idx] for idx in batch],
                 truncation=True,
                 max_length=max_length,
                 padding=True,
@@ -179,10 +237,9 @@ class OnnxReranker:
             }
             outputs = self._session.run(None, inputs)
             if not outputs:
-                scores.extend([0.0] * len(batch))
                 continue
             logits = outputs[0]
-            for row in logits:
+            for idx, row in zip(batch, logits, strict=False):
                 if isinstance(row, (list, tuple)):
                     if len(row) == 0:
                         score = 0.0
@@ -195,7 +252,7 @@ class OnnxReranker:
                         score = float(row)
                     except (TypeError, ValueError):
                         score = 0.0
-                scores.append(score)
+                scores[idx] = score
         return scores
 
 
@@ -239,6 +296,111 @@ def reset_reranker_cache() -> None:
     _RERANKER_KEY = None
 
 
+def normalize_rerank_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class RerankScoreCache:
+    """Process-wide LRU of raw cross-encoder scores.
+
+    Keys carry the snapshot marker, so a snapshot reload retires old entries
+    naturally as they age out.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, ...], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, ...]) -> float | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, ...], value: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SCORE_CACHE: RerankScoreCache | None = None
+
+
+def get_rerank_score_cache() -> RerankScoreCache:
+    global _SCORE_CACHE
+    size = _score_cache_size()
+    if _SCORE_CACHE is None or _SCORE_CACHE.max_entries != size:
+        _SCORE_CACHE = RerankScoreCache(size)
+    return _SCORE_CACHE
+
+
+def reset_rerank_score_cache() -> None:
+    global _SCORE_CACHE
+    _SCORE_CACHE = None
+
+
+def _score_cache_key(
+    reranker: Reranker,
+    *,
+    query: str,
+    doc_id: str,
+    document: str,
+    snapshot_marker: str,
+) -> tuple[str, ...]:
+    model = getattr(reranker, "model_name", type(reranker).__name__)
+    backend = getattr(reranker, "backend", "")
+    digest = hashlib.sha1(document.encode("utf-8")).hexdigest()
+    return (model, backend, snapshot_marker, query, doc_id, digest)
+
+
+def score_with_cache(
+    reranker: Reranker,
+    *,
+    query: str,
+    doc_ids: Sequence[str],
+    documents: Sequence[str],
+    snapshot_marker: str | None,
+) -> tuple[list[float], int]:
+    """Score documents, serving repeats from the score cache.
+
+    Returns raw scores in input order and the number of cache hits. Without a
+    snapshot marker nothing is cached, since scores cannot be tied to a
+    snapshot.
+    """
+    if snapshot_marker is None or _score_cache_size() <= 0:
+        return list(reranker.score(query, documents)), 0
+    cache = get_rerank_score_cache()
+    normalized = normalize_rerank_query(query)
+    keys = [
+        _score_cache_key(
+            reranker,
+            query=normalized,
+            doc_id=doc_id,
+            document=document,
+            snapshot_marker=snapshot_marker,
+        )
+        for doc_id, document in zip(doc_ids, documents, strict=True)
+    ]
+    scores: list[float | None] = [cache.get(key) for key in keys]
+    missing = [idx for idx, value in enumerate(scores) if value is None]
+    if missing:
+        fresh = reranker.score(query, [documents[idx] for idx in missing])
+        for idx, value in zip(missing, fresh, strict=False):
+            scores[idx] = float(value)
+            cache.put(keys[idx], float(value))
+    hits = len(documents) - len(missing)
+    return [float(value or 0.0) for value in scores], hits
+
+
 def normalize_rerank_scores(scores: Sequence[float]) -> list[float]:
     if not scores:
         return []
@@ -1,17 +1,27 @@
 from retikon_core.ingestion.idempotency import (
+    DedupeRecord,
     IdempotencyDecision,
+    InMemoryDedupeIndex,
     InMemoryIdempotency,
     build_doc_id,
+    dedupe_index_from_env,
+)
+from retikon_core.ingestion.idempotency_sqlite import (
+    SqliteDedupeIndex,
+    SqliteIdempotency,
 )
-from retikon_core.ingestion.idempotency_sqlite import SqliteIdempotency
 from retikon_core.ingestion.router import process_event
 from retikon_core.ingestion.storage_event import StorageEvent
 
 __all__ = [
     "StorageEvent",
+    "DedupeRecord",
     "IdempotencyDecision",
+    "InMemoryDedupeIndex",
     "InMemoryIdempotency",
+    "SqliteDedupeIndex",
     "SqliteIdempotency",
     "build_doc_id",
+    "dedupe_index_from_env",
     "process_event",
 ]
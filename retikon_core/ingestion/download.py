@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import os
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,6 +13,8 @@ import fsspec
 
 from retikon_core.errors import PermanentError, RecoverableError
 
+_STREAM_CHUNK_BYTES = 8 * 1024 * 1024
+
 
 @dataclass(frozen=True)
 class DownloadResult:
@@ -54,33 +59,71 @@ def _extract_metadata(
     )
 
 
+class _RangesUnsupported(Exception):
+    pass
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
 def download_to_tmp(
     uri: str,
     max_bytes: int,
+    *,
+    concurrency: int | None = None,
+    part_bytes: int | None = None,
+    min_parallel_bytes: int | None = None,
 ) -> DownloadResult:
+    """Download ``uri`` to a temp file, hashing it and enforcing ``max_bytes``.
+
+    Objects of known size at or above ``min_parallel_bytes`` are fetched as
+    concurrent byte ranges written into a preallocated file. Smaller objects,
+    objects without a size, and backends that ignore range requests are
+    streamed sequentially.
+    """
     fs, path = fsspec.core.url_to_fs(uri)
     info = _info_for_uri(fs, path)
     content_type, md5_hash, crc32c, metadata, size_hint = _extract_metadata(info)
     if size_hint is not None and size_hint > max_bytes:
         raise PermanentError(f"Object too large: {size_hint} bytes")
 
+    workers = (
+        concurrency
+        if concurrency is not None
+        else _env_int("DOWNLOAD_CONCURRENCY", 8)
+    )
+    part = part_bytes or _env_int("DOWNLOAD_PART_BYTES", 16 * 1024 * 1024)
+    threshold = (
+        min_parallel_bytes
+        if min_parallel_bytes is not None
+        else _env_int("DOWNLOAD_PARALLEL_MIN_BYTES", 64 * 1024 * 1024)
+    )
+    ranged = (
+        size_hint is not None
+        and workers > 1
+        and part > 0
+        and size_hint >= threshold
+        and size_hint > part
+    )
+
     tmp_handle = tempfile.NamedTemporaryFile(delete=False)
     tmp_path = tmp_handle.name
     tmp_handle.close()
 
     try:
-        size = 0
-        digest = hashlib.sha256()
-        with fs.open(path, "rb") as reader, open(tmp_path, "wb") as writer:
-            while True:
-                chunk = reader.read(8 * 1024 * 1024)
-                if not chunk:
-                    break
-                size += len(chunk)
-                if size > max_bytes:
-                    raise PermanentError("Download exceeded MAX_RAW_BYTES")
-                digest.update(chunk)
-                writer.write(chunk)
+        if ranged:
+            try:
+                size, sha256 = _download_ranges(
+                    fs, path, tmp_path, int(size_hint or 0), part, workers
+                )
+            except _RangesUnsupported:
+                size, sha256 = _download_stream(fs, path, tmp_path, max_bytes)
+        else:
+            size, sha256 = _download_stream(fs, path, tmp_path, max_bytes)
     except Exception as exc:
         cleanup_tmp(tmp_path)
         if isinstance(exc, PermanentError):
@@ -93,11 +136,100 @@ def download_to_tmp(
         content_type=content_type,
         md5_hash=md5_hash,
         crc32c=crc32c,
-        content_hash_sha256=digest.hexdigest(),
+        content_hash_sha256=sha256,
         metadata=metadata,
     )
 
 
+def _download_stream(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    tmp_path: str,
+    max_bytes: int,
+) -> tuple[int, str]:
+    size = 0
+    digest = hashlib.sha256()
+    with fs.open(path, "rb") as reader, open(tmp_path, "wb") as writer:
+        while True:
+            chunk = reader.read(_STREAM_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise PermanentError("Download exceeded MAX_RAW_BYTES")
+            digest.update(chunk)
+            writer.write(chunk)
+    return size, digest.hexdigest()
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _download_ranges(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    tmp_path: str,
+    size: int,
+    part_bytes: int,
+    workers: int,
+) -> tuple[int, str]:
+    # Parts land in the file as they arrive; the hash is fed in order, so at
+    # most ``workers`` parts are held in memory at once.
+    digest = hashlib.sha256()
+    fd = os.open(tmp_path, os.O_WRONLY)
+    try:
+        os.ftruncate(fd, size)
+
+        def _fetch(start: int) -> bytes:
+            end = min(start + part_bytes, size)
+            data = fs.cat_file(path, start=start, end=end)
+            if len(data) != end - start:
+                raise _RangesUnsupported(
+                    f"Expected {end - start} bytes at {start}, got {len(data)}"
+                )
+            _pwrite_all(fd, data, start)
+            return data
+
+        # Probe with the first range so a backend that answers with the whole
+        # object is detected before any concurrent requests go out.
+        first = fs.cat_file(path, start=0, end=part_bytes)
+        if len(first) == size:
+            _pwrite_all(fd, first, 0)
+            digest.update(first)
+            return size, digest.hexdigest()
+        if len(first) != part_bytes:
+            raise _RangesUnsupported(f"Range probe returned {len(first)} bytes")
+        _pwrite_all(fd, first, 0)
+        digest.update(first)
+        del first
+
+        starts = iter(range(part_bytes, size, part_bytes))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="download-range"
+        ) as executor:
+            pending: deque[Future[bytes]] = deque(
+                executor.submit(_fetch, start)
+                for start in itertools.islice(starts, workers)
+            )
+            try:
+                while pending:
+                    digest.update(pending.popleft().result())
+                    for start in itertools.islice(starts, 1):
+                        pending.append(executor.submit(_fetch, start))
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+    finally:
+        os.close(fd)
+    return size, digest.hexdigest()
+
+
 def cleanup_tmp(path: str) -> None:
     try:
         os.remove(path)
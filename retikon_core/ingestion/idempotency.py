@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from retikon_core.config import Config
+
+_SCOPE_PLACEHOLDER = "-"
 
 
 @dataclass(frozen=True)
@@ -112,3 +120,135 @@ class InMemoryIdempotency:
             record["error_code"] = error_code
             record["error_message"] = error_message
             record["updated_at"] = datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class DedupeRecord:
+    """Outputs of a completed ingest, keyed by its tenant scope and bytes."""
+
+    scope_key: str
+    pipeline_version: str
+    modality: str
+    manifest_uri: str
+    content_hash_sha256: str | None = None
+    checksum: str | None = None
+    size_bytes: int | None = None
+    media_asset_id: str | None = None
+    counts: dict[str, int] | None = None
+    duration_ms: int | None = None
+    completed_at: float | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, payload: str | bytes) -> DedupeRecord:
+        data = json.loads(payload)
+        return cls(**{key: data.get(key) for key in cls.__dataclass_fields__})
+
+    def matches(self, *, pipeline_version: str, size_bytes: int | None) -> bool:
+        if self.pipeline_version != pipeline_version:
+            return False
+        if size_bytes is not None and self.size_bytes is not None:
+            return int(size_bytes) == int(self.size_bytes)
+        return True
+
+
+class DedupeIndex(Protocol):
+    def get(self, key: str) -> DedupeRecord | None: ...
+
+    def put(self, keys: list[str], record: DedupeRecord) -> None: ...
+
+
+def resolve_scope_key(
+    org_id: str | None,
+    site_id: str | None,
+    stream_id: str | None,
+) -> str:
+    return (
+        f"{org_id or _SCOPE_PLACEHOLDER}:"
+        f"{site_id or _SCOPE_PLACEHOLDER}:"
+        f"{stream_id or _SCOPE_PLACEHOLDER}"
+    )
+
+
+def content_hash_key(scope_key: str, content_hash: str) -> str:
+    return f"sha256:{scope_key}:{content_hash}"
+
+
+def checksum_key(scope_key: str, checksum: str) -> str:
+    return f"checksum:{scope_key}:{checksum}"
+
+
+def dedupe_record_keys(record: DedupeRecord) -> list[str]:
+    keys: list[str] = []
+    if record.content_hash_sha256:
+        keys.append(content_hash_key(record.scope_key, record.content_hash_sha256))
+    if record.checksum:
+        keys.append(checksum_key(record.scope_key, record.checksum))
+    return keys
+
+
+class InMemoryDedupeIndex:
+    def __init__(self, ttl_seconds: int = 0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.store: dict[str, tuple[DedupeRecord, float | None]] = {}
+
+    def get(self, key: str) -> DedupeRecord | None:
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        record, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            self.store.pop(key, None)
+            return None
+        return record
+
+    def put(self, keys: list[str], record: DedupeRecord) -> None:
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        for key in keys:
+            self.store[key] = (record, expires_at)
+
+
+def _dedupe_ttl_seconds() -> int:
+    try:
+        return max(0, int(os.getenv("DEDUPE_TTL_SECONDS", "0")))
+    except ValueError:
+        return 0
+
+
+def dedupe_index_from_env(
+    config: Config,
+    *,
+    default_backend: str = "none",
+    default_sqlite_path: str | None = None,
+) -> DedupeIndex | None:
+    """Build the content-hash dedupe index selected by ``DEDUPE_BACKEND``.
+
+    ``sqlite`` keeps the index in ``DEDUPE_SQLITE_PATH``, else
+    ``default_sqlite_path``, else under the local graph root (so wiping the
+    graph also wipes the index); ``redis`` shares it across replicas.
+    Returns ``None`` when dedupe is disabled.
+    """
+    if not config.dedupe_cache_enabled:
+        return None
+    backend = os.getenv("DEDUPE_BACKEND", default_backend).strip().lower()
+    ttl_seconds = _dedupe_ttl_seconds()
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryDedupeIndex(ttl_seconds=ttl_seconds)
+    if backend == "sqlite":
+        from retikon_core.ingestion.idempotency_sqlite import SqliteDedupeIndex
+
+        path = os.getenv("DEDUPE_SQLITE_PATH") or default_sqlite_path
+        if not path:
+            if not config.local_graph_root:
+                raise ValueError("DEDUPE_SQLITE_PATH is required for sqlite dedupe")
+            path = os.path.join(config.local_graph_root, "_state", "dedupe.sqlite")
+        return SqliteDedupeIndex(path=path, ttl_seconds=ttl_seconds)
+    if backend == "redis":
+        from retikon_core.ingestion.idempotency_redis import RedisDedupeIndex
+
+        return RedisDedupeIndex.from_config(config, ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unsupported DEDUPE_BACKEND: {backend}")
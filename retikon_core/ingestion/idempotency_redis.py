@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from retikon_core.config import Config
+from retikon_core.errors import RecoverableError
+from retikon_core.ingestion.idempotency import DedupeRecord
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency for redis backend
+    redis = None
+
+
+class RedisDedupeIndex:
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "retikon:dedupe",
+        ttl_seconds: int = 0,
+    ) -> None:
+        self._client = client
+        self._prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def from_config(cls, config: Config, *, ttl_seconds: int = 0) -> RedisDedupeIndex:
+        if redis is None:
+            raise ValueError("Redis dedupe requires the redis package")
+        prefix = os.getenv("DEDUPE_REDIS_PREFIX", "retikon:dedupe")
+        url = os.getenv("REDIS_URL")
+        if url:
+            client = redis.Redis.from_url(url)
+        elif config.redis_host:
+            client = redis.Redis(
+                host=config.redis_host,
+                port=config.redis_port,
+                db=config.redis_db,
+                ssl=config.redis_ssl,
+                password=config.redis_password,
+            )
+        else:
+            raise ValueError("REDIS_HOST or REDIS_URL is required for redis dedupe")
+        return cls(client, prefix=prefix, ttl_seconds=ttl_seconds)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}" if self._prefix else key
+
+    def get(self, key: str) -> DedupeRecord | None:
+        try:
+            payload = self._client.get(self._key(key))
+        except Exception as exc:
+            raise RecoverableError(f"Redis dedupe lookup failed: {exc}") from exc
+        if payload is None:
+            return None
+        return DedupeRecord.from_json(payload)
+
+    def put(self, keys: list[str], record: DedupeRecord) -> None:
+        payload = record.to_json()
+        ttl = self.ttl_seconds if self.ttl_seconds > 0 else None
+        try:
+            pipe = self._client.pipeline()
+            for key in keys:
+                pipe.set(self._key(key), payload, ex=ttl)
+            pipe.execute()
+        except Exception as exc:
+            raise RecoverableError(f"Redis dedupe write failed: {exc}") from exc
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from retikon_core.errors import RecoverableError
-from retikon_core.ingestion.idempotency import IdempotencyDecision, build_doc_id
+from retikon_core.ingestion.idempotency import (
+    DedupeRecord,
+    IdempotencyDecision,
+    build_doc_id,
+)
 
 
 @dataclass(frozen=True)
@@ -178,3 +183,61 @@ class SqliteIdempotency:
                 """,
                 ("DLQ", error_code, error_message, now_ts, doc_id),
             )
+
+
+@dataclass(frozen=True)
+class SqliteDedupeIndex:
+    path: str
+    ttl_seconds: int = 0
+
+    def __post_init__(self) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dedupe_index (
+                    lookup_key TEXT PRIMARY KEY,
+                    record TEXT NOT NULL,
+                    expires_at INTEGER
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> DedupeRecord | None:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT record, expires_at FROM dedupe_index WHERE lookup_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                record, expires_at = row
+                if expires_at is not None and int(expires_at) <= int(time.time()):
+                    conn.execute(
+                        "DELETE FROM dedupe_index WHERE lookup_key = ?",
+                        (key,),
+                    )
+                    return None
+        except sqlite3.Error as exc:  # pragma: no cover - infrastructure errors
+            raise RecoverableError(f"SQLite dedupe lookup failed: {exc}") from exc
+        return DedupeRecord.from_json(record)
+
+    def put(self, keys: list[str], record: DedupeRecord) -> None:
+        expires_at = (
+            int(time.time()) + self.ttl_seconds if self.ttl_seconds > 0 else None
+        )
+        payload = record.to_json()
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO dedupe_index "
+                    "(lookup_key, record, expires_at) VALUES (?, ?, ?)",
+                    [(key, payload, expires_at) for key in keys],
+                )
+        except sqlite3.Error as exc:  # pragma: no cover - infrastructure errors
+            raise RecoverableError(f"SQLite dedupe write failed: {exc}") from exc
@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import base64
 import json
+import multiprocessing
 import os
 import shutil
+import threading
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from typing import Callable, Sequence, TypeVar
 
 import fitz
 from PIL import Image
 
 from retikon_core.connectors.ocr import load_ocr_connectors
-from retikon_core.errors import PermanentError, RecoverableError
+from retikon_core.errors import InferenceTimeoutError, PermanentError, RecoverableError
+from retikon_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -44,18 +56,24 @@ def ocr_result_from_image(
     *,
     min_confidence: int = 0,
     min_text_len: int = 0,
+    timeout_s: float | None = None,
 ) -> OcrImageResult:
     pytesseract = _load_pytesseract()
     text_tokens: list[str] = []
     conf_values: list[float] = []
+    # pytesseract kills the tesseract process itself when a timeout is given.
+    limits = {"timeout": timeout_s} if timeout_s else {}
 
     try:
         data = pytesseract.image_to_data(
             image,
             output_type=pytesseract.Output.DICT,
+            **limits,
         )
-    except Exception:
-        raw = (pytesseract.image_to_string(image) or "").strip()
+    except Exception as exc:
+        if limits and "timeout" in str(exc).lower():
+            raise InferenceTimeoutError(f"OCR timed out after {timeout_s}s") from exc
+        raw = (pytesseract.image_to_string(image, **limits) or "").strip()
         if min_text_len > 0 and len(raw) < min_text_len:
             return OcrImageResult(text="", conf_avg=None, kept_tokens=0, raw_tokens=0)
         return OcrImageResult(
@@ -102,20 +120,225 @@ def ocr_result_from_image(
     )
 
 
+def prepare_ocr_image(image: Image.Image, max_side: int) -> Image.Image:
+    """Convert to grayscale and cap the longest side before OCR."""
+    prepared = image.convert("L")
+    if max_side > 0 and max(prepared.size) > max_side:
+        prepared.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+    return prepared
+
+
+def _ocr_image_job(
+    source: str | Image.Image,
+    min_confidence: int,
+    min_text_len: int,
+    max_side: int,
+    timeout_s: float | None,
+) -> OcrImageResult:
+    if isinstance(source, str):
+        with Image.open(source) as opened:
+            image = prepare_ocr_image(opened, max_side)
+    else:
+        image = prepare_ocr_image(source, max_side)
+    return ocr_result_from_image(
+        image,
+        min_confidence=min_confidence,
+        min_text_len=min_text_len,
+        timeout_s=timeout_s,
+    )
+
+
+def _ocr_pdf_page_job(
+    path: str,
+    page_index: int,
+    max_side: int,
+    timeout_s: float | None,
+) -> str:
+    pytesseract = _load_pytesseract()
+    doc = fitz.open(path)
+    try:
+        pix = doc.load_page(page_index).get_pixmap()
+        mode = "RGBA" if pix.alpha else "RGB"
+        image = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+    finally:
+        doc.close()
+    limits = {"timeout": timeout_s} if timeout_s else {}
+    prepared = prepare_ocr_image(image, max_side)
+    return (pytesseract.image_to_string(prepared, **limits) or "").strip()
+
+
+class OcrExecutor:
+    """Run OCR jobs on a reusable process pool and collect results in order.
+
+    Tesseract is CPU-bound, so work is spread across worker processes that
+    stay alive between calls. Decoding and preprocessing happen in the worker
+    so only paths or small images cross the process boundary. With
+    ``workers=0`` jobs run inline, which keeps tests and single-core hosts
+    simple.
+    """
+
+    def __init__(self, *, workers: int, max_side: int = 2048) -> None:
+        self.workers = max(0, workers)
+        self.max_side = max_side
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def ocr_images(
+        self,
+        sources: Sequence[str | Image.Image],
+        *,
+        min_confidence: int = 0,
+        min_text_len: int = 0,
+        timeout_s: float | None = None,
+        budget_s: float | None = None,
+    ) -> list[OcrImageResult | None]:
+        """OCR each image or image path; failed or unfinished entries are None."""
+        _load_pytesseract()
+        jobs = [
+            (
+                _ocr_image_job,
+                (source, min_confidence, min_text_len, self.max_side, timeout_s),
+            )
+            for source in sources
+        ]
+        return self._run(jobs, budget_s)
+
+    def ocr_pdf_pages(
+        self,
+        path: str,
+        page_indexes: Sequence[int],
+        *,
+        timeout_s: float | None = None,
+        budget_s: float | None = None,
+    ) -> list[str | None]:
+        _load_pytesseract()
+        jobs = [
+            (_ocr_pdf_page_job, (path, index, self.max_side, timeout_s))
+            for index in page_indexes
+        ]
+        return self._run(jobs, budget_s)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(
+        self,
+        jobs: Sequence[tuple[Callable[..., _T], tuple[object, ...]]],
+        budget_s: float | None,
+    ) -> list[_T | None]:
+        deadline = time.monotonic() + budget_s if budget_s else None
+        if self.workers <= 0 or len(jobs) <= 1:
+            return self._run_inline(jobs, deadline)
+        pool = self._get_pool()
+        futures: list[Future[_T]] = [pool.submit(fn, *args) for fn, args in jobs]
+        results: list[_T | None] = []
+        try:
+            for future in futures:
+                remaining = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                try:
+                    results.append(future.result(timeout=remaining))
+                except FutureTimeoutError:
+                    results.append(None)
+                except BrokenProcessPool as exc:
+                    # A crashed worker poisons the pool; start a fresh one next
+                    # call.
+                    self.close()
+                    self._log_failure(exc)
+                    results.append(None)
+                except Exception as exc:
+                    self._log_failure(exc)
+                    results.append(None)
+        finally:
+            for future in futures:
+                future.cancel()
+        return results
+
+    def _run_inline(
+        self,
+        jobs: Sequence[tuple[Callable[..., _T], tuple[object, ...]]],
+        deadline: float | None,
+    ) -> list[_T | None]:
+        results: list[_T | None] = []
+        for fn, args in jobs:
+            if deadline is not None and time.monotonic() >= deadline:
+                results.append(None)
+                continue
+            try:
+                results.append(fn(*args))
+            except Exception as exc:
+                self._log_failure(exc)
+                results.append(None)
+        return results
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Spawned workers avoid inheriting locks held by service threads.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _log_failure(self, exc: Exception) -> None:
+        logger.warning(
+            "OCR job failed",
+            extra={"error_type": type(exc).__name__, "error_message": str(exc)},
+        )
+
+
+def _ocr_workers() -> int:
+    raw = os.getenv("OCR_WORKERS")
+    if raw is None or raw == "":
+        return min(4, os.cpu_count() or 1)
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return min(4, os.cpu_count() or 1)
+
+
+def ocr_max_side() -> int:
+    try:
+        return int(os.getenv("OCR_MAX_SIDE", "2048"))
+    except ValueError:
+        return 2048
+
+
+_EXECUTOR: OcrExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_ocr_executor() -> OcrExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = OcrExecutor(workers=_ocr_workers(), max_side=ocr_max_side())
+        return _EXECUTOR
+
+
 def ocr_results_from_keyframes(
-    images: list[Image.Image],
+    images: Sequence[str | Image.Image],
     *,
     min_confidence: int = 0,
     min_text_len: int = 0,
-) -> list[OcrImageResult]:
-    return [
-        ocr_result_from_image(
-            image,
-            min_confidence=min_confidence,
-            min_text_len=min_text_len,
-        )
-        for image in images
-    ]
+    timeout_s: float | None = None,
+    budget_s: float | None = None,
+    executor: OcrExecutor | None = None,
+) -> list[OcrImageResult | None]:
+    """OCR keyframes in parallel; entries are None when a frame failed, timed
+    out, or was still running when the budget ran out."""
+    return (executor or get_ocr_executor()).ocr_images(
+        images,
+        min_confidence=min_confidence,
+        min_text_len=min_text_len,
+        timeout_s=timeout_s,
+        budget_s=budget_s,
+    )
 
 
 def ocr_text_from_pdf(
@@ -130,25 +353,14 @@ def ocr_text_from_pdf(
 
 
 def _ocr_text_from_pdf_local(path: str, max_pages: int) -> str:
-    pytesseract = _load_pytesseract()
     doc = fitz.open(path)
-    texts: list[str] = []
     try:
         total_pages = len(doc)
-        limit = total_pages if max_pages <= 0 else min(total_pages, max_pages)
-        for page_index in range(limit):
-            page = doc.load_page(page_index)
-            pix = page.get_pixmap()
-            mode = "RGBA" if pix.alpha else "RGB"
-            image = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
-            if mode == "RGBA":
-                image = image.convert("RGB")
-            text = (pytesseract.image_to_string(image) or "").strip()
-            if text:
-                texts.append(text)
     finally:
         doc.close()
-    return "\n".join(texts).strip()
+    limit = total_pages if max_pages <= 0 else min(total_pages, max_pages)
+    texts = get_ocr_executor().ocr_pdf_pages(path, range(limit))
+    return "\n".join(text for text in texts if text).strip()
 
 
 def _select_ocr_connector(base_uri: str | None):
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator
+
+import fitz
+
+from retikon_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _pdf_page_range_job(path: str, start: int, stop: int) -> list[str]:
+    doc = fitz.open(path)
+    try:
+        return [doc.load_page(index).get_text() for index in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def pdf_extract_workers() -> int:
+    raw = os.getenv("PDF_EXTRACT_WORKERS")
+    if raw is None or raw == "":
+        return min(4, os.cpu_count() or 1)
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return min(4, os.cpu_count() or 1)
+
+
+def pdf_pages_per_task() -> int:
+    try:
+        value = int(os.getenv("PDF_PAGES_PER_TASK", "16"))
+    except ValueError:
+        return 16
+    return value if value > 0 else 16
+
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS != workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False, cancel_futures=True)
+            # Spawned workers avoid inheriting locks held by service threads.
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def _reset_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def pdf_page_count(path: str) -> int:
+    doc = fitz.open(path)
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+
+def iter_pdf_page_texts(
+    path: str,
+    *,
+    workers: int | None = None,
+    pages_per_task: int | None = None,
+) -> Iterator[str]:
+    """Yield each page's text in page order while later pages are extracted.
+
+    Page ranges of ``pages_per_task`` pages are extracted on a reusable
+    process pool, with at most two ranges per worker in flight so memory
+    stays bounded on very long PDFs. Documents that fit in one range, or
+    ``workers=0``, are read inline. If the pool breaks, the remaining
+    ranges are read inline.
+    """
+    workers = pdf_extract_workers() if workers is None else max(0, workers)
+    per_task = pages_per_task or pdf_pages_per_task()
+    total = pdf_page_count(path)
+    ranges = [
+        (start, min(start + per_task, total)) for start in range(0, total, per_task)
+    ]
+    if workers <= 0 or len(ranges) <= 1:
+        for start, stop in ranges:
+            yield from _pdf_page_range_job(path, start, stop)
+        return
+
+    pool = _get_pool(workers)
+    pending = iter(ranges)
+    in_flight: deque[tuple[tuple[int, int], Future[list[str]]]] = deque()
+
+    def _submit() -> None:
+        page_range = next(pending, None)
+        if page_range is not None:
+            in_flight.append(
+                (page_range, pool.submit(_pdf_page_range_job, path, *page_range))
+            )
+
+    try:
+        for _ in range(workers * 2):
+            _submit()
+        while in_flight:
+            page_range, future = in_flight.popleft()
+            try:
+                texts = future.result()
+            except BrokenProcessPool as exc:
+                logger.warning(
+                    "PDF extraction pool failed; continuing inline",
+                    extra={"error_message": str(exc)},
+                )
+                _reset_pool()
+                remaining = [page_range, *(item for item, _ in in_flight), *pending]
+                in_flight.clear()
+                for start, stop in remaining:
+                    yield from _pdf_page_range_job(path, start, stop)
+                return
+            _submit()
+            yield from texts
+    finally:
+        for _, future in in_flight:
+            future.cancel()
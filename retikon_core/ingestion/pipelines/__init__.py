@@ -1,11 +1,12 @@
 from retikon_core.ingestion.pipelines.audio import ingest_audio
 from retikon_core.ingestion.pipelines.document import ingest_document
-from retikon_core.ingestion.pipelines.image import ingest_image
+from retikon_core.ingestion.pipelines.image import ingest_image, ingest_images
 from retikon_core.ingestion.pipelines.video import ingest_video
 
 __all__ = [
     "ingest_audio",
     "ingest_document",
     "ingest_image",
+    "ingest_images",
     "ingest_video",
 ]
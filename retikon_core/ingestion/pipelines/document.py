@@ -3,15 +3,18 @@ from __future__ import annotations
 import os
 import re
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator, Sequence, TypeVar
 
-import fitz
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from docx import Document
+from openpyxl import load_workbook
 from pptx import Presentation
 
 from retikon_core.config import Config
@@ -23,6 +26,12 @@ from retikon_core.embeddings import (
 from retikon_core.embeddings.timeout import run_inference
 from retikon_core.errors import PermanentError
 from retikon_core.ingestion.ocr import ocr_text_from_pdf
+from retikon_core.ingestion.pdf_text import iter_pdf_page_texts
+from retikon_core.ingestion.pipelines.embedding_cache import (
+    chunk_cache_key,
+    chunk_cache_shared,
+    get_chunk_embedding_cache,
+)
 from retikon_core.ingestion.pipelines.embedding_utils import text_embed_batch_size
 from retikon_core.ingestion.pipelines.metrics import (
     CallTracker,
@@ -32,6 +41,7 @@ from retikon_core.ingestion.pipelines.metrics import (
 )
 from retikon_core.ingestion.pipelines.types import PipelineResult
 from retikon_core.ingestion.types import IngestSource
+from retikon_core.logging import get_logger
 from retikon_core.storage.manifest import (
     build_manifest,
     manifest_bytes,
@@ -44,9 +54,19 @@ from retikon_core.storage.paths import (
     vertex_part_uri,
 )
 from retikon_core.storage.schemas import schema_for
-from retikon_core.storage.writer import WriteResult, write_parquet
+from retikon_core.storage.writer import StreamingParquetWriter, write_parquet
 from retikon_core.tenancy import tenancy_fields
 
+logger = get_logger(__name__)
+
+_T = TypeVar("_T")
+
+_TABLE_EXTENSIONS = (".csv", ".tsv", ".xlsx", ".xls")
+# Bounds rows buffered per DocChunk file while streaming, unless configured.
+_DOC_STREAM_ROW_GROUP_SIZE = 1024
+_RICH_DOC_EXTENSIONS = (".pdf", ".docx", ".pptx", ".doc", ".ppt")
+_SENTENCE_END_RE = re.compile(r"[.!?][\"')\]]*\s+")
+
 
 @dataclass(frozen=True)
 class Chunk:
@@ -57,6 +77,8 @@ class Chunk:
     token_start: int
     token_end: int
     token_count: int
+    page_start: int | None = None
+    page_end: int | None = None
 
 
 def _pipeline_model() -> str:
@@ -71,6 +93,14 @@ def _tokenizer_cache_dir() -> str | None:
     return os.getenv("MODEL_DIR")
 
 
+def _table_batch_rows() -> int:
+    try:
+        value = int(os.getenv("TABLE_BATCH_ROWS", "5000"))
+    except ValueError:
+        return 5000
+    return value if value > 0 else 5000
+
+
 def _doc_parquet_compression() -> str:
     value = os.getenv("DOC_PARQUET_COMPRESSION", "").strip()
     if value:
@@ -91,44 +121,6 @@ def _doc_parquet_row_group_size() -> int | None:
     return value if value > 0 else None
 
 
-def _write_parquet_parallel(
-    jobs: list[tuple[list[dict[str, object]], object, str]],
-    *,
-    compression: str,
-    row_group_size: int | None,
-) -> list[WriteResult]:
-    if not jobs:
-        return []
-    if len(jobs) == 1:
-        rows, schema, uri = jobs[0]
-        return [
-            write_parquet(
-                rows,
-                schema,
-                uri,
-                compression=compression,
-                row_group_size=row_group_size,
-            )
-        ]
-    max_workers = min(4, len(jobs))
-    results: list[WriteResult | None] = [None] * len(jobs)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {}
-        for idx, (rows, schema, uri) in enumerate(jobs):
-            future = executor.submit(
-                write_parquet,
-                rows,
-                schema,
-                uri,
-                compression,
-                row_group_size,
-            )
-            future_map[future] = idx
-        for future in as_completed(future_map):
-            results[future_map[future]] = future.result()
-    return [item for item in results if item is not None]
-
-
 class _SimpleTokenizer:
     def __call__(
         self,
@@ -177,11 +169,7 @@ def _load_tokenizer():
 
 def _extract_text(path: str, extension: str) -> str:
     if extension == ".pdf":
-        doc = fitz.open(path)
-        try:
-            return "\n".join(page.get_text() for page in doc)
-        finally:
-            doc.close()
+        return "\n".join(iter_pdf_page_texts(path))
     if extension == ".docx":
         doc = Document(path)
         return "\n".join(p.text for p in doc.paragraphs if p.text)
@@ -195,13 +183,10 @@ def _extract_text(path: str, extension: str) -> str:
                     if text:
                         parts.append(text)
         return "\n".join(parts)
-    if extension in (".csv", ".tsv"):
-        sep = "," if extension == ".csv" else "\t"
-        df = pd.read_csv(path, sep=sep)
-        return _table_to_text(df)
-    if extension in (".xlsx", ".xls"):
-        df = pd.read_excel(path)
-        return _table_to_text(df)
+    if extension in _TABLE_EXTENSIONS:
+        return "\n".join(
+            row for rows in _iter_table_rows(path, extension) for row in rows
+        )
     if extension in (".doc", ".ppt"):
         raise PermanentError(f"Legacy format not supported: {extension}")
 
@@ -209,55 +194,366 @@ def _extract_text(path: str, extension: str) -> str:
 
 
 def _table_to_text(df: pd.DataFrame) -> str:
-    rows: list[str] = []
-    columns = list(df.columns)
-    for _, row in df.iterrows():
-        row_str = ", ".join(f"{col}: {row[col]}" for col in columns)
-        rows.append(row_str)
-    return "\n".join(rows)
-
+    return "\n".join(_format_table_rows(df))
 
-def _chunk_text(text: str, target_tokens: int, overlap_tokens: int) -> list[Chunk]:
-    tokenizer = _load_tokenizer()
-    encoded = tokenizer(
-        text,
-        return_offsets_mapping=True,
-        add_special_tokens=False,
-    )
-    input_ids = encoded.get("input_ids", [])
-    offsets = encoded.get("offset_mapping", [])
-    if not input_ids or not offsets:
-        raise PermanentError("No tokens produced")
 
-    step = max(1, target_tokens - overlap_tokens)
-    chunks: list[Chunk] = []
-    start = 0
-    index = 0
-
-    while start < len(input_ids):
-        end = min(start + target_tokens, len(input_ids))
-        if end <= start:
-            break
-        char_start = offsets[start][0]
-        char_end = offsets[end - 1][1]
+def _format_table_rows(df: pd.DataFrame) -> list[str]:
+    """Render each row as ``col: value, ...`` one column at a time."""
+    if df.empty or not len(df.columns):
+        return []
+    parts = []
+    for position, column in enumerate(df.columns):
+        series = df.iloc[:, position]
+        values = series.astype(str).where(series.notna(), "nan")
+        parts.append(f"{column}: " + values)
+    rendered = parts[0]
+    for part in parts[1:]:
+        rendered = rendered + ", " + part
+    return rendered.tolist()
+
+
+def _iter_table_frames(path: str, extension: str) -> Iterator[pd.DataFrame]:
+    batch_rows = _table_batch_rows()
+    if extension in (".csv", ".tsv"):
+        sep = "," if extension == ".csv" else "\t"
+        with pd.read_csv(path, sep=sep, chunksize=batch_rows) as reader:
+            yield from reader
+        return
+    if extension == ".xlsx":
+        yield from _iter_xlsx_frames(path, batch_rows)
+        return
+    df = pd.read_excel(path)
+    for start in range(0, len(df), batch_rows):
+        yield df.iloc[start : start + batch_rows]
+
+
+def _iter_xlsx_frames(path: str, batch_rows: int) -> Iterator[pd.DataFrame]:
+    # Read-only mode streams sheet XML instead of loading every cell up front.
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [
+            f"Unnamed: {idx}" if value is None else str(value)
+            for idx, value in enumerate(header)
+        ]
+        batch: list[tuple[object, ...]] = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            values = tuple(row[: len(columns)])
+            batch.append(values + (None,) * (len(columns) - len(values)))
+            if len(batch) >= batch_rows:
+                yield pd.DataFrame.from_records(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame.from_records(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _iter_table_rows(path: str, extension: str) -> Iterator[list[str]]:
+    for frame in _iter_table_frames(path, extension):
+        rows = _format_table_rows(frame)
+        if rows:
+            yield rows
+
+
+def _text_block_chars() -> int:
+    try:
+        value = int(os.getenv("TEXT_STREAM_BLOCK_CHARS", "262144"))
+    except ValueError:
+        return 262144
+    return value if value > 0 else 262144
+
+
+def _block_boundary(text: str) -> int:
+    """Return where ``text`` can be cut without splitting a token, or 0."""
+    cut = text.rfind("\n\n")
+    if cut >= 0:
+        return cut + 2
+    sentence_end = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        sentence_end = match.end()
+    if sentence_end:
+        return sentence_end
+    return max(text.rfind(" "), text.rfind("\n"), text.rfind("\t")) + 1
+
+
+def _is_plain_text(extension: str) -> bool:
+    return extension not in _RICH_DOC_EXTENSIONS + _TABLE_EXTENSIONS
+
+
+def _iter_text_blocks(path: str) -> Iterator[str]:
+    """Read a text file in blocks ending on paragraph, sentence, or word breaks.
+
+    Concatenated, the blocks equal the decoded file, so chunk offsets match
+    ``_extract_text``. A block grows past the target size only while no
+    break has been found, up to four times the target.
+    """
+    block_chars = _text_block_chars()
+    pending = ""
+    with open(path, encoding="utf-8", errors="ignore") as handle:
+        while True:
+            data = handle.read(block_chars)
+            if not data:
+                break
+            pending += data
+            cut = _block_boundary(pending)
+            if cut <= 0:
+                if len(pending) < block_chars * 4:
+                    continue
+                cut = len(pending)
+            yield pending[:cut]
+            pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def _iter_text_segments(path: str, extension: str) -> Iterator[str]:
+    if extension == ".pdf":
+        yield from iter_pdf_page_texts(path)
+        return
+    if _is_plain_text(extension):
+        yield from _iter_text_blocks(path)
+        return
+    yield _extract_text(path, extension)
+
+
+def _timed_iter(items: Iterable[_T], timer: StageTimer, name: str) -> Iterator[_T]:
+    iterator = iter(items)
+    while True:
+        with timer.track(name):
+            item = next(iterator, None)
+        if item is None:
+            return
+        yield item
+
+
+class _StreamingChunker:
+    """Slide token windows over text that arrives one segment at a time.
+
+    Offsets match the text of every segment fed so far, joined with
+    ``separator``. Segments are tokenized as they arrive and only tokens from
+    the current window onward are kept, so memory is bounded by a window
+    plus one segment. With ``paged=True`` each segment is a page and chunks
+    record the 1-based pages they span.
+    """
+
+    def __init__(
+        self,
+        target_tokens: int,
+        overlap_tokens: int,
+        *,
+        paged: bool = False,
+        separator: str = "\n",
+    ) -> None:
+        self._tokenizer = _load_tokenizer()
+        self._target = max(1, target_tokens)
+        self._step = max(1, target_tokens - overlap_tokens)
+        self._paged = paged
+        self._separator = separator
+        # (char_start, char_end, page) for tokens from the buffer start on;
+        # _head indexes the next window start, _base_token is spans[0]'s index.
+        self._spans: list[tuple[int, int, int | None]] = []
+        self._head = 0
+        self._base_token = 0
+        self._buffer = ""
+        self._buffer_offset = 0
+        self._text_end = 0
+        self._segments = 0
+        self._index = 0
+        self.token_total = 0
+
+    def feed(self, text: str) -> list[Chunk]:
+        if self._segments and self._separator:
+            self._buffer += self._separator
+            self._text_end += len(self._separator)
+        self._segments += 1
+        page = self._segments if self._paged else None
+        encoded = self._tokenizer(
+            text,
+            return_offsets_mapping=True,
+            add_special_tokens=False,
+        )
+        base = self._text_end
+        offsets = encoded.get("offset_mapping", [])
+        self._spans.extend((base + start, base + end, page) for start, end in offsets)
+        self.token_total += len(offsets)
+        self._buffer += text
+        self._text_end += len(text)
+        chunks: list[Chunk] = []
+        while len(self._spans) - self._head >= self._target:
+            self._emit(chunks)
+        self._trim()
+        return chunks
+
+    def finish(self) -> list[Chunk]:
+        chunks: list[Chunk] = []
+        while self._head < len(self._spans):
+            self._emit(chunks)
+        self._trim()
+        return chunks
+
+    def _emit(self, chunks: list[Chunk]) -> None:
+        head = self._head
+        stop = min(head + self._target, len(self._spans))
+        token_start = self._base_token + head
+        self._head += self._step
+        char_start = self._spans[head][0]
+        char_end = self._spans[stop - 1][1]
         if char_end <= char_start:
-            start += step
-            continue
-        chunk_text = text[char_start:char_end]
+            return
         chunks.append(
             Chunk(
-                index=index,
-                text=chunk_text,
+                index=self._index,
+                text=self._buffer[
+                    char_start - self._buffer_offset : char_end - self._buffer_offset
+                ],
                 char_start=char_start,
                 char_end=char_end,
-                token_start=start,
-                token_end=end,
-                token_count=end - start,
+                token_start=token_start,
+                token_end=token_start + stop - head,
+                token_count=stop - head,
+                page_start=self._spans[head][2],
+                page_end=self._spans[stop - 1][2],
             )
         )
-        index += 1
-        start += step
+        self._index += 1
+
+    def _trim(self) -> None:
+        drop = min(self._head, len(self._spans))
+        if drop:
+            del self._spans[:drop]
+            self._head -= drop
+            self._base_token += drop
+        keep_from = self._spans[0][0] if self._spans else self._text_end
+        if keep_from > self._buffer_offset:
+            self._buffer = self._buffer[keep_from - self._buffer_offset :]
+            self._buffer_offset = keep_from
+
+
+def _iter_chunks(
+    segments: Iterable[str],
+    target_tokens: int,
+    overlap_tokens: int,
+    *,
+    separator: str = "\n",
+) -> Iterator[Chunk]:
+    """Yield chunks as soon as each window fills, reading segments lazily."""
+    chunker = _StreamingChunker(target_tokens, overlap_tokens, separator=separator)
+    for segment in segments:
+        yield from chunker.feed(segment)
+    yield from chunker.finish()
+
+
+class _RowChunker:
+    """Pack whole table rows into chunks of up to ``target_tokens`` tokens.
+
+    Rows already carry their column names, so chunks never split a row and
+    need no overlap; a row longer than the target is split into token
+    windows on its own. Each batch of rows is tokenized in one call and
+    chunks never span batches. Offsets match the newline-joined rows.
+    """
+
+    def __init__(self, target_tokens: int, overlap_tokens: int) -> None:
+        self._tokenizer = _load_tokenizer()
+        self._target = max(1, target_tokens)
+        self._step = max(1, target_tokens - overlap_tokens)
+        self._text_end = 0
+        self._batches = 0
+        self._index = 0
+        self.token_total = 0
+
+    def feed(self, rows: Sequence[str]) -> list[Chunk]:
+        if not rows:
+            return []
+        text = "\n".join(rows)
+        encoded = self._tokenizer(
+            text,
+            return_offsets_mapping=True,
+            add_special_tokens=False,
+        )
+        offsets = np.asarray(encoded.get("offset_mapping", []), dtype=np.int64)
+        offsets = offsets.reshape(-1, 2)
+        lengths = np.fromiter((len(row) for row in rows), np.int64, len(rows))
+        row_starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+        token_rows = np.searchsorted(row_starts, offsets[:, 0], side="right") - 1
+        counts = np.bincount(token_rows, minlength=len(rows))
+        first_token = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        base_char = self._text_end + (1 if self._batches else 0)
+        self._batches += 1
+        base_token = self.token_total
+        chunks: list[Chunk] = []
+
+        def _emit(
+            char_start: int, char_end: int, token_start: int, count: int
+        ) -> None:
+            if count <= 0 or char_end <= char_start:
+                return
+            chunks.append(
+                Chunk(
+                    index=self._index,
+                    text=text[char_start:char_end],
+                    char_start=base_char + char_start,
+                    char_end=base_char + char_end,
+                    token_start=base_token + token_start,
+                    token_end=base_token + token_start + count,
+                    token_count=count,
+                )
+            )
+            self._index += 1
+
+        group_start = 0
+        group_tokens = 0
+        for row, count in enumerate(counts.tolist()):
+            if group_tokens and group_tokens + count > self._target:
+                _emit(
+                    int(row_starts[group_start]),
+                    int(row_starts[row - 1] + lengths[row - 1]),
+                    int(first_token[group_start]),
+                    group_tokens,
+                )
+                group_start, group_tokens = row, 0
+            if count > self._target:
+                first = int(first_token[row])
+                for start in range(first, first + count, self._step):
+                    end = min(start + self._target, first + count)
+                    _emit(
+                        int(offsets[start, 0]),
+                        int(offsets[end - 1, 1]),
+                        start,
+                        end - start,
+                    )
+                    if end == first + count:
+                        break
+                group_start, group_tokens = row + 1, 0
+                continue
+            group_tokens += count
+        if group_tokens:
+            last = len(rows) - 1
+            _emit(
+                int(row_starts[group_start]),
+                int(row_starts[last] + lengths[last]),
+                int(first_token[group_start]),
+                group_tokens,
+            )
+
+        self._text_end = base_char + len(text)
+        self.token_total += len(offsets)
+        return chunks
 
+    def finish(self) -> list[Chunk]:
+        return []
+
+
+def _chunk_text(text: str, target_tokens: int, overlap_tokens: int) -> list[Chunk]:
+    chunks = list(_iter_chunks([text], target_tokens, overlap_tokens))
+    if not chunks:
+        raise PermanentError("No tokens produced")
     return chunks
 
 
@@ -302,6 +598,49 @@ def _embed_chunks(
     return embeddings
 
 
+def _embed_chunks_cached(
+    chunks: list[Chunk],
+    tracker: CallTracker | None,
+    *,
+    scope: str | None,
+) -> tuple[list[list[float]], int, int]:
+    """Embed chunks, reusing cached vectors for text seen before.
+
+    Returns the embeddings plus cache hit and miss counts; only misses (one per
+    distinct normalized text) reach ``_embed_chunks``.
+    """
+    cache = get_chunk_embedding_cache()
+    if cache is None:
+        return _embed_chunks(chunks, tracker), 0, len(chunks)
+    model_id = f"{_pipeline_model()}|{get_embedding_artifact('text')}"
+    keys = [chunk_cache_key(model_id, chunk.text, scope) for chunk in chunks]
+    try:
+        vectors = cache.get_many(list(dict.fromkeys(keys)))
+    except Exception as exc:
+        logger.warning(
+            "Chunk embedding cache lookup failed",
+            extra={"error_message": str(exc)},
+        )
+        vectors = {}
+    pending: dict[str, Chunk] = {}
+    for key, chunk in zip(keys, chunks, strict=True):
+        if key not in vectors:
+            pending.setdefault(key, chunk)
+    if pending:
+        fresh = dict(
+            zip(pending, _embed_chunks(list(pending.values()), tracker), strict=True)
+        )
+        try:
+            cache.put_many(fresh)
+        except Exception as exc:
+            logger.warning(
+                "Chunk embedding cache write failed",
+                extra={"error_message": str(exc)},
+            )
+        vectors.update(fresh)
+    return [vectors[key] for key in keys], len(chunks) - len(pending), len(pending)
+
+
 def ingest_document(
     *,
     source: IngestSource,
@@ -314,156 +653,207 @@ def ingest_document(
     extension = source.extension
     timer = StageTimer()
     calls = CallTracker()
-    with timer.track("extract_text"):
-        text = _extract_text(source.local_path, extension)
-    if not text.strip() and config.enable_ocr and extension == ".pdf":
-        with timer.track("ocr"):
-            text = ocr_text_from_pdf(
-                source.local_path,
-                config.ocr_max_pages,
-                base_uri=config.graph_root_uri(),
-            )
-    if not text.strip():
-        raise PermanentError("No extractable text")
-
-    with timer.track("chunk"):
-        chunks = _chunk_text(
-            text,
-            config.chunk_target_tokens,
-            config.chunk_overlap_tokens,
-        )
-    if not chunks:
-        raise PermanentError("No chunks produced")
-
-    with timer.track("embed"):
-        embeddings = _embed_chunks(chunks, calls)
-
+    output_root = output_uri or config.graph_root_uri()
+    media_asset_id = str(uuid.uuid4())
     embedding_backend = None
     embedding_artifact = None
     if config.embedding_metadata_enabled:
         embedding_backend = get_runtime_embedding_backend("text")
         embedding_artifact = get_embedding_artifact("text")
-
-    output_root = output_uri or config.graph_root_uri()
-    media_asset_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc)
-
-    media_row = {
-        "id": media_asset_id,
-        "uri": source.uri,
-        "media_type": "document",
-        "content_type": source.content_type or "application/octet-stream",
-        "size_bytes": source.size_bytes or 0,
-        "source_bucket": source.bucket,
-        "source_object": source.name,
-        "source_generation": source.generation,
-        "checksum": source.md5_hash or source.crc32c,
-        "duration_ms": None,
-        "width_px": None,
-        "height_px": None,
-        "frame_count": None,
-        "sample_rate_hz": None,
-        "channels": None,
+    chunk_fields = {
+        "media_asset_id": media_asset_id,
+        "source_type": "document",
+        "source_ref_id": None,
+        "source_time_ms": None,
+        "ocr_conf_avg": None,
+        "embedding_model": _pipeline_model(),
+        "embedding_backend": embedding_backend,
+        "embedding_artifact": embedding_artifact,
         **tenancy_fields(
             org_id=source.org_id,
             site_id=source.site_id,
             stream_id=source.stream_id,
         ),
-        "created_at": now,
         "pipeline_version": pipeline_version,
         "schema_version": schema_version,
     }
+    cache_scope = None if chunk_cache_shared() else (source.org_id or "-")
+    batch_size = text_embed_batch_size()
+    compression = _doc_parquet_compression()
+    row_group_size = _doc_parquet_row_group_size()
+    pending: list[Chunk] = []
+    chunk_count = 0
+    token_total = 0
+    cache_hits = 0
+    cache_misses = 0
+    word_count = 0
+
+    with ExitStack() as stack:
+
+        def _writer(dest_uri: str, schema: pa.Schema) -> StreamingParquetWriter:
+            return stack.enter_context(
+                StreamingParquetWriter(
+                    dest_uri,
+                    schema,
+                    compression=compression,
+                    row_group_size=row_group_size or _DOC_STREAM_ROW_GROUP_SIZE,
+                )
+            )
 
-    chunk_core_rows = []
-    chunk_text_rows = []
-    chunk_vector_rows = []
-    edge_rows = []
-
-    for chunk, vector in zip(chunks, embeddings, strict=False):
-        chunk_id = str(uuid.uuid4())
-        chunk_core_rows.append(
-            {
-                "id": chunk_id,
-                "media_asset_id": media_asset_id,
-                "chunk_index": chunk.index,
-                "char_start": chunk.char_start,
-                "char_end": chunk.char_end,
-                "token_start": chunk.token_start,
-                "token_end": chunk.token_end,
-                "token_count": chunk.token_count,
-                "source_type": "document",
-                "source_ref_id": None,
-                "source_time_ms": None,
-                "ocr_conf_avg": None,
-                "embedding_model": _pipeline_model(),
-                "embedding_backend": embedding_backend,
-                "embedding_artifact": embedding_artifact,
-                **tenancy_fields(
-                    org_id=source.org_id,
-                    site_id=source.site_id,
-                    stream_id=source.stream_id,
-                ),
-                "pipeline_version": pipeline_version,
-                "schema_version": schema_version,
-            }
+        core_writer = _writer(
+            vertex_part_uri(output_root, "DocChunk", "core", str(uuid.uuid4())),
+            schema_for("DocChunk", "core"),
         )
-        chunk_text_rows.append({"content": chunk.text})
-        chunk_vector_rows.append({"text_vector": vector})
-        edge_rows.append(
-            {
-                "src_id": chunk_id,
-                "dst_id": media_asset_id,
-                "schema_version": schema_version,
-            }
+        text_writer = _writer(
+            vertex_part_uri(output_root, "DocChunk", "text", str(uuid.uuid4())),
+            schema_for("DocChunk", "text"),
+        )
+        vector_writer = _writer(
+            vertex_part_uri(output_root, "DocChunk", "vector", str(uuid.uuid4())),
+            schema_for("DocChunk", "vector"),
+        )
+        edge_writer = _writer(
+            edge_part_uri(output_root, "DerivedFrom", str(uuid.uuid4())),
+            schema_for("DerivedFrom", "adj_list"),
         )
 
-    files: list[WriteResult] = []
-    with timer.track("write_parquet"):
-        compression = _doc_parquet_compression()
-        row_group_size = _doc_parquet_row_group_size()
-        jobs = [
-            (
-                [media_row],
-                schema_for("MediaAsset", "core"),
-                vertex_part_uri(
-                    output_root, "MediaAsset", "core", str(uuid.uuid4())
-                ),
-            ),
-            (
-                chunk_core_rows,
-                schema_for("DocChunk", "core"),
-                vertex_part_uri(output_root, "DocChunk", "core", str(uuid.uuid4())),
-            ),
-            (
-                chunk_text_rows,
-                schema_for("DocChunk", "text"),
-                vertex_part_uri(output_root, "DocChunk", "text", str(uuid.uuid4())),
+        def _flush(min_batch: int) -> None:
+            # Embed and write full batches as soon as chunking produces them:
+            # embedding overlaps extraction, and finished rows leave memory.
+            nonlocal cache_hits, cache_misses, chunk_count, token_total
+            while pending and len(pending) >= min_batch:
+                batch = pending[:batch_size]
+                del pending[:batch_size]
+                with timer.track("embed"):
+                    vectors, hits, misses = _embed_chunks_cached(
+                        batch, calls, scope=cache_scope
+                    )
+                cache_hits += hits
+                cache_misses += misses
+                chunk_ids = [str(uuid.uuid4()) for _ in batch]
+                with timer.track("write_parquet"):
+                    core_writer.write_rows(
+                        {
+                            "id": chunk_id,
+                            "chunk_index": chunk.index,
+                            "char_start": chunk.char_start,
+                            "char_end": chunk.char_end,
+                            "token_start": chunk.token_start,
+                            "token_end": chunk.token_end,
+                            "token_count": chunk.token_count,
+                            "page_start": chunk.page_start,
+                            "page_end": chunk.page_end,
+                            **chunk_fields,
+                        }
+                        for chunk_id, chunk in zip(chunk_ids, batch, strict=True)
+                    )
+                    text_writer.write_rows({"content": chunk.text} for chunk in batch)
+                    vector_writer.write_rows(
+                        {"text_vector": vector} for vector in vectors
+                    )
+                    edge_writer.write_rows(
+                        {
+                            "src_id": chunk_id,
+                            "dst_id": media_asset_id,
+                            "schema_version": schema_version,
+                        }
+                        for chunk_id in chunk_ids
+                    )
+                chunk_count += len(batch)
+                token_total += sum(chunk.token_count for chunk in batch)
+
+        chunker: _StreamingChunker | _RowChunker
+        if extension in _TABLE_EXTENSIONS:
+            chunker = row_chunker = _RowChunker(
+                config.chunk_target_tokens,
+                config.chunk_overlap_tokens,
+            )
+            batches = _iter_table_rows(source.local_path, extension)
+            for rows in _timed_iter(batches, timer, "extract_text"):
+                word_count += sum(len(row.split()) for row in rows)
+                with timer.track("chunk"):
+                    pending.extend(row_chunker.feed(rows))
+                _flush(batch_size)
+        else:
+            chunker = text_chunker = _StreamingChunker(
+                config.chunk_target_tokens,
+                config.chunk_overlap_tokens,
+                paged=extension == ".pdf",
+                separator="" if _is_plain_text(extension) else "\n",
+            )
+            segments = _iter_text_segments(source.local_path, extension)
+            for segment in _timed_iter(segments, timer, "extract_text"):
+                word_count += len(segment.split())
+                with timer.track("chunk"):
+                    pending.extend(text_chunker.feed(segment))
+                _flush(batch_size)
+        if not word_count and config.enable_ocr and extension == ".pdf":
+            with timer.track("ocr"):
+                text = ocr_text_from_pdf(
+                    source.local_path,
+                    config.ocr_max_pages,
+                    base_uri=config.graph_root_uri(),
+                )
+            word_count = len(text.split())
+            chunker = _StreamingChunker(
+                config.chunk_target_tokens,
+                config.chunk_overlap_tokens,
+            )
+            with timer.track("chunk"):
+                pending.extend(chunker.feed(text))
+        if not word_count:
+            raise PermanentError("No extractable text")
+
+        with timer.track("chunk"):
+            pending.extend(chunker.finish())
+        _flush(1)
+        if not chunk_count:
+            raise PermanentError("No chunks produced")
+
+        media_row = {
+            "id": media_asset_id,
+            "uri": source.uri,
+            "media_type": "document",
+            "content_type": source.content_type or "application/octet-stream",
+            "size_bytes": source.size_bytes or 0,
+            "source_bucket": source.bucket,
+            "source_object": source.name,
+            "source_generation": source.generation,
+            "checksum": source.md5_hash or source.crc32c,
+            "duration_ms": None,
+            "width_px": None,
+            "height_px": None,
+            "frame_count": None,
+            "sample_rate_hz": None,
+            "channels": None,
+            **tenancy_fields(
+                org_id=source.org_id,
+                site_id=source.site_id,
+                stream_id=source.stream_id,
             ),
-            (
-                chunk_vector_rows,
-                schema_for("DocChunk", "vector"),
-                vertex_part_uri(
-                    output_root, "DocChunk", "vector", str(uuid.uuid4())
+            "created_at": datetime.now(timezone.utc),
+            "pipeline_version": pipeline_version,
+            "schema_version": schema_version,
+        }
+        with timer.track("write_parquet"):
+            files = [
+                write_parquet(
+                    [media_row],
+                    schema_for("MediaAsset", "core"),
+                    vertex_part_uri(
+                        output_root, "MediaAsset", "core", str(uuid.uuid4())
+                    ),
+                    compression=compression,
+                    row_group_size=row_group_size,
                 ),
-            ),
-            (
-                edge_rows,
-                schema_for("DerivedFrom", "adj_list"),
-                edge_part_uri(output_root, "DerivedFrom", str(uuid.uuid4())),
-            ),
-        ]
-        files.extend(
-            _write_parquet_parallel(
-                jobs,
-                compression=compression,
-                row_group_size=row_group_size,
-            )
-        )
+                core_writer.close(),
+                text_writer.close(),
+                vector_writer.close(),
+                edge_writer.close(),
+            ]
 
     parquet_bytes = sum(item.bytes_written for item in files)
     bytes_raw = source.size_bytes or 0
-    token_total = sum(chunk.token_count for chunk in chunks)
-    word_count = len(text.split())
     hashes: dict[str, str] = {}
     if source.content_hash_sha256:
         hashes["content_sha256"] = source.content_hash_sha256
@@ -489,18 +879,20 @@ def ingest_document(
             "quality": {
                 "word_count": word_count,
                 "token_count": token_total,
-                "chunk_count": len(chunks),
+                "chunk_count": chunk_count,
             },
             "hashes": hashes,
             "embeddings": {
                 "text": {
-                    "count": len(chunks),
+                    "count": chunk_count,
                     "dims": 768,
+                    "cache_hits": cache_hits,
+                    "cache_misses": cache_misses,
                 }
             },
             "evidence": {
                 "frames": 0,
-                "snippets": len(chunks),
+                "snippets": chunk_count,
                 "segments": 0,
             },
             "stage_timings_ms": stage_timings_preview,
@@ -514,8 +906,8 @@ def ingest_document(
             schema_version=schema_version,
             counts={
                 "MediaAsset": 1,
-                "DocChunk": len(chunk_core_rows),
-                "DerivedFrom": len(edge_rows),
+                "DocChunk": chunk_count,
+                "DerivedFrom": chunk_count,
             },
             files=files,
             started_at=started_at,
@@ -563,18 +955,20 @@ def ingest_document(
         "quality": {
             "word_count": word_count,
             "token_count": token_total,
-            "chunk_count": len(chunks),
+            "chunk_count": chunk_count,
         },
         "hashes": hashes,
         "embeddings": {
             "text": {
-                "count": len(chunks),
+                "count": chunk_count,
                 "dims": 768,
+                "cache_hits": cache_hits,
+                "cache_misses": cache_misses,
             }
         },
         "evidence": {
             "frames": 0,
-            "snippets": len(chunks),
+            "snippets": chunk_count,
             "segments": 0,
         },
     }
@@ -582,8 +976,8 @@ def ingest_document(
     return PipelineResult(
         counts={
             "MediaAsset": 1,
-            "DocChunk": len(chunk_core_rows),
-            "DerivedFrom": len(edge_rows),
+            "DocChunk": chunk_count,
+            "DerivedFrom": chunk_count,
         },
         manifest_uri=manifest_path,
         media_asset_id=media_asset_id,
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from retikon_core.errors import RecoverableError
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SHARED_SCOPE = "*"
+
+
+class EmbeddingCache(Protocol):
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]: ...
+
+    def put_many(self, items: dict[str, list[float]]) -> None: ...
+
+
+def normalize_chunk_text(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def chunk_cache_key(model_id: str, text: str, scope: str | None = None) -> str:
+    digest = hashlib.sha256(normalize_chunk_text(text).encode("utf-8")).hexdigest()
+    return f"{model_id}|{scope or _SHARED_SCOPE}|{digest}"
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(payload: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(payload)
+    return values.tolist()
+
+
+class InMemoryEmbeddingCache:
+    """Process-local LRU of float32 vectors, bounded by entry count."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                payload = self._entries.get(key)
+                if payload is None:
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = _unpack(payload)
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._entries[key] = _pack(vector)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+@dataclass(frozen=True)
+class SqliteEmbeddingCache:
+    path: str
+    max_entries: int
+
+    def __post_init__(self) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chunk_embeddings (
+                    cache_key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    used_at INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS chunk_embeddings_used_at "
+                "ON chunk_embeddings (used_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        if not keys:
+            return found
+        now_ts = int(time.time())
+        try:
+            with self._connect() as conn:
+                # Stay well under SQLite's bound-parameter limit.
+                for start in range(0, len(keys), 500):
+                    batch = keys[start : start + 500]
+                    marks = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        "SELECT cache_key, vector FROM chunk_embeddings "
+                        f"WHERE cache_key IN ({marks})",
+                        batch,
+                    ).fetchall()
+                    for key, payload in rows:
+                        found[key] = _unpack(payload)
+                    conn.execute(
+                        f"UPDATE chunk_embeddings SET used_at = ? "
+                        f"WHERE cache_key IN ({marks})",
+                        [now_ts, *batch],
+                    )
+        except sqlite3.Error as exc:  # pragma: no cover - infrastructure errors
+            raise RecoverableError(f"SQLite embedding cache failed: {exc}") from exc
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        if not items:
+            return
+        now_ts = int(time.time())
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO chunk_embeddings "
+                    "(cache_key, vector, used_at) VALUES (?, ?, ?)",
+                    [(key, _pack(vector), now_ts) for key, vector in items.items()],
+                )
+                conn.execute(
+                    "DELETE FROM chunk_embeddings WHERE cache_key IN ("
+                    "SELECT cache_key FROM chunk_embeddings "
+                    "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as exc:  # pragma: no cover - infrastructure errors
+            raise RecoverableError(f"SQLite embedding cache failed: {exc}") from exc
+
+
+def chunk_cache_backend() -> str:
+    """Resolve the chunk cache backend.
+
+    An explicit ``CHUNK_EMBED_CACHE`` wins; otherwise setting
+    ``CHUNK_EMBED_CACHE_PATH`` selects ``sqlite`` and the default is ``memory``.
+    """
+    backend = os.getenv("CHUNK_EMBED_CACHE", "").strip().lower()
+    if backend:
+        return backend
+    if os.getenv("CHUNK_EMBED_CACHE_PATH", "").strip():
+        return "sqlite"
+    return "memory"
+
+
+def chunk_cache_max_entries(default: int = 10000) -> int:
+    try:
+        value = int(os.getenv("CHUNK_EMBED_CACHE_MAX_ENTRIES", str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def chunk_cache_shared() -> bool:
+    """Whether cached chunk vectors are shared across tenants.
+
+    Defaults to per-org partitions; ``CHUNK_EMBED_CACHE_SCOPE=global`` shares
+    vectors between tenants, which is safe for deployments with one owner.
+    """
+    return os.getenv("CHUNK_EMBED_CACHE_SCOPE", "org").strip().lower() == "global"
+
+
+_CACHE_LOCK = threading.Lock()
+_CACHES: dict[tuple[str, str | None, int], EmbeddingCache] = {}
+
+
+def get_chunk_embedding_cache() -> EmbeddingCache | None:
+    backend = chunk_cache_backend()
+    if backend == "none":
+        return None
+    max_entries = chunk_cache_max_entries()
+    path = os.getenv("CHUNK_EMBED_CACHE_PATH") if backend == "sqlite" else None
+    key = (backend, path, max_entries)
+    with _CACHE_LOCK:
+        cache = _CACHES.get(key)
+        if cache is not None:
+            return cache
+        if backend == "memory":
+            cache = InMemoryEmbeddingCache(max_entries)
+        elif backend == "sqlite":
+            if not path:
+                raise ValueError("CHUNK_EMBED_CACHE_PATH is required for sqlite")
+            cache = SqliteEmbeddingCache(path=path, max_entries=max_entries)
+        else:
+            raise ValueError(f"Unsupported CHUNK_EMBED_CACHE: {backend}")
+        _CACHES[key] = cache
+        return cache
@@ -33,6 +33,11 @@ def image_embed_max_dim(default: int = 0) -> int:
     return max(0, value)
 
 
+def image_decode_max_side(default: int = 2048) -> int:
+    value = _parse_int(os.getenv("IMAGE_DECODE_MAX_SIDE"), default)
+    return max(0, value)
+
+
 def video_embed_max_dim(default: int = 0) -> int:
     raw = os.getenv("VIDEO_EMBED_MAX_DIM")
     if raw is None or raw == "":
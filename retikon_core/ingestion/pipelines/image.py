@@ -5,7 +5,9 @@ import shutil
 import tempfile
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 
 import fsspec
 from PIL import Image, ImageOps
@@ -20,7 +22,7 @@ from retikon_core.embeddings import (
 )
 from retikon_core.embeddings.timeout import run_inference
 from retikon_core.errors import InferenceTimeoutError, PermanentError
-from retikon_core.ingestion.ocr import ocr_result_from_image
+from retikon_core.ingestion.ocr import ocr_max_side, ocr_result_from_image
 from retikon_core.ingestion.pipelines.metrics import (
     CallTracker,
     StageTimer,
@@ -28,12 +30,14 @@ from retikon_core.ingestion.pipelines.metrics import (
     timed_call,
 )
 from retikon_core.ingestion.pipelines.embedding_utils import (
+    image_decode_max_side,
     image_embed_batch_size,
     image_embed_max_dim,
     prepare_image_for_embed,
+    text_embed_batch_size,
     thumbnail_jpeg_quality,
 )
-from retikon_core.ingestion.pipelines.types import PipelineResult
+from retikon_core.ingestion.pipelines.types import BatchPipelineResult, PipelineResult
 from retikon_core.ingestion.types import IngestSource
 from retikon_core.storage.manifest import (
     build_manifest,
@@ -52,6 +56,20 @@ from retikon_core.storage.writer import WriteResult, write_parquet
 from retikon_core.tenancy import tenancy_fields
 
 
+_EXIF_ORIENTATION = 0x0112
+# Orientations that rotate by 90 degrees and so swap width and height.
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+@dataclass(frozen=True)
+class DecodedImage:
+    """RGB working copy of an upload plus its original oriented dimensions."""
+
+    image: Image.Image
+    width: int
+    height: int
+
+
 def _pipeline_model() -> str:
     return os.getenv("IMAGE_MODEL_NAME", "openai/clip-vit-base-patch32")
 
@@ -117,6 +135,79 @@ def _write_parquet_parallel(
     return [item for item in results if item is not None]
 
 
+def decode_target_side(config: Config) -> int:
+    """Longest side any consumer of the decoded image needs; 0 means full size.
+
+    Embeddings want ``IMAGE_EMBED_MAX_DIM`` (unbounded when unset), OCR wants
+    ``OCR_MAX_SIDE`` and the thumbnail its width. ``IMAGE_DECODE_MAX_SIDE``
+    caps the result.
+    """
+    needs = [image_embed_max_dim(), max(0, config.video_thumbnail_width)]
+    if config.ocr_images:
+        needs.append(max(0, ocr_max_side()))
+    target = 0 if needs[0] == 0 or 0 in needs[2:] else max(needs)
+    cap = image_decode_max_side()
+    if cap > 0:
+        target = min(target, cap) if target > 0 else cap
+    return target
+
+
+def _oriented_size(img: Image.Image) -> tuple[int, int]:
+    width, height = img.size
+    try:
+        orientation = img.getexif().get(_EXIF_ORIENTATION)
+    except Exception:
+        orientation = None
+    if orientation in _TRANSPOSED_ORIENTATIONS:
+        return height, width
+    return width, height
+
+
+def _seek_pyramid_level(img: Image.Image, max_side: int) -> None:
+    # Pyramidal TIFFs store reduced copies as extra frames; use the smallest
+    # one with the same aspect ratio that still covers ``max_side``.
+    frames = getattr(img, "n_frames", 1)
+    if img.format != "TIFF" or frames <= 1:
+        return
+    base_w, base_h = img.size
+    best, best_side = 0, max(base_w, base_h)
+    for idx in range(1, frames):
+        img.seek(idx)
+        width, height = img.size
+        same_aspect = abs(width * base_h - height * base_w) <= 0.02 * base_w * height
+        if same_aspect and max_side <= max(width, height) < best_side:
+            best, best_side = idx, max(width, height)
+    img.seek(best)
+
+
+def decode_image(path: str, max_side: int) -> DecodedImage:
+    """Decode straight to roughly ``max_side`` rather than full resolution.
+
+    JPEGs use DCT scaling via ``draft`` and pyramidal TIFFs read their
+    closest reduced level, so only the remaining reduction runs on pixels.
+    The result is EXIF-transposed RGB no larger than ``max_side``.
+    """
+    with Image.open(path) as img:
+        width, height = _oriented_size(img)
+        if max_side > 0 and max(img.size) > max_side:
+            scale = max_side / float(max(img.size))
+            box = (
+                max(1, round(img.size[0] * scale)),
+                max(1, round(img.size[1] * scale)),
+            )
+            if img.format == "JPEG":
+                img.draft("RGB", box)
+            else:
+                _seek_pyramid_level(img, max_side)
+        oriented = ImageOps.exif_transpose(img)
+        if oriented is None:
+            oriented = img
+        rgb = oriented.convert("RGB")
+    if max_side > 0 and max(rgb.size) > max_side:
+        rgb.thumbnail((max_side, max_side), resample=Image.Resampling.LANCZOS)
+    return DecodedImage(image=rgb, width=width, height=height)
+
+
 def _thumbnail_uri(output_root: str, media_asset_id: str) -> str:
     return join_uri(output_root, "thumbnails", media_asset_id, "image.jpg")
 
@@ -124,10 +215,10 @@ def _thumbnail_uri(output_root: str, media_asset_id: str) -> str:
 def _write_thumbnail(image: Image.Image, uri: str, width: int) -> int:
     if width <= 0:
         return 0
-    thumb = image.copy()
+    thumb = image
     if thumb.width > width:
         height = max(1, int(thumb.height * (width / float(thumb.width))))
-        thumb = thumb.resize((width, height))
+        thumb = thumb.resize((width, height), reducing_gap=2.0)
     with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
         tmp_path = tmp.name
     try:
@@ -227,76 +318,114 @@ def _embed_images_v2(
     return vectors
 
 
-def ingest_image(
-    *,
-    source: IngestSource,
-    config: Config,
-    output_uri: str | None,
-    pipeline_version: str,
-    schema_version: str,
-) -> PipelineResult:
-    started_at = datetime.now(timezone.utc)
-    output_root = output_uri or config.graph_root_uri()
-    timer = StageTimer()
-    calls = CallTracker()
+_STAGE_MAP = {
+    "load_image": "decode_ms",
+    "ocr": "decode_ms",
+    "ocr_text_embed": "embed_text_ms",
+    "image_embed": "embed_image_ms",
+    "image_embed_v2": "embed_image_ms",
+    "write_thumbnail": "write_blobs_ms",
+    "write_parquet": "write_parquet_ms",
+    "write_manifest": "write_manifest_ms",
+}
+# The manifest is written before OCR timings are folded in.
+_PREVIEW_STAGE_MAP = {
+    key: value for key, value in _STAGE_MAP.items() if not key.startswith("ocr")
+}
 
-    with timer.track("load_image"):
-        with Image.open(source.local_path) as img:
-            exif_img = ImageOps.exif_transpose(img)
-            if exif_img is None:
-                exif_img = img
-            rgb = exif_img.convert("RGB")
-            width, height = rgb.size
-    embed_image = prepare_image_for_embed(rgb)
-    with timer.track("image_embed"):
-        vector = _embed_images([embed_image], calls)[0]
-    vector_v2: list[float] | None = None
-    if config.vision_v2_enabled:
-        try:
-            with timer.track("image_embed_v2"):
-                vectors_v2 = _embed_images_v2([embed_image], calls)
-        except InferenceTimeoutError:
-            vectors_v2 = None
-        except Exception:
-            vectors_v2 = None
-        if vectors_v2:
-            vector_v2 = vectors_v2[0]
 
-    ocr_chunk_core_rows: list[dict[str, object]] = []
-    ocr_chunk_text_rows: list[dict[str, object]] = []
-    ocr_chunk_vector_rows: list[dict[str, object]] = []
-    ocr_edge_rows: list[dict[str, object]] = []
+@dataclass
+class _ImageOutcome:
+    source: IngestSource
+    width: int
+    height: int
+    vector: list[float]
+    vector_v2: list[float] | None
+    ocr_text: str = ""
     ocr_conf_avg: int | None = None
-    ocr_status = "disabled"
-    ocr_text = ""
-    if config.ocr_images:
-        try:
-            with timer.track("ocr"):
-                ocr_result = run_inference(
-                    "ocr",
-                    lambda: ocr_result_from_image(
-                        rgb,
-                        min_confidence=config.ocr_min_confidence,
-                        min_text_len=config.ocr_min_text_len,
-                    ),
-                )
-        except (InferenceTimeoutError, PermanentError):
-            ocr_result = None
-            ocr_status = "error"
-        except Exception:
-            ocr_result = None
-            ocr_status = "error"
-        if ocr_result is not None:
-            ocr_text = ocr_result.text
-            ocr_conf_avg = ocr_result.conf_avg
-            if ocr_text:
-                ocr_status = "ok"
-            else:
-                ocr_status = "empty"
+    ocr_status: str = "disabled"
+    media_asset_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    image_asset_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    thumb_uri: str | None = None
+    thumb_bytes: int = 0
 
-    media_asset_id = str(uuid.uuid4())
-    image_asset_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc)
+
+@dataclass
+class _ImageRows:
+    media: list[dict[str, object]] = field(default_factory=list)
+    image_core: list[dict[str, object]] = field(default_factory=list)
+    image_vector: list[dict[str, object]] = field(default_factory=list)
+    chunk_core: list[dict[str, object]] = field(default_factory=list)
+    chunk_text: list[dict[str, object]] = field(default_factory=list)
+    chunk_vector: list[dict[str, object]] = field(default_factory=list)
+    derived: list[dict[str, object]] = field(default_factory=list)
+
+    def counts(self) -> dict[str, int]:
+        counts = {
+            "MediaAsset": len(self.media),
+            "ImageAsset": len(self.image_core),
+            "DerivedFrom": len(self.derived),
+        }
+        if self.chunk_core:
+            counts["DocChunk"] = len(self.chunk_core)
+        return counts
+
+
+def _embed_images_v2_safe(
+    images: list[Image.Image],
+    tracker: CallTracker | None = None,
+) -> list[list[float]] | None:
+    try:
+        return _embed_images_v2(images, tracker)
+    except InferenceTimeoutError:
+        return None
+    except Exception:
+        return None
+
+
+def _ocr_image(image: Image.Image, config: Config) -> tuple[str, int | None, str]:
+    try:
+        ocr_result = run_inference(
+            "ocr",
+            lambda: ocr_result_from_image(
+                image,
+                min_confidence=config.ocr_min_confidence,
+                min_text_len=config.ocr_min_text_len,
+            ),
+        )
+    except (InferenceTimeoutError, PermanentError):
+        return "", None, "error"
+    except Exception:
+        return "", None, "error"
+    return ocr_result.text, ocr_result.conf_avg, "ok" if ocr_result.text else "empty"
+
+
+def _embed_ocr_texts(texts: list[str]) -> list[list[float]]:
+    if not texts:
+        return []
+    embedder = get_text_embedder(768)
+    batch_size = text_embed_batch_size()
+    vectors: list[list[float]] = []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start : start + batch_size]
+        vectors.extend(run_inference("text", partial(embedder.encode, batch)))
+    return vectors
+
+
+def _add_image_rows(
+    rows: _ImageRows,
+    outcome: _ImageOutcome,
+    *,
+    ocr_vector: list[float] | None,
+    config: Config,
+    now: datetime,
+    pipeline_version: str,
+    schema_version: str,
+) -> None:
+    source = outcome.source
+    media_asset_id = outcome.media_asset_id
+    image_asset_id = outcome.image_asset_id
+    has_v2 = config.vision_v2_enabled and outcome.vector_v2 is not None
     embedding_backend = None
     embedding_artifact = None
     embedding_backend_v2 = None
@@ -306,335 +435,554 @@ def ingest_image(
     if config.embedding_metadata_enabled:
         embedding_backend = get_runtime_embedding_backend("image")
         embedding_artifact = get_embedding_artifact("image")
-        if config.vision_v2_enabled and vector_v2 is not None:
+        if has_v2:
             embedding_backend_v2 = get_runtime_embedding_backend("vision_v2")
             embedding_artifact_v2 = get_embedding_artifact("vision_v2")
         text_embedding_backend = get_runtime_embedding_backend("text")
         text_embedding_artifact = get_embedding_artifact("text")
-    thumb_uri = None
-    thumb_bytes = 0
-    if config.video_thumbnail_width > 0:
-        thumb_uri = _thumbnail_uri(output_root, media_asset_id)
-        with timer.track("write_thumbnail"):
-            thumb_bytes = _write_thumbnail(rgb, thumb_uri, config.video_thumbnail_width)
-
-    media_row = {
-        "id": media_asset_id,
-        "uri": source.uri,
-        "media_type": "image",
-        "content_type": source.content_type or "application/octet-stream",
-        "size_bytes": source.size_bytes or 0,
-        "source_bucket": source.bucket,
-        "source_object": source.name,
-        "source_generation": source.generation,
-        "checksum": source.md5_hash or source.crc32c,
-        "duration_ms": None,
-        "width_px": width,
-        "height_px": height,
-        "frame_count": None,
-        "sample_rate_hz": None,
-        "channels": None,
-        **tenancy_fields(
-            org_id=source.org_id,
-            site_id=source.site_id,
-            stream_id=source.stream_id,
-        ),
-        "created_at": now,
-        "pipeline_version": pipeline_version,
-        "schema_version": schema_version,
-    }
+    tenancy = tenancy_fields(
+        org_id=source.org_id,
+        site_id=source.site_id,
+        stream_id=source.stream_id,
+    )
 
-    image_core_row = {
-        "id": image_asset_id,
-        "media_asset_id": media_asset_id,
-        "frame_index": None,
-        "timestamp_ms": None,
-        "width_px": width,
-        "height_px": height,
-        "thumbnail_uri": thumb_uri,
-        "embedding_model": _pipeline_model(),
-        "embedding_backend": embedding_backend,
-        "embedding_artifact": embedding_artifact,
-        "embedding_model_v2": (
-            _pipeline_model_v2() if config.vision_v2_enabled and vector_v2 is not None else None
-        ),
-        "embedding_backend_v2": embedding_backend_v2,
-        "embedding_artifact_v2": embedding_artifact_v2,
-        **tenancy_fields(
-            org_id=source.org_id,
-            site_id=source.site_id,
-            stream_id=source.stream_id,
-        ),
-        "pipeline_version": pipeline_version,
-        "schema_version": schema_version,
-    }
+    rows.media.append(
+        {
+            "id": media_asset_id,
+            "uri": source.uri,
+            "media_type": "image",
+            "content_type": source.content_type or "application/octet-stream",
+            "size_bytes": source.size_bytes or 0,
+            "source_bucket": source.bucket,
+            "source_object": source.name,
+            "source_generation": source.generation,
+            "checksum": source.md5_hash or source.crc32c,
+            "duration_ms": None,
+            "width_px": outcome.width,
+            "height_px": outcome.height,
+            "frame_count": None,
+            "sample_rate_hz": None,
+            "channels": None,
+            **tenancy,
+            "created_at": now,
+            "pipeline_version": pipeline_version,
+            "schema_version": schema_version,
+        }
+    )
+    rows.image_core.append(
+        {
+            "id": image_asset_id,
+            "media_asset_id": media_asset_id,
+            "frame_index": None,
+            "timestamp_ms": None,
+            "width_px": outcome.width,
+            "height_px": outcome.height,
+            "thumbnail_uri": outcome.thumb_uri,
+            "embedding_model": _pipeline_model(),
+            "embedding_backend": embedding_backend,
+            "embedding_artifact": embedding_artifact,
+            "embedding_model_v2": _pipeline_model_v2() if has_v2 else None,
+            "embedding_backend_v2": embedding_backend_v2,
+            "embedding_artifact_v2": embedding_artifact_v2,
+            **tenancy,
+            "pipeline_version": pipeline_version,
+            "schema_version": schema_version,
+        }
+    )
+    rows.image_vector.append(
+        {"clip_vector": outcome.vector, "vision_vector_v2": outcome.vector_v2}
+    )
+    rows.derived.append(
+        {
+            "src_id": image_asset_id,
+            "dst_id": media_asset_id,
+            "schema_version": schema_version,
+        }
+    )
+    if not outcome.ocr_text or ocr_vector is None:
+        return
+    ocr_text = outcome.ocr_text
+    chunk_id = str(uuid.uuid4())
+    token_count = len([token for token in ocr_text.split() if token.strip()])
+    rows.chunk_core.append(
+        {
+            "id": chunk_id,
+            "media_asset_id": media_asset_id,
+            "chunk_index": 0,
+            "char_start": 0,
+            "char_end": len(ocr_text),
+            "token_start": 0,
+            "token_end": token_count,
+            "token_count": token_count,
+            "source_type": "image",
+            "source_ref_id": image_asset_id,
+            "source_time_ms": None,
+            "ocr_conf_avg": outcome.ocr_conf_avg,
+            "embedding_model": os.getenv("TEXT_MODEL_NAME", "BAAI/bge-base-en-v1.5"),
+            "embedding_backend": text_embedding_backend,
+            "embedding_artifact": text_embedding_artifact,
+            **tenancy,
+            "pipeline_version": pipeline_version,
+            "schema_version": schema_version,
+        }
+    )
+    rows.chunk_text.append({"content": ocr_text})
+    rows.chunk_vector.append({"text_vector": ocr_vector})
+    rows.derived.append(
+        {
+            "src_id": chunk_id,
+            "dst_id": media_asset_id,
+            "schema_version": schema_version,
+        }
+    )
 
-    if ocr_text:
-        with timer.track("ocr_text_embed"):
-            ocr_vector = run_inference(
-                "text",
-                lambda: get_text_embedder(768).encode([ocr_text])[0],
-            )
-        chunk_id = str(uuid.uuid4())
-        token_count = len([token for token in ocr_text.split() if token.strip()])
-        ocr_chunk_core_rows.append(
-            {
-                "id": chunk_id,
-                "media_asset_id": media_asset_id,
-                "chunk_index": 0,
-                "char_start": 0,
-                "char_end": len(ocr_text),
-                "token_start": 0,
-                "token_end": token_count,
-                "token_count": token_count,
-                "source_type": "image",
-                "source_ref_id": image_asset_id,
-                "source_time_ms": None,
-                "ocr_conf_avg": ocr_conf_avg,
-                "embedding_model": os.getenv("TEXT_MODEL_NAME", "BAAI/bge-base-en-v1.5"),
-                "embedding_backend": text_embedding_backend,
-                "embedding_artifact": text_embedding_artifact,
-                **tenancy_fields(
-                    org_id=source.org_id,
-                    site_id=source.site_id,
-                    stream_id=source.stream_id,
-                ),
-                "pipeline_version": pipeline_version,
-                "schema_version": schema_version,
-            }
-        )
-        ocr_chunk_text_rows.append({"content": ocr_text})
-        ocr_chunk_vector_rows.append({"text_vector": ocr_vector})
-        ocr_edge_rows.append(
-            {
-                "src_id": chunk_id,
-                "dst_id": media_asset_id,
-                "schema_version": schema_version,
-            }
-        )
 
-    files: list[WriteResult] = []
-    with timer.track("write_parquet"):
-        compression = _image_parquet_compression()
-        row_group_size = _image_parquet_row_group_size()
-        derived_rows = [
-            {
-                "src_id": image_asset_id,
-                "dst_id": media_asset_id,
-                "schema_version": schema_version,
-            }
-        ]
-        derived_rows.extend(ocr_edge_rows)
-        jobs = [
-            (
-                [media_row],
-                schema_for("MediaAsset", "core"),
-                vertex_part_uri(
-                    output_root, "MediaAsset", "core", str(uuid.uuid4())
+def _write_image_parquet(rows: _ImageRows, output_root: str) -> list[WriteResult]:
+    jobs: list[tuple[list[dict[str, object]], object, str]] = [
+        (
+            rows.media,
+            schema_for("MediaAsset", "core"),
+            vertex_part_uri(output_root, "MediaAsset", "core", str(uuid.uuid4())),
+        ),
+        (
+            rows.image_core,
+            schema_for("ImageAsset", "core"),
+            vertex_part_uri(output_root, "ImageAsset", "core", str(uuid.uuid4())),
+        ),
+        (
+            rows.image_vector,
+            schema_for("ImageAsset", "vector"),
+            vertex_part_uri(output_root, "ImageAsset", "vector", str(uuid.uuid4())),
+        ),
+    ]
+    if rows.chunk_core:
+        jobs.extend(
+            [
+                (
+                    rows.chunk_core,
+                    schema_for("DocChunk", "core"),
+                    vertex_part_uri(output_root, "DocChunk", "core", str(uuid.uuid4())),
                 ),
-            ),
-            (
-                [image_core_row],
-                schema_for("ImageAsset", "core"),
-                vertex_part_uri(output_root, "ImageAsset", "core", str(uuid.uuid4())),
-            ),
-            (
-                [
-                    {
-                        "clip_vector": vector,
-                        "vision_vector_v2": vector_v2,
-                    }
-                ],
-                schema_for("ImageAsset", "vector"),
-                vertex_part_uri(
-                    output_root, "ImageAsset", "vector", str(uuid.uuid4())
+                (
+                    rows.chunk_text,
+                    schema_for("DocChunk", "text"),
+                    vertex_part_uri(output_root, "DocChunk", "text", str(uuid.uuid4())),
                 ),
-            ),
-        ]
-        if ocr_chunk_core_rows:
-            jobs.extend(
-                [
-                    (
-                        ocr_chunk_core_rows,
-                        schema_for("DocChunk", "core"),
-                        vertex_part_uri(output_root, "DocChunk", "core", str(uuid.uuid4())),
-                    ),
-                    (
-                        ocr_chunk_text_rows,
-                        schema_for("DocChunk", "text"),
-                        vertex_part_uri(output_root, "DocChunk", "text", str(uuid.uuid4())),
+                (
+                    rows.chunk_vector,
+                    schema_for("DocChunk", "vector"),
+                    vertex_part_uri(
+                        output_root, "DocChunk", "vector", str(uuid.uuid4())
                     ),
-                    (
-                        ocr_chunk_vector_rows,
-                        schema_for("DocChunk", "vector"),
-                        vertex_part_uri(
-                            output_root, "DocChunk", "vector", str(uuid.uuid4())
-                        ),
-                    ),
-                ]
-            )
-        jobs.append(
-            (
-                derived_rows,
-                schema_for("DerivedFrom", "adj_list"),
-                edge_part_uri(output_root, "DerivedFrom", str(uuid.uuid4())),
-            )
+                ),
+            ]
         )
-        files.extend(
-            _write_parquet_parallel(
-                jobs,
-                compression=compression,
-                row_group_size=row_group_size,
-            )
+    jobs.append(
+        (
+            rows.derived,
+            schema_for("DerivedFrom", "adj_list"),
+            edge_part_uri(output_root, "DerivedFrom", str(uuid.uuid4())),
         )
-
-    parquet_bytes = sum(item.bytes_written for item in files)
-    bytes_raw = source.size_bytes or 0
-    vector_dims = len(vector) if vector is not None else 0
-    vector_v2_dims = len(vector_v2) if vector_v2 is not None else 0
-    hashes: dict[str, str] = {}
-    if source.content_hash_sha256:
-        hashes["content_sha256"] = source.content_hash_sha256
-    raw_timings_preview = timer.summary()
-    stage_timings_preview = build_stage_timings(
-        raw_timings_preview,
-        {
-            "load_image": "decode_ms",
-            "image_embed": "embed_image_ms",
-            "image_embed_v2": "embed_image_ms",
-            "write_thumbnail": "write_blobs_ms",
-            "write_parquet": "write_parquet_ms",
-            "write_manifest": "write_manifest_ms",
-        },
     )
-    manifest_metrics = manifest_metrics_subset(
-        {
-            "io": {
-                "bytes_raw": bytes_raw,
-                "bytes_parquet": parquet_bytes,
-                "bytes_thumbnails": thumb_bytes,
-                "bytes_derived": parquet_bytes + thumb_bytes,
-            },
-                "quality": {
-                    "width_px": width,
-                    "height_px": height,
-                    "ocr_status": ocr_status,
-                    "ocr_conf_avg": ocr_conf_avg,
-                },
-                "hashes": hashes,
-                "embeddings": {
-                    "image": {
-                        "count": 1,
-                        "dims": vector_dims,
-                    },
-                    "vision_v2": {
-                        "count": 1 if vector_v2 is not None else 0,
-                        "dims": vector_v2_dims,
-                    },
-                    "text": {
-                        "count": len(ocr_chunk_vector_rows),
-                        "dims": 768 if ocr_chunk_vector_rows else 0,
-                    },
-                },
-                "evidence": {
-                    "frames": 1,
-                    "snippets": len(ocr_chunk_core_rows),
-                    "segments": 0,
-                },
-                "stage_timings_ms": stage_timings_preview,
-        }
+    return _write_parquet_parallel(
+        jobs,
+        compression=_image_parquet_compression(),
+        row_group_size=_image_parquet_row_group_size(),
     )
-    counts = {
-        "MediaAsset": 1,
-        "ImageAsset": 1,
-        "DerivedFrom": 1 + len(ocr_edge_rows),
-    }
-    if ocr_chunk_core_rows:
-        counts["DocChunk"] = len(ocr_chunk_core_rows)
-    completed_at = datetime.now(timezone.utc)
-    run_id = str(uuid.uuid4())
-    with timer.track("write_manifest"):
-        manifest = build_manifest(
-            pipeline_version=pipeline_version,
-            schema_version=schema_version,
-            counts=counts,
-            files=files,
-            started_at=started_at,
-            completed_at=completed_at,
-            metrics=manifest_metrics,
-        )
-        manifest_size = manifest_bytes(manifest, compact=True)
-        manifest_path = manifest_uri(output_root, run_id)
-        write_manifest(manifest, manifest_path, compact=True)
+
+
+def _run_metrics(
+    *,
+    timer: StageTimer,
+    stage_map: dict[str, str],
+    rows: _ImageRows,
+    outcomes: list[_ImageOutcome],
+    bytes_raw: int,
+    parquet_bytes: int,
+    quality: dict[str, object],
+    hashes: dict[str, object],
+) -> dict[str, object]:
+    thumb_bytes = sum(item.thumb_bytes for item in outcomes)
+    vector_dims = len(outcomes[0].vector) if outcomes else 0
+    v2_vectors = [item.vector_v2 for item in outcomes if item.vector_v2 is not None]
     raw_timings = timer.summary()
-    stage_timings_ms = build_stage_timings(
-        raw_timings,
-        {
-            "load_image": "decode_ms",
-            "ocr": "decode_ms",
-            "ocr_text_embed": "embed_text_ms",
-            "image_embed": "embed_image_ms",
-            "image_embed_v2": "embed_image_ms",
-            "write_thumbnail": "write_blobs_ms",
-            "write_parquet": "write_parquet_ms",
-            "write_manifest": "write_manifest_ms",
-        },
-    )
-    derived_breakdown = {
-        "manifest_b": manifest_size,
-        "parquet_b": parquet_bytes,
-        "thumbnails_b": thumb_bytes,
-        "frames_b": 0,
-        "transcript_b": 0,
-        "embeddings_b": 0,
-        "other_b": 0,
-    }
-    derived_total = sum(derived_breakdown.values())
-    metrics = {
+    stage_timings_ms = build_stage_timings(raw_timings, stage_map)
+    return {
         "timings_ms": raw_timings,
         "stage_timings_ms": stage_timings_ms,
         "pipe_ms": round(sum(stage_timings_ms.values()), 2),
-        "model_calls": calls.summary(),
         "io": {
             "bytes_raw": bytes_raw,
             "bytes_parquet": parquet_bytes,
             "bytes_thumbnails": thumb_bytes,
             "bytes_derived": parquet_bytes + thumb_bytes,
-            "bytes_manifest": manifest_size,
-            "derived_b_total": derived_total,
-            "derived_b_breakdown": derived_breakdown,
-        },
-        "quality": {
-            "width_px": width,
-            "height_px": height,
-            "ocr_status": ocr_status,
-            "ocr_conf_avg": ocr_conf_avg,
         },
+        "quality": quality,
         "hashes": hashes,
         "embeddings": {
             "image": {
-                "count": 1,
+                "count": len(outcomes),
                 "dims": vector_dims,
             },
             "vision_v2": {
-                "count": 1 if vector_v2 is not None else 0,
-                "dims": vector_v2_dims,
+                "count": len(v2_vectors),
+                "dims": len(v2_vectors[0]) if v2_vectors else 0,
             },
             "text": {
-                "count": len(ocr_chunk_vector_rows),
-                "dims": 768 if ocr_chunk_vector_rows else 0,
+                "count": len(rows.chunk_vector),
+                "dims": 768 if rows.chunk_vector else 0,
             },
         },
         "evidence": {
-            "frames": 1,
-            "snippets": len(ocr_chunk_core_rows),
+            "frames": len(outcomes),
+            "snippets": len(rows.chunk_core),
             "segments": 0,
         },
     }
 
+
+def _finish_run(
+    *,
+    timer: StageTimer,
+    calls: CallTracker,
+    rows: _ImageRows,
+    outcomes: list[_ImageOutcome],
+    files: list[WriteResult],
+    output_root: str,
+    started_at: datetime,
+    pipeline_version: str,
+    schema_version: str,
+    quality: dict[str, object],
+    hashes: dict[str, object],
+) -> tuple[str, dict[str, int], dict[str, object]]:
+    parquet_bytes = sum(item.bytes_written for item in files)
+    bytes_raw = sum(item.source.size_bytes or 0 for item in outcomes)
+    run_metrics = partial(
+        _run_metrics,
+        timer=timer,
+        rows=rows,
+        outcomes=outcomes,
+        bytes_raw=bytes_raw,
+        parquet_bytes=parquet_bytes,
+        quality=quality,
+        hashes=hashes,
+    )
+    manifest_metrics = manifest_metrics_subset(
+        run_metrics(stage_map=_PREVIEW_STAGE_MAP)
+    )
+    counts = rows.counts()
+    run_id = str(uuid.uuid4())
+    with timer.track("write_manifest"):
+        manifest = build_manifest(
+            pipeline_version=pipeline_version,
+            schema_version=schema_version,
+            counts=counts,
+            files=files,
+            started_at=started_at,
+            completed_at=datetime.now(timezone.utc),
+            metrics=manifest_metrics,
+        )
+        manifest_size = manifest_bytes(manifest, compact=True)
+        manifest_path = manifest_uri(output_root, run_id)
+        write_manifest(manifest, manifest_path, compact=True)
+
+    metrics = run_metrics(stage_map=_STAGE_MAP)
+    metrics["model_calls"] = calls.summary()
+    io = metrics["io"]
+    assert isinstance(io, dict)
+    derived_breakdown = {
+        "manifest_b": manifest_size,
+        "parquet_b": parquet_bytes,
+        "thumbnails_b": io["bytes_thumbnails"],
+        "frames_b": 0,
+        "transcript_b": 0,
+        "embeddings_b": 0,
+        "other_b": 0,
+    }
+    io["bytes_manifest"] = manifest_size
+    io["derived_b_total"] = sum(derived_breakdown.values())
+    io["derived_b_breakdown"] = derived_breakdown
+    return manifest_path, counts, metrics
+
+
+def ingest_image(
+    *,
+    source: IngestSource,
+    config: Config,
+    output_uri: str | None,
+    pipeline_version: str,
+    schema_version: str,
+) -> PipelineResult:
+    started_at = datetime.now(timezone.utc)
+    output_root = output_uri or config.graph_root_uri()
+    timer = StageTimer()
+    calls = CallTracker()
+
+    with timer.track("load_image"):
+        decoded = decode_image(source.local_path, decode_target_side(config))
+    rgb = decoded.image
+    embed_image = prepare_image_for_embed(rgb)
+    with timer.track("image_embed"):
+        vector = _embed_images([embed_image], calls)[0]
+    vector_v2: list[float] | None = None
+    if config.vision_v2_enabled:
+        with timer.track("image_embed_v2"):
+            vectors_v2 = _embed_images_v2_safe([embed_image], calls)
+        if vectors_v2:
+            vector_v2 = vectors_v2[0]
+
+    outcome = _ImageOutcome(
+        source=source,
+        width=decoded.width,
+        height=decoded.height,
+        vector=vector,
+        vector_v2=vector_v2,
+    )
+    if config.ocr_images:
+        with timer.track("ocr"):
+            text, conf_avg, status = _ocr_image(rgb, config)
+        outcome.ocr_text, outcome.ocr_conf_avg, outcome.ocr_status = (
+            text,
+            conf_avg,
+            status,
+        )
+
+    now = datetime.now(timezone.utc)
+    if config.video_thumbnail_width > 0:
+        outcome.thumb_uri = _thumbnail_uri(output_root, outcome.media_asset_id)
+        with timer.track("write_thumbnail"):
+            outcome.thumb_bytes = _write_thumbnail(
+                rgb, outcome.thumb_uri, config.video_thumbnail_width
+            )
+
+    ocr_vector: list[float] | None = None
+    if outcome.ocr_text:
+        with timer.track("ocr_text_embed"):
+            ocr_vector = _embed_ocr_texts([outcome.ocr_text])[0]
+    rows = _ImageRows()
+    _add_image_rows(
+        rows,
+        outcome,
+        ocr_vector=ocr_vector,
+        config=config,
+        now=now,
+        pipeline_version=pipeline_version,
+        schema_version=schema_version,
+    )
+
+    with timer.track("write_parquet"):
+        files = _write_image_parquet(rows, output_root)
+
+    hashes: dict[str, object] = {}
+    if source.content_hash_sha256:
+        hashes["content_sha256"] = source.content_hash_sha256
+    manifest_path, counts, metrics = _finish_run(
+        timer=timer,
+        calls=calls,
+        rows=rows,
+        outcomes=[outcome],
+        files=files,
+        output_root=output_root,
+        started_at=started_at,
+        pipeline_version=pipeline_version,
+        schema_version=schema_version,
+        quality={
+            "width_px": outcome.width,
+            "height_px": outcome.height,
+            "ocr_status": outcome.ocr_status,
+            "ocr_conf_avg": outcome.ocr_conf_avg,
+        },
+        hashes=hashes,
+    )
     return PipelineResult(
         counts=counts,
         manifest_uri=manifest_path,
-        media_asset_id=media_asset_id,
+        media_asset_id=outcome.media_asset_id,
+        metrics=metrics,
+    )
+
+
+def _image_batch_workers() -> int:
+    try:
+        value = int(os.getenv("IMAGE_BATCH_WORKERS", "0"))
+    except ValueError:
+        value = 0
+    if value > 0:
+        return value
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _decode_or_error(source: IngestSource, max_side: int) -> DecodedImage | str:
+    try:
+        return decode_image(source.local_path, max_side)
+    except Exception as exc:
+        return str(exc) or exc.__class__.__name__
+
+
+def ingest_images(
+    *,
+    sources: list[IngestSource],
+    config: Config,
+    output_uri: str | None,
+    pipeline_version: str,
+    schema_version: str,
+) -> BatchPipelineResult:
+    """Ingest many images as one run with one set of GraphAr files.
+
+    Sources are processed in windows of ``IMAGE_EMBED_BATCH_SIZE`` so only
+    one window of decoded images is held at a time; rows from every window
+    are written together once at the end. Decoding, OCR and thumbnails run
+    on a thread pool of ``IMAGE_BATCH_WORKERS``. Images that fail to decode
+    are reported in ``skipped`` rather than failing the batch.
+
+    No ingest service calls this entry point yet; the per-object services
+    still use :func:`ingest_image`.
+    """
+    if not sources:
+        raise PermanentError("No images to ingest")
+    started_at = datetime.now(timezone.utc)
+    output_root = output_uri or config.graph_root_uri()
+    timer = StageTimer()
+    calls = CallTracker()
+    target = decode_target_side(config)
+    window = image_embed_batch_size()
+    width = config.video_thumbnail_width
+
+    kept: list[int] = []
+    outcomes: list[_ImageOutcome] = []
+    skipped: dict[str, str] = {}
+    with ThreadPoolExecutor(
+        max_workers=min(_image_batch_workers(), len(sources)),
+        thread_name_prefix="image-batch",
+    ) as executor:
+        for offset in range(0, len(sources), window):
+            window_sources = sources[offset : offset + window]
+            with timer.track("load_image"):
+                decoded = list(
+                    executor.map(
+                        _decode_or_error,
+                        window_sources,
+                        [target] * len(window_sources),
+                    )
+                )
+            window_kept: list[tuple[int, DecodedImage]] = []
+            for idx, item in enumerate(decoded, start=offset):
+                if isinstance(item, DecodedImage):
+                    window_kept.append((idx, item))
+                else:
+                    skipped[sources[idx].uri] = item
+            del decoded
+            if not window_kept:
+                continue
+            images = [item.image for _, item in window_kept]
+            embed_images = list(executor.map(prepare_image_for_embed, images))
+
+            with timer.track("image_embed"):
+                vectors = _embed_images(embed_images, calls)
+            vectors_v2: list[list[float]] | None = None
+            if config.vision_v2_enabled:
+                with timer.track("image_embed_v2"):
+                    vectors_v2 = _embed_images_v2_safe(embed_images, calls)
+            del embed_images
+
+            window_outcomes = [
+                _ImageOutcome(
+                    source=sources[idx],
+                    width=item.width,
+                    height=item.height,
+                    vector=vectors[pos],
+                    vector_v2=vectors_v2[pos] if vectors_v2 else None,
+                )
+                for pos, (idx, item) in enumerate(window_kept)
+            ]
+            if config.ocr_images:
+                with timer.track("ocr"):
+                    ocr_results = list(
+                        executor.map(partial(_ocr_image, config=config), images)
+                    )
+                for outcome, (text, conf_avg, status) in zip(
+                    window_outcomes, ocr_results, strict=True
+                ):
+                    outcome.ocr_text, outcome.ocr_conf_avg, outcome.ocr_status = (
+                        text,
+                        conf_avg,
+                        status,
+                    )
+
+            if width > 0:
+                thumb_uris = [
+                    _thumbnail_uri(output_root, outcome.media_asset_id)
+                    for outcome in window_outcomes
+                ]
+                with timer.track("write_thumbnail"):
+                    thumb_sizes = list(
+                        executor.map(
+                            partial(_write_thumbnail, width=width), images, thumb_uris
+                        )
+                    )
+                for outcome, uri, size in zip(
+                    window_outcomes, thumb_uris, thumb_sizes, strict=True
+                ):
+                    outcome.thumb_uri, outcome.thumb_bytes = uri, size
+            kept.extend(idx for idx, _ in window_kept)
+            del images, window_kept
+            outcomes.extend(window_outcomes)
+    if not outcomes:
+        raise PermanentError("No decodable images in batch")
+
+    ocr_texts = [outcome.ocr_text for outcome in outcomes if outcome.ocr_text]
+    ocr_vectors: list[list[float]] = []
+    if ocr_texts:
+        with timer.track("ocr_text_embed"):
+            ocr_vectors = _embed_ocr_texts(ocr_texts)
+    vector_iter = iter(ocr_vectors)
+    now = datetime.now(timezone.utc)
+    rows = _ImageRows()
+    for outcome in outcomes:
+        _add_image_rows(
+            rows,
+            outcome,
+            ocr_vector=next(vector_iter) if outcome.ocr_text else None,
+            config=config,
+            now=now,
+            pipeline_version=pipeline_version,
+            schema_version=schema_version,
+        )
+
+    with timer.track("write_parquet"):
+        files = _write_image_parquet(rows, output_root)
+
+    ocr_statuses: dict[str, int] = {}
+    for outcome in outcomes:
+        ocr_statuses[outcome.ocr_status] = ocr_statuses.get(outcome.ocr_status, 0) + 1
+    hashes: dict[str, object] = {}
+    content_hashes = [outcome.source.content_hash_sha256 for outcome in outcomes]
+    if any(content_hashes):
+        hashes["content_sha256"] = content_hashes
+    manifest_path, counts, metrics = _finish_run(
+        timer=timer,
+        calls=calls,
+        rows=rows,
+        outcomes=outcomes,
+        files=files,
+        output_root=output_root,
+        started_at=started_at,
+        pipeline_version=pipeline_version,
+        schema_version=schema_version,
+        quality={
+            "images": len(outcomes),
+            "skipped": len(skipped),
+            "ocr_status_counts": ocr_statuses,
+        },
+        hashes=hashes,
+    )
+    media_ids: list[str | None] = [None] * len(sources)
+    for idx, outcome in zip(kept, outcomes, strict=True):
+        media_ids[idx] = outcome.media_asset_id
+    return BatchPipelineResult(
+        counts=counts,
+        manifest_uri=manifest_path,
+        media_asset_ids=tuple(media_ids),
+        skipped=skipped,
         metrics=metrics,
     )
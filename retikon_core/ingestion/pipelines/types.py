@@ -10,3 +10,13 @@ class PipelineResult:
     media_asset_id: str
     duration_ms: int | None = None
     metrics: dict[str, object] | None = None
+
+
+@dataclass(frozen=True)
+class BatchPipelineResult:
+    counts: dict[str, int]
+    manifest_uri: str
+    media_asset_ids: tuple[str | None, ...]
+    skipped: dict[str, str]
+    duration_ms: int | None = None
+    metrics: dict[str, object] | None = None
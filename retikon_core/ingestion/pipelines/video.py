@@ -20,7 +20,7 @@ from retikon_core.embeddings import (
     get_runtime_embedding_backend,
     get_text_embedder,
 )
-from retikon_core.embeddings.timeout import run_inference
+from retikon_core.embeddings.timeout import inference_timeout_seconds, run_inference
 from retikon_core.errors import InferenceTimeoutError, PermanentError
 from retikon_core.ingestion.download import cleanup_tmp
 from retikon_core.ingestion.media import (
@@ -42,7 +42,7 @@ from retikon_core.ingestion.pipelines.embedding_utils import (
     thumbnail_jpeg_quality,
     video_embed_max_dim,
 )
-from retikon_core.ingestion.ocr import ocr_result_from_image
+from retikon_core.ingestion.ocr import ocr_results_from_keyframes
 from retikon_core.ingestion.pipelines.types import PipelineResult
 from retikon_core.ingestion.transcription_policy import (
     resolve_transcribe_policy,
@@ -408,37 +408,38 @@ def ingest_video(
             ocr_candidates = len(selected_positions)
             ocr_items: list[tuple[str, int | None, int | None, str]] = []
             ocr_status = "empty"
+            ocr_frames = [
+                (pos, image_id_by_frame_index[pos])
+                for pos in selected_positions
+                if pos in image_id_by_frame_index
+            ]
+            budget_s = (
+                config.ocr_total_budget_ms / 1000.0
+                if config.ocr_total_budget_ms > 0
+                else None
+            )
+            timeout_s = inference_timeout_seconds("ocr")
             budget_start = time.monotonic()
-            for pos in selected_positions:
-                source_ref_id = image_id_by_frame_index.get(pos)
-                if source_ref_id is None:
-                    continue
-                elapsed_ms = (time.monotonic() - budget_start) * 1000.0
-                if config.ocr_total_budget_ms > 0 and elapsed_ms >= float(config.ocr_total_budget_ms):
-                    if ocr_items:
-                        ocr_status = "partial_budget"
-                    else:
-                        ocr_status = "budget_exhausted"
-                    break
-                frame_info = frame_infos[pos]
-                try:
-                    with Image.open(frame_info.path) as frame_image:
-                        rgb = frame_image.convert("RGB")
-                except Exception:
-                    continue
-                try:
-                    with timer.track("ocr"):
-                        ocr_result = run_inference(
-                            "ocr",
-                            lambda: ocr_result_from_image(
-                                rgb,
-                                min_confidence=config.ocr_min_confidence,
-                                min_text_len=config.ocr_min_text_len,
-                            ),
-                        )
-                except (InferenceTimeoutError, PermanentError):
-                    continue
-                except Exception:
+            try:
+                with timer.track("ocr"):
+                    ocr_results = ocr_results_from_keyframes(
+                        [frame_infos[pos].path for pos, _ in ocr_frames],
+                        min_confidence=config.ocr_min_confidence,
+                        min_text_len=config.ocr_min_text_len,
+                        timeout_s=timeout_s if timeout_s > 0 else None,
+                        budget_s=budget_s,
+                    )
+            except PermanentError:
+                ocr_results = [None] * len(ocr_frames)
+            budget_hit = (
+                budget_s is not None
+                and time.monotonic() - budget_start >= budget_s
+                and any(result is None for result in ocr_results)
+            )
+            for (pos, source_ref_id), ocr_result in zip(
+                ocr_frames, ocr_results, strict=True
+            ):
+                if ocr_result is None:
                     continue
                 ocr_processed += 1
                 if not ocr_result.text:
@@ -446,11 +447,13 @@ def ingest_video(
                 ocr_items.append(
                     (
                         source_ref_id,
-                        frame_info.timestamp_ms,
+                        frame_infos[pos].timestamp_ms,
                         ocr_result.conf_avg,
                         ocr_result.text,
                     )
                 )
+            if budget_hit:
+                ocr_status = "partial_budget" if ocr_items else "budget_exhausted"
             if ocr_items:
                 with timer.track("ocr_text_embed"):
                     ocr_vectors = run_inference(
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass
 
+import fsspec
+
 from retikon_core.config import Config
 from retikon_core.errors import PermanentError
 from retikon_core.ingestion.download import DownloadResult, cleanup_tmp, download_to_tmp
+from retikon_core.ingestion.idempotency import (
+    DedupeIndex,
+    DedupeRecord,
+    dedupe_record_keys,
+    resolve_scope_key,
+)
 from retikon_core.ingestion.pipelines import audio, document, image, video
-from retikon_core.ingestion.pipelines.metrics import StageTimer
+from retikon_core.ingestion.pipelines.metrics import (
+    StageTimer,
+    build_dedupe_stage_timings,
+)
 from retikon_core.ingestion.rate_limit import enforce_rate_limit
 from retikon_core.ingestion.storage_event import StorageEvent
 from retikon_core.ingestion.types import IngestSource
+from retikon_core.logging import get_logger
 from retikon_core.storage.paths import has_uri_scheme, join_uri
 from retikon_core.tenancy import scope_from_metadata
 from retikon_core.tenancy.types import TenantScope
 
+logger = get_logger(__name__)
+
 
 @dataclass(frozen=True)
 class PipelineOutcome:
@@ -290,6 +305,105 @@ def _run_pipeline(
     raise PermanentError(f"Unsupported modality: {modality}")
 
 
+def _dedupe_scope_key(scope: TenantScope | None, config: Config) -> str:
+    if scope is None:
+        return resolve_scope_key(
+            config.default_org_id,
+            config.default_site_id,
+            config.default_stream_id,
+        )
+    return resolve_scope_key(scope.org_id, scope.site_id, scope.stream_id)
+
+
+def _manifest_exists(manifest_uri: str) -> bool:
+    try:
+        fs, path = fsspec.core.url_to_fs(manifest_uri)
+        return bool(fs.exists(path))
+    except Exception:
+        return False
+
+
+def _find_dedupe_match(
+    dedupe: DedupeIndex,
+    key: str,
+    *,
+    pipeline_version_value: str,
+    size_bytes: int | None,
+) -> DedupeRecord | None:
+    try:
+        record = dedupe.get(key)
+    except Exception as exc:
+        logger.warning("Dedupe lookup failed", extra={"error_message": str(exc)})
+        return None
+    if record is None or not record.matches(
+        pipeline_version=pipeline_version_value,
+        size_bytes=size_bytes,
+    ):
+        return None
+    # Outputs deleted since the record was written must be rebuilt.
+    if not _manifest_exists(record.manifest_uri):
+        return None
+    return record
+
+
+def _dedupe_outcome(
+    record: DedupeRecord,
+    *,
+    modality: str,
+    source: str,
+    started: float,
+) -> PipelineOutcome:
+    pipe_ms = round((time.monotonic() - started) * 1000.0, 2)
+    return PipelineOutcome(
+        status="completed",
+        counts=dict(record.counts or {}),
+        manifest_uri=record.manifest_uri,
+        modality=modality,
+        media_asset_id=record.media_asset_id,
+        duration_ms=record.duration_ms,
+        metrics={
+            "stage_timings_ms": build_dedupe_stage_timings(pipe_ms),
+            "pipe_ms": pipe_ms,
+            "cache_hit": True,
+            "dedupe_source": source,
+        },
+    )
+
+
+def _record_dedupe(
+    dedupe: DedupeIndex,
+    outcome: PipelineOutcome,
+    *,
+    scope_key: str,
+    pipeline_version_value: str,
+    content_hash: str | None,
+    checksum: str | None,
+    size_bytes: int | None,
+) -> None:
+    if not outcome.manifest_uri or not outcome.modality:
+        return
+    record = DedupeRecord(
+        scope_key=scope_key,
+        pipeline_version=pipeline_version_value,
+        modality=outcome.modality,
+        manifest_uri=outcome.manifest_uri,
+        content_hash_sha256=content_hash,
+        checksum=checksum,
+        size_bytes=size_bytes,
+        media_asset_id=outcome.media_asset_id,
+        counts=dict(outcome.counts),
+        duration_ms=outcome.duration_ms,
+        completed_at=time.time(),
+    )
+    keys = dedupe_record_keys(record)
+    if not keys:
+        return
+    try:
+        dedupe.put(keys, record)
+    except Exception as exc:
+        logger.warning("Dedupe record failed", extra={"error_message": str(exc)})
+
+
 def process_event(
     *,
     event: StorageEvent,
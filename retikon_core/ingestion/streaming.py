@@ -6,6 +6,7 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Any, Iterable, Sequence
 
+from retikon_core.edge.policies import AdaptiveBatchPolicy, BackpressurePolicy
 from retikon_core.ingestion.storage_event import StorageEvent
 from retikon_core.queue import QueuePublisher
 
@@ -50,54 +51,155 @@ class StreamBackpressureError(RuntimeError):
 
 
 class StreamBatcher:
+    """Queue stream events and release them in batches.
+
+    With no policies the batcher flushes at a fixed size or latency. Given an
+    ``AdaptiveBatchPolicy``, the batch size and flush deadline are re-tuned on
+    every check from the load (queued events, or events received within the
+    policy's max delay when that is higher) and the smoothed cost of recent
+    flushes. A ``BackpressurePolicy`` replaces the fixed backlog cap: requests
+    are refused once the backlog reaches ``max_backlog``, and an admitted
+    request may fill it up to ``hard_limit``.
+    """
+
     def __init__(
         self,
         *,
         max_batch_size: int = 50,
         max_latency_s: float = 2.0,
         max_backlog: int = 1000,
+        batch_policy: AdaptiveBatchPolicy | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        latency_alpha: float = 0.2,
     ) -> None:
         self.max_batch_size = max_batch_size
         self.max_latency_s = max_latency_s
         self.max_backlog = max_backlog
+        self.batch_policy = batch_policy
+        self.backpressure = backpressure
+        self.latency_alpha = latency_alpha
         self._queue: deque[tuple[StreamEvent, float]] = deque()
+        self._arrivals: deque[float] = deque(
+            maxlen=batch_policy.high_watermark if batch_policy else 0
+        )
+        self._flush_ms: float | None = None
+        self._downstream_ms: float | None = None
 
     @property
     def backlog(self) -> int:
         return len(self._queue)
 
+    @property
+    def avg_latency_ms(self) -> float | None:
+        """Smoothed publish plus downstream processing time per batch."""
+        if self._flush_ms is None and self._downstream_ms is None:
+            return None
+        return (self._flush_ms or 0.0) + (self._downstream_ms or 0.0)
+
+    def targets(self, now: float | None = None) -> tuple[int, float]:
+        """Return the batch size and flush deadline (seconds) to apply now."""
+        if self.batch_policy is None:
+            return self.max_batch_size, self.max_latency_s
+        now = time.monotonic() if now is None else now
+        load = self._load(self.batch_policy, now)
+        batch, delay_ms = self.batch_policy.tune(load, self.avg_latency_ms)
+        return batch, delay_ms / 1000.0
+
     def can_accept(self, count: int = 1) -> bool:
+        projected = len(self._queue) + count
+        if self.backpressure is not None:
+            return (
+                self.backpressure.should_accept(len(self._queue))
+                and projected <= self.backpressure.hard_limit
+            )
         if self.max_backlog <= 0:
             return True
-        return (len(self._queue) + count) <= self.max_backlog
+        return projected <= self.max_backlog
+
+    def record_flush(self, duration_ms: float) -> None:
+        self._flush_ms = self._smooth(self._flush_ms, duration_ms)
+
+    def record_downstream(self, duration_ms: float) -> None:
+        self._downstream_ms = self._smooth(self._downstream_ms, duration_ms)
 
     def add(self, event: StreamEvent, now: float | None = None) -> list[StreamEvent]:
         if not self.can_accept():
             raise StreamBackpressureError("Stream backlog exceeded")
+        return self._push(event, now)
+
+    def add_many(
+        self,
+        events: Sequence[StreamEvent],
+        now: float | None = None,
+    ) -> list[list[StreamEvent]]:
+        """Admit ``events`` as one request and return the batches they fill."""
+        if not self.can_accept(len(events)):
+            raise StreamBackpressureError("Stream backlog exceeded")
+        batches: list[list[StreamEvent]] = []
+        for event in events:
+            batch = self._push(event, now)
+            if batch:
+                batches.append(batch)
+        return batches
+
+    def flush(self, now: float | None = None) -> list[StreamEvent]:
         now = time.monotonic() if now is None else now
-        self._queue.append((event, now))
         return self._maybe_flush(now)
 
-    def flush(self, now: float | None = None) -> list[StreamEvent]:
+    def next_flush_in(self, now: float | None = None) -> float | None:
+        """Seconds until the queued events are due, or None when empty."""
+        if not self._queue:
+            return None
+        now = time.monotonic() if now is None else now
+        batch_size, latency_s = self.targets(now)
+        if len(self._queue) >= batch_size or latency_s <= 0:
+            return 0.0
+        return max(0.0, self._queue[0][1] + latency_s - now)
+
+    def _push(self, event: StreamEvent, now: float | None) -> list[StreamEvent]:
         now = time.monotonic() if now is None else now
+        self._queue.append((event, now))
+        if self.batch_policy is not None:
+            self._arrivals.append(now)
         return self._maybe_flush(now)
 
     def _maybe_flush(self, now: float) -> list[StreamEvent]:
         if not self._queue:
             return []
-        if len(self._queue) >= self.max_batch_size:
+        batch_size, latency_s = self.targets(now)
+        if len(self._queue) >= batch_size:
             return self._drain()
         oldest_time = self._queue[0][1]
-        if self.max_latency_s <= 0:
+        if latency_s <= 0:
             return self._drain()
-        if (now - oldest_time) >= self.max_latency_s:
+        if (now - oldest_time) >= latency_s:
             return self._drain()
         return []
 
     def _drain(self) -> list[StreamEvent]:
-        items = [event for event, _ in self._queue]
-        self._queue.clear()
-        return items
+        if self.batch_policy is None:
+            items = [event for event, _ in self._queue]
+            self._queue.clear()
+            return items
+        # Cap adaptive batches at the policy maximum; the remainder keeps its
+        # arrival times and is released by the next flush.
+        count = min(len(self._queue), self.batch_policy.max_batch)
+        return [self._queue.popleft()[0] for _ in range(count)]
+
+    def _load(self, policy: AdaptiveBatchPolicy, now: float) -> int:
+        # Flushing keeps the queue short, so the recent arrival rate is what
+        # reveals a burst. Arrivals older than the longest wait no longer count.
+        window_s = max(policy.max_delay_ms, 1000) / 1000.0
+        while self._arrivals and now - self._arrivals[0] > window_s:
+            self._arrivals.popleft()
+        return max(len(self._queue), len(self._arrivals))
+
+    def _smooth(self, current: float | None, sample: float) -> float | None:
+        if sample < 0:
+            return current
+        if current is None:
+            return sample
+        return current + self.latency_alpha * (sample - current)
 
 
 class StreamIngestPipeline:
@@ -122,13 +224,12 @@ class StreamIngestPipeline:
     def enqueue_events(
         self, events: Iterable[StreamEvent], now: float | None = None
     ) -> StreamDispatchResult:
-        message_ids: list[str] = []
-        accepted = 0
-        for event in events:
-            accepted += 1
-            batch = self.batcher.add(event, now=now)
-            if batch:
-                message_ids.append(self._publish_batch(batch))
+        admitted = list(events)
+        message_ids = [
+            self._publish_batch(batch)
+            for batch in self.batcher.add_many(admitted, now=now)
+        ]
+        accepted = len(admitted)
         return StreamDispatchResult(
             accepted=accepted,
             queued=accepted,
@@ -138,18 +239,23 @@ class StreamIngestPipeline:
         )
 
     def flush(self, now: float | None = None) -> tuple[str, ...]:
-        batch = self.batcher.flush(now=now)
-        if not batch:
-            return ()
-        message_id = self._publish_batch(batch)
-        return (message_id,)
+        message_ids: list[str] = []
+        while True:
+            batch = self.batcher.flush(now=now)
+            if not batch:
+                break
+            message_ids.append(self._publish_batch(batch))
+        return tuple(message_ids)
 
     def _publish_batch(self, events: Sequence[StreamEvent]) -> str:
         payload = {
             "events": [stream_event_to_dict(event) for event in events],
         }
         data = json.dumps(payload).encode("utf-8")
-        return self.publisher.publish(topic=self.topic, data=data)
+        started = time.perf_counter()
+        message_id = self.publisher.publish(topic=self.topic, data=data)
+        self.batcher.record_flush((time.perf_counter() - started) * 1000.0)
+        return message_id
 
 
 def stream_event_to_dict(event: StreamEvent) -> dict[str, Any]:
@@ -1,4 +1,5 @@
 from retikon_core.privacy.engine import (
+    PrivacyRedactor,
     build_context,
     redact_text_for_context,
     redaction_plan_for_context,
@@ -15,6 +16,7 @@ from retikon_core.privacy.types import PrivacyContext, PrivacyPolicy
 __all__ = [
     "PrivacyContext",
     "PrivacyPolicy",
+    "PrivacyRedactor",
     "build_context",
     "load_privacy_policies",
     "privacy_policy_registry_uri",
@@ -6,9 +6,10 @@ from typing import Iterable
 from retikon_core.privacy.types import PrivacyContext, PrivacyPolicy
 from retikon_core.redaction import (
     RedactionPlan,
+    TextRedactor,
+    compile_redactor,
     media_redaction_enabled,
     plan_media_redaction,
-    redact_text,
 )
 from retikon_core.tenancy.types import TenantScope
 
@@ -47,20 +48,54 @@ def resolve_redaction_types(
     return tuple(requested)
 
 
+class PrivacyRedactor:
+    """Text redaction for one set of policies, compiled once per context.
+
+    Policy resolution and matcher compilation happen the first time a
+    context is seen. Later strings in that context reuse the compiled
+    matcher.
+    """
+
+    def __init__(self, policies: Iterable[PrivacyPolicy]) -> None:
+        self.policies = tuple(policies)
+        self._redactors: dict[PrivacyContext, TextRedactor | None] = {}
+
+    def redactor_for(self, context: PrivacyContext) -> TextRedactor | None:
+        try:
+            return self._redactors[context]
+        except KeyError:
+            pass
+        redactor: TextRedactor | None = None
+        if not (context.is_admin and _admin_bypass_enabled()):
+            redaction_types = resolve_redaction_types(self.policies, context)
+            if redaction_types:
+                redactor = compile_redactor(redaction_types)
+                if not redactor.active:
+                    redactor = None
+        self._redactors[context] = redactor
+        return redactor
+
+    def redact(self, text: str | None, context: PrivacyContext) -> str | None:
+        if not text:
+            return text
+        redactor = self.redactor_for(context)
+        if redactor is None:
+            return text
+        return redactor.redact(text)
+
+
 def redact_text_for_context(
     text: str | None,
     *,
-    policies: Iterable[PrivacyPolicy],
+    policies: Iterable[PrivacyPolicy] | PrivacyRedactor,
     context: PrivacyContext,
 ) -> str | None:
     if text is None:
         return None
-    if context.is_admin and _admin_bypass_enabled():
-        return text
-    redaction_types = resolve_redaction_types(policies, context)
-    if not redaction_types:
-        return text
-    return redact_text(text, redaction_types=redaction_types)
+    redactor = (
+        policies if isinstance(policies, PrivacyRedactor) else PrivacyRedactor(policies)
+    )
+    return redactor.redact(text, context)
 
 
 def redaction_plan_for_context(
@@ -7,6 +7,7 @@ import os
 import shutil
 import time
 import urllib.request
+import uuid
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
@@ -21,8 +22,27 @@ from retikon_core.query_engine.duckdb_auth import (
     DuckDBAuthContext,
     load_duckdb_auth_provider,
 )
+from retikon_core.query_engine.quantization import (
+    build_quantized_column,
+    float_table_name,
+    measure_recall,
+    parse_quantization_config,
+    rescore_factor,
+    restore_float_column,
+)
+from retikon_core.query_engine.snapshot import file_sha256
 from retikon_core.query_engine.uri_signer import load_duckdb_uri_signer
 from retikon_core.query_engine.warm_start import load_extensions
+from retikon_core.storage.manifest_catalog import (
+    CATALOG_DIR,
+    CATALOG_FILE,
+    CATALOG_LOG_DIR,
+    CATALOG_WATERMARK_DIR,
+    ManifestRecord,
+    list_manifests,
+    list_uncompacted_manifests,
+    read_manifest_record,
+)
 from retikon_core.storage.paths import (
     backend_scheme,
     graph_root,
@@ -32,6 +52,11 @@ from retikon_core.storage.paths import (
 )
 
 SERVICE_NAME = "retikon-index-builder"
+URI_TRIGRAM_TABLE = "media_uri_trigrams"
+_FTS_INDEX_SPECS = (
+    ("doc_chunks_content_fts", "doc_chunks"),
+    ("transcripts_content_fts", "transcripts"),
+)
 
 logger = get_logger(__name__)
 
@@ -71,6 +96,8 @@ class IndexBuildReport:
     total_vectors: int | None = None
     snapshot_manifest_count: int | None = None
     index_queue_length: int | None = None
+    vector_quantization: dict[str, dict[str, Any]] | None = None
+    snapshot_sha256: str | None = None
     skipped: bool = False
 
 
@@ -123,30 +150,6 @@ def _is_remote(uri: str) -> bool:
     return bool(parsed.scheme and parsed.netloc)
 
 
-def _parse_iso(value: str | None) -> datetime:
-    if not value:
-        return datetime.now(timezone.utc)
-    if value.endswith("Z"):
-        value = f"{value[:-1]}+00:00"
-    return datetime.fromisoformat(value).astimezone(timezone.utc)
-
-
-def _run_id_from_manifest_uri(uri: str) -> str:
-    parsed = urlparse(uri)
-    path = parsed.path if parsed.scheme else uri
-    parts = path.strip("/").split("/")
-    if "manifests" in parts:
-        idx = parts.index("manifests")
-        if len(parts) > idx + 1:
-            return parts[idx + 1]
-    return "unknown"
-
-
-def _manifest_hash(payload: dict[str, Any]) -> str:
-    serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(serialized).hexdigest()
-
-
 def _manifest_fingerprint(entries: Iterable[ManifestEntry]) -> str | None:
     parts = sorted(f"{entry.run_id}:{entry.content_hash}" for entry in entries)
     if not parts:
@@ -164,16 +167,10 @@ _TABLE_BY_VERTEX: dict[str, str] = {
 }
 
 
-def _rows_added_by_table(manifest_uris: Iterable[str]) -> dict[str, int]:
+def _rows_added_by_table(records: Iterable[ManifestRecord]) -> dict[str, int]:
     rows_by_table: dict[str, int] = {}
-    for uri in manifest_uris:
-        manifest = _read_manifest(uri)
-        files = manifest.get("files")
-        if not isinstance(files, list):
-            continue
-        for item in files:
-            if not isinstance(item, dict):
-                continue
+    for record in records:
+        for item in record.files:
             file_uri = item.get("uri")
             if not file_uri:
                 continue
@@ -198,19 +195,17 @@ def _rows_added_by_table(manifest_uris: Iterable[str]) -> dict[str, int]:
 
 
 def _compaction_metrics(
-    manifest_uris: Iterable[str],
+    records: Iterable[ManifestRecord],
 ) -> tuple[int, float | None]:
     count = 0
     latest_completed: datetime | None = None
     latest_duration: float | None = None
-    for uri in manifest_uris:
-        run_id = _run_id_from_manifest_uri(uri)
-        if not run_id.startswith("compaction-"):
+    for record in records:
+        if not record.is_compaction:
             continue
         count += 1
-        manifest = _read_manifest(uri)
-        started_at = _parse_iso(str(manifest.get("started_at") or ""))
-        completed_at = _parse_iso(str(manifest.get("completed_at") or ""))
+        completed_at = record.completed_at
+        started_at = record.started_at or completed_at
         duration = max(0.0, (completed_at - started_at).total_seconds())
         if latest_completed is None or completed_at > latest_completed:
             latest_completed = completed_at
@@ -268,12 +263,6 @@ def _vertex_kind_from_uri(uri: str) -> tuple[str, str] | None:
     return parts[idx + 1], parts[idx + 2]
 
 
-def _read_manifest(uri: str) -> dict[str, Any]:
-    fs, path = fsspec.core.url_to_fs(uri)
-    with fs.open(path, "rb") as handle:
-        return json.load(handle)
-
-
 def _localize_manifest_uri(
     uri: str,
     *,
@@ -296,12 +285,15 @@ def _load_manifest_groups(
     source_uri: str | None = None,
     use_latest_compaction: bool = False,
     manifest_uris: list[str] | None = None,
+    records: list[ManifestRecord] | None = None,
     skip_missing_files: bool = False,
 ) -> tuple[dict[str, list[ManifestGroup]], list[str], bool, str | None, int, list[str]]:
-    if manifest_uris is None:
-        manifest_glob = join_uri(base_uri, "manifests", "*", "manifest.json")
-        manifest_uris = _glob_files(manifest_glob)
-    if not manifest_uris:
+    if records is None:
+        if manifest_uris is None:
+            records = list_manifests(base_uri)
+        else:
+            records = [read_manifest_record(uri) for uri in manifest_uris]
+    if not records:
         return {}, [], False, None, 0, []
 
     local_root = Path(base_uri).resolve()
@@ -314,29 +306,17 @@ def _load_manifest_groups(
             raise ValueError("source_uri is required when mapping manifests locally")
         source_scheme, source_container, source_prefix = _parse_remote_uri(source_uri)
 
-    entries: list[ManifestEntry] = []
-    for manifest_uri in manifest_uris:
-        manifest = _read_manifest(manifest_uri)
-        files_raw = manifest.get("files")
-        files = (
-            tuple(item for item in files_raw if isinstance(item, dict))
-            if isinstance(files_raw, list)
-            else tuple()
-        )
-        run_id = _run_id_from_manifest_uri(manifest_uri)
-        completed_at = _parse_iso(
-            str(manifest.get("completed_at") or manifest.get("started_at") or "")
-        )
-        entries.append(
-            ManifestEntry(
-                uri=manifest_uri,
-                run_id=run_id,
-                completed_at=completed_at,
-                is_compaction=run_id.startswith("compaction-"),
-                content_hash=_manifest_hash(manifest),
-                files=files,
-            )
+    entries = [
+        ManifestEntry(
+            uri=record.uri,
+            run_id=record.run_id,
+            completed_at=record.completed_at,
+            is_compaction=record.is_compaction,
+            content_hash=record.content_hash,
+            files=record.files,
         )
+        for record in records
+    ]
 
     selected_entries = _select_manifest_entries(
         entries,
@@ -435,6 +415,9 @@ def _copy_graph_to_local(base_uri: str, work_dir: str) -> str:
 
     patterns = [
         join_uri(base_uri, "manifests", "*", "manifest.json"),
+        join_uri(base_uri, "manifests", CATALOG_DIR, CATALOG_FILE),
+        join_uri(base_uri, "manifests", CATALOG_DIR, CATALOG_LOG_DIR, "*.parquet"),
+        join_uri(base_uri, "manifests", CATALOG_DIR, CATALOG_WATERMARK_DIR, "*.json"),
         join_uri(base_uri, "vertices", "DocChunk", "core", "*.parquet"),
         join_uri(base_uri, "vertices", "DocChunk", "text", "*.parquet"),
         join_uri(base_uri, "vertices", "DocChunk", "vector", "*.parquet"),
@@ -796,6 +779,7 @@ def _report_from_existing(
         total_vectors=payload.get("total_vectors"),
         snapshot_manifest_count=snapshot_manifest_count,
         index_queue_length=index_queue_length,
+        vector_quantization=payload.get("vector_quantization"),
         skipped=True,
     )
 
@@ -805,7 +789,11 @@ def _upload_file(src_path: str, dest_uri: str) -> None:
     if not parsed.scheme or not parsed.netloc:
         dest = Path(dest_uri)
         dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dest)
+        # Query services open local snapshots in place; swap the file
+        # atomically so open readers never see a partial write.
+        partial = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.partial")
+        shutil.copy2(src_path, partial)
+        os.replace(partial, dest)
         return
     fs, path = fsspec.core.url_to_fs(dest_uri)
     fs.makedirs(os.path.dirname(path), exist_ok=True)
@@ -930,6 +918,31 @@ def _media_assets_select(
     return ", ".join(select_parts)
 
 
+def _build_uri_trigram_index(conn: duckdb.DuckDBPyConnection) -> int:
+    # Lower-cased URI trigrams, sorted so zone maps and the ART index can
+    # narrow `uri ILIKE '%...%'` lookups to a handful of candidate assets.
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TABLE {URI_TRIGRAM_TABLE} AS
+        SELECT DISTINCT substr(uri_lower, pos, 3) AS trigram, media_asset_id
+        FROM (
+            SELECT id AS media_asset_id,
+                   lower(uri) AS uri_lower,
+                   unnest(range(1, length(lower(uri)) - 1)) AS pos
+            FROM media_assets
+            WHERE uri IS NOT NULL AND id IS NOT NULL
+        )
+        ORDER BY trigram, media_asset_id
+        """
+    )
+    conn.execute(
+        f"CREATE INDEX {URI_TRIGRAM_TABLE}_trigram "
+        f"ON {URI_TRIGRAM_TABLE} (trigram)"
+    )
+    row = conn.execute(f"SELECT COUNT(*) FROM {URI_TRIGRAM_TABLE}").fetchone()
+    return int(row[0]) if row else 0
+
+
 def build_snapshot(
     *,
     graph_uri: str,
@@ -946,6 +959,8 @@ def build_snapshot(
     incremental_max_new_manifests: int | None = None,
     incremental_min_new_manifests: int | None = None,
     skip_missing_files: bool = False,
+    vector_quantization: str | None = None,
+    quantization_recall_samples: int = 16,
 ) -> IndexBuildReport:
     start = time.time()
     started_at = datetime.now(timezone.utc).isoformat()
@@ -966,6 +981,14 @@ def build_snapshot(
         base_uri: str,
         source_uri: str | None = None,
     ) -> tuple[IndexBuildReport, str]:
+        # The latest compaction's watermark names exactly the runs it has not
+        # consumed; trees without one fall back to the completed_at cutoff.
+        manifest_records = (
+            list_uncompacted_manifests(base_uri) if use_latest_compaction else None
+        )
+        select_latest = use_latest_compaction and manifest_records is None
+        if manifest_records is None:
+            manifest_records = list_manifests(base_uri)
         (
             groups,
             media_files,
@@ -976,7 +999,8 @@ def build_snapshot(
         ) = _load_manifest_groups(
             base_uri,
             source_uri=source_uri,
-            use_latest_compaction=use_latest_compaction,
+            use_latest_compaction=select_latest,
+            records=manifest_records,
             skip_missing_files=skip_missing_files,
         )
         snapshot_manifest_count = None
@@ -1088,7 +1112,12 @@ def build_snapshot(
                 logger.warning("Incremental index build disabled; base snapshot missing.")
                 new_manifest_uris = None
                 new_manifest_count = None
+        new_records: list[ManifestRecord] | None = None
         if new_manifest_uris:
+            new_uri_set = set(new_manifest_uris)
+            new_records = [
+                record for record in manifest_records if record.uri in new_uri_set
+            ]
             (
                 groups,
                 media_files,
@@ -1099,8 +1128,8 @@ def build_snapshot(
             ) = _load_manifest_groups(
                 base_uri,
                 source_uri=source_uri,
-                use_latest_compaction=use_latest_compaction,
-                manifest_uris=new_manifest_uris,
+                use_latest_compaction=select_latest,
+                records=new_records,
                 skip_missing_files=skip_missing_files,
             )
 
@@ -1901,6 +1930,18 @@ def build_snapshot(
         ]
 
         indexes: dict[str, dict[str, Any]] = {}
+        quantization_modes = parse_quantization_config(
+            vector_quantization,
+            [spec[0] for spec in index_specs],
+        )
+        quantization_report: dict[str, dict[str, Any]] = {}
+        for _, table, column, dim in index_specs:
+            float_table = float_table_name(table, column)
+            if incremental_mode and _table_exists(conn, "base", float_table):
+                conn.execute(
+                    f"CREATE TABLE {float_table} AS SELECT * FROM base.{float_table}"
+                )
+            restore_float_column(conn, table=table, column=column, dim=dim)
         prev_size = _file_size_bytes(str(db_path))
         build_vectors_start = time.monotonic()
         hnsw_build_seconds = 0.0
@@ -1916,7 +1957,13 @@ def build_snapshot(
                 ")"
             )
 
-        for index_name, table, column, dim in index_specs:
+        # Quantizing drops the float column, which DuckDB refuses once the
+        # table carries an HNSW index, so quantized columns go first.
+        ordered_specs = sorted(
+            index_specs,
+            key=lambda spec: spec[0] not in quantization_modes,
+        )
+        for index_name, table, column, dim in ordered_specs:
             try:
                 non_null_rows = int(
                     conn.execute(
@@ -1937,6 +1984,53 @@ def build_snapshot(
                     "status": "skipped_empty",
                 }
                 continue
+            quantization_mode = quantization_modes.get(index_name)
+            if quantization_mode:
+                quantize_start = time.monotonic()
+                spec = build_quantized_column(
+                    conn,
+                    table=table,
+                    column=column,
+                    dim=dim,
+                    mode=quantization_mode,
+                )
+                conn.execute("CHECKPOINT")
+                quantize_seconds = round(time.monotonic() - quantize_start, 2)
+                new_size = _file_size_bytes(str(db_path))
+                size_delta = max(0, new_size - prev_size)
+                prev_size = new_size
+                index_size_delta_bytes += size_delta
+                quantization_report[index_name] = {
+                    "table": table,
+                    "column": column,
+                    "code_column": spec.code_column,
+                    "float_table": spec.float_table,
+                    "mode": quantization_mode,
+                    "dim": dim,
+                    "rows": non_null_rows,
+                    "size_bytes": size_delta,
+                    "build_seconds": quantize_seconds,
+                    **measure_recall(
+                        conn,
+                        spec,
+                        sample_size=quantization_recall_samples,
+                        top_k=10,
+                        rescore_factor=rescore_factor(),
+                    ),
+                }
+                # Codes replace the in-memory HNSW graph for this column;
+                # queries rescore code candidates against the float side table.
+                indexes[index_name] = {
+                    "table": table,
+                    "column": column,
+                    "dim": dim,
+                    "ef_construction": hnsw_ef_value,
+                    "m": hnsw_m_value,
+                    "size_bytes": 0,
+                    "build_seconds": 0.0,
+                    "status": "skipped_quantized",
+                }
+                continue
             index_start = time.monotonic()
             conn.execute(
                 f"CREATE INDEX {index_name} ON {table} USING HNSW ({column})"
@@ -1965,35 +2059,66 @@ def build_snapshot(
             "yes",
             "on",
         }:
-            if _table_has_column(conn, "doc_chunks", "id") and _table_has_column(
-                conn,
-                "doc_chunks",
-                "content",
-            ):
+            for index_name, table in _FTS_INDEX_SPECS:
+                if not (
+                    _table_has_column(conn, table, "id")
+                    and _table_has_column(conn, table, "content")
+                ):
+                    continue
                 fts_start = time.monotonic()
                 try:
                     conn.execute(
-                        "PRAGMA create_fts_index('doc_chunks', 'id', 'content', overwrite=1)"
+                        f"PRAGMA create_fts_index('{table}', 'id', 'content', "
+                        "overwrite=1)"
                     )
                     conn.execute("CHECKPOINT")
                 except duckdb.Error as exc:
                     logger.warning(
                         "FTS index build skipped",
-                        extra={"error_message": str(exc)},
+                        extra={"table": table, "error_message": str(exc)},
                     )
-                else:
-                    fts_seconds = round(time.monotonic() - fts_start, 2)
-                    new_size = _file_size_bytes(str(db_path))
-                    size_delta = max(0, new_size - prev_size)
-                    indexes["doc_chunks_content_fts"] = {
-                        "table": "doc_chunks",
-                        "column": "content",
-                        "type": "fts",
-                        "size_bytes": size_delta,
-                        "build_seconds": fts_seconds,
-                    }
-                    index_size_delta_bytes += size_delta
-                    prev_size = new_size
+                    continue
+                fts_seconds = round(time.monotonic() - fts_start, 2)
+                new_size = _file_size_bytes(str(db_path))
+                size_delta = max(0, new_size - prev_size)
+                indexes[index_name] = {
+                    "table": table,
+                    "column": "content",
+                    "type": "fts",
+                    "size_bytes": size_delta,
+                    "build_seconds": fts_seconds,
+                }
+                index_size_delta_bytes += size_delta
+                prev_size = new_size
+
+        if _table_has_column(conn, "media_assets", "id") and _table_has_column(
+            conn,
+            "media_assets",
+            "uri",
+        ):
+            trigram_start = time.monotonic()
+            try:
+                trigram_rows = _build_uri_trigram_index(conn)
+                conn.execute("CHECKPOINT")
+            except duckdb.Error as exc:
+                logger.warning(
+                    "URI trigram index build skipped",
+                    extra={"error_message": str(exc)},
+                )
+            else:
+                trigram_seconds = round(time.monotonic() - trigram_start, 2)
+                new_size = _file_size_bytes(str(db_path))
+                size_delta = max(0, new_size - prev_size)
+                indexes["media_assets_uri_trigram"] = {
+                    "table": URI_TRIGRAM_TABLE,
+                    "column": "uri",
+                    "type": "trigram",
+                    "rows": trigram_rows,
+                    "size_bytes": size_delta,
+                    "build_seconds": trigram_seconds,
+                }
+                index_size_delta_bytes += size_delta
+                prev_size = new_size
 
         build_vectors_seconds = round(time.monotonic() - build_vectors_start, 2)
 
@@ -2002,7 +2127,11 @@ def build_snapshot(
         conn.close()
         write_snapshot_seconds = round(time.monotonic() - write_snapshot_start, 2)
 
-        rows_added_by_table = _rows_added_by_table(new_manifest_uris or manifest_uris)
+        selected_uris = set(manifest_uris)
+        rows_added_by_table = _rows_added_by_table(
+            new_records
+            or [record for record in manifest_records if record.uri in selected_uris]
+        )
         if not rows_added_by_table:
             rows_added_by_table = {
                 table: int(info.get("rows") or 0) for table, info in tables.items()
@@ -2022,7 +2151,9 @@ def build_snapshot(
                 int(rows_added_by_table.get(table, 0) or 0)
                 for table in vector_tables
             )
-        compaction_count, latest_compaction_duration = _compaction_metrics(manifest_uris)
+        compaction_count, latest_compaction_duration = _compaction_metrics(
+            record for record in manifest_records if record.uri in selected_uris
+        )
         snapshot_manifest_count = manifest_count
         index_queue_length = 0
 
@@ -2057,6 +2188,7 @@ def build_snapshot(
             total_vectors=total_vectors,
             snapshot_manifest_count=snapshot_manifest_count,
             index_queue_length=index_queue_length,
+            vector_quantization=quantization_report or None,
         )
         logger.info(
             "DuckDB auth initialized",
@@ -2096,8 +2228,11 @@ def build_snapshot(
         if cleanup_dir and cleanup_dir.exists():
             shutil.rmtree(cleanup_dir, ignore_errors=True)
         return report
+    report = replace(report, snapshot_sha256=file_sha256(db_path))
     _write_report(report, report_path)
 
+    # The sidecar lands after the snapshot; readers that catch the new file
+    # beside the old checksum re-read the sidecar once before failing.
     snapshot_upload_start = time.monotonic()
     _upload_file(str(db_path), snapshot_uri)
     snapshot_upload_seconds = round(time.monotonic() - snapshot_upload_start, 2)
@@ -2179,6 +2314,7 @@ def _config_from_env() -> dict[str, Any]:
         hnsw_m_value = int(hnsw_m) if hnsw_m else 16
     except ValueError as exc:
         raise ValueError("HNSW_EF_CONSTRUCTION and HNSW_M must be integers") from exc
+    recall_samples = os.getenv("INDEX_QUANTIZATION_RECALL_SAMPLES", "").strip()
     return {
         "graph_uri": graph_uri,
         "snapshot_uri": snapshot_uri,
@@ -2196,6 +2332,10 @@ def _config_from_env() -> dict[str, Any]:
         "incremental_min_new_manifests": incremental_min_value,
         "skip_missing_files": os.getenv("INDEX_BUILDER_SKIP_MISSING_FILES", "0")
         == "1",
+        "vector_quantization": os.getenv("INDEX_VECTOR_QUANTIZATION") or None,
+        "quantization_recall_samples": int(recall_samples)
+        if recall_samples.isdigit()
+        else 16,
     }
 
 
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import duckdb
+
+QUANTIZATION_TABLE = "vector_quantization"
+QUANTIZATION_MODES = ("int8", "binary")
+
+_CODE_SUFFIX = {"int8": "int8", "binary": "bits"}
+
+
+@dataclass(frozen=True)
+class QuantizedColumn:
+    table: str
+    column: str
+    code_column: str
+    mode: str
+    dim: int
+
+    @property
+    def float_table(self) -> str:
+        return float_table_name(self.table, self.column)
+
+    @property
+    def key_column(self) -> str:
+        return key_column_name(self.column)
+
+
+def normalize_mode(value: str | None) -> str | None:
+    if value is None:
+        return None
+    cleaned = value.strip().lower()
+    if cleaned in {"", "none", "off", "0", "false", "float"}:
+        return None
+    if cleaned in {"int8", "scalar", "sq8"}:
+        return "int8"
+    if cleaned in {"binary", "bit", "bits", "sign"}:
+        return "binary"
+    raise ValueError(f"Unsupported vector quantization mode: {value}")
+
+
+def parse_quantization_config(
+    raw: str | None,
+    index_names: Sequence[str],
+) -> dict[str, str]:
+    """Parse `int8` or `index_name=mode,...` into an index -> mode mapping."""
+    if not raw or not raw.strip():
+        return {}
+    cleaned = raw.strip()
+    if "=" not in cleaned:
+        mode = normalize_mode(cleaned)
+        return {name: mode for name in index_names} if mode else {}
+    modes: dict[str, str] = {}
+    for item in cleaned.split(","):
+        if "=" not in item:
+            continue
+        key, value = item.split("=", 1)
+        key = key.strip()
+        if key not in index_names:
+            raise ValueError(f"Unknown vector index for quantization: {key}")
+        mode = normalize_mode(value)
+        if mode:
+            modes[key] = mode
+    return modes
+
+
+def rescore_factor() -> int:
+    raw = os.getenv("QUERY_QUANTIZED_RESCORE_FACTOR", "4")
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 4
+    return max(1, value)
+
+
+def code_column_name(column: str, mode: str) -> str:
+    return f"{column}_{_CODE_SUFFIX[mode]}"
+
+
+def float_table_name(table: str, column: str) -> str:
+    return f"{table}_{column}_float"
+
+
+def key_column_name(column: str) -> str:
+    return f"{column}_key"
+
+
+def int8_codes(vector: Sequence[float]) -> list[int]:
+    # Per-vector max-abs scaling; cosine similarity is scale invariant, so
+    # codes compare directly without storing the scale.
+    scale = max((abs(float(value)) for value in vector), default=0.0)
+    if scale <= 0.0 or not math.isfinite(scale):
+        return [0 for _ in vector]
+    return [int(round(float(value) * 127.0 / scale)) for value in vector]
+
+
+def binary_code(vector: Sequence[float]) -> str:
+    return "".join("1" if float(value) > 0.0 else "0" for value in vector)
+
+
+def query_code(mode: str, vector: Sequence[float]) -> object:
+    if mode == "int8":
+        return [float(value) for value in int8_codes(vector)]
+    if mode == "binary":
+        return binary_code(vector)
+    raise ValueError(f"Unsupported vector quantization mode: {mode}")
+
+
+def first_pass_order_sql(mode: str, code_expr: str) -> str:
+    """ORDER BY expression (ascending = closer) for the compact-code pass."""
+    if mode == "int8":
+        return f"(1.0 - list_cosine_similarity({code_expr}::FLOAT[], ?::FLOAT[]))"
+    if mode == "binary":
+        return f"bit_count(xor({code_expr}, ?::BIT))"
+    raise ValueError(f"Unsupported vector quantization mode: {mode}")
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM duckdb_tables() "
+        "WHERE database_name = current_database() AND table_name = ? LIMIT 1",
+        [table],
+    ).fetchone()
+    return row is not None
+
+
+def _column_names(conn: duckdb.DuckDBPyConnection, table: str) -> set[str]:
+    rows = conn.execute(f"PRAGMA table_info('{table}')").fetchall()
+    return {str(row[1]) for row in rows}
+
+
+def restore_float_column(
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    table: str,
+    column: str,
+    dim: int,
+) -> None:
+    """Move vectors back from the side table into `table.column`.
+
+    Incremental builds copy the base tables and append new rows with the
+    float column in place; carried-over rows get their vectors back here so
+    the column can be indexed or quantized again as a whole.
+    """
+    float_table = float_table_name(table, column)
+    if not _table_exists(conn, float_table):
+        return
+    key_column = key_column_name(column)
+    columns = _column_names(conn, table)
+    if column not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} FLOAT[{dim}]")
+    if key_column in columns:
+        conn.execute(
+            f"""
+            UPDATE {table}
+            SET {column} = f.{column}
+            FROM {float_table} f
+            WHERE {table}.{key_column} = f.{key_column}
+            """
+        )
+        conn.execute(f"ALTER TABLE {table} DROP COLUMN {key_column}")
+    for mode in QUANTIZATION_MODES:
+        code_column = code_column_name(column, mode)
+        conn.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {code_column}")
+    conn.execute(f"DROP TABLE {float_table}")
+
+
+def build_quantized_column(
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    table: str,
+    column: str,
+    dim: int,
+    mode: str,
+) -> QuantizedColumn:
+    """Replace `table.column` with compact codes and a float side table.
+
+    The searched table keeps only the codes plus a join key, so the first
+    pass never scans float vectors; `{table}_{column}_float` holds the
+    vectors and is read for rescoring candidates only.
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Unsupported vector quantization mode: {mode}")
+    restore_float_column(conn, table=table, column=column, dim=dim)
+    code_column = code_column_name(column, mode)
+    key_column = key_column_name(column)
+    float_table = float_table_name(table, column)
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {key_column} BIGINT")
+    conn.execute(
+        f"UPDATE {table} SET {key_column} = rowid WHERE {column} IS NOT NULL"
+    )
+    conn.execute(
+        f"""
+        CREATE TABLE {float_table} AS
+        SELECT {key_column}, {column}
+        FROM {table}
+        WHERE {column} IS NOT NULL
+        ORDER BY {key_column}
+        """
+    )
+    if mode == "int8":
+        # Per-vector max-abs scale, computed once per row rather than inside
+        # the per-element lambda.
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {code_column} TINYINT[{dim}]")
+        conn.execute(
+            f"""
+            UPDATE {table}
+            SET {code_column} = CAST(
+                list_transform(s.{column}::FLOAT[], x -> round(x * 127.0 / s.scale))
+                AS TINYINT[{dim}]
+            )
+            FROM (
+                SELECT
+                    {key_column},
+                    {column},
+                    greatest(
+                        list_max(list_transform({column}::FLOAT[], y -> abs(y))),
+                        1e-12
+                    ) AS scale
+                FROM {float_table}
+            ) s
+            WHERE {table}.{key_column} = s.{key_column}
+            """
+        )
+    else:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {code_column} BIT")
+        conn.execute(
+            f"""
+            UPDATE {table}
+            SET {code_column} = array_to_string(
+                list_transform(
+                    {column}::FLOAT[],
+                    x -> CASE WHEN x > 0 THEN '1' ELSE '0' END
+                ),
+                ''
+            )::BIT
+            WHERE {column} IS NOT NULL
+            """
+        )
+    conn.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {QUANTIZATION_TABLE} (
+            table_name VARCHAR,
+            column_name VARCHAR,
+            code_column VARCHAR,
+            mode VARCHAR,
+            dim INTEGER
+        )
+        """
+    )
+    conn.execute(
+        f"DELETE FROM {QUANTIZATION_TABLE} WHERE table_name = ? AND column_name = ?",
+        [table, column],
+    )
+    conn.execute(
+        f"INSERT INTO {QUANTIZATION_TABLE} VALUES (?, ?, ?, ?, ?)",
+        [table, column, code_column, mode, dim],
+    )
+    return QuantizedColumn(
+        table=table,
+        column=column,
+        code_column=code_column,
+        mode=mode,
+        dim=dim,
+    )
+
+
+def measure_recall(
+    conn: duckdb.DuckDBPyConnection,
+    spec: QuantizedColumn,
+    *,
+    sample_size: int,
+    top_k: int,
+    rescore_factor: int,
+) -> dict[str, Any]:
+    """Recall@k of code search + float rescoring against exact search.
+
+    Query vectors are sampled from the indexed column itself so the measure
+    needs no external ground truth.
+    """
+    samples = conn.execute(
+        f"""
+        SELECT {spec.column}::FLOAT[]
+        FROM {spec.float_table}
+        ORDER BY hash({spec.key_column})
+        LIMIT {int(sample_size)}
+        """
+    ).fetchall()
+    if not samples:
+        return {"recall_at_k": None, "samples": 0, "k": top_k}
+    exact_sql = f"""
+        SELECT {spec.key_column}
+        FROM {spec.float_table}
+        ORDER BY (1.0 - list_cosine_similarity({spec.column}::FLOAT[], ?::FLOAT[]))
+        LIMIT {int(top_k)}
+    """
+    approx_sql = f"""
+        SELECT f.{spec.key_column}
+        FROM (
+            SELECT {spec.key_column}
+            FROM {spec.table}
+            WHERE {spec.code_column} IS NOT NULL
+            ORDER BY {first_pass_order_sql(spec.mode, spec.code_column)}
+            LIMIT {int(top_k * max(1, rescore_factor))}
+        ) c
+        JOIN {spec.float_table} f ON f.{spec.key_column} = c.{spec.key_column}
+        ORDER BY (1.0 - list_cosine_similarity(f.{spec.column}::FLOAT[], ?::FLOAT[]))
+        LIMIT {int(top_k)}
+    """
+    hits = 0
+    expected = 0
+    exact_ms = 0.0
+    approx_ms = 0.0
+    for (vector,) in samples:
+        start = time.monotonic()
+        exact = {row[0] for row in conn.execute(exact_sql, [vector]).fetchall()}
+        exact_ms += (time.monotonic() - start) * 1000.0
+        start = time.monotonic()
+        approx = {
+            row[0]
+            for row in conn.execute(
+                approx_sql,
+                [query_code(spec.mode, vector), vector],
+            ).fetchall()
+        }
+        approx_ms += (time.monotonic() - start) * 1000.0
+        hits += len(exact & approx)
+        expected += len(exact)
+    return {
+        "recall_at_k": round(hits / expected, 4) if expected else None,
+        "samples": len(samples),
+        "k": top_k,
+        "rescore_factor": rescore_factor,
+        "exact_query_ms": round(exact_ms / len(samples), 2),
+        "quantized_query_ms": round(approx_ms / len(samples), 2),
+    }
+
+
+def quantized_columns_from_rows(
+    rows: Sequence[Sequence[Any]],
+) -> dict[tuple[str, str], QuantizedColumn]:
+    specs: dict[tuple[str, str], QuantizedColumn] = {}
+    for table, column, code_column, mode, dim in rows:
+        if mode not in QUANTIZATION_MODES:
+            continue
+        specs[(str(table), str(column))] = QuantizedColumn(
+            table=str(table),
+            column=str(column),
+            code_column=str(code_column),
+            mode=str(mode),
+            dim=int(dim),
+        )
+    return specs
+
+
+QUANTIZED_COLUMNS_SQL = (
+    f"SELECT table_name, column_name, code_column, mode, dim FROM {QUANTIZATION_TABLE}"
+)
@@ -24,16 +24,26 @@ from retikon_core.embeddings import (
     get_runtime_embedding_backend,
     get_text_embedder,
     normalize_rerank_scores,
+    score_with_cache,
 )
 from retikon_core.embeddings.timeout import run_inference
 from retikon_core.errors import InferenceTimeoutError
 from retikon_core.logging import get_logger
+from retikon_core.query_engine.quantization import (
+    QUANTIZED_COLUMNS_SQL,
+    QuantizedColumn,
+    first_pass_order_sql,
+    quantized_columns_from_rows,
+    query_code,
+    rescore_factor,
+)
 from retikon_core.query_engine.warm_start import load_extensions
 from retikon_core.tenancy.types import TenantScope
 
 logger = get_logger(__name__)
 
 _CONN_LOCAL = threading.local()
+_URI_TRIGRAM_TABLE = "media_uri_trigrams"
 
 _DEFAULT_MODALITY_BOOSTS: dict[str, float] = {
     "document": 1.0,
@@ -691,6 +701,217 @@ def _table_has_column(
     return any(row[1] == column for row in rows)
 
 
+def _fts_index_exists(conn: duckdb.DuckDBPyConnection, table: str) -> bool:
+    try:
+        rows = conn.execute(
+            "SELECT 1 FROM duckdb_schemas() WHERE schema_name = ? LIMIT 1",
+            [f"fts_main_{table}"],
+        ).fetchall()
+    except duckdb.Error:
+        return False
+    return bool(rows)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table: str) -> bool:
+    try:
+        rows = conn.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_name = ? LIMIT 1",
+            [table],
+        ).fetchall()
+    except duckdb.Error:
+        return False
+    return bool(rows)
+
+
+def _uri_trigrams(value: str) -> list[str]:
+    lowered = value.strip().lower()
+    return sorted({lowered[idx : idx + 3] for idx in range(len(lowered) - 2)})
+
+
+def _keyword_match_rows(
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    table: str,
+    alias: str,
+    select_sql: str,
+    query_text: str,
+    top_k: int,
+    scope_clause: str,
+    scope_params: Sequence[object],
+    use_fts: bool,
+) -> tuple[list[tuple], str]:
+    """Return keyword hits for a content table plus the path that served them.
+
+    Rows carry the selected columns followed by a raw score: the BM25 score on
+    the FTS path, or the substring occurrence count on the ILIKE path. ILIKE
+    serves snapshots built without an FTS index and queries the index cannot
+    tokenize into a match (part numbers, URI fragments).
+    """
+    fts_ran = False
+    if use_fts and _fts_index_exists(conn, table):
+        fts_sql = f"""
+            WITH ranked AS (
+                SELECT {select_sql},
+                       fts_main_{table}.match_bm25({alias}.id, ?) AS bm25
+                FROM {table} {alias}
+                JOIN media_assets m ON {alias}.media_asset_id = m.id
+                {scope_clause}
+            )
+            SELECT *
+            FROM ranked
+            WHERE bm25 IS NOT NULL
+            ORDER BY bm25 DESC
+            LIMIT {int(top_k)}
+        """
+        try:
+            rows = _query_rows(conn, fts_sql, [query_text, *scope_params])
+        except duckdb.Error as exc:
+            logger.warning(
+                "Keyword FTS query failed; falling back to ILIKE",
+                extra={"table": table, "error_message": str(exc)},
+            )
+        else:
+            if rows:
+                return rows, "fts"
+            fts_ran = True
+    scope_filter = scope_clause.replace("WHERE ", "", 1) if scope_clause else ""
+    scope_sql = f" AND {scope_filter}" if scope_filter else ""
+    needle = query_text.strip().lower()
+    ilike_sql = f"""
+        SELECT {select_sql},
+               CAST(
+                   (
+                       length(lower({alias}.content))
+                       - length(replace(lower({alias}.content), ?, ''))
+                   ) / greatest(length(?), 1) AS DOUBLE
+               ) AS hits
+        FROM {table} {alias}
+        JOIN media_assets m ON {alias}.media_asset_id = m.id
+        WHERE {alias}.content ILIKE ?{scope_sql}
+        ORDER BY hits DESC
+        LIMIT {int(top_k)}
+    """
+    pattern = _keyword_pattern(query_text)
+    rows = _query_rows(conn, ilike_sql, [needle, needle, pattern, *scope_params])
+    return rows, "fts_empty_ilike" if fts_ran else "ilike"
+
+
+def _keyword_score(
+    raw: float | None,
+    path: str,
+) -> tuple[float, list[dict[str, object]]]:
+    # Both paths share the saturating x / (x + 1) curve so BM25 hits and
+    # substring hits from different tables sort on one scale.
+    value = float(raw or 0.0)
+    if path == "fts":
+        return _bm25_to_score(value), [
+            {
+                "modality": "fts",
+                "source": "fts",
+                "reason": "keyword_bm25",
+                "raw_score": round(value, 6),
+            }
+        ]
+    return _bm25_to_score(value), [
+        {
+            "modality": "fts",
+            "source": "ilike",
+            "reason": "keyword_substring",
+            "raw_score": round(value, 6),
+        }
+    ]
+
+
+def _vector_quantization_enabled() -> bool:
+    return os.getenv("QUERY_VECTOR_QUANTIZATION", "auto").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def _quantized_columns(
+    conn: duckdb.DuckDBPyConnection,
+) -> dict[tuple[str, str], QuantizedColumn]:
+    # Loaded even with quantization switched off: the float vectors of these
+    # columns live in side tables either way.
+    try:
+        rows = _query_rows(conn, QUANTIZED_COLUMNS_SQL, [])
+    except duckdb.Error:
+        return {}
+    return quantized_columns_from_rows(rows)
+
+
+def _vector_source(
+    quantized: dict[tuple[str, str], QuantizedColumn],
+    *,
+    table: str,
+    alias: str,
+    column: str,
+    vector: Sequence[float],
+    limit: int,
+    scope_clause: str,
+    scope_params: Sequence[object],
+    trace: dict[str, float | int | str] | None,
+    trace_key: str,
+) -> tuple[str, list[object]]:
+    """Return the FROM source for a vector search plus its bind parameters.
+
+    Quantized columns are searched in two stages: compact codes pick a
+    candidate pool and the caller's float distance rescores only those rows,
+    whose vectors are joined in from the float side table.
+    """
+    spec = quantized.get((table, column))
+    if spec is None:
+        return f"{table} {alias}", []
+    float_join = (
+        f"JOIN {spec.float_table} f "
+        f"ON f.{spec.key_column} = q.{spec.key_column}"
+    )
+    if not _vector_quantization_enabled():
+        return f"(SELECT q.*, f.{column} FROM {table} q {float_join}) {alias}", []
+    candidates = max(1, int(limit)) * rescore_factor()
+    conditions = [f"q.{spec.code_column} IS NOT NULL"]
+    if scope_clause:
+        conditions.append(scope_clause.replace("WHERE ", "", 1))
+    source_sql = f"""(
+                SELECT q.*, f.{column}
+                FROM (
+                    SELECT q.*
+                    FROM {table} q
+                    JOIN media_assets m ON q.media_asset_id = m.id
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY {first_pass_order_sql(spec.mode, f"q.{spec.code_column}")}
+                    LIMIT {int(candidates)}
+                ) q
+                {float_join}
+            ) {alias}"""
+    if trace is not None:
+        trace[f"{trace_key}_vector_mode"] = spec.mode
+        trace[f"{trace_key}_rescore_candidates"] = int(candidates)
+    return source_sql, [*scope_params, query_code(spec.mode, vector)]
+
+
+def _has_vector_column(
+    conn: duckdb.DuckDBPyConnection,
+    quantized: dict[tuple[str, str], QuantizedColumn],
+    table: str,
+    column: str,
+) -> bool:
+    return (table, column) in quantized or _table_has_column(conn, table, column)
+
+
+def _vector_presence_column(
+    quantized: dict[tuple[str, str], QuantizedColumn],
+    table: str,
+    column: str,
+) -> str:
+    """Column of `table` that is non-null exactly where a vector is stored."""
+    spec = quantized.get((table, column))
+    return spec.code_column if spec is not None else column
+
+
 def _scope_filters(
     conn: duckdb.DuckDBPyConnection,
     scope: TenantScope | None,
@@ -839,13 +1060,18 @@ def search_by_text(
         transcript_has_id = _table_has_column(conn, "transcripts", "id")
         transcript_has_end_ms = _table_has_column(conn, "transcripts", "end_ms")
         image_has_id = _table_has_column(conn, "image_assets", "id")
+        quantized = _quantized_columns(conn)
         has_vision_v2_vectors = (
             need_image
             and _vision_v2_enabled()
-            and _table_has_column(conn, "image_assets", "vision_vector_v2")
+            and _has_vector_column(conn, quantized, "image_assets", "vision_vector_v2")
+        )
+        has_audio_segments = _has_vector_column(
+            conn, quantized, "audio_segments", "clap_embedding"
+        )
+        has_audio_clips = _has_vector_column(
+            conn, quantized, "audio_clips", "clap_embedding"
         )
-        has_audio_segments = _table_has_column(conn, "audio_segments", "clap_embedding")
-        has_audio_clips = _table_has_column(conn, "audio_clips", "clap_embedding")
         audio_table = "audio_segments" if has_audio_segments else "audio_clips"
         audio_source_type = "audio_segment" if has_audio_segments else "audio"
         audio_has_id = _table_has_column(conn, audio_table, "id")
@@ -892,18 +1118,21 @@ def search_by_text(
         scope_clause, scope_params = _scope_filters(conn, scope)
         image_text_vec_v2 = None
         if has_vision_v2_vectors:
+            v2_present = _vector_presence_column(
+                quantized, "image_assets", "vision_vector_v2"
+            )
             if scope_clause:
                 probe_sql = (
                     "SELECT 1 FROM image_assets i "
                     "JOIN media_assets m ON i.media_asset_id = m.id "
-                    f"{scope_clause} AND i.vision_vector_v2 IS NOT NULL "
+                    f"{scope_clause} AND i.{v2_present} IS NOT NULL "
                     "LIMIT 1"
                 )
             else:
                 probe_sql = (
                     "SELECT 1 FROM image_assets i "
                     "JOIN media_assets m ON i.media_asset_id = m.id "
-                    "WHERE i.vision_vector_v2 IS NOT NULL "
+                    f"WHERE i.{v2_present} IS NOT NULL "
                     "LIMIT 1"
                 )
             has_vision_v2_vectors = bool(_query_rows(conn, probe_sql, scope_params))
@@ -921,13 +1150,25 @@ def search_by_text(
                     (time.monotonic() - image_v2_embed_start) * 1000.0, 2
                 )
 
+        doc_source, doc_source_params = _vector_source(
+            quantized,
+            table="doc_chunks",
+            alias="d",
+            column="text_vector",
+            vector=text_vec or [],
+            limit=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            trace=trace if need_text and text_vec is not None else None,
+            trace_key="doc",
+        )
         doc_sql = f"""
             SELECT m.uri, m.media_type, d.media_asset_id, d.content,
                    {doc_id_expr} AS evidence_id,
                    {doc_source_type_expr} AS source_type,
                    {doc_source_time_expr} AS source_time_ms,
                    (1.0 - list_cosine_similarity(d.text_vector, ?::FLOAT[])) AS distance
-            FROM doc_chunks d
+            FROM {doc_source}
             JOIN media_assets m ON d.media_asset_id = m.id
             {scope_clause}
             ORDER BY distance
@@ -935,7 +1176,11 @@ def search_by_text(
         """
         if need_text and text_vec is not None:
             doc_start = time.monotonic()
-            doc_rows = _query_rows(conn, doc_sql, [text_vec, *scope_params])
+            doc_rows = _query_rows(
+                conn,
+                doc_sql,
+                [text_vec, *doc_source_params, *scope_params],
+            )
             if trace is not None:
                 trace["doc_query_ms"] = round(
                     (time.monotonic() - doc_start) * 1000.0, 2
@@ -1103,6 +1348,18 @@ def search_by_text(
                     if trace is not None and "fts_status" not in trace:
                         trace["fts_status"] = "applied"
 
+        transcript_source, transcript_source_params = _vector_source(
+            quantized,
+            table="transcripts",
+            alias="t",
+            column="text_embedding",
+            vector=text_vec or [],
+            limit=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            trace=trace if need_text and text_vec is not None else None,
+            trace_key="transcript",
+        )
         transcript_sql = f"""
             SELECT m.uri, m.media_type, t.media_asset_id, t.content, t.start_ms,
                    {transcript_end_expr},
@@ -1110,7 +1367,7 @@ def search_by_text(
                    (1.0 - list_cosine_similarity(
                        t.text_embedding, ?::FLOAT[]
                    )) AS distance
-            FROM transcripts t
+            FROM {transcript_source}
             JOIN media_assets m ON t.media_asset_id = m.id
             {scope_clause}
             ORDER BY distance
@@ -1121,7 +1378,7 @@ def search_by_text(
             transcript_rows = _query_rows(
                 conn,
                 transcript_sql,
-                [text_vec, *scope_params],
+                [text_vec, *transcript_source_params, *scope_params],
             )
             if trace is not None:
                 trace["transcript_query_ms"] = round(
@@ -1173,12 +1430,24 @@ def search_by_text(
                     )
                 )
 
+        image_source, image_source_params = _vector_source(
+            quantized,
+            table="image_assets",
+            alias="i",
+            column="clip_vector",
+            vector=image_text_vec or [],
+            limit=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            trace=trace if image_text_vec is not None else None,
+            trace_key="image",
+        )
         image_sql = f"""
             SELECT m.uri, m.media_type, i.media_asset_id, i.timestamp_ms,
                    {thumbnail_expr},
                    {image_id_expr} AS evidence_id,
                    (1.0 - list_cosine_similarity(i.clip_vector, ?::FLOAT[])) AS distance
-            FROM image_assets i
+            FROM {image_source}
             JOIN media_assets m ON i.media_asset_id = m.id
             {scope_clause}
             ORDER BY distance
@@ -1186,7 +1455,11 @@ def search_by_text(
         """
         if need_image and image_text_vec is not None:
             image_start = time.monotonic()
-            image_rows = _query_rows(conn, image_sql, [image_text_vec, *scope_params])
+            image_rows = _query_rows(
+                conn,
+                image_sql,
+                [image_text_vec, *image_source_params, *scope_params],
+            )
             if trace is not None:
                 trace["image_query_ms"] = round(
                     (time.monotonic() - image_start) * 1000.0, 2
@@ -1257,6 +1530,18 @@ def search_by_text(
                 image_scope_v2 = f"{scope_clause} AND i.vision_vector_v2 IS NOT NULL"
             else:
                 image_scope_v2 = "WHERE i.vision_vector_v2 IS NOT NULL"
+            image_source_v2, image_source_v2_params = _vector_source(
+                quantized,
+                table="image_assets",
+                alias="i",
+                column="vision_vector_v2",
+                vector=image_text_vec_v2,
+                limit=top_k,
+                scope_clause=scope_clause,
+                scope_params=scope_params,
+                trace=trace,
+                trace_key="vision_v2",
+            )
             image_sql_v2 = f"""
                 SELECT m.uri, m.media_type, i.media_asset_id, i.timestamp_ms,
                        {thumbnail_expr},
@@ -1264,14 +1549,18 @@ def search_by_text(
                        (1.0 - list_cosine_similarity(
                            i.vision_vector_v2, ?::FLOAT[]
                        )) AS distance
-                FROM image_assets i
+                FROM {image_source_v2}
                 JOIN media_assets m ON i.media_asset_id = m.id
                 {image_scope_v2}
                 ORDER BY distance
                 LIMIT {int(top_k)}
             """
             image_v2_start = time.monotonic()
-            image_rows_v2 = _query_rows(conn, image_sql_v2, [image_text_vec_v2, *scope_params])
+            image_rows_v2 = _query_rows(
+                conn,
+                image_sql_v2,
+                [image_text_vec_v2, *image_source_v2_params, *scope_params],
+            )
             if trace is not None:
                 trace["vision_v2_query_ms"] = round(
                     (time.monotonic() - image_v2_start) * 1000.0, 2
@@ -1334,6 +1623,18 @@ def search_by_text(
                     )
                 )
 
+        audio_source, audio_source_params = _vector_source(
+            quantized,
+            table=audio_table,
+            alias="a",
+            column="clap_embedding",
+            vector=audio_text_vec or [],
+            limit=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            trace=trace if need_audio and audio_text_vec is not None else None,
+            trace_key="audio",
+        )
         audio_sql = f"""
             SELECT m.uri, m.media_type, a.media_asset_id,
                    {audio_start_expr},
@@ -1342,7 +1643,7 @@ def search_by_text(
                    (1.0 - list_cosine_similarity(
                        a.clap_embedding, ?::FLOAT[]
                    )) AS distance
-            FROM {audio_table} a
+            FROM {audio_source}
             JOIN media_assets m ON a.media_asset_id = m.id
             {scope_clause}
             ORDER BY distance
@@ -1350,7 +1651,11 @@ def search_by_text(
         """
         if need_audio and audio_text_vec is not None:
             audio_start = time.monotonic()
-            audio_rows = _query_rows(conn, audio_sql, [audio_text_vec, *scope_params])
+            audio_rows = _query_rows(
+                conn,
+                audio_sql,
+                [audio_text_vec, *audio_source_params, *scope_params],
+            )
             if trace is not None:
                 trace["audio_query_ms"] = round(
                     (time.monotonic() - audio_start) * 1000.0, 2
@@ -1437,6 +1742,18 @@ def search_by_text(
                 # Overfetch slightly to account for skipping clip rows that belong to
                 # assets already represented by audio segment results.
                 clip_limit = fill_limit + len(audio_asset_ids)
+                clip_source, clip_source_params = _vector_source(
+                    quantized,
+                    table="audio_clips",
+                    alias="a",
+                    column="clap_embedding",
+                    vector=audio_text_vec,
+                    limit=clip_limit,
+                    scope_clause=scope_clause,
+                    scope_params=scope_params,
+                    trace=trace,
+                    trace_key="audio_clip_fallback",
+                )
                 clip_sql = f"""
                     SELECT m.uri, m.media_type, a.media_asset_id,
                            {clip_start_expr},
@@ -1445,13 +1762,17 @@ def search_by_text(
                            (1.0 - list_cosine_similarity(
                                a.clap_embedding, ?::FLOAT[]
                            )) AS distance
-                    FROM audio_clips a
+                    FROM {clip_source}
                     JOIN media_assets m ON a.media_asset_id = m.id
                     {scope_clause}
                     ORDER BY distance
                     LIMIT {int(clip_limit)}
                 """
-                clip_rows = _query_rows(conn, clip_sql, [audio_text_vec, *scope_params])
+                clip_rows = _query_rows(
+                    conn,
+                    clip_sql,
+                    [audio_text_vec, *clip_source_params, *scope_params],
+                )
                 if trace is not None:
                     trace["audio_clip_fallback_rows"] = len(clip_rows)
                 for row in clip_rows:
@@ -1512,7 +1833,7 @@ def search_by_keyword(
     trace: dict[str, float | int | str] | None = None,
 ) -> list[QueryResult]:
     results: list[QueryResult] = []
-    pattern = _keyword_pattern(query_text)
+    use_fts = _fts_enabled()
 
     connect_start = time.monotonic()
     conn = _connect(snapshot_path)
@@ -1554,25 +1875,29 @@ def search_by_keyword(
         transcript_end_expr = "t.end_ms" if transcript_has_end_ms else "NULL AS end_ms"
 
         scope_clause, scope_params = _scope_filters(conn, scope)
-        scope_filter = scope_clause.replace("WHERE ", "", 1) if scope_clause else ""
-        scope_sql = f" AND {scope_filter}" if scope_filter else ""
-        doc_sql = f"""
-            SELECT m.uri, m.media_type, d.media_asset_id, d.content,
-                   {doc_id_expr} AS evidence_id,
-                   {doc_source_type_expr} AS source_type,
-                   {doc_source_time_expr} AS source_time_ms
-            FROM doc_chunks d
-            JOIN media_assets m ON d.media_asset_id = m.id
-            WHERE d.content ILIKE ?{scope_sql}
-            LIMIT {int(top_k)}
-        """
         doc_start = time.monotonic()
-        doc_rows = _query_rows(conn, doc_sql, [pattern, *scope_params])
+        doc_rows, doc_path = _keyword_match_rows(
+            conn,
+            table="doc_chunks",
+            alias="d",
+            select_sql=f"""
+                m.uri, m.media_type, d.media_asset_id, d.content,
+                {doc_id_expr} AS evidence_id,
+                {doc_source_type_expr} AS source_type,
+                {doc_source_time_expr} AS source_time_ms
+            """,
+            query_text=query_text,
+            top_k=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            use_fts=use_fts and doc_has_id,
+        )
         if trace is not None:
             trace["keyword_doc_query_ms"] = round(
                 (time.monotonic() - doc_start) * 1000.0, 2
             )
             trace["keyword_doc_rows"] = len(doc_rows)
+            trace["keyword_doc_path"] = doc_path
         _record_hitlist(
             trace,
             "keyword_document",
@@ -1587,7 +1912,9 @@ def search_by_keyword(
             evidence_id,
             source_type,
             source_time_ms,
+            raw_score,
         ) in doc_rows:
+            score, why = _keyword_score(raw_score, doc_path)
             source_type_text = str(source_type or "document").strip().lower()
             is_ocr = source_type_text in {"image", "keyframe", "pdf_page"}
             modality = "ocr" if is_ocr else "document"
@@ -1604,31 +1931,38 @@ def search_by_keyword(
                     start_ms=start_ms,
                     end_ms=start_ms,
                     thumbnail_uri=None,
-                    score=1.0,
+                    score=score,
                     media_asset_id=media_asset_id,
                     media_type=media_type,
                     primary_evidence_id=str(evidence_id),
                     source_type=source_type_text,
                     evidence_refs=_evidence_refs_for(modality, str(evidence_id)),
+                    why=why,
                 )
             )
 
-        transcript_sql = f"""
-            SELECT m.uri, m.media_type, t.media_asset_id, t.content, t.start_ms,
-                   {transcript_end_expr},
-                   {transcript_id_expr} AS evidence_id
-            FROM transcripts t
-            JOIN media_assets m ON t.media_asset_id = m.id
-            WHERE t.content ILIKE ?{scope_sql}
-            LIMIT {int(top_k)}
-        """
         transcript_start = time.monotonic()
-        transcript_rows = _query_rows(conn, transcript_sql, [pattern, *scope_params])
+        transcript_rows, transcript_path = _keyword_match_rows(
+            conn,
+            table="transcripts",
+            alias="t",
+            select_sql=f"""
+                m.uri, m.media_type, t.media_asset_id, t.content, t.start_ms,
+                {transcript_end_expr},
+                {transcript_id_expr} AS evidence_id
+            """,
+            query_text=query_text,
+            top_k=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            use_fts=use_fts and transcript_has_id,
+        )
         if trace is not None:
             trace["keyword_transcript_query_ms"] = round(
                 (time.monotonic() - transcript_start) * 1000.0, 2
             )
             trace["keyword_transcript_rows"] = len(transcript_rows)
+            trace["keyword_transcript_path"] = transcript_path
         _record_hitlist(
             trace,
             "keyword_transcript",
@@ -1643,7 +1977,9 @@ def search_by_keyword(
             start_ms,
             end_ms,
             evidence_id,
+            raw_score,
         ) in transcript_rows:
+            score, why = _keyword_score(raw_score, transcript_path)
             results.append(
                 QueryResult(
                     modality="transcript",
@@ -1652,17 +1988,19 @@ def search_by_keyword(
                     start_ms=int(start_ms) if start_ms is not None else None,
                     end_ms=int(end_ms) if end_ms is not None else None,
                     thumbnail_uri=None,
-                    score=1.0,
+                    score=score,
                     media_asset_id=media_asset_id,
                     media_type=media_type,
                     primary_evidence_id=str(evidence_id),
                     source_type="transcript",
                     evidence_refs=_evidence_refs_for("transcript", str(evidence_id)),
+                    why=why,
                 )
             )
     finally:
         _release_conn(snapshot_path, conn)
 
+    results.sort(key=lambda item: item.score, reverse=True)
     return results[: int(top_k)]
 
 
@@ -1683,12 +2021,34 @@ def search_by_metadata(
         trace.update(_apply_duckdb_settings(conn))
     try:
         allowed = {"uri", "media_type", "content_type"}
+        uri_path: str | None = None
         conditions: list[str] = []
         params: list[object] = []
         for key, value in filters.items():
             if key not in allowed:
                 raise ValueError(f"Unsupported metadata filter: {key}")
             if key == "uri":
+                trigrams = _uri_trigrams(value)
+                if (
+                    trigrams
+                    and not any(ch in value for ch in "%_")
+                    and _table_exists(conn, _URI_TRIGRAM_TABLE)
+                ):
+                    placeholders = ", ".join("?" for _ in trigrams)
+                    conditions.append(
+                        "m.id IN ("
+                        f"SELECT media_asset_id FROM {_URI_TRIGRAM_TABLE} "
+                        f"WHERE trigram IN ({placeholders}) "
+                        "GROUP BY media_asset_id "
+                        "HAVING COUNT(DISTINCT trigram) = ?"
+                        ")"
+                    )
+                    params.extend(trigrams)
+                    params.append(len(trigrams))
+                    uri_path = "trigram"
+                else:
+                    uri_path = "ilike"
+                # Trigram hits are candidates only; ILIKE confirms adjacency.
                 conditions.append("uri ILIKE ?")
                 params.append(_keyword_pattern(value))
             elif key == "media_type":
@@ -1721,6 +2081,8 @@ def search_by_metadata(
                 (time.monotonic() - query_start) * 1000.0, 2
             )
             trace["metadata_rows"] = len(rows)
+            if uri_path is not None:
+                trace["metadata_uri_path"] = uri_path
         _record_hitlist(
             trace,
             "metadata",
@@ -1805,25 +2167,30 @@ def search_by_image(
             "COALESCE(CAST(i.timestamp_ms AS VARCHAR), '0')"
         )
         scope_clause, scope_params = _scope_filters(conn, scope)
-        has_vision_v2_vectors = _vision_v2_enabled() and _table_has_column(
+        quantized = _quantized_columns(conn)
+        has_vision_v2_vectors = _vision_v2_enabled() and _has_vector_column(
             conn,
+            quantized,
             "image_assets",
             "vision_vector_v2",
         )
         vector_v2 = None
         if has_vision_v2_vectors:
+            v2_present = _vector_presence_column(
+                quantized, "image_assets", "vision_vector_v2"
+            )
             if scope_clause:
                 probe_sql = (
                     "SELECT 1 FROM image_assets i "
                     "JOIN media_assets m ON i.media_asset_id = m.id "
-                    f"{scope_clause} AND i.vision_vector_v2 IS NOT NULL "
+                    f"{scope_clause} AND i.{v2_present} IS NOT NULL "
                     "LIMIT 1"
                 )
             else:
                 probe_sql = (
                     "SELECT 1 FROM image_assets i "
                     "JOIN media_assets m ON i.media_asset_id = m.id "
-                    "WHERE i.vision_vector_v2 IS NOT NULL "
+                    f"WHERE i.{v2_present} IS NOT NULL "
                     "LIMIT 1"
                 )
             has_vision_v2_vectors = bool(_query_rows(conn, probe_sql, scope_params))
@@ -1843,12 +2210,24 @@ def search_by_image(
                     (time.monotonic() - embed_v2_start) * 1000.0, 2
                 )
 
+        image_source, image_source_params = _vector_source(
+            quantized,
+            table="image_assets",
+            alias="i",
+            column="clip_vector",
+            vector=vector or [],
+            limit=top_k,
+            scope_clause=scope_clause,
+            scope_params=scope_params,
+            trace=trace if vector is not None else None,
+            trace_key="image",
+        )
         image_sql = f"""
             SELECT m.uri, m.media_type, i.media_asset_id, i.timestamp_ms,
                    {thumbnail_expr},
                    {image_id_expr} AS evidence_id,
                    (1.0 - list_cosine_similarity(i.clip_vector, ?::FLOAT[])) AS distance
-            FROM image_assets i
+            FROM {image_source}
             JOIN media_assets m ON i.media_asset_id = m.id
             {scope_clause}
             ORDER BY distance
@@ -1857,7 +2236,11 @@ def search_by_image(
         results: list[QueryResult] = []
         if vector is not None:
             image_start = time.monotonic()
-            image_rows = _query_rows(conn, image_sql, [vector, *scope_params])
+            image_rows = _query_rows(
+                conn,
+                image_sql,
+                [vector, *image_source_params, *scope_params],
+            )
             if trace is not None:
                 trace["image_query_ms"] = round(
                     (time.monotonic() - image_start) * 1000.0, 2
@@ -1908,6 +2291,18 @@ def search_by_image(
                 image_scope_v2 = f"{scope_clause} AND i.vision_vector_v2 IS NOT NULL"
             else:
                 image_scope_v2 = "WHERE i.vision_vector_v2 IS NOT NULL"
+            image_source_v2, image_source_v2_params = _vector_source(
+                quantized,
+                table="image_assets",
+                alias="i",
+                column="vision_vector_v2",
+                vector=vector_v2,
+                limit=top_k,
+                scope_clause=scope_clause,
+                scope_params=scope_params,
+                trace=trace,
+                trace_key="vision_v2",
+            )
             image_sql_v2 = f"""
                 SELECT m.uri, m.media_type, i.media_asset_id, i.timestamp_ms,
                        {thumbnail_expr},
@@ -1915,14 +2310,18 @@ def search_by_image(
                        (1.0 - list_cosine_similarity(
                            i.vision_vector_v2, ?::FLOAT[]
                        )) AS distance
-                FROM image_assets i
+                FROM {image_source_v2}
                 JOIN media_assets m ON i.media_asset_id = m.id
                 {image_scope_v2}
                 ORDER BY distance
                 LIMIT {int(top_k)}
             """
             image_v2_start = time.monotonic()
-            image_rows_v2 = _query_rows(conn, image_sql_v2, [vector_v2, *scope_params])
+            image_rows_v2 = _query_rows(
+                conn,
+                image_sql_v2,
+                [vector_v2, *image_source_v2_params, *scope_params],
+            )
             if trace is not None:
                 trace["vision_v2_query_ms"] = round(
                     (time.monotonic() - image_v2_start) * 1000.0, 2
@@ -2042,6 +2441,7 @@ def rerank_text_candidates(
     query_text: str | None,
     results: Sequence[QueryResult],
     trace: dict[str, float | int | str] | None = None,
+    snapshot_marker: str | None = None,
 ) -> list[QueryResult]:
     if not results:
         return []
@@ -2101,12 +2501,19 @@ def rerank_text_candidates(
                 trace["rerank_score_gap"] = round(score_gap, 6)
             return list(results)
     selected_docs = [row.snippet or "" for _, row in selected]
+    selected_ids = [row.primary_evidence_id for _, row in selected]
 
     rerank_start = time.monotonic()
     try:
-        raw_scores = run_inference(
+        raw_scores, cache_hits = run_inference(
             "rerank",
-            lambda: get_reranker().score(query_text, selected_docs),
+            lambda: score_with_cache(
+                get_reranker(),
+                query=query_text,
+                doc_ids=selected_ids,
+                documents=selected_docs,
+                snapshot_marker=snapshot_marker,
+            ),
         )
     except InferenceTimeoutError:
         if trace is not None:
@@ -2143,6 +2550,7 @@ def rerank_text_candidates(
         trace["rerank_status"] = "applied"
         trace["rerank_candidates"] = len(selected)
         trace["rerank_selected_chars"] = selected_chars
+        trace["rerank_cache_hits"] = cache_hits
         trace["rerank_ms"] = round((time.monotonic() - rerank_start) * 1000.0, 2)
 
     reranked.sort(key=lambda row: row.score, reverse=True)
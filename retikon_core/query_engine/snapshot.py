@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
-import shutil
+import os
+import time
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib.parse import urlparse
 
 import fsspec
@@ -14,79 +18,246 @@ from retikon_core.logging import get_logger
 
 logger = get_logger(__name__)
 
+CACHE_DIRNAME = "snapshot-cache"
+_CHUNK_BYTES = 8 * 1024 * 1024
+# Remote object attributes that change whenever the object is rewritten.
+_VERSION_KEYS = ("generation", "etag", "ETag", "md5Hash", "crc32c", "mtime", "updated")
+
 
 @dataclass(frozen=True)
 class SnapshotInfo:
     local_path: str
     metadata: dict[str, Any] | None
+    sha256: str | None = None
+    cache_hit: bool = False
 
 
 def _sidecar_uri(snapshot_uri: str) -> str:
-    if snapshot_uri.endswith(".duckdb"):
-        return f"{snapshot_uri}.json"
     return f"{snapshot_uri}.json"
 
 
-def _download_remote(uri: str, dest: Path) -> None:
+def _read_local_json(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _read_remote_json(uri: str) -> dict[str, Any] | None:
     fs, path = fsspec.core.url_to_fs(uri)
-    dest.parent.mkdir(parents=True, exist_ok=True)
     try:
-        fs.info(path)
-    except FileNotFoundError as exc:
-        raise RecoverableError(f"Snapshot file not found: {uri}") from exc
-    except Exception as exc:
-        raise RecoverableError(f"Failed to stat {uri}: {exc}") from exc
+        with fs.open(path, "rb") as handle:
+            payload = json.loads(handle.read().decode("utf-8"))
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def file_sha256(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _expected_sha256(meta: dict[str, Any] | None) -> str | None:
+    value = meta.get("snapshot_sha256") if meta else None
+    if isinstance(value, str) and len(value) == 64:
+        return value.lower()
+    return None
+
+
+def _verify_enabled() -> bool:
+    return os.getenv("SNAPSHOT_VERIFY", "1") == "1"
+
+
+def _sidecar_retry_s() -> float:
     try:
-        with fs.open(path, "rb") as reader, open(dest, "wb") as writer:
-            shutil.copyfileobj(reader, writer)
-    except Exception as exc:
-        raise RecoverableError(f"Failed to download {uri}: {exc}") from exc
+        return max(0.0, float(os.getenv("SNAPSHOT_SIDECAR_RETRY_S", "1")))
+    except ValueError:
+        return 1.0
 
 
-def _read_local_json(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
+def _refreshed_sidecar(
+    read: Callable[[], dict[str, Any] | None],
+    actual: str,
+) -> dict[str, Any] | None:
+    """Re-read the sidecar once after a checksum mismatch.
+
+    The index builder uploads the snapshot before its sidecar, so a reader can
+    briefly see the new file next to the previous checksum. Returns the new
+    sidecar only if it vouches for the bytes that were read.
+    """
+    delay = _sidecar_retry_s()
+    if delay:
+        time.sleep(delay)
+    try:
+        meta = read()
+    except ValueError:
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return meta if _expected_sha256(meta) == actual else None
+
+
+def _cache_keep() -> int:
+    try:
+        return max(1, int(os.getenv("SNAPSHOT_CACHE_KEEP", "2")))
+    except ValueError:
+        return 2
 
 
 def download_snapshot(snapshot_uri: str, dest_dir: str = "/tmp") -> SnapshotInfo:
+    """Resolve a snapshot to a local path the query engine can open read-only.
+
+    Local snapshots are used in place. Remote snapshots land in a cache under
+    ``dest_dir`` keyed by the sidecar ``snapshot_sha256`` (or the object's
+    version attributes for older sidecars), so an unchanged snapshot is only
+    downloaded once. When the sidecar carries a checksum, the file is verified
+    against it; on a mismatch the sidecar is re-read once (it may be mid-publish)
+    and a persistent mismatch raises ``RecoverableError``.
+    """
     if not snapshot_uri:
         raise ValueError("SNAPSHOT_URI is required")
 
-    dest_dir_path = Path(dest_dir)
-    dest_dir_path.mkdir(parents=True, exist_ok=True)
+    cache_dir = Path(dest_dir) / CACHE_DIRNAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
     parsed = urlparse(snapshot_uri)
-    is_local = parsed.scheme in {"", "file"}
-    if is_local:
+    if parsed.scheme in {"", "file"}:
         snapshot_path = (
             Path(parsed.path) if parsed.scheme == "file" else Path(snapshot_uri)
         )
-        if not snapshot_path.exists():
-            raise RecoverableError(f"Snapshot file not found: {snapshot_path}")
-
-        local_path = dest_dir_path / snapshot_path.name
-        if snapshot_path.resolve() != local_path.resolve():
-            shutil.copy2(snapshot_path, local_path)
-
-        sidecar_path = Path(f"{snapshot_path}.json")
-        meta = _read_local_json(sidecar_path)
-    else:
-        filename = Path(parsed.path).name if parsed.path else "snapshot.duckdb"
-        local_path = dest_dir_path / filename
-        _download_remote(snapshot_uri, local_path)
-        sidecar = _sidecar_uri(snapshot_uri)
-        meta = None
-        try:
-            sidecar_path = dest_dir_path / Path(urlparse(sidecar).path).name
-            _download_remote(sidecar, sidecar_path)
-            meta = _read_local_json(sidecar_path)
-        except RecoverableError:
-            meta = None
+        return _open_local(snapshot_path, cache_dir)
+    return _fetch_remote(snapshot_uri, cache_dir)
+
+
+def _open_local(snapshot_path: Path, cache_dir: Path) -> SnapshotInfo:
+    if not snapshot_path.exists():
+        raise RecoverableError(f"Snapshot file not found: {snapshot_path}")
+    sidecar_path = Path(f"{snapshot_path}.json")
+    meta = _read_local_json(sidecar_path)
+    expected = _expected_sha256(meta)
+    if expected and _verify_enabled():
+        meta = _verify_local(snapshot_path, meta, sidecar_path, cache_dir)
+        expected = _expected_sha256(meta)
+    logger.info(
+        "Snapshot opened in place",
+        extra={"snapshot_path": str(snapshot_path), "snapshot_sha256": expected},
+    )
+    return SnapshotInfo(local_path=str(snapshot_path), metadata=meta, sha256=expected)
+
+
+def _verify_local(
+    snapshot_path: Path,
+    meta: dict[str, Any] | None,
+    sidecar_path: Path,
+    cache_dir: Path,
+) -> dict[str, Any] | None:
+    # Remember verified (path, size, mtime) so restarts skip re-hashing an
+    # unchanged file.
+    expected = _expected_sha256(meta)
+    stat = snapshot_path.stat()
+    marker = cache_dir / "verified" / f"{expected}.json"
+    stamp = {
+        "path": str(snapshot_path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    try:
+        if json.loads(marker.read_text(encoding="utf-8")) == stamp:
+            return meta
+    except (OSError, ValueError):
+        pass
+    actual = file_sha256(snapshot_path)
+    if actual != expected:
+        refreshed = _refreshed_sidecar(
+            functools.partial(_read_local_json, sidecar_path), actual
+        )
+        if refreshed is None:
+            raise RecoverableError(
+                f"Snapshot checksum mismatch for {snapshot_path}: "
+                f"expected {expected}, got {actual}"
+            )
+        meta = refreshed
+        marker = cache_dir / "verified" / f"{actual}.json"
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    marker.write_text(json.dumps(stamp), encoding="utf-8")
+    return meta
+
+
+def _fetch_remote(snapshot_uri: str, cache_dir: Path) -> SnapshotInfo:
+    fs, path = fsspec.core.url_to_fs(snapshot_uri)
+    try:
+        info = fs.info(path)
+    except FileNotFoundError as exc:
+        raise RecoverableError(f"Snapshot file not found: {snapshot_uri}") from exc
+    except Exception as exc:
+        raise RecoverableError(f"Failed to stat {snapshot_uri}: {exc}") from exc
+
+    meta = _read_remote_json(_sidecar_uri(snapshot_uri))
+    expected = _expected_sha256(meta)
+    key = expected or _remote_fingerprint(snapshot_uri, info)
+    cached = cache_dir / f"{key}.duckdb"
+    if cached.exists():
+        os.utime(cached)
+        logger.info(
+            "Snapshot cache hit",
+            extra={"snapshot_path": str(cached), "snapshot_sha256": expected},
+        )
+        return SnapshotInfo(
+            local_path=str(cached), metadata=meta, sha256=expected, cache_hit=True
+        )
 
+    partial = cache_dir / f".{key}.{uuid.uuid4().hex}.partial"
+    digest = hashlib.sha256()
+    try:
+        with fs.open(path, "rb") as reader, open(partial, "wb") as writer:
+            for chunk in iter(lambda: reader.read(_CHUNK_BYTES), b""):
+                digest.update(chunk)
+                writer.write(chunk)
+    except Exception as exc:
+        partial.unlink(missing_ok=True)
+        raise RecoverableError(f"Failed to download {snapshot_uri}: {exc}") from exc
+    actual = digest.hexdigest()
+    if expected and actual != expected:
+        refreshed = _refreshed_sidecar(
+            functools.partial(_read_remote_json, _sidecar_uri(snapshot_uri)), actual
+        )
+        if refreshed is None:
+            partial.unlink(missing_ok=True)
+            raise RecoverableError(
+                f"Snapshot checksum mismatch for {snapshot_uri}: "
+                f"expected {expected}, got {actual}"
+            )
+        meta = refreshed
+        cached = cache_dir / f"{actual}.duckdb"
+    os.replace(partial, cached)
+    _evict_cache(cache_dir, keep=_cache_keep(), current=cached)
     logger.info(
-        "Snapshot prepared",
-        extra={"snapshot_path": str(local_path)},
+        "Snapshot downloaded",
+        extra={
+            "snapshot_path": str(cached),
+            "snapshot_sha256": actual,
+            "snapshot_size_bytes": cached.stat().st_size,
+        },
+    )
+    return SnapshotInfo(local_path=str(cached), metadata=meta, sha256=actual)
+
+
+def _remote_fingerprint(snapshot_uri: str, info: dict[str, Any]) -> str:
+    version = {key: str(info[key]) for key in _VERSION_KEYS if info.get(key)}
+    payload = json.dumps(
+        {"uri": snapshot_uri, "size": info.get("size"), "version": version},
+        sort_keys=True,
     )
+    return "src-" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:40]
+
 
-    return SnapshotInfo(local_path=str(local_path), metadata=meta)
+def _evict_cache(cache_dir: Path, *, keep: int, current: Path) -> None:
+    entries = sorted(
+        cache_dir.glob("*.duckdb"),
+        key=lambda item: item.stat().st_mtime_ns,
+        reverse=True,
+    )
+    # Open connections keep an unlinked inode readable until they close.
+    for entry in [item for item in entries if item != current][keep - 1 :]:
+        entry.unlink(missing_ok=True)
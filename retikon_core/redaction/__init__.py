@@ -11,7 +11,12 @@ from retikon_core.redaction.media import (
     redact_media_payload,
     resolve_media_types,
 )
-from retikon_core.redaction.text import DEFAULT_PLACEHOLDER, redact_text
+from retikon_core.redaction.text import (
+    DEFAULT_PLACEHOLDER,
+    TextRedactor,
+    compile_redactor,
+    redact_text,
+)
 
 __all__ = [
     "AUDIO_REDACTION_TYPES",
@@ -21,7 +26,9 @@ __all__ = [
     "RedactionOperation",
     "RedactionPlan",
     "RedactionRegion",
+    "TextRedactor",
     "VIDEO_REDACTION_TYPES",
+    "compile_redactor",
     "media_redaction_enabled",
     "plan_media_redaction",
     "redact_media_payload",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Iterable
 
 DEFAULT_PLACEHOLDER = "[REDACTED]"
@@ -51,6 +52,68 @@ def _resolve_types(values: Iterable[str] | None) -> tuple[str, ...]:
     return tuple(deduped)
 
 
+class TextRedactor:
+    """All enabled PII patterns compiled into one alternation.
+
+    A string is scanned once. When several types match at the same
+    position, the longest span is redacted. Scanning resumes after it, so
+    overlapping matches collapse into a single placeholder.
+    """
+
+    def __init__(self, types: tuple[str, ...]) -> None:
+        self.types = types
+        self._patterns = tuple(
+            _PATTERN_MAP[item] for item in types if item in _PATTERN_MAP
+        )
+        self._combined = (
+            re.compile("|".join(_scoped(pattern) for pattern in self._patterns))
+            if self._patterns
+            else None
+        )
+
+    @property
+    def active(self) -> bool:
+        return self._combined is not None
+
+    def redact(self, text: str, placeholder: str = DEFAULT_PLACEHOLDER) -> str:
+        if not text or self._combined is None:
+            return text
+        search = self._combined.search
+        alternatives = self._patterns if len(self._patterns) > 1 else ()
+        pieces: list[str] = []
+        emitted = 0
+        pos = 0
+        length = len(text)
+        while pos <= length:
+            match = search(text, pos)
+            if match is None:
+                break
+            start, end = match.span()
+            for pattern in alternatives:
+                other = pattern.match(text, start)
+                if other is not None and other.end() > end:
+                    end = other.end()
+            if end == start:
+                pos = start + 1
+                continue
+            pieces.append(text[emitted:start])
+            pieces.append(placeholder)
+            emitted = pos = end
+        if not pieces:
+            return text
+        pieces.append(text[emitted:])
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=128)
+def _compile_types(types: tuple[str, ...]) -> TextRedactor:
+    return TextRedactor(types)
+
+
+def compile_redactor(redaction_types: Iterable[str] | None = None) -> TextRedactor:
+    return _compile_types(_resolve_types(redaction_types))
+
+
 def redact_text(
     text: str,
     *,
@@ -59,11 +122,12 @@ def redact_text(
 ) -> str:
     if not text:
         return text
-    types = _resolve_types(redaction_types)
-    redacted = text
-    for item in types:
-        pattern = _PATTERN_MAP.get(item)
-        if pattern is None:
-            continue
-        redacted = pattern.sub(placeholder, redacted)
-    return redacted
+    return compile_redactor(redaction_types).redact(text, placeholder)
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    # Inline-scope per-pattern flags so one combined regex keeps each
+    # pattern's own case sensitivity.
+    if pattern.flags & re.IGNORECASE:
+        return f"(?i:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
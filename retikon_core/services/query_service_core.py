@@ -24,8 +24,8 @@ from retikon_core.embeddings import (
 from retikon_core.embeddings.timeout import run_inference
 from retikon_core.privacy import (
     PrivacyContext,
+    PrivacyRedactor,
     load_privacy_policies,
-    redact_text_for_context,
 )
 from retikon_core.query_engine.query_runner import (
     QueryResult,
@@ -581,6 +581,7 @@ def run_query(
     modalities: set[str],
     scope: TenantScope | None = None,
     timings: dict[str, float | int | str] | None = None,
+    snapshot_marker: str | None = None,
 ) -> list[QueryResult]:
     trace = timings if timings is not None else {}
     results: list[QueryResult] = []
@@ -645,6 +646,7 @@ def run_query(
         query_text=payload.query_text,
         results=fused,
         trace=trace,
+        snapshot_marker=snapshot_marker,
     )
     return reranked
 
@@ -686,16 +688,13 @@ def apply_privacy_redaction(
         return results
 
     context = PrivacyContext(action="query", scope=scope, is_admin=is_admin)
+    redactor = PrivacyRedactor(policies)
     redacted: list[QueryResult] = []
     for item in results:
         if item.snippet is None:
             redacted.append(item)
             continue
-        snippet = redact_text_for_context(
-            item.snippet,
-            policies=policies,
-            context=context.with_modality(item.modality),
-        )
+        snippet = redactor.redact(item.snippet, context.with_modality(item.modality))
         if snippet == item.snippet:
             redacted.append(item)
         else:
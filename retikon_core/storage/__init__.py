@@ -12,9 +12,14 @@ from retikon_core.storage.schemas import (
     merge_schemas,
     schema_for,
 )
-from retikon_core.storage.writer import WriteResult, write_parquet
+from retikon_core.storage.writer import (
+    StreamingParquetWriter,
+    WriteResult,
+    write_parquet,
+)
 
 __all__ = [
+    "StreamingParquetWriter",
     "WriteResult",
     "build_manifest",
     "edge_part_uri",
@@ -8,6 +8,10 @@ from urllib.parse import urlparse
 
 import fsspec
 
+from retikon_core.storage.manifest_catalog import (
+    append_manifest_record,
+    catalog_enabled,
+)
 from retikon_core.storage.object_store import ObjectStore, atomic_write_bytes
 from retikon_core.storage.writer import WriteResult
 
@@ -67,11 +71,13 @@ def write_manifest(
     if parsed.scheme == "file" or not parsed.scheme:
         store = ObjectStore.from_base_uri(dest_uri)
         atomic_write_bytes(store.base_path, payload)
-        return
-    fs, path = fsspec.core.url_to_fs(dest_uri)
-    fs.makedirs("/".join(path.split("/")[:-1]), exist_ok=True)
-    with fs.open(path, "wb") as handle:
-        handle.write(payload)
+    else:
+        fs, path = fsspec.core.url_to_fs(dest_uri)
+        fs.makedirs("/".join(path.split("/")[:-1]), exist_ok=True)
+        with fs.open(path, "wb") as handle:
+            handle.write(payload)
+    if catalog_enabled():
+        append_manifest_record(manifest, dest_uri)
 
 
 def manifest_bytes(manifest: dict[str, object], *, compact: bool = False) -> int:
@@ -0,0 +1,715 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator
+from urllib.parse import urlparse
+
+import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from retikon_core.logging import get_logger
+from retikon_core.storage.paths import join_uri
+from retikon_core.storage.writer import write_parquet
+
+logger = get_logger(__name__)
+
+CATALOG_DIR = "_catalog"
+CATALOG_FILE = "catalog.parquet"
+CATALOG_LOG_DIR = "log"
+CATALOG_LOCK_FILE = "consolidate.lock"
+CATALOG_WATERMARK_DIR = "watermarks"
+COMPACTION_WATERMARK = "compaction"
+COMPACTION_WATERMARK_KEY = "compaction_watermark"
+CATALOG_ROW_GROUP_SIZE = 8192
+
+_FILE_TYPE = pa.struct(
+    [
+        ("uri", pa.string()),
+        ("rows", pa.int64()),
+        ("bytes_written", pa.int64()),
+        ("sha256", pa.string()),
+    ]
+)
+
+CATALOG_SCHEMA = pa.schema(
+    [
+        pa.field("run_id", pa.string(), nullable=False),
+        pa.field("pipeline_version", pa.string()),
+        pa.field("schema_version", pa.string()),
+        pa.field("started_at", pa.timestamp("us", tz="UTC")),
+        pa.field("completed_at", pa.timestamp("us", tz="UTC"), nullable=False),
+        pa.field("content_hash", pa.string()),
+        pa.field("counts_json", pa.string()),
+        pa.field("files", pa.list_(_FILE_TYPE)),
+        pa.field("seq", pa.int64()),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class ManifestRecord:
+    uri: str
+    run_id: str
+    pipeline_version: str
+    schema_version: str
+    started_at: datetime | None
+    completed_at: datetime
+    content_hash: str
+    counts: dict[str, int]
+    files: tuple[dict[str, Any], ...]
+    seq: int | None = None
+
+    @property
+    def is_compaction(self) -> bool:
+        return self.run_id.startswith("compaction-")
+
+
+@dataclass(frozen=True)
+class CatalogWatermark:
+    """Catalog sequence a consumer has processed, minus the runs it skipped.
+
+    Sequences are assigned by consolidation in catalog order, so a run
+    appended late with an old `completed_at` still sorts after the mark.
+    """
+
+    seq: int
+    pending: tuple[str, ...] = ()
+
+    def covers(self, record: ManifestRecord) -> bool:
+        return (
+            record.seq is not None
+            and record.seq <= self.seq
+            and record.run_id not in self.pending
+        )
+
+    def to_payload(self) -> dict[str, object]:
+        return {"seq": self.seq, "pending": list(self.pending)}
+
+    @classmethod
+    def from_payload(cls, payload: object) -> CatalogWatermark | None:
+        if not isinstance(payload, dict):
+            return None
+        try:
+            seq = int(payload["seq"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        pending = payload.get("pending")
+        return cls(
+            seq=seq,
+            pending=tuple(str(item) for item in pending)
+            if isinstance(pending, list)
+            else (),
+        )
+
+
+@dataclass(frozen=True)
+class CatalogConsolidation:
+    catalog_uri: str
+    records: int
+    merged_log_files: int
+    backfilled: bool
+    reconciled: int = 0
+
+
+def catalog_enabled() -> bool:
+    return os.getenv("MANIFEST_CATALOG_ENABLED", "1").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def _lock_ttl_seconds() -> int:
+    try:
+        value = int(os.getenv("MANIFEST_CATALOG_LOCK_TTL_SECONDS", "600"))
+    except ValueError:
+        return 600
+    return value if value > 0 else 600
+
+
+def manifest_content_hash(manifest: dict[str, Any]) -> str:
+    serialized = json.dumps(manifest, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(serialized).hexdigest()
+
+
+def catalog_uri(base_uri: str) -> str:
+    return join_uri(base_uri, "manifests", CATALOG_DIR, CATALOG_FILE)
+
+
+def run_id_from_manifest_uri(uri: str) -> str:
+    parsed = urlparse(uri)
+    path = parsed.path if parsed.scheme else uri
+    parts = path.strip("/").split("/")
+    if "manifests" in parts:
+        idx = parts.index("manifests")
+        if len(parts) > idx + 1:
+            return parts[idx + 1]
+    return "unknown"
+
+
+def _base_uri_from_manifest_uri(uri: str) -> str | None:
+    marker = "/manifests/"
+    idx = uri.rfind(marker)
+    if idx <= 0 or not uri.endswith("/manifest.json"):
+        return None
+    return uri[:idx]
+
+
+def _parse_iso(value: object) -> datetime | None:
+    if not value:
+        return None
+    text = str(value)
+    if text.endswith("Z"):
+        text = f"{text[:-1]}+00:00"
+    try:
+        return datetime.fromisoformat(text).astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+def _fs_uri(fs: fsspec.AbstractFileSystem, path: str) -> str:
+    # Match the URI form produced by globbing so catalog and legacy listings
+    # compare equal (index builder reports persist these URIs).
+    protocol = fs.protocol[0] if isinstance(fs.protocol, tuple) else fs.protocol
+    if protocol in {"file", "local"}:
+        return path
+    return f"{protocol}://{path}"
+
+
+def _record_from_manifest(uri: str, manifest: dict[str, Any]) -> ManifestRecord:
+    started_at = _parse_iso(manifest.get("started_at"))
+    completed_at = (
+        _parse_iso(manifest.get("completed_at"))
+        or started_at
+        or datetime.now(timezone.utc)
+    )
+    counts: dict[str, int] = {}
+    counts_raw = manifest.get("counts")
+    if isinstance(counts_raw, dict):
+        for key, value in counts_raw.items():
+            try:
+                counts[str(key)] = int(value)
+            except (TypeError, ValueError):
+                continue
+    files_raw = manifest.get("files")
+    files = (
+        tuple(item for item in files_raw if isinstance(item, dict))
+        if isinstance(files_raw, list)
+        else tuple()
+    )
+    return ManifestRecord(
+        uri=uri,
+        run_id=run_id_from_manifest_uri(uri),
+        pipeline_version=str(manifest.get("pipeline_version") or ""),
+        schema_version=str(manifest.get("schema_version") or ""),
+        started_at=started_at,
+        completed_at=completed_at,
+        content_hash=manifest_content_hash(manifest),
+        counts=counts,
+        files=files,
+    )
+
+
+def read_manifest_record(uri: str) -> ManifestRecord:
+    fs, path = fsspec.core.url_to_fs(uri)
+    with fs.open(path, "rb") as handle:
+        payload = json.load(handle)
+    return _record_from_manifest(uri, payload if isinstance(payload, dict) else {})
+
+
+def _record_row(record: ManifestRecord) -> dict[str, object]:
+    return {
+        "run_id": record.run_id,
+        "pipeline_version": record.pipeline_version,
+        "schema_version": record.schema_version,
+        "started_at": record.started_at,
+        "completed_at": record.completed_at,
+        "content_hash": record.content_hash,
+        "counts_json": json.dumps(record.counts, sort_keys=True),
+        "files": [
+            {
+                "uri": str(item.get("uri") or ""),
+                "rows": int(item.get("rows") or 0),
+                "bytes_written": int(item.get("bytes_written") or 0),
+                "sha256": str(item.get("sha256") or ""),
+            }
+            for item in record.files
+        ],
+        "seq": record.seq,
+    }
+
+
+def _record_from_row(
+    row: dict[str, Any],
+    *,
+    fs: fsspec.AbstractFileSystem,
+    root_path: str,
+) -> ManifestRecord:
+    run_id = str(row["run_id"])
+    counts_raw = json.loads(row.get("counts_json") or "{}")
+    return ManifestRecord(
+        uri=_fs_uri(fs, f"{root_path}/manifests/{run_id}/manifest.json"),
+        run_id=run_id,
+        pipeline_version=str(row.get("pipeline_version") or ""),
+        schema_version=str(row.get("schema_version") or ""),
+        started_at=row.get("started_at"),
+        completed_at=row["completed_at"],
+        content_hash=str(row.get("content_hash") or ""),
+        counts={str(key): int(value) for key, value in counts_raw.items()},
+        files=tuple(row.get("files") or ()),
+        seq=row.get("seq"),
+    )
+
+
+def append_manifest_record(
+    manifest: dict[str, Any],
+    manifest_uri: str,
+) -> str | None:
+    """Append one manifest to the catalog log as a single immutable object.
+
+    Each append is one small Parquet PUT, so concurrent writers never
+    contend; `consolidate_manifest_catalog` folds the log into the catalog.
+    The manifest itself is written first, so a crash before this append
+    leaves a manifest the catalog lacks; consolidation reconciles those from
+    the `manifests/` listing.
+    """
+    base_uri = _base_uri_from_manifest_uri(manifest_uri)
+    if base_uri is None:
+        return None
+    record = _record_from_manifest(manifest_uri, manifest)
+    stamp = record.completed_at.strftime("%Y%m%dT%H%M%S%f")
+    dest_uri = join_uri(
+        base_uri,
+        "manifests",
+        CATALOG_DIR,
+        CATALOG_LOG_DIR,
+        f"{stamp}-{record.run_id}.parquet",
+    )
+    write_parquet([_record_row(record)], CATALOG_SCHEMA, dest_uri)
+    return dest_uri
+
+
+def _log_stamp(path: str) -> datetime | None:
+    name = path.rstrip("/").split("/")[-1]
+    try:
+        return datetime.strptime(name.split("-", 1)[0], "%Y%m%dT%H%M%S%f").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def _dedupe(records: Iterable[ManifestRecord]) -> list[ManifestRecord]:
+    by_run: dict[str, ManifestRecord] = {}
+    for record in records:
+        by_run[record.run_id] = record
+    return sorted(by_run.values(), key=lambda item: (item.completed_at, item.run_id))
+
+
+def _sequence(records: list[ManifestRecord]) -> list[ManifestRecord]:
+    # Only consolidation assigns sequences and it holds the lease, so new
+    # runs always number above everything already in the catalog.
+    next_seq = max((r.seq for r in records if r.seq is not None), default=0) + 1
+    by_run: dict[str, ManifestRecord] = {}
+    for record in records:
+        prior = by_run.get(record.run_id)
+        if (
+            record.seq is None
+            and prior is not None
+            and prior.content_hash == record.content_hash
+        ):
+            record = replace(record, seq=prior.seq)
+        by_run[record.run_id] = record
+    sequenced: list[ManifestRecord] = []
+    for record in sorted(
+        by_run.values(), key=lambda item: (item.completed_at, item.run_id)
+    ):
+        if record.seq is None:
+            record = replace(record, seq=next_seq)
+            next_seq += 1
+        sequenced.append(record)
+    return sequenced
+
+
+def _with_seq(table: pa.Table) -> pa.Table:
+    # Catalog files written before sequencing lack the column.
+    if "seq" in table.column_names:
+        return table
+    return table.append_column("seq", pa.nulls(table.num_rows, pa.int64()))
+
+
+def _uncovered(table: pa.Table, after: CatalogWatermark | None) -> pa.Table:
+    if after is None:
+        return table
+    mask = pc.or_(
+        pc.fill_null(pc.greater(table.column("seq"), after.seq), True),
+        pc.is_in(table.column("run_id"), pa.array(after.pending, pa.string())),
+    )
+    return table.filter(mask)
+
+
+def _read_catalog_once(
+    fs: fsspec.AbstractFileSystem,
+    root_path: str,
+    since: datetime | None,
+    after: CatalogWatermark | None = None,
+) -> list[ManifestRecord] | None:
+    catalog_dir = f"{root_path}/manifests/{CATALOG_DIR}"
+    base_path = f"{catalog_dir}/{CATALOG_FILE}"
+    log_paths = sorted(fs.glob(f"{catalog_dir}/{CATALOG_LOG_DIR}/*.parquet"))
+    if not fs.exists(base_path):
+        return None
+    filters = [("completed_at", ">", since)] if since is not None else None
+    tables = [_with_seq(pq.read_table(base_path, filesystem=fs, filters=filters))]
+    for path in log_paths:
+        stamp = _log_stamp(path)
+        if since is not None and stamp is not None and stamp <= since:
+            continue
+        tables.append(_with_seq(pq.read_table(path, filesystem=fs, filters=filters)))
+    rows = _uncovered(pa.concat_tables(tables), after).to_pylist()
+    return _dedupe(
+        _record_from_row(row, fs=fs, root_path=root_path) for row in rows
+    )
+
+
+def _scan_manifest_files(
+    fs: fsspec.AbstractFileSystem,
+    root_path: str,
+    since: datetime | None,
+) -> list[ManifestRecord]:
+    records: list[ManifestRecord] = []
+    for path in sorted(fs.glob(f"{root_path}/manifests/*/manifest.json")):
+        try:
+            record = read_manifest_record(_fs_uri(fs, path))
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable manifest", extra={"path": path})
+            continue
+        if since is not None and record.completed_at <= since:
+            continue
+        records.append(record)
+    return _dedupe(records)
+
+
+def list_manifests(
+    base_uri: str,
+    *,
+    since: datetime | None = None,
+    after: CatalogWatermark | None = None,
+) -> list[ManifestRecord]:
+    """Return manifests completed after `since`, oldest first.
+
+    `after` drops runs a watermark covers; runs not yet sequenced by a
+    consolidation are never covered. Served from the consolidated catalog
+    plus its append log when a catalog exists; otherwise falls back to
+    reading every `manifest.json`.
+    """
+    fs, root_path = fsspec.core.url_to_fs(base_uri)
+    root_path = root_path.rstrip("/")
+    if catalog_enabled():
+        for _ in range(3):
+            try:
+                records = _read_catalog_once(fs, root_path, since, after)
+            except FileNotFoundError:
+                # A consolidation removed log files mid-read; the new catalog
+                # now holds them.
+                continue
+            if records is not None:
+                return records
+            break
+    return _scan_manifest_files(fs, root_path, since)
+
+
+def list_manifest_uris(base_uri: str) -> list[str]:
+    """Manifest URIs only; avoids reading manifest bodies on either path."""
+    fs, root_path = fsspec.core.url_to_fs(base_uri)
+    root_path = root_path.rstrip("/")
+    catalog_dir = f"{root_path}/manifests/{CATALOG_DIR}"
+    base_path = f"{catalog_dir}/{CATALOG_FILE}"
+    if catalog_enabled():
+        for _ in range(3):
+            try:
+                log_paths = fs.glob(f"{catalog_dir}/{CATALOG_LOG_DIR}/*.parquet")
+                if not fs.exists(base_path):
+                    break
+                run_ids = set(
+                    pq.read_table(base_path, filesystem=fs, columns=["run_id"])
+                    .column("run_id")
+                    .to_pylist()
+                )
+                for path in log_paths:
+                    run_ids.update(
+                        pq.read_table(path, filesystem=fs, columns=["run_id"])
+                        .column("run_id")
+                        .to_pylist()
+                    )
+            except FileNotFoundError:
+                continue
+            return [
+                _fs_uri(fs, f"{root_path}/manifests/{run_id}/manifest.json")
+                for run_id in sorted(run_ids)
+            ]
+    return [
+        _fs_uri(fs, path)
+        for path in sorted(fs.glob(f"{root_path}/manifests/*/manifest.json"))
+    ]
+
+
+def watermark_uri(base_uri: str, name: str) -> str:
+    return join_uri(
+        base_uri, "manifests", CATALOG_DIR, CATALOG_WATERMARK_DIR, f"{name}.json"
+    )
+
+
+def read_watermark(base_uri: str, name: str) -> CatalogWatermark | None:
+    """Return the catalog position a consumer last processed manifests up to."""
+    fs, path = fsspec.core.url_to_fs(watermark_uri(base_uri, name))
+    try:
+        with fs.open(path, "rb") as handle:
+            payload = json.load(handle)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable watermark", extra={"path": path})
+        return None
+    return CatalogWatermark.from_payload(payload)
+
+
+def write_watermark(base_uri: str, name: str, watermark: CatalogWatermark) -> str:
+    dest_uri = watermark_uri(base_uri, name)
+    fs, path = fsspec.core.url_to_fs(dest_uri)
+    fs.makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+    payload = json.dumps(
+        {
+            **watermark.to_payload(),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+    ).encode("utf-8")
+    with fs.open(path, "wb") as handle:
+        handle.write(payload)
+    return dest_uri
+
+
+def _embedded_watermark(uri: str) -> CatalogWatermark | None:
+    fs, path = fsspec.core.url_to_fs(uri)
+    try:
+        with fs.open(path, "rb") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return CatalogWatermark.from_payload(payload.get(COMPACTION_WATERMARK_KEY))
+
+
+def list_uncompacted_manifests(base_uri: str) -> list[ManifestRecord] | None:
+    """Return the latest compaction plus every run it did not consume.
+
+    Each compaction manifest embeds the watermark of its inputs; the
+    watermark file is only a hint that narrows the listing, so a crash
+    between the two writes cannot double count or drop runs. Returns None
+    when no compaction has recorded a watermark yet.
+    """
+    hint = read_watermark(base_uri, COMPACTION_WATERMARK)
+    records = list_manifests(base_uri, after=hint)
+    compactions = [record for record in records if record.is_compaction]
+    if not compactions:
+        return records if hint is not None else None
+    latest = max(
+        compactions,
+        key=lambda item: (item.seq is None, item.seq or 0, item.completed_at),
+    )
+    watermark = _embedded_watermark(latest.uri)
+    if watermark is None:
+        return records if hint is not None else None
+    return [
+        record
+        for record in records
+        if record.run_id == latest.run_id or not watermark.covers(record)
+    ]
+
+
+def _lease_owner(fs: fsspec.AbstractFileSystem, path: str) -> tuple[str, datetime]:
+    try:
+        with fs.open(path, "rb") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return "", datetime.min.replace(tzinfo=timezone.utc)
+    if not isinstance(payload, dict):
+        return "", datetime.min.replace(tzinfo=timezone.utc)
+    expires_at = _parse_iso(payload.get("expires_at"))
+    return (
+        str(payload.get("owner") or ""),
+        expires_at or datetime.min.replace(tzinfo=timezone.utc),
+    )
+
+
+def _create_lease(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    owner: str,
+) -> bool:
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=_lock_ttl_seconds())
+    payload = json.dumps(
+        {"owner": owner, "expires_at": expires_at.isoformat()}
+    ).encode("utf-8")
+    try:
+        with fs.open(path, "xb") as handle:
+            handle.write(payload)
+        return True
+    except FileExistsError:
+        return False
+    except (ValueError, NotImplementedError):
+        # Backends without exclusive create: write, then confirm by reading
+        # back that this writer's lease won.
+        if fs.exists(path):
+            return False
+        with fs.open(path, "wb") as handle:
+            handle.write(payload)
+        return _lease_owner(fs, path)[0] == owner
+
+
+@contextmanager
+def _consolidation_lease(
+    fs: fsspec.AbstractFileSystem,
+    catalog_dir: str,
+) -> Iterator[bool]:
+    """Hold the catalog's consolidation lease; yields False if another owns it.
+
+    Two consolidations racing could each rewrite `catalog.parquet` from a
+    different log listing and then delete log files the other never merged.
+    Leases expire after `MANIFEST_CATALOG_LOCK_TTL_SECONDS` so a crashed
+    consolidator does not block the catalog forever.
+    """
+    path = f"{catalog_dir}/{CATALOG_LOCK_FILE}"
+    owner = uuid.uuid4().hex
+    fs.makedirs(catalog_dir, exist_ok=True)
+    acquired = _create_lease(fs, path, owner)
+    if not acquired:
+        _, expires_at = _lease_owner(fs, path)
+        if expires_at <= datetime.now(timezone.utc):
+            logger.warning(
+                "Replacing expired manifest catalog lease",
+                extra={"path": path},
+            )
+            try:
+                fs.rm(path)
+            except FileNotFoundError:
+                pass
+            acquired = _create_lease(fs, path, owner)
+    try:
+        yield acquired
+    finally:
+        if acquired and _lease_owner(fs, path)[0] == owner:
+            fs.rm(path)
+
+
+def _reconcile_manifests(
+    fs: fsspec.AbstractFileSystem,
+    root_path: str,
+    known_runs: set[str],
+) -> list[ManifestRecord]:
+    records: list[ManifestRecord] = []
+    for path in sorted(fs.glob(f"{root_path}/manifests/*/manifest.json")):
+        run_id = run_id_from_manifest_uri(path)
+        if run_id in known_runs:
+            continue
+        try:
+            records.append(read_manifest_record(_fs_uri(fs, path)))
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable manifest", extra={"path": path})
+    return records
+
+
+def consolidate_manifest_catalog(base_uri: str) -> CatalogConsolidation | None:
+    """Fold the append log into `catalog.parquet`.
+
+    The first consolidation backfills from the JSON manifests so trees that
+    predate the catalog are complete before readers switch over. Later runs
+    list `manifests/` and add any run whose log append was lost. Returns
+    None when another consolidation holds the lease.
+    """
+    fs, root_path = fsspec.core.url_to_fs(base_uri)
+    root_path = root_path.rstrip("/")
+    catalog_dir = f"{root_path}/manifests/{CATALOG_DIR}"
+    with _consolidation_lease(fs, catalog_dir) as acquired:
+        if not acquired:
+            logger.info(
+                "Manifest catalog consolidation already running",
+                extra={"catalog_uri": catalog_uri(base_uri)},
+            )
+            return None
+        return _consolidate(fs, root_path, catalog_dir, base_uri)
+
+
+def _consolidate(
+    fs: fsspec.AbstractFileSystem,
+    root_path: str,
+    catalog_dir: str,
+    base_uri: str,
+) -> CatalogConsolidation:
+    base_path = f"{catalog_dir}/{CATALOG_FILE}"
+    log_paths = sorted(fs.glob(f"{catalog_dir}/{CATALOG_LOG_DIR}/*.parquet"))
+
+    backfilled = not fs.exists(base_path)
+    if backfilled:
+        records = _scan_manifest_files(fs, root_path, None)
+    else:
+        rows = _with_seq(pq.read_table(base_path, filesystem=fs)).to_pylist()
+        records = [
+            _record_from_row(row, fs=fs, root_path=root_path) for row in rows
+        ]
+    if log_paths:
+        rows = pa.concat_tables(
+            [_with_seq(pq.read_table(path, filesystem=fs)) for path in log_paths]
+        ).to_pylist()
+        records.extend(
+            _record_from_row(row, fs=fs, root_path=root_path) for row in rows
+        )
+    reconciled: list[ManifestRecord] = []
+    if not backfilled:
+        reconciled = _reconcile_manifests(
+            fs, root_path, {record.run_id for record in records}
+        )
+        if reconciled:
+            logger.warning(
+                "Manifests missing from catalog",
+                extra={"run_ids": [record.run_id for record in reconciled]},
+            )
+        records.extend(reconciled)
+    merged = _sequence(records)
+
+    dest_uri = catalog_uri(base_uri)
+    write_parquet(
+        [_record_row(record) for record in merged],
+        CATALOG_SCHEMA,
+        dest_uri,
+        row_group_size=CATALOG_ROW_GROUP_SIZE,
+    )
+    if log_paths:
+        fs.rm(log_paths)
+    logger.info(
+        "Manifest catalog consolidated",
+        extra={
+            "catalog_uri": dest_uri,
+            "records": len(merged),
+            "merged_log_files": len(log_paths),
+            "backfilled": backfilled,
+            "reconciled": len(reconciled),
+        },
+    )
+    return CatalogConsolidation(
+        catalog_uri=dest_uri,
+        records=len(merged),
+        merged_log_files=len(log_paths),
+        backfilled=backfilled,
+        reconciled=len(reconciled),
+    )
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import hashlib
 import os
-import shutil
 import tempfile
 from dataclasses import dataclass
-from typing import Iterable, Mapping
+from types import TracebackType
+from typing import IO, Iterable, Mapping
 from urllib.parse import urlparse
 
 import fsspec
 import pyarrow as pa
 import pyarrow.parquet as pq
+from fsspec.spec import AbstractBufferedFile
+
+DEFAULT_ROW_GROUP_SIZE = 65536
 
 
 @dataclass(frozen=True)
@@ -21,24 +24,210 @@ class WriteResult:
     sha256: str
 
 
-def _sha256_file(path: str) -> str:
-    digest = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+class _HashingSink:
+    """File-like sink that hashes and counts bytes on their way out."""
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._digest = hashlib.sha256()
+        self.bytes_written = 0
+        self.closed = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        self._digest.update(view)
+        self._handle.write(view)
+        self.bytes_written += view.nbytes
+        return view.nbytes
+
+    def tell(self) -> int:
+        return self.bytes_written
 
+    def flush(self) -> None:
+        self._handle.flush()
 
-def _write_local(src_path: str, dest_path: str) -> None:
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    os.replace(src_path, dest_path)
+    def close(self) -> None:
+        # The owning writer closes (and commits) the underlying handle.
+        self.closed = True
 
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
 
-def _write_remote(src_path: str, dest_uri: str) -> None:
-    fs, path = fsspec.core.url_to_fs(dest_uri)
-    fs.makedirs(os.path.dirname(path), exist_ok=True)
-    with fs.open(path, "wb") as handle, open(src_path, "rb") as src:
-        shutil.copyfileobj(src, handle)
+
+def _nullable_fixed_lists(schema: pa.Schema) -> list[str]:
+    return [
+        field.name
+        for field in schema
+        if field.nullable and pa.types.is_fixed_size_list(field.type)
+    ]
+
+
+class StreamingParquetWriter:
+    """Write a Parquet file incrementally, hashing bytes as they are produced.
+
+    Rows are buffered only until a row group fills. Local destinations are
+    written to a temp file next to the target and renamed into place on close;
+    remote destinations stream straight into the object store's multipart /
+    resumable upload, so no file is staged on local disk. Leaving the context
+    manager with an exception aborts the upload and discards partial output.
+    """
+
+    def __init__(
+        self,
+        dest_uri: str,
+        schema: pa.Schema,
+        *,
+        compression: str = "zstd",
+        row_group_size: int | None = None,
+    ) -> None:
+        self.dest_uri = dest_uri
+        self.schema = schema
+        self.row_group_size = max(1, row_group_size or DEFAULT_ROW_GROUP_SIZE)
+        self.rows = 0
+        self._buffer: list[Mapping[str, object]] = []
+        self._fixed_lists = _nullable_fixed_lists(schema)
+        self._tmp_path: str | None = None
+        self._local_path: str | None = None
+        self._fs: fsspec.AbstractFileSystem | None = None
+        self._remote_path: str | None = None
+        self._result: WriteResult | None = None
+
+        parsed = urlparse(dest_uri)
+        handle: IO[bytes]
+        if parsed.scheme and parsed.scheme != "file" and parsed.netloc:
+            self._fs, self._remote_path = fsspec.core.url_to_fs(dest_uri)
+            self._fs.makedirs(os.path.dirname(self._remote_path), exist_ok=True)
+            handle = self._fs.open(self._remote_path, "wb")
+        else:
+            local_path = parsed.path if parsed.scheme == "file" else dest_uri
+            dest_dir = os.path.dirname(local_path) or "."
+            os.makedirs(dest_dir, exist_ok=True)
+            tmp = tempfile.NamedTemporaryFile(
+                dir=dest_dir,
+                prefix=".",
+                suffix=".parquet.tmp",
+                delete=False,
+            )
+            self._local_path = local_path
+            self._tmp_path = tmp.name
+            handle = tmp
+        self._handle = handle
+        self._sink = _HashingSink(handle)
+        try:
+            self._writer: pq.ParquetWriter | None = pq.ParquetWriter(
+                self._sink,
+                schema,
+                compression=compression,
+            )
+        except Exception:
+            self.abort()
+            raise
+
+    def __enter__(self) -> StreamingParquetWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+        elif self._result is None:
+            self.close()
+
+    def write_rows(self, rows: Iterable[Mapping[str, object]]) -> None:
+        for row in rows:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.row_group_size:
+                self._flush_rows()
+
+    def write_table(self, table: pa.Table) -> None:
+        if self._writer is None:
+            raise ValueError("Parquet writer is closed")
+        self._flush_rows()
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows += table.num_rows
+
+    def _flush_rows(self) -> None:
+        if not self._buffer:
+            return
+        if self._writer is None:
+            raise ValueError("Parquet writer is closed")
+        rows = self._buffer
+        self._buffer = []
+        # pyarrow can interpret missing fixed-size list fields as empty lists,
+        # which fails schema validation. Fill missing nullable fixed-size list
+        # fields with explicit nulls to keep additive schema changes safe.
+        if self._fixed_lists:
+            filled: list[Mapping[str, object]] = []
+            for row in rows:
+                updated = dict(row)
+                for name in self._fixed_lists:
+                    if name not in updated:
+                        updated[name] = None
+                filled.append(updated)
+            rows = filled
+        table = pa.Table.from_pylist(rows, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows += table.num_rows
+
+    def close(self) -> WriteResult:
+        if self._result is not None:
+            return self._result
+        if self._writer is None:
+            raise ValueError("Parquet writer was aborted")
+        try:
+            self._flush_rows()
+            self._writer.close()
+            self._writer = None
+            self._handle.close()
+            if self._tmp_path is not None and self._local_path is not None:
+                os.replace(self._tmp_path, self._local_path)
+                self._tmp_path = None
+        except Exception:
+            self.abort()
+            raise
+        self._result = WriteResult(
+            uri=self.dest_uri,
+            rows=self.rows,
+            bytes_written=self._sink.bytes_written,
+            sha256=self._sink.hexdigest(),
+        )
+        return self._result
+
+    def abort(self) -> None:
+        self._buffer = []
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception:
+                pass
+        if self._fs is not None:
+            # Cancel the multipart/resumable upload instead of committing a
+            # truncated object, then mark the handle closed so garbage
+            # collection does not finalize it.
+            discard = getattr(self._handle, "discard", None)
+            if callable(discard):
+                try:
+                    discard()
+                except Exception:
+                    pass
+            if isinstance(self._handle, AbstractBufferedFile):
+                self._handle.closed = True
+        else:
+            try:
+                self._handle.close()
+            except Exception:
+                pass
+        if self._tmp_path is not None and os.path.exists(self._tmp_path):
+            os.unlink(self._tmp_path)
+        self._tmp_path = None
 
 
 def write_parquet(
@@ -48,51 +237,11 @@ def write_parquet(
     compression: str = "zstd",
     row_group_size: int | None = None,
 ) -> WriteResult:
-    rows_list = rows if isinstance(rows, list) else list(rows)
-    # pyarrow can interpret missing fixed-size list fields as empty lists, which
-    # fails schema validation. Fill missing nullable fixed-size list fields with
-    # explicit nulls to keep additive schema changes safe.
-    nullable_fixed_lists = [
-        field.name
-        for field in schema
-        if field.nullable and pa.types.is_fixed_size_list(field.type)
-    ]
-    if rows_list and nullable_fixed_lists:
-        filled_rows = []
-        for row in rows_list:
-            updated = dict(row)
-            for name in nullable_fixed_lists:
-                if name not in updated:
-                    updated[name] = None
-            filled_rows.append(updated)
-        rows_list = filled_rows
-    table = pa.Table.from_pylist(rows_list, schema=schema)
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-        tmp_path = tmp.name
-
-    try:
-        pq.write_table(
-            table,
-            tmp_path,
-            compression=compression,
-            row_group_size=row_group_size,
-        )
-        bytes_written = os.path.getsize(tmp_path)
-        checksum = _sha256_file(tmp_path)
-        parsed = urlparse(dest_uri)
-        if parsed.scheme == "file":
-            _write_local(tmp_path, parsed.path)
-        elif parsed.scheme and parsed.netloc:
-            _write_remote(tmp_path, dest_uri)
-        else:
-            _write_local(tmp_path, dest_uri)
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-
-    return WriteResult(
-        uri=dest_uri,
-        rows=table.num_rows,
-        bytes_written=bytes_written,
-        sha256=checksum,
-    )
+    with StreamingParquetWriter(
+        dest_uri,
+        schema,
+        compression=compression,
+        row_group_size=row_group_size,
+    ) as writer:
+        writer.write_rows(rows)
+    return writer.close()
@@ -1,8 +1,10 @@
 from retikon_core.webhooks.delivery import (
     DeliveryOptions,
     DeliveryResult,
+    WebhookDeliveryEngine,
     deliver_webhook,
     deliver_webhooks,
+    get_delivery_engine,
 )
 from retikon_core.webhooks.logs import (
     WebhookDeliveryRecord,
@@ -19,12 +21,14 @@ from retikon_core.webhooks.types import WebhookEvent, WebhookRegistration, event
 __all__ = [
     "DeliveryOptions",
     "DeliveryResult",
+    "WebhookDeliveryEngine",
     "WebhookDeliveryRecord",
     "WebhookEvent",
     "WebhookRegistration",
     "deliver_webhook",
     "deliver_webhooks",
     "event_to_dict",
+    "get_delivery_engine",
     "load_webhooks",
     "register_webhook",
     "save_webhooks",
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import http.client
+import itertools
 import json
+import random
+import threading
 import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Iterable
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Callable, Iterable
+from urllib.parse import urlsplit
 
+from retikon_core.logging import get_logger
 from retikon_core.webhooks.logs import WebhookDeliveryRecord
 from retikon_core.webhooks.signer import sign_payload
 from retikon_core.webhooks.types import WebhookEvent, WebhookRegistration, event_to_dict
 
+logger = get_logger(__name__)
+
 
 @dataclass(frozen=True)
 class DeliveryOptions:
@@ -20,6 +29,10 @@ class DeliveryOptions:
     max_attempts: int = 3
     backoff_s: float = 0.5
     retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+    max_concurrency: int = 8
+    jitter: float = 0.5
+    breaker_failures: int = 5
+    breaker_cooldown_s: float = 30.0
 
 
 @dataclass(frozen=True)
@@ -33,22 +46,657 @@ class DeliveryResult:
     error: str | None = None
 
 
+RetryCallback = Callable[[list[DeliveryResult], list[WebhookDeliveryRecord]], None]
+
+
 def deliver_webhook(
     webhook: WebhookRegistration,
     event: WebhookEvent,
     options: DeliveryOptions,
+    *,
+    engine: WebhookDeliveryEngine | None = None,
 ) -> tuple[DeliveryResult, list[WebhookDeliveryRecord]]:
-    if not webhook.enabled:
-        result = DeliveryResult(
-            webhook_id=webhook.id,
-            event_id=event.id,
-            status="skipped",
-            status_code=None,
-            attempts=0,
-            duration_ms=0,
+    """Deliver an event to one webhook and wait until the delivery settles.
+
+    Runs on the delivery engine like `deliver_webhooks`, but keeps retries in
+    the call even when the engine's retry scheduler is running.
+    """
+    resolved = engine or get_delivery_engine()
+    results, records = resolved.deliver(
+        [webhook], event, options, defer_retries=False
+    )
+    return results[0], records
+
+
+def deliver_webhooks(
+    webhooks: Iterable[WebhookRegistration],
+    event: WebhookEvent,
+    options: DeliveryOptions,
+    *,
+    engine: WebhookDeliveryEngine | None = None,
+    on_retries_done: RetryCallback | None = None,
+) -> tuple[list[DeliveryResult], list[WebhookDeliveryRecord]]:
+    """Fan an event out to every subscription concurrently.
+
+    Results come back in subscription order. Records are grouped per
+    subscription in the same order. When the engine's retry scheduler is
+    running, see `WebhookDeliveryEngine.deliver`.
+    """
+    resolved = engine or get_delivery_engine()
+    return resolved.deliver(
+        webhooks, event, options, on_retries_done=on_retries_done
+    )
+
+
+@dataclass
+class _PendingDelivery:
+    index: int
+    webhook: WebhookRegistration
+    body: bytes
+    headers: dict[str, str]
+    timeout_s: float
+    delivery_id: str
+    started: float
+    attempts: int = 0
+    last_status: int | None = None
+    last_error: str | None = None
+    retry_at: float = 0.0
+    breaker_waits: int = 0
+    records: list[WebhookDeliveryRecord] = field(default_factory=list)
+
+
+@dataclass
+class _RetryBatch:
+    """Deliveries of one event handed to the background retry scheduler."""
+
+    event_id: str
+    options: DeliveryOptions
+    outstanding: int
+    on_done: RetryCallback | None
+    results: list[DeliveryResult] = field(default_factory=list)
+    records: list[WebhookDeliveryRecord] = field(default_factory=list)
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port)."""
+
+    def __init__(self, max_idle_per_host: int) -> None:
+        self._max_idle = max(0, max_idle_per_host)
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        key: tuple[str, str, int],
+        timeout_s: float,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout_s
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout_s)
+            return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout_s), False
+        return http.client.HTTPConnection(host, port, timeout=timeout_s), False
+
+    def release(
+        self,
+        key: tuple[str, str, int],
+        conn: http.client.HTTPConnection,
+    ) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+
+class _CircuitBreaker:
+    """Consecutive-failure breaker per endpoint with a half-open probe."""
+
+    def __init__(self) -> None:
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def allow(self, key: str, now: float, cooldown_s: float) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return True
+            if now - opened_at < cooldown_s or key in self._probing:
+                return False
+            self._probing.add(key)
+            return True
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+            self._probing.discard(key)
+
+    def record_failure(self, key: str, now: float, threshold: int) -> None:
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if key in self._probing or failures >= max(1, threshold):
+                self._opened_at[key] = now
+            self._probing.discard(key)
+
+    def is_open(self, key: str) -> bool:
+        with self._lock:
+            return key in self._opened_at
+
+    def probe_at(self, key: str, cooldown_s: float) -> float | None:
+        """When the next half-open probe may run, or None if closed."""
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+        return None if opened_at is None else opened_at + cooldown_s
+
+
+class WebhookDeliveryEngine:
+    """Concurrent webhook delivery with pooled connections.
+
+    Attempts run on a bounded thread pool. Retries go back on a queue keyed by
+    their due time, so a slow endpoint never holds up the other subscribers.
+    Connections are kept alive per host. Endpoints that keep failing are cut
+    off by a circuit breaker until a cooldown has passed.
+
+    Once `start` has been called, retries move to a long-lived scheduler
+    thread instead, so `deliver` returns after the first attempt round.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_host: int = 4,
+        rng: random.Random | None = None,
+        retry_workers: int = 8,
+    ) -> None:
+        self._pool = _ConnectionPool(max_idle_per_host)
+        self._breaker = _CircuitBreaker()
+        self._rng = rng or random.Random()
+        self._retry_workers = max(1, retry_workers)
+        self._retry_queue: list[
+            tuple[float, int, _PendingDelivery, _RetryBatch]
+        ] = []
+        self._retry_sequence = itertools.count()
+        self._retry_cond = threading.Condition()
+        self._retry_thread: threading.Thread | None = None
+        self._retry_executor: ThreadPoolExecutor | None = None
+        self._retry_inflight = 0
+        self._stopping = False
+
+    def circuit_open(self, url: str) -> bool:
+        return self._breaker.is_open(url)
+
+    @property
+    def scheduling_retries(self) -> bool:
+        thread = self._retry_thread
+        return thread is not None and thread.is_alive() and not self._stopping
+
+    def start(self) -> None:
+        """Start the background retry scheduler (idempotent)."""
+        with self._retry_cond:
+            if self._retry_thread is not None and self._retry_thread.is_alive():
+                return
+            self._stopping = False
+            self._retry_executor = ThreadPoolExecutor(
+                max_workers=self._retry_workers,
+                thread_name_prefix="webhook-retry",
+            )
+            self._retry_thread = threading.Thread(
+                target=self._schedule_retries,
+                name="webhook-retry-scheduler",
+                daemon=True,
+            )
+            self._retry_thread.start()
+
+    def close(self, drain_timeout_s: float = 5.0) -> None:
+        """Stop the retry scheduler and close pooled connections.
+
+        Queued retries keep running for up to `drain_timeout_s`. Retries still
+        waiting after that are reported to their callbacks as "abandoned":
+        they did not use up their attempts, so they are not failures.
+        """
+        deadline = time.monotonic() + max(0.0, drain_timeout_s)
+        with self._retry_cond:
+            while self.scheduling_retries and (
+                self._retry_queue or self._retry_inflight
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._retry_cond.wait(remaining)
+            self._stopping = True
+            thread, self._retry_thread = self._retry_thread, None
+            executor, self._retry_executor = self._retry_executor, None
+            self._retry_cond.notify_all()
+        if thread is not None:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._retry_cond:
+            abandoned, self._retry_queue = self._retry_queue, []
+        if abandoned:
+            logger.warning(
+                "Abandoning queued webhook retries on shutdown",
+                extra={"count": len(abandoned)},
+            )
+        for _, _, delivery, batch in abandoned:
+            self._finish_retry(delivery, batch, "abandoned")
+        self._pool.close()
+
+    def deliver(
+        self,
+        webhooks: Iterable[WebhookRegistration],
+        event: WebhookEvent,
+        options: DeliveryOptions,
+        *,
+        on_retries_done: RetryCallback | None = None,
+        defer_retries: bool = True,
+    ) -> tuple[list[DeliveryResult], list[WebhookDeliveryRecord]]:
+        """Deliver an event to every webhook.
+
+        Without a running scheduler, or with `defer_retries=False`, this
+        blocks until every delivery settles. Otherwise it returns after the
+        first attempt round: deliveries that need a retry, or that an open
+        circuit turned away, come back with status "retrying", and
+        `on_retries_done` later receives their final results and the records
+        of the retry attempts.
+        """
+        defer_retries = defer_retries and self.scheduling_retries
+        deferred: list[_PendingDelivery] = []
+        hooks = list(webhooks)
+        results: list[DeliveryResult | None] = [None] * len(hooks)
+        pending: list[_PendingDelivery] = []
+        queue: list[tuple[float, int, _PendingDelivery]] = []
+        sequence = itertools.count()
+        now = time.monotonic()
+        for index, webhook in enumerate(hooks):
+            if not webhook.enabled:
+                results[index] = DeliveryResult(
+                    webhook_id=webhook.id,
+                    event_id=event.id,
+                    status="skipped",
+                    status_code=None,
+                    attempts=0,
+                    duration_ms=0,
+                )
+                continue
+            body, headers = _prepare_request(webhook, event)
+            delivery = _PendingDelivery(
+                index=index,
+                webhook=webhook,
+                body=body,
+                headers=headers,
+                timeout_s=(
+                    webhook.timeout_s
+                    if webhook.timeout_s is not None
+                    else options.timeout_s
+                ),
+                delivery_id=str(uuid.uuid4()),
+                started=now,
+            )
+            pending.append(delivery)
+            heapq.heappush(queue, (now, next(sequence), delivery))
+
+        if pending:
+            workers = max(1, min(options.max_concurrency, len(pending)))
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="webhook-delivery",
+            ) as executor:
+                inflight: dict[Future[WebhookDeliveryRecord], _PendingDelivery] = {}
+                while queue or inflight:
+                    now = time.monotonic()
+                    while queue and queue[0][0] <= now and len(inflight) < workers:
+                        _, _, delivery = heapq.heappop(queue)
+                        url = delivery.webhook.url
+                        if not self._breaker.allow(
+                            url, now, options.breaker_cooldown_s
+                        ):
+                            delivery.last_error = "circuit open"
+                            if defer_retries:
+                                delivery.breaker_waits += 1
+                                delivery.retry_at = self._breaker_retry_at(
+                                    delivery, now, options
+                                )
+                                deferred.append(delivery)
+                                results[delivery.index] = _final_result(
+                                    delivery, event.id, "retrying"
+                                )
+                                continue
+                            delivery.attempts += 1
+                            delivery.records.append(
+                                _attempt_record(
+                                    delivery,
+                                    event.id,
+                                    status="failed",
+                                    status_code=None,
+                                    error=delivery.last_error,
+                                    duration_ms=0,
+                                )
+                            )
+                            results[delivery.index] = _final_result(
+                                delivery, event.id, "failed"
+                            )
+                            continue
+                        delivery.attempts += 1
+                        future = executor.submit(self._attempt, delivery, event.id)
+                        inflight[future] = delivery
+
+                    timeout: float | None = None
+                    if queue and len(inflight) < workers:
+                        timeout = max(0.0, queue[0][0] - time.monotonic())
+                    if not inflight:
+                        if timeout:
+                            time.sleep(timeout)
+                        continue
+                    done, _ = wait(
+                        inflight,
+                        timeout=timeout,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        delivery = inflight.pop(future)
+                        record = future.result()
+                        delivery.records.append(record)
+                        delivery.last_status = record.status_code
+                        delivery.last_error = record.error
+                        retry_at = self._settle(delivery, record, options)
+                        if retry_at is not None and defer_retries:
+                            deferred.append(delivery)
+                            results[delivery.index] = _final_result(
+                                delivery, event.id, "retrying"
+                            )
+                            delivery.retry_at = retry_at
+                        elif retry_at is not None:
+                            heapq.heappush(
+                                queue, (retry_at, next(sequence), delivery)
+                            )
+                        else:
+                            results[delivery.index] = _final_result(
+                                delivery, event.id, record.status
+                            )
+
+        records: list[WebhookDeliveryRecord] = []
+        for delivery in pending:
+            records.extend(delivery.records)
+        if deferred:
+            batch = _RetryBatch(
+                event_id=event.id,
+                options=options,
+                outstanding=len(deferred),
+                on_done=on_retries_done,
+            )
+            for delivery in deferred:
+                # First-round records were returned above; the batch only
+                # reports the attempts made by the scheduler.
+                delivery.records = []
+                self._enqueue_retry(delivery.retry_at, delivery, batch)
+        return [result for result in results if result is not None], records
+
+    def _enqueue_retry(
+        self,
+        due: float,
+        delivery: _PendingDelivery,
+        batch: _RetryBatch,
+    ) -> None:
+        with self._retry_cond:
+            if not self._stopping:
+                heapq.heappush(
+                    self._retry_queue,
+                    (due, next(self._retry_sequence), delivery, batch),
+                )
+                self._retry_cond.notify_all()
+                return
+        self._finish_retry(delivery, batch, "abandoned")
+
+    def _schedule_retries(self) -> None:
+        while True:
+            with self._retry_cond:
+                while not self._stopping:
+                    now = time.monotonic()
+                    if (
+                        self._retry_queue
+                        and self._retry_queue[0][0] <= now
+                        and self._retry_inflight < self._retry_workers
+                    ):
+                        break
+                    timeout = None
+                    if (
+                        self._retry_queue
+                        and self._retry_inflight < self._retry_workers
+                    ):
+                        timeout = self._retry_queue[0][0] - now
+                    self._retry_cond.wait(timeout)
+                if self._stopping:
+                    return
+                _, _, delivery, batch = heapq.heappop(self._retry_queue)
+                executor = self._retry_executor
+                url = delivery.webhook.url
+                now = time.monotonic()
+                allowed = self._breaker.allow(
+                    url, now, batch.options.breaker_cooldown_s
+                )
+                if not allowed and delivery.breaker_waits < max(
+                    1, batch.options.max_attempts
+                ):
+                    # The endpoint is cut off; wait for the breaker instead of
+                    # spending an attempt on it.
+                    delivery.breaker_waits += 1
+                    heapq.heappush(
+                        self._retry_queue,
+                        (
+                            self._breaker_retry_at(delivery, now, batch.options),
+                            next(self._retry_sequence),
+                            delivery,
+                            batch,
+                        ),
+                    )
+                    continue
+                delivery.attempts += 1
+                if allowed and executor is not None:
+                    self._retry_inflight += 1
+            if not allowed or executor is None:
+                delivery.last_error = "circuit open"
+                delivery.records.append(
+                    _attempt_record(
+                        delivery,
+                        batch.event_id,
+                        status="failed",
+                        status_code=None,
+                        error=delivery.last_error,
+                        duration_ms=0,
+                    )
+                )
+                self._finish_retry(delivery, batch, "failed")
+                continue
+            future = executor.submit(self._attempt, delivery, batch.event_id)
+            future.add_done_callback(
+                functools.partial(self._retry_attempted, delivery, batch)
+            )
+
+    def _retry_attempted(
+        self,
+        delivery: _PendingDelivery,
+        batch: _RetryBatch,
+        future: Future[WebhookDeliveryRecord],
+    ) -> None:
+        with self._retry_cond:
+            self._retry_inflight -= 1
+            self._retry_cond.notify_all()
+        try:
+            record = future.result()
+        except Exception as exc:
+            delivery.last_error = str(exc) or exc.__class__.__name__
+            self._finish_retry(delivery, batch, "failed")
+            return
+        delivery.records.append(record)
+        delivery.last_status = record.status_code
+        delivery.last_error = record.error
+        retry_at = self._settle(delivery, record, batch.options)
+        if retry_at is not None:
+            self._enqueue_retry(retry_at, delivery, batch)
+        else:
+            self._finish_retry(delivery, batch, record.status)
+
+    def _finish_retry(
+        self,
+        delivery: _PendingDelivery,
+        batch: _RetryBatch,
+        status: str,
+    ) -> None:
+        with self._retry_cond:
+            batch.results.append(_final_result(delivery, batch.event_id, status))
+            batch.records.extend(delivery.records)
+            batch.outstanding -= 1
+            done = batch.outstanding == 0
+            self._retry_cond.notify_all()
+        if not done or batch.on_done is None:
+            return
+        try:
+            batch.on_done(batch.results, batch.records)
+        except Exception as exc:
+            logger.warning(
+                "Webhook retry callback failed",
+                extra={"event_id": batch.event_id, "error_message": str(exc)},
+            )
+
+    def _settle(
+        self,
+        delivery: _PendingDelivery,
+        record: WebhookDeliveryRecord,
+        options: DeliveryOptions,
+    ) -> float | None:
+        url = delivery.webhook.url
+        if record.status == "success":
+            self._breaker.record_success(url)
+            return None
+        retryable = _should_retry(record.status_code, options.retry_statuses)
+        now = time.monotonic()
+        if not retryable:
+            # The endpoint answered; a 4xx is the subscriber's problem, not an
+            # outage.
+            self._breaker.record_success(url)
+            return None
+        self._breaker.record_failure(url, now, options.breaker_failures)
+        if delivery.attempts >= max(1, options.max_attempts):
+            return None
+        return now + self._backoff(delivery.attempts, options)
+
+    def _breaker_retry_at(
+        self,
+        delivery: _PendingDelivery,
+        now: float,
+        options: DeliveryOptions,
+    ) -> float:
+        probe_at = self._breaker.probe_at(
+            delivery.webhook.url, options.breaker_cooldown_s
         )
-        return result, []
+        if probe_at is None or probe_at <= now:
+            # A half-open probe is in flight; it settles within one timeout.
+            return now + delivery.timeout_s
+        return probe_at
+
+    def _backoff(self, attempts: int, options: DeliveryOptions) -> float:
+        if options.backoff_s <= 0:
+            return 0.0
+        delay = options.backoff_s * (2 ** (attempts - 1))
+        jitter = min(max(options.jitter, 0.0), 1.0)
+        return delay * self._rng.uniform(1.0 - jitter, 1.0 + jitter)
+
+    def _attempt(
+        self,
+        delivery: _PendingDelivery,
+        event_id: str,
+    ) -> WebhookDeliveryRecord:
+        attempt_start = time.monotonic()
+        status_code: int | None = None
+        error: str | None = None
+        try:
+            status_code = self._post(delivery)
+        except (OSError, http.client.HTTPException, ValueError) as exc:
+            error = str(exc) or exc.__class__.__name__
+        status = (
+            "success"
+            if status_code is not None and 200 <= status_code < 300
+            else "failed"
+        )
+        if status == "failed" and error is None and status_code is not None:
+            error = f"HTTP {status_code}"
+        return _attempt_record(
+            delivery,
+            event_id,
+            status=status,
+            status_code=status_code,
+            error=error,
+            duration_ms=int((time.monotonic() - attempt_start) * 1000),
+        )
+
+    def _post(self, delivery: _PendingDelivery) -> int:
+        parts = urlsplit(delivery.webhook.url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported webhook URL: {delivery.webhook.url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        while True:
+            conn, reused = self._pool.acquire(key, delivery.timeout_s)
+            try:
+                conn.request("POST", path, body=delivery.body, headers=delivery.headers)
+                response = conn.getresponse()
+                response.read()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                conn.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; retry
+                    # once on a fresh one without spending an attempt.
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._pool.release(key, conn)
+            return int(response.status)
+
 
+_ENGINE: WebhookDeliveryEngine | None = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_delivery_engine() -> WebhookDeliveryEngine:
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = WebhookDeliveryEngine()
+        return _ENGINE
+
+
+def _prepare_request(
+    webhook: WebhookRegistration,
+    event: WebhookEvent,
+) -> tuple[bytes, dict[str, str]]:
     body = json.dumps(event_to_dict(event), ensure_ascii=True).encode("utf-8")
     timestamp = datetime.now(timezone.utc).isoformat()
     headers = {
@@ -62,104 +710,45 @@ def deliver_webhook(
         headers["X-Retikon-Signature"] = sign_payload(webhook.secret, timestamp, body)
     if webhook.headers:
         headers.update(webhook.headers)
+    return body, headers
 
-    delivery_id = str(uuid.uuid4())
-    attempts = 0
-    started = time.monotonic()
-    records: list[WebhookDeliveryRecord] = []
-    last_error: str | None = None
-    last_status: int | None = None
 
-    while attempts < max(1, options.max_attempts):
-        attempts += 1
-        attempt_start = time.monotonic()
-        status: str
-        status_code: int | None = None
-        error: str | None = None
-        try:
-            request = Request(webhook.url, data=body, headers=headers, method="POST")
-            with urlopen(request, timeout=options.timeout_s) as response:
-                raw_status = getattr(response, "status", None)
-                if raw_status is None:
-                    raw_status = response.getcode()
-                if raw_status is None:
-                    status_code = None
-                    status = "failed"
-                else:
-                    status_code = int(raw_status)
-                    status = "success" if 200 <= status_code < 300 else "failed"
-        except HTTPError as exc:
-            status_code = exc.code
-            status = "failed"
-            error = exc.reason if isinstance(exc.reason, str) else str(exc)
-        except URLError as exc:
-            status = "failed"
-            error = str(exc)
-        except Exception as exc:  # pragma: no cover - defensive
-            status = "failed"
-            error = str(exc)
-
-        duration_ms = int((time.monotonic() - attempt_start) * 1000)
-        records.append(
-            WebhookDeliveryRecord(
-                delivery_id=delivery_id,
-                event_id=event.id,
-                webhook_id=webhook.id,
-                attempt=attempts,
-                status=status,
-                status_code=status_code,
-                error=error,
-                duration_ms=duration_ms,
-                delivered_at=datetime.now(timezone.utc).isoformat(),
-            )
-        )
-
-        last_error = error
-        last_status = status_code
-
-        if status == "success":
-            total_ms = int((time.monotonic() - started) * 1000)
-            result = DeliveryResult(
-                webhook_id=webhook.id,
-                event_id=event.id,
-                status="success",
-                status_code=status_code,
-                attempts=attempts,
-                duration_ms=total_ms,
-            )
-            return result, records
-
-        if not _should_retry(status_code, options.retry_statuses):
-            break
-
-        if attempts < options.max_attempts and options.backoff_s > 0:
-            time.sleep(options.backoff_s * (2 ** (attempts - 1)))
-
-    total_ms = int((time.monotonic() - started) * 1000)
-    result = DeliveryResult(
-        webhook_id=webhook.id,
-        event_id=event.id,
-        status="failed",
-        status_code=last_status,
-        attempts=attempts,
-        duration_ms=total_ms,
-        error=last_error,
+def _attempt_record(
+    delivery: _PendingDelivery,
+    event_id: str,
+    *,
+    status: str,
+    status_code: int | None,
+    error: str | None,
+    duration_ms: int,
+) -> WebhookDeliveryRecord:
+    return WebhookDeliveryRecord(
+        delivery_id=delivery.delivery_id,
+        event_id=event_id,
+        webhook_id=delivery.webhook.id,
+        attempt=delivery.attempts,
+        status=status,
+        status_code=status_code,
+        error=error,
+        duration_ms=duration_ms,
+        delivered_at=datetime.now(timezone.utc).isoformat(),
     )
-    return result, records
 
 
-def deliver_webhooks(
-    webhooks: Iterable[WebhookRegistration],
-    event: WebhookEvent,
-    options: DeliveryOptions,
-) -> tuple[list[DeliveryResult], list[WebhookDeliveryRecord]]:
-    results: list[DeliveryResult] = []
-    records: list[WebhookDeliveryRecord] = []
-    for webhook in webhooks:
-        result, attempts = deliver_webhook(webhook, event, options)
-        results.append(result)
-        records.extend(attempts)
-    return results, records
+def _final_result(
+    delivery: _PendingDelivery,
+    event_id: str,
+    status: str,
+) -> DeliveryResult:
+    return DeliveryResult(
+        webhook_id=delivery.webhook.id,
+        event_id=event_id,
+        status=status,
+        status_code=delivery.last_status,
+        attempts=delivery.attempts,
+        duration_ms=int((time.monotonic() - delivery.started) * 1000),
+        error=None if status == "success" else delivery.last_error,
+    )
 
 
 def _should_retry(status_code: int | None, retry_statuses: tuple[int, ...]) -> bool:
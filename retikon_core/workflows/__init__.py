@@ -1,3 +1,4 @@
+from retikon_core.workflows.dag import step_dependencies, topological_order
 from retikon_core.workflows.store import (
     list_workflow_runs,
     load_workflow_runs,
@@ -24,6 +25,8 @@ __all__ = [
     "register_workflow_run",
     "save_workflow_runs",
     "save_workflows",
+    "step_dependencies",
+    "topological_order",
     "update_workflow",
     "update_workflow_run",
     "workflow_registry_uri",
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from retikon_core.workflows.types import WorkflowStep
+
+
+def step_dependencies(steps: Iterable[WorkflowStep]) -> dict[str, tuple[str, ...]]:
+    """Resolve each step's prerequisites, validating the resulting graph.
+
+    Workflows where no step declares ``depends_on`` keep their original
+    sequential meaning: every step waits on the one before it. Once any step
+    declares dependencies, steps without them are roots and may run as soon as
+    the run starts. Raises ``ValueError`` for duplicate ids, unknown or self
+    references, and cycles.
+    """
+    ordered = list(steps)
+    ids = [step.id for step in ordered]
+    seen: set[str] = set()
+    for step_id in ids:
+        if step_id in seen:
+            raise ValueError(f"Duplicate workflow step id: {step_id}")
+        seen.add(step_id)
+
+    if not any(step.depends_on for step in ordered):
+        return {
+            step_id: (ids[idx - 1],) if idx else () for idx, step_id in enumerate(ids)
+        }
+
+    deps: dict[str, tuple[str, ...]] = {}
+    for step in ordered:
+        required = tuple(dict.fromkeys(step.depends_on or ()))
+        for dep in required:
+            if dep == step.id:
+                raise ValueError(f"Workflow step {step.id} depends on itself")
+            if dep not in seen:
+                raise ValueError(
+                    f"Workflow step {step.id} depends on unknown step {dep}"
+                )
+        deps[step.id] = required
+    topological_order(deps)
+    return deps
+
+
+def topological_order(deps: dict[str, tuple[str, ...]]) -> list[str]:
+    """Order step ids so each follows its dependencies; ties keep input order."""
+    remaining = {step_id: len(required) for step_id, required in deps.items()}
+    dependents: dict[str, list[str]] = {step_id: [] for step_id in deps}
+    for step_id, required in deps.items():
+        for dep in required:
+            dependents[dep].append(step_id)
+    order: list[str] = []
+    ready = [step_id for step_id, count in remaining.items() if count == 0]
+    while ready:
+        step_id = ready.pop(0)
+        order.append(step_id)
+        for child in dependents[step_id]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+    if len(order) != len(deps):
+        stuck = sorted(step_id for step_id in deps if step_id not in set(order))
+        raise ValueError(f"Workflow steps form a cycle: {', '.join(stuck)}")
+    return order
@@ -259,6 +259,7 @@ def _step_from_dict(payload: dict[str, object]) -> WorkflowStep:
         config=_coerce_dict(payload.get("config")),
         retries=_coerce_int(payload.get("retries")),
         timeout_seconds=_coerce_int(payload.get("timeout_seconds")),
+        depends_on=_coerce_str_tuple(payload.get("depends_on")),
     )
 
 
@@ -269,6 +270,12 @@ def _coerce_optional_str(value: object) -> str | None:
     return text or None
 
 
+def _coerce_str_tuple(value: object) -> tuple[str, ...] | None:
+    if not isinstance(value, (list, tuple)):
+        return None
+    return tuple(str(item) for item in value if str(item).strip())
+
+
 def _coerce_dict(value: object) -> dict[str, object] | None:
     if isinstance(value, dict):
         return value
@@ -11,6 +11,7 @@ class WorkflowStep:
     config: dict[str, object] | None
     retries: int | None
     timeout_seconds: int | None
+    depends_on: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any
+
+from retikon_core.alerts import AlertRule, compile_rules, rule_matches
+from retikon_core.webhooks.types import WebhookEvent
+
+_MODALITIES = ("document", "image", "audio", "video", "transcript")
+_TAGS = tuple(f"tag-{idx}" for idx in range(50))
+
+
+def _synthetic_rules(
+    rng: random.Random,
+    *,
+    count: int,
+    event_types: list[str],
+    tenants: int,
+) -> list[AlertRule]:
+    rules: list[AlertRule] = []
+    for idx in range(count):
+        rules.append(
+            AlertRule(
+                id=f"rule-{idx}",
+                name=f"Rule {idx}",
+                event_types=(
+                    ("*",) if rng.random() < 0.02 else (rng.choice(event_types),)
+                ),
+                modalities=(
+                    None if rng.random() < 0.3 else (rng.choice(_MODALITIES),)
+                ),
+                min_confidence=(
+                    None if rng.random() < 0.5 else round(rng.uniform(0.5, 0.99), 2)
+                ),
+                tags=None if rng.random() < 0.7 else tuple(rng.sample(_TAGS, 2)),
+                destinations=(),
+                enabled=True,
+                created_at="now",
+                updated_at="now",
+                org_id=f"org-{rng.randrange(tenants)}",
+            )
+        )
+    return rules
+
+
+def _synthetic_events(
+    rng: random.Random,
+    *,
+    count: int,
+    event_types: list[str],
+) -> list[WebhookEvent]:
+    return [
+        WebhookEvent(
+            id=f"evt-{idx}",
+            event_type=rng.choice(event_types),
+            created_at="2026-01-27T00:00:00Z",
+            payload={},
+            modality=rng.choice(_MODALITIES),
+            confidence=rng.random(),
+            tags=tuple(rng.sample(_TAGS, 3)),
+        )
+        for idx in range(count)
+    ]
+
+
+def run_benchmark(
+    *,
+    rules: int,
+    events: int,
+    event_types: int,
+    tenants: int,
+    seed: int,
+) -> dict[str, Any]:
+    rng = random.Random(seed)
+    types = [f"event.type{idx}" for idx in range(event_types)]
+    rule_list = _synthetic_rules(rng, count=rules, event_types=types, tenants=tenants)
+    event_list = _synthetic_events(rng, count=events, event_types=types)
+
+    start = time.perf_counter()
+    linear = [
+        [rule.id for rule in rule_list if rule_matches(rule, event)]
+        for event in event_list
+    ]
+    linear_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = compile_rules(rule_list)
+    compile_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [
+        [match.rule_id for match in index.evaluate(event)] for event in event_list
+    ]
+    indexed_s = time.perf_counter() - start
+
+    if indexed != linear:
+        raise SystemExit("Indexed evaluation diverged from the linear scan")
+    matches = sum(len(item) for item in linear)
+    return {
+        "rules": rules,
+        "events": events,
+        "event_types": event_types,
+        "tenants": tenants,
+        "matches": matches,
+        "compile_ms": round(compile_s * 1000.0, 2),
+        "linear_us_per_event": round(linear_s * 1e6 / max(1, events), 2),
+        "indexed_us_per_event": round(indexed_s * 1e6 / max(1, events), 2),
+        "speedup": round(linear_s / indexed_s, 2) if indexed_s > 0 else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark indexed alert rule evaluation against a linear scan."
+    )
+    parser.add_argument("--rules", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--event-types", type=int, default=40)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    results = [
+        run_benchmark(
+            rules=count,
+            events=args.events,
+            event_types=args.event_types,
+            tenants=args.tenants,
+            seed=args.seed,
+        )
+        for count in args.rules
+    ]
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import numpy as np
+
+from retikon_core.query_engine.index_builder import build_snapshot
+from retikon_core.query_engine.warm_start import load_extensions
+from retikon_core.storage.manifest import build_manifest, write_manifest
+from retikon_core.storage.paths import GraphPaths, edge_part_uri, manifest_uri
+from retikon_core.storage.schemas import schema_for
+from retikon_core.storage.writer import write_parquet
+
+DIM = 768
+_CHUNKS_PER_ASSET = 50
+_INDEX_NAME = "doc_chunks_text_vector"
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return (matrix / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+def _clustered_vectors(
+    rng: np.random.Generator, *, count: int, clusters: int, spread: float
+) -> np.ndarray:
+    centers = rng.standard_normal((clusters, DIM))
+    labels = rng.integers(0, clusters, size=count)
+    return _normalize(centers[labels] + spread * rng.standard_normal((count, DIM)))
+
+
+def write_synthetic_corpus(
+    graph_uri: str,
+    *,
+    docs: int,
+    clusters: int,
+    spread: float,
+    seed: int,
+) -> int:
+    """Write one GraphAr run of DocChunk rows with clustered unit vectors."""
+    rng = np.random.default_rng(seed)
+    vectors = _clustered_vectors(rng, count=docs, clusters=clusters, spread=spread)
+    paths = GraphPaths(base_uri=graph_uri)
+    now = datetime.now(timezone.utc)
+    media_rows: list[dict[str, Any]] = []
+    core_rows: list[dict[str, Any]] = []
+    text_rows: list[dict[str, Any]] = []
+    edges: list[dict[str, Any]] = []
+    media_id = ""
+    for idx in range(docs):
+        if idx % _CHUNKS_PER_ASSET == 0:
+            media_id = str(uuid.uuid4())
+            media_rows.append(
+                {
+                    "id": media_id,
+                    "uri": f"gs://bench/raw/docs/doc-{idx // _CHUNKS_PER_ASSET}.txt",
+                    "media_type": "document",
+                    "content_type": "text/plain",
+                    "size_bytes": 0,
+                    "source_bucket": "bench",
+                    "source_object": f"raw/docs/doc-{idx // _CHUNKS_PER_ASSET}.txt",
+                    "source_generation": "1",
+                    "checksum": None,
+                    "duration_ms": None,
+                    "width_px": None,
+                    "height_px": None,
+                    "frame_count": None,
+                    "sample_rate_hz": None,
+                    "channels": None,
+                    "created_at": now,
+                    "pipeline_version": "bench",
+                    "schema_version": "1",
+                }
+            )
+        chunk_id = f"chunk-{idx:08d}"
+        core_rows.append(
+            {
+                "id": chunk_id,
+                "media_asset_id": media_id,
+                "chunk_index": idx % _CHUNKS_PER_ASSET,
+                "char_start": 0,
+                "char_end": 0,
+                "token_start": 0,
+                "token_end": 0,
+                "token_count": 0,
+                "embedding_model": "bench",
+                "pipeline_version": "bench",
+                "schema_version": "1",
+            }
+        )
+        text_rows.append({"content": f"synthetic chunk {idx}"})
+        edges.append({"src_id": chunk_id, "dst_id": media_id, "schema_version": "1"})
+
+    run_id = str(uuid.uuid4())
+    files = [
+        write_parquet(
+            media_rows,
+            schema_for("MediaAsset", "core"),
+            paths.vertex("MediaAsset", "core", run_id),
+        ),
+        write_parquet(
+            core_rows,
+            schema_for("DocChunk", "core"),
+            paths.vertex("DocChunk", "core", run_id),
+        ),
+        write_parquet(
+            text_rows,
+            schema_for("DocChunk", "text"),
+            paths.vertex("DocChunk", "text", run_id),
+        ),
+        write_parquet(
+            [{"text_vector": row} for row in vectors.tolist()],
+            schema_for("DocChunk", "vector"),
+            paths.vertex("DocChunk", "vector", run_id),
+        ),
+        write_parquet(
+            edges,
+            schema_for("DerivedFrom", "adj_list"),
+            edge_part_uri(graph_uri, "DerivedFrom", run_id),
+        ),
+    ]
+    manifest = build_manifest(
+        pipeline_version="bench",
+        schema_version="1",
+        counts={"MediaAsset": len(media_rows), "DocChunk": docs, "DerivedFrom": docs},
+        files=files,
+        started_at=now,
+        completed_at=datetime.now(timezone.utc),
+    )
+    write_manifest(manifest, manifest_uri(graph_uri, run_id))
+    return docs
+
+
+def _sample_queries(
+    conn: duckdb.DuckDBPyConnection, *, count: int, noise: float, seed: int
+) -> list[list[float]]:
+    # Perturbed corpus vectors keep queries on the data manifold without
+    # letting them hit their source row exactly.
+    rows = conn.execute(
+        "SELECT text_vector FROM doc_chunks WHERE text_vector IS NOT NULL "
+        "ORDER BY hash(id) LIMIT ?",
+        [count],
+    ).fetchall()
+    rng = np.random.default_rng(seed)
+    base = np.asarray([row[0] for row in rows], dtype=np.float32)
+    return _normalize(base + noise * rng.standard_normal(base.shape)).tolist()
+
+
+def _exact_neighbors(
+    conn: duckdb.DuckDBPyConnection, queries: list[list[float]], k: int
+) -> list[list[str]]:
+    sql = (
+        "SELECT id FROM doc_chunks "
+        "ORDER BY list_cosine_similarity(text_vector::FLOAT[], ?::FLOAT[]) DESC, id "
+        f"LIMIT {int(k)}"
+    )
+    return [
+        [row[0] for row in conn.execute(sql, [query]).fetchall()] for query in queries
+    ]
+
+
+def _ann_sql(k: int) -> str:
+    # Unit vectors rank identically under L2 and cosine, and L2 matches the
+    # index metric, so this ORDER BY is answered by the HNSW index.
+    return (
+        "SELECT id FROM doc_chunks "
+        f"ORDER BY array_distance(text_vector, ?::FLOAT[{DIM}]) LIMIT {int(k)}"
+    )
+
+
+def _uses_index(conn: duckdb.DuckDBPyConnection, sql: str, query: list[float]) -> bool:
+    plan = conn.execute(f"EXPLAIN {sql}", [query]).fetchall()
+    return any("HNSW_INDEX_SCAN" in str(row[-1]) for row in plan)
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    return round(float(np.percentile(np.asarray(values), pct)), 3)
+
+
+def _measure(
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    queries: list[list[float]],
+    truth: list[list[str]],
+    k: int,
+    ef_search: int,
+    warmup: int,
+) -> dict[str, Any]:
+    conn.execute(f"SET hnsw_ef_search={int(ef_search)}")
+    sql = _ann_sql(k)
+    for query in queries[:warmup]:
+        conn.execute(sql, [query]).fetchall()
+    latencies: list[float] = []
+    hits = 0
+    for query, expected in zip(queries, truth, strict=True):
+        start = time.perf_counter()
+        found = [row[0] for row in conn.execute(sql, [query]).fetchall()]
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        hits += len(set(found) & set(expected))
+    return {
+        "ef_search": ef_search,
+        "recall_at_k": round(hits / max(1, len(queries) * k), 4),
+        "latency_ms_p50": _percentile(latencies, 50),
+        "latency_ms_p95": _percentile(latencies, 95),
+        "latency_ms_p99": _percentile(latencies, 99),
+        "latency_ms_mean": round(float(np.mean(latencies)), 3) if latencies else None,
+        "index_scan": _uses_index(conn, sql, queries[0]) if queries else False,
+    }
+
+
+def run_benchmark(
+    *,
+    graph_uri: str,
+    work_dir: str,
+    ef_construction: list[int],
+    m_values: list[int],
+    ef_search: list[int],
+    queries: int,
+    k: int,
+    query_noise: float,
+    warmup: int,
+    seed: int,
+    allow_install: bool,
+) -> dict[str, Any]:
+    """Build one snapshot per (ef_construction, M) and sweep ef_search on each.
+
+    Ground truth is an exact ``list_cosine_similarity`` scan of the first
+    snapshot; every snapshot holds the same rows, so it is computed once.
+    """
+    runs: list[dict[str, Any]] = []
+    query_vectors: list[list[float]] = []
+    truth: list[list[str]] = []
+    exact: dict[str, Any] = {}
+    for efc, m in itertools.product(ef_construction, m_values):
+        snapshot_uri = str(Path(work_dir) / f"efc{efc}-m{m}" / "retikon.duckdb")
+        report = build_snapshot(
+            graph_uri=graph_uri,
+            snapshot_uri=snapshot_uri,
+            work_dir=str(Path(work_dir) / "build"),
+            copy_local=False,
+            fallback_local=False,
+            allow_install=allow_install,
+            hnsw_ef_construction=efc,
+            hnsw_m=m,
+        )
+        index = report.indexes.get(_INDEX_NAME, {})
+        conn = duckdb.connect(snapshot_uri, read_only=True)
+        try:
+            load_extensions(conn, ("vss",), allow_install)
+            if not query_vectors:
+                query_vectors = _sample_queries(
+                    conn, count=queries, noise=query_noise, seed=seed
+                )
+                start = time.perf_counter()
+                truth = _exact_neighbors(conn, query_vectors, k)
+                exact_ms = (time.perf_counter() - start) * 1000.0
+                count_row = conn.execute("SELECT COUNT(*) FROM doc_chunks").fetchone()
+                exact = {
+                    "rows": int(count_row[0]) if count_row else 0,
+                    "queries": len(query_vectors),
+                    "latency_ms_mean": round(exact_ms / max(1, len(truth)), 3),
+                }
+            searches = [
+                _measure(
+                    conn,
+                    queries=query_vectors,
+                    truth=truth,
+                    k=k,
+                    ef_search=value,
+                    warmup=warmup,
+                )
+                for value in ef_search
+            ]
+        finally:
+            conn.close()
+        runs.append(
+            {
+                "ef_construction": efc,
+                "m": m,
+                "build_seconds": report.duration_seconds,
+                "hnsw_build_seconds": index.get("build_seconds"),
+                "index_size_bytes": index.get("size_bytes"),
+                "snapshot_size_bytes": Path(snapshot_uri).stat().st_size,
+                "searches": searches,
+            }
+        )
+    return {"k": k, "dim": DIM, "exact": exact, "runs": runs}
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Sweep HNSW ef_construction/M/ef_search on a local snapshot and report "
+            "recall@k against exact cosine search."
+        )
+    )
+    parser.add_argument(
+        "--graph-uri",
+        default=None,
+        help="Existing GraphAr root to index; a synthetic corpus is generated if unset",
+    )
+    parser.add_argument("--work-dir", default=None)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--clusters", type=int, default=64)
+    parser.add_argument("--spread", type=float, default=0.35)
+    parser.add_argument("--ef-construction", type=_int_list, default=[100, 200])
+    parser.add_argument("--m", type=_int_list, default=[8, 16])
+    parser.add_argument("--ef-search", type=_int_list, default=[32, 64, 128])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--query-noise", type=float, default=0.05)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--allow-install", action="store_true")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="retikon-hnsw-bench-")
+    cleanup = args.work_dir is None
+    try:
+        graph_uri = args.graph_uri
+        corpus: dict[str, Any] = {"graph_uri": graph_uri, "synthetic": False}
+        if graph_uri is None:
+            graph_uri = str(Path(work_dir) / "graph")
+            Path(graph_uri).mkdir(parents=True, exist_ok=True)
+            write_synthetic_corpus(
+                graph_uri,
+                docs=args.docs,
+                clusters=args.clusters,
+                spread=args.spread,
+                seed=args.seed,
+            )
+            corpus = {
+                "synthetic": True,
+                "docs": args.docs,
+                "clusters": args.clusters,
+                "spread": args.spread,
+                "seed": args.seed,
+            }
+        results = run_benchmark(
+            graph_uri=graph_uri,
+            work_dir=work_dir,
+            ef_construction=args.ef_construction,
+            m_values=args.m,
+            ef_search=args.ef_search,
+            queries=args.queries,
+            k=args.k,
+            query_noise=args.query_noise,
+            warmup=args.warmup,
+            seed=args.seed,
+            allow_install=args.allow_install,
+        )
+        results["corpus"] = corpus
+        results["duckdb_version"] = duckdb.__version__
+    finally:
+        if cleanup:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
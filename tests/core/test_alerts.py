@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from retikon_core.alerts import evaluate_rules, rule_matches
+import random
+
+from retikon_core.alerts import (
+    alert_registry_version,
+    compile_rules,
+    evaluate_rules,
+    rule_matches,
+    save_alerts,
+)
 from retikon_core.alerts.types import AlertDestination, AlertRule
 from retikon_core.webhooks.types import WebhookEvent
 
@@ -65,3 +73,69 @@ def test_evaluate_rules_returns_matches():
     assert len(matches) == 1
     assert matches[0].rule_id == rule.id
     assert matches[0].destinations[0].target == "wh-2"
+
+
+def test_rule_index_matches_linear_scan():
+    rng = random.Random(7)
+    event_types = ("asset.detected", "asset.ready", "alert.triggered")
+    modalities = ("image", "video", "audio")
+    tags = ("person", "vehicle", "animal")
+    rules = [
+        AlertRule(
+            id=f"rule-{idx}",
+            name="Rule",
+            event_types=rng.choice([None, ("*",), (rng.choice(event_types),)]),
+            modalities=rng.choice([None, (rng.choice(modalities),)]),
+            min_confidence=rng.choice([None, round(rng.random(), 2)]),
+            tags=rng.choice([None, (rng.choice(tags),)]),
+            destinations=(),
+            enabled=idx % 11 != 0,
+            created_at="now",
+            updated_at="now",
+            org_id=rng.choice([None, "org-a", "org-b"]),
+        )
+        for idx in range(300)
+    ]
+    index = compile_rules(rules)
+    for idx in range(50):
+        event = WebhookEvent(
+            id=f"evt-{idx}",
+            event_type=rng.choice(event_types),
+            created_at="2026-01-27T00:00:00Z",
+            payload={},
+            modality=rng.choice([None, *modalities]),
+            confidence=rng.choice([None, rng.random()]),
+            tags=rng.choice([None, (rng.choice(tags),)]),
+        )
+        expected = [rule.id for rule in rules if rule_matches(rule, event)]
+        assert [match.rule_id for match in index.evaluate(event)] == expected
+        scoped = [
+            rule.id
+            for rule in rules
+            if rule.org_id in {None, "org-a"} and rule_matches(rule, event)
+        ]
+        assert [
+            match.rule_id for match in index.evaluate(event, org_id="org-a")
+        ] == scoped
+
+    index.remove("rule-1")
+    event = WebhookEvent(
+        id="evt-x",
+        event_type="asset.ready",
+        created_at="2026-01-27T00:00:00Z",
+        payload={},
+    )
+    assert "rule-1" not in {match.rule_id for match in index.evaluate(event)}
+
+
+def test_alert_registry_version_tracks_writes(tmp_path):
+    base_uri = tmp_path.as_posix()
+    assert alert_registry_version(base_uri) == ""
+
+    save_alerts(base_uri, [_rule(event_types=("asset.detected",))])
+    first = alert_registry_version(base_uri)
+    assert first
+    assert alert_registry_version(base_uri) == first
+
+    save_alerts(base_uri, [_rule(), _rule(modalities=("image",))])
+    assert alert_registry_version(base_uri) != first
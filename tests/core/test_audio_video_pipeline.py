@@ -1168,26 +1168,24 @@ def test_video_pipeline_writes_keyframe_ocr_docchunks(tmp_path, monkeypatch):
     )
     monkeypatch.setattr(video_pipeline, "cleanup_tmp", lambda _path: None)
 
-    call_index = {"value": 0}
-
-    def fake_ocr(_image, **_kwargs):
-        if call_index["value"] == 0:
-            call_index["value"] += 1
-            return OcrImageResult(
+    def fake_ocr(frame_paths, **_kwargs):
+        assert frame_paths == [str(frame_fixture), str(frame_fixture)]
+        return [
+            OcrImageResult(
                 text="BAY-12",
                 conf_avg=88,
                 kept_tokens=1,
                 raw_tokens=1,
-            )
-        call_index["value"] += 1
-        return OcrImageResult(
-            text="",
-            conf_avg=None,
-            kept_tokens=0,
-            raw_tokens=0,
-        )
+            ),
+            OcrImageResult(
+                text="",
+                conf_avg=None,
+                kept_tokens=0,
+                raw_tokens=0,
+            ),
+        ]
 
-    monkeypatch.setattr(video_pipeline, "ocr_result_from_image", fake_ocr)
+    monkeypatch.setattr(video_pipeline, "ocr_results_from_keyframes", fake_ocr)
 
     source = IngestSource(
         bucket="test-raw",
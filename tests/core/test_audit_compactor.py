@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from retikon_core.audit import (
@@ -9,6 +12,20 @@ from retikon_core.audit import (
     compact_audit_logs,
     record_audit_log,
 )
+from retikon_core.audit.layout import list_audit_files
+from retikon_core.storage.schemas import schema_for
+
+
+def _audit_row(action: str, org_id: str, created_at: datetime) -> dict[str, object]:
+    return {
+        "id": str(uuid.uuid4()),
+        "org_id": org_id,
+        "action": action,
+        "decision": "allow",
+        "created_at": created_at,
+        "pipeline_version": "v1",
+        "schema_version": "1",
+    }
 
 
 def test_audit_compaction_merges_files(tmp_path, monkeypatch):
@@ -25,7 +42,7 @@ def test_audit_compaction_merges_files(tmp_path, monkeypatch):
         )
 
     audit_dir = Path(base_uri) / "vertices" / "AuditLog" / "core"
-    before = list(audit_dir.glob("*.parquet"))
+    before = list(audit_dir.rglob("*.parquet"))
     assert len(before) == 3
 
     policy = AuditCompactionPolicy(
@@ -43,7 +60,7 @@ def test_audit_compaction_merges_files(tmp_path, monkeypatch):
         strict=True,
     )
 
-    after = list(audit_dir.glob("*.parquet"))
+    after = list(audit_dir.rglob("*.parquet"))
     assert report.outputs == 1
     assert len(after) == 1
 
@@ -52,3 +69,37 @@ def test_audit_compaction_merges_files(tmp_path, monkeypatch):
 
     assert report.audit_uri is not None
     assert Path(report.audit_uri).exists()
+
+
+def test_audit_compaction_partitions_legacy_files(tmp_path):
+    base_uri = tmp_path.as_posix()
+    schema = schema_for("AuditLog", "core")
+    audit_dir = Path(base_uri) / "vertices" / "AuditLog" / "core"
+    audit_dir.mkdir(parents=True)
+    rows = [
+        _audit_row("a", "org-1", datetime(2026, 1, 1, 8, tzinfo=timezone.utc)),
+        _audit_row("b", "org-2", datetime(2026, 1, 1, 9, tzinfo=timezone.utc)),
+        _audit_row("c", "org-1", datetime(2026, 1, 2, 9, tzinfo=timezone.utc)),
+    ]
+    for idx in range(2):
+        pq.write_table(
+            pa.Table.from_pylist(rows[idx::2], schema=schema),
+            audit_dir / f"part-legacy-{idx}.parquet",
+        )
+
+    report = compact_audit_logs(
+        base_uri=base_uri,
+        policy=AuditCompactionPolicy(min_age_seconds=0),
+        delete_source=True,
+        dry_run=False,
+        strict=True,
+    )
+
+    assert report.outputs == 3
+    assert list(audit_dir.glob("*.parquet")) == []
+    files = list_audit_files(base_uri)
+    assert sorted((item.day.isoformat(), item.tenant) for item in files) == [
+        ("2026-01-01", "org-1"),
+        ("2026-01-01", "org-2"),
+        ("2026-01-02", "org-1"),
+    ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pyarrow.parquet as pq
@@ -10,6 +11,7 @@ from retikon_core.audit import (
     record_audit_log,
     write_compaction_audit_log,
 )
+from retikon_core.audit.layout import list_audit_files
 from retikon_core.auth.types import AuthContext
 from retikon_core.tenancy.types import TenantScope
 
@@ -64,3 +66,37 @@ def test_audit_log_write(tmp_path):
     assert data["decision"][0] == "allow"
     assert data["api_key_id"][0] == "key-1"
     assert data["org_id"][0] == "org-1"
+
+
+def test_audit_files_pruned_by_tenant_and_time(tmp_path):
+    base_uri = tmp_path.as_posix()
+    stamps = [
+        ("org-1", datetime(2026, 1, 1, 8, tzinfo=timezone.utc)),
+        ("org-1", datetime(2026, 1, 3, 8, tzinfo=timezone.utc)),
+        ("org-2", datetime(2026, 1, 3, 9, tzinfo=timezone.utc)),
+        ("org-1", datetime(2026, 1, 3, 23, tzinfo=timezone.utc)),
+    ]
+    for org_id, created_at in stamps:
+        result = record_audit_log(
+            base_uri=base_uri,
+            action="query:read",
+            decision="allow",
+            scope=TenantScope(org_id=org_id),
+            pipeline_version="v1",
+            schema_version="1",
+            created_at=created_at,
+        )
+        assert f"/date={created_at.date().isoformat()}/tenant={org_id}/" in (
+            result.uri
+        )
+
+    assert len(list_audit_files(base_uri)) == 4
+    files = list_audit_files(
+        base_uri,
+        org_id="org-1",
+        since=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        until=datetime(2026, 1, 3, 12, tzinfo=timezone.utc),
+    )
+    assert len(files) == 1
+    table = pq.read_table(files[0].uri)
+    assert table.column("created_at").to_pylist()[0].hour == 8
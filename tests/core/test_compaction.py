@@ -10,6 +10,12 @@ import pyarrow.parquet as pq
 from retikon_core.compaction import CompactionPolicy, run_compaction
 from retikon_core.retention import RetentionPolicy
 from retikon_core.storage import build_manifest, manifest_uri, write_manifest
+from retikon_core.storage.manifest_catalog import (
+    COMPACTION_WATERMARK,
+    list_uncompacted_manifests,
+    read_watermark,
+    watermark_uri,
+)
 from retikon_core.storage.paths import GraphPaths
 from retikon_core.storage.schemas import schema_for
 from retikon_core.storage.writer import write_parquet
@@ -40,7 +46,15 @@ def _doc_rows(start: int, count: int) -> tuple[list[dict], list[dict], list[dict
     return core_rows, text_rows, vector_rows
 
 
-def _write_doc_run(base_uri: str, run_id: str, start: int, count: int) -> None:
+def _write_doc_run(
+    base_uri: str,
+    run_id: str,
+    start: int,
+    count: int,
+    *,
+    completed_at: datetime | None = None,
+    kinds: tuple[str, ...] = ("core", "text", "vector"),
+) -> None:
     paths = GraphPaths(base_uri=base_uri)
     core_rows, text_rows, vector_rows = _doc_rows(start, count)
 
@@ -60,13 +74,14 @@ def _write_doc_run(base_uri: str, run_id: str, start: int, count: int) -> None:
         paths.vertex("DocChunk", "vector", str(uuid.uuid4())),
     )
 
-    started = datetime.now(timezone.utc)
-    completed = datetime.now(timezone.utc)
+    completed = completed_at or datetime.now(timezone.utc)
+    started = completed
+    results = {"core": core_result, "text": text_result, "vector": vector_result}
     manifest = build_manifest(
         pipeline_version="test",
         schema_version="1",
         counts={"DocChunk": len(core_rows)},
-        files=[core_result, text_result, vector_result],
+        files=[results[kind] for kind in kinds],
         started_at=started,
         completed_at=completed,
     )
@@ -112,6 +127,97 @@ def test_compaction_merges_docchunk_runs(tmp_path):
     assert audit_path.exists()
 
 
+def test_compaction_resumes_from_watermark(tmp_path):
+    base_uri = tmp_path.as_posix()
+    _write_doc_run(base_uri, "run-1", start=0, count=2)
+    _write_doc_run(base_uri, "run-2", start=2, count=2)
+    policy = CompactionPolicy(
+        target_min_bytes=10_000_000,
+        target_max_bytes=20_000_000,
+        max_groups_per_batch=10,
+    )
+
+    def _compact() -> pq.ParquetFile:
+        report = run_compaction(
+            base_uri=base_uri,
+            policy=policy,
+            retention_policy=RetentionPolicy(),
+            delete_source=False,
+            dry_run=False,
+            strict=True,
+        )
+        core = next(
+            output for output in report.outputs if output.file_kind == "core"
+        )
+        return pq.ParquetFile(core.result.uri)
+
+    assert _compact().metadata.num_rows == 4
+    assert read_watermark(base_uri, "compaction") is not None
+
+    _write_doc_run(base_uri, "run-3", start=4, count=2)
+    # Only the previous compaction output and the new run are merged; the
+    # already-compacted sources are not read again.
+    core_file = _compact()
+    assert core_file.metadata.num_rows == 6
+    assert sorted(core_file.read()["chunk_index"].to_pylist()) == list(range(6))
+
+
+def test_compaction_watermark_follows_catalog_order(tmp_path):
+    base_uri = tmp_path.as_posix()
+    _write_doc_run(base_uri, "run-1", start=0, count=2)
+    _write_doc_run(base_uri, "run-2", start=2, count=2)
+    policy = CompactionPolicy(
+        target_min_bytes=10_000_000,
+        target_max_bytes=20_000_000,
+        max_groups_per_batch=10,
+    )
+
+    def _compact() -> list[int]:
+        report = run_compaction(
+            base_uri=base_uri,
+            policy=policy,
+            retention_policy=RetentionPolicy(),
+            delete_source=False,
+            dry_run=False,
+            strict=True,
+        )
+        core = next(
+            output for output in report.outputs if output.file_kind == "core"
+        )
+        return sorted(pq.read_table(core.result.uri)["chunk_index"].to_pylist())
+
+    assert _compact() == list(range(4))
+
+    # A retried ingest lands after the compaction but carries an older
+    # producer timestamp; a run missing its vectors cannot be compacted.
+    _write_doc_run(base_uri, "run-3", start=4, count=2)
+    _write_doc_run(
+        base_uri,
+        "run-late",
+        start=6,
+        count=2,
+        completed_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+    )
+    _write_doc_run(base_uri, "run-partial", start=8, count=2, kinds=("core", "text"))
+
+    assert _compact() == list(range(8))
+    watermark = read_watermark(base_uri, COMPACTION_WATERMARK)
+    assert watermark is not None
+    assert watermark.pending == ("run-partial",)
+
+    listed = list_uncompacted_manifests(base_uri)
+    assert listed is not None
+    assert sorted(record.run_id for record in listed if not record.is_compaction) == [
+        "run-partial"
+    ]
+    # The compaction manifest embeds its watermark, so losing the hint file
+    # (a crash between the two writes) changes nothing.
+    Path(watermark_uri(base_uri, COMPACTION_WATERMARK)).unlink()
+    assert [record.run_id for record in list_uncompacted_manifests(base_uri)] == [
+        record.run_id for record in listed
+    ]
+
+
 def test_compaction_skips_missing_files(tmp_path, monkeypatch):
     base_uri = tmp_path.as_posix()
     _write_doc_run(base_uri, "run-1", start=0, count=2)
@@ -155,3 +261,96 @@ def test_compaction_skips_missing_files(tmp_path, monkeypatch):
     )
 
     assert report.outputs
+
+
+def test_compaction_clusters_batches_in_parallel(tmp_path):
+    base_uri = tmp_path.as_posix()
+    for idx in range(4):
+        _write_doc_run(base_uri, f"run-{idx}", start=idx * 4, count=4)
+
+    policy = CompactionPolicy(
+        target_min_bytes=10_000_000,
+        target_max_bytes=20_000_000,
+        max_groups_per_batch=2,
+        target_row_group_rows=2,
+        cluster_by=("media_asset_id",),
+        workers=2,
+    )
+    report = run_compaction(
+        base_uri=base_uri,
+        policy=policy,
+        retention_policy=RetentionPolicy(),
+        delete_source=False,
+        dry_run=False,
+        strict=True,
+    )
+
+    assert len(report.batches) == 2
+    for stats in report.batches:
+        assert stats.rows == 8 * 3
+        assert stats.clustered_by == ("media_asset_id",)
+        assert stats.duration_seconds > 0
+
+    outputs = {output.file_kind: output.result.uri for output in report.outputs}
+    core_file = pq.ParquetFile(outputs["core"])
+    assert core_file.metadata.num_row_groups == 4
+    column = core_file.schema_arrow.get_field_index("media_asset_id")
+    bounds = [
+        (
+            core_file.metadata.row_group(idx).column(column).statistics.min,
+            core_file.metadata.row_group(idx).column(column).statistics.max,
+        )
+        for idx in range(core_file.metadata.num_row_groups)
+    ]
+    for (_, prev_max), (next_min, _) in zip(bounds, bounds[1:], strict=False):
+        assert prev_max <= next_min
+
+    # Sibling file kinds keep row alignment with the clustered core file.
+    core_table = core_file.read()
+    text_table = pq.read_table(outputs["text"])
+    assert core_table["media_asset_id"].to_pylist() == sorted(
+        core_table["media_asset_id"].to_pylist()
+    )
+    assert [
+        f"chunk {idx}" for idx in core_table["chunk_index"].to_pylist()
+    ] == text_table["content"].to_pylist()
+
+
+def test_compaction_clusters_within_bounded_windows(tmp_path):
+    base_uri = tmp_path.as_posix()
+    for idx in range(3):
+        _write_doc_run(base_uri, f"run-{idx}", start=idx * 4, count=4)
+
+    policy = CompactionPolicy(
+        target_min_bytes=10_000_000,
+        target_max_bytes=20_000_000,
+        cluster_by=("media_asset_id",),
+        workers=1,
+        max_inflight_bytes=1,
+    )
+    report = run_compaction(
+        base_uri=base_uri,
+        policy=policy,
+        retention_policy=RetentionPolicy(),
+        delete_source=False,
+        dry_run=False,
+        strict=True,
+    )
+
+    assert len(report.batches) == 1
+    assert report.batches[0].clustered_by == ("media_asset_id",)
+    outputs = {output.file_kind: output.result.uri for output in report.outputs}
+    core_table = pq.read_table(outputs["core"])
+    text_table = pq.read_table(outputs["text"])
+    assert core_table.num_rows == 12
+
+    # Each source run is its own window: sorted inside, never merged across.
+    chunk_index = core_table["chunk_index"].to_pylist()
+    asset_ids = core_table["media_asset_id"].to_pylist()
+    for start in range(0, 12, 4):
+        window = chunk_index[start : start + 4]
+        assert len({value // 4 for value in window}) == 1
+        assert asset_ids[start : start + 4] == sorted(asset_ids[start : start + 4])
+    assert [f"chunk {idx}" for idx in chunk_index] == text_table[
+        "content"
+    ].to_pylist()
@@ -4,8 +4,10 @@ from pathlib import Path
 
 import pyarrow.parquet as pq
 
+from retikon_core import config as config_module
 from retikon_core.config import get_config
 from retikon_core.ingestion.pipelines import document as document_pipeline
+from retikon_core.ingestion.pipelines import embedding_cache
 from retikon_core.ingestion.pipelines.metrics import CANONICAL_STAGE_KEYS
 from retikon_core.ingestion.types import IngestSource
 
@@ -95,3 +97,298 @@ def test_document_pipeline_writes_graphar(tmp_path):
         assert text_rows["content"][idx] == extracted_text[char_start:char_end]
     assert result.metrics is not None
     _assert_stage_timings(result.metrics)
+
+
+def test_document_pipeline_reuses_cached_chunk_embeddings(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHUNK_TARGET_TOKENS", "20")
+    monkeypatch.setenv("CHUNK_OVERLAP_TOKENS", "0")
+    monkeypatch.setenv("CHUNK_EMBED_CACHE", "sqlite")
+    monkeypatch.setenv("CHUNK_EMBED_CACHE_PATH", str(tmp_path / "chunks.sqlite"))
+    config_module.get_config.cache_clear()
+    config = get_config()
+    embedded: list[str] = []
+    real_embed = document_pipeline._embed_chunks
+
+    def _spy(chunks, tracker=None):
+        embedded.extend(chunk.text for chunk in chunks)
+        return real_embed(chunks, tracker)
+
+    monkeypatch.setattr(document_pipeline, "_embed_chunks", _spy)
+    words = [f"word{idx}" for idx in range(100)]
+
+    def _ingest(name: str, text: str, org_id: str) -> dict[str, object]:
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        source = IngestSource(
+            bucket="test-raw",
+            name=f"raw/docs/{name}",
+            generation="1",
+            content_type="text/plain",
+            size_bytes=path.stat().st_size,
+            md5_hash=None,
+            crc32c=None,
+            local_path=str(path),
+            org_id=org_id,
+            uri_scheme="gs",
+        )
+        result = document_pipeline.ingest_document(
+            source=source,
+            config=config,
+            output_uri=(tmp_path / "graph").as_posix(),
+            pipeline_version="v2.5",
+            schema_version="1",
+        )
+        assert result.metrics is not None
+        embeddings = result.metrics["embeddings"]
+        assert isinstance(embeddings, dict)
+        return embeddings["text"]
+
+    first = _ingest("v1.txt", " ".join(words), "org-a")
+    assert first["cache_hits"] == 0
+    assert first["cache_misses"] == first["count"] == len(embedded)
+
+    embedded.clear()
+    edited = _ingest("v2.txt", " ".join([*words[:-1], "edited"]), "org-a")
+    assert edited["cache_misses"] == len(embedded) == 1
+    assert edited["cache_hits"] == edited["count"] - 1
+    assert "edited" in embedded[0]
+
+    embedded.clear()
+    other_org = _ingest("v1-copy.txt", " ".join(words), "org-b")
+    assert other_org["cache_hits"] == 0
+    config_module.get_config.cache_clear()
+
+
+def test_document_pipeline_records_pdf_pages(tmp_path, monkeypatch):
+    import fitz
+
+    from retikon_core.ingestion.pdf_text import iter_pdf_page_texts
+
+    monkeypatch.setenv("CHUNK_TARGET_TOKENS", "8")
+    monkeypatch.setenv("CHUNK_OVERLAP_TOKENS", "2")
+    monkeypatch.setenv("PDF_EXTRACT_WORKERS", "2")
+    monkeypatch.setenv("PDF_PAGES_PER_TASK", "1")
+    config_module.get_config.cache_clear()
+    config = get_config()
+    path = tmp_path / "pages.pdf"
+    pdf = fitz.open()
+    for page_no in range(1, 5):
+        page = pdf.new_page()
+        words = " ".join(f"p{page_no}w{idx}" for idx in range(10))
+        page.insert_text((72, 72), words)
+    pdf.save(str(path))
+    pdf.close()
+
+    pages = list(iter_pdf_page_texts(str(path)))
+    assert pages == list(iter_pdf_page_texts(str(path), workers=0))
+    assert len(pages) == 4
+    extracted_text = "\n".join(pages)
+
+    source = IngestSource(
+        bucket="test-raw",
+        name="raw/docs/pages.pdf",
+        generation="1",
+        content_type="application/pdf",
+        size_bytes=path.stat().st_size,
+        md5_hash=None,
+        crc32c=None,
+        local_path=str(path),
+        uri_scheme="gs",
+    )
+    result = document_pipeline.ingest_document(
+        source=source,
+        config=config,
+        output_uri=(tmp_path / "graph").as_posix(),
+        pipeline_version="v2.5",
+        schema_version="1",
+    )
+    config_module.get_config.cache_clear()
+
+    manifest = json.loads(Path(result.manifest_uri).read_text(encoding="utf-8"))
+    uris = [item["uri"] for item in manifest["files"]]
+    core_uri = next(uri for uri in uris if "/DocChunk/core/" in uri)
+    text_uri = next(uri for uri in uris if "/DocChunk/text/" in uri)
+    core = pq.read_table(core_uri).to_pydict()
+    contents = pq.read_table(text_uri).column("content").to_pylist()
+    assert core["token_start"][:3] == [0, 6, 12]
+    for idx, content in enumerate(contents):
+        char_start = core["char_start"][idx]
+        assert content == extracted_text[char_start : core["char_end"][idx]]
+        first_page = int(content.split()[0][1])
+        last_page = int(content.split()[-1][1])
+        assert core["page_start"][idx] == first_page
+        assert core["page_end"][idx] == last_page
+    assert core["page_start"][0] == 1
+    assert core["page_end"][-1] == 4
+    assert any(
+        start != end
+        for start, end in zip(core["page_start"], core["page_end"], strict=True)
+    )
+
+
+def test_document_pipeline_chunks_tables_by_whole_rows(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHUNK_TARGET_TOKENS", "20")
+    monkeypatch.setenv("CHUNK_OVERLAP_TOKENS", "5")
+    monkeypatch.setenv("TABLE_BATCH_ROWS", "7")
+    config_module.get_config.cache_clear()
+    config = get_config()
+    path = tmp_path / "items.csv"
+    lines = ["id,name,price"]
+    for idx in range(30):
+        lines.append(f"{idx},item {idx},{'' if idx == 3 else idx * 1.5}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    extracted_text = document_pipeline._extract_text(str(path), ".csv")
+    assert extracted_text.splitlines()[3] == "id: 3, name: item 3, price: nan"
+
+    source = IngestSource(
+        bucket="test-raw",
+        name="raw/docs/items.csv",
+        generation="1",
+        content_type="text/csv",
+        size_bytes=path.stat().st_size,
+        md5_hash=None,
+        crc32c=None,
+        local_path=str(path),
+        uri_scheme="gs",
+    )
+    result = document_pipeline.ingest_document(
+        source=source,
+        config=config,
+        output_uri=(tmp_path / "graph").as_posix(),
+        pipeline_version="v2.5",
+        schema_version="1",
+    )
+    config_module.get_config.cache_clear()
+
+    manifest = json.loads(Path(result.manifest_uri).read_text(encoding="utf-8"))
+    uris = [item["uri"] for item in manifest["files"]]
+    core_uri = next(uri for uri in uris if "/DocChunk/core/" in uri)
+    text_uri = next(uri for uri in uris if "/DocChunk/text/" in uri)
+    core = pq.read_table(core_uri).to_pydict()
+    contents = pq.read_table(text_uri).column("content").to_pylist()
+    seen_rows: list[str] = []
+    for idx, content in enumerate(contents):
+        char_start = core["char_start"][idx]
+        assert content == extracted_text[char_start : core["char_end"][idx]]
+        assert core["token_count"][idx] <= 20
+        rows = content.split("\n")
+        assert all(row.startswith("id: ") for row in rows)
+        # Chunks never span a read batch of TABLE_BATCH_ROWS rows.
+        batch_ids = {int(row.split(",")[0][4:]) // 7 for row in rows}
+        assert len(batch_ids) == 1
+        seen_rows.extend(rows)
+    assert seen_rows == extracted_text.splitlines()
+    assert core["token_start"][1] == core["token_end"][0]
+
+
+def test_chunk_embedding_cache_path_selects_sqlite(tmp_path, monkeypatch):
+    monkeypatch.delenv("CHUNK_EMBED_CACHE", raising=False)
+    monkeypatch.setenv("CHUNK_EMBED_CACHE_PATH", str(tmp_path / "chunks.sqlite"))
+    cache = embedding_cache.get_chunk_embedding_cache()
+    assert isinstance(cache, embedding_cache.SqliteEmbeddingCache)
+
+    monkeypatch.setenv("CHUNK_EMBED_CACHE", "memory")
+    cache = embedding_cache.get_chunk_embedding_cache()
+    assert isinstance(cache, embedding_cache.InMemoryEmbeddingCache)
+
+
+def test_document_pipeline_streams_large_text(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHUNK_TARGET_TOKENS", "12")
+    monkeypatch.setenv("CHUNK_OVERLAP_TOKENS", "4")
+    monkeypatch.setenv("TEXT_STREAM_BLOCK_CHARS", "64")
+    monkeypatch.setenv("DOC_EMBED_BATCH_SIZE", "2")
+    monkeypatch.setenv("CHUNK_EMBED_CACHE", "none")
+    config_module.get_config.cache_clear()
+    config = get_config()
+    path = tmp_path / "notes.txt"
+    paragraphs = [
+        " ".join(f"para{idx} sentence{part} words here." for part in range(4))
+        for idx in range(12)
+    ]
+    text = "\n\n".join(paragraphs) + "\n"
+    path.write_text(text, encoding="utf-8")
+
+    blocks = list(document_pipeline._iter_text_blocks(str(path)))
+    assert "".join(blocks) == text
+    assert len(blocks) > 1
+    assert all(block[-1].isspace() for block in blocks)
+
+    events: list[str] = []
+    real_blocks = document_pipeline._iter_text_blocks
+    real_embed = document_pipeline._embed_chunks
+
+    def _spy_blocks(block_path):
+        for block in real_blocks(block_path):
+            events.append("block")
+            yield block
+
+    def _spy_embed(chunks, tracker=None):
+        events.append("embed")
+        return real_embed(chunks, tracker)
+
+    monkeypatch.setattr(document_pipeline, "_iter_text_blocks", _spy_blocks)
+    monkeypatch.setattr(document_pipeline, "_embed_chunks", _spy_embed)
+    source = IngestSource(
+        bucket="test-raw",
+        name="raw/docs/notes.txt",
+        generation="1",
+        content_type="text/plain",
+        size_bytes=path.stat().st_size,
+        md5_hash=None,
+        crc32c=None,
+        local_path=str(path),
+        uri_scheme="gs",
+    )
+    result = document_pipeline.ingest_document(
+        source=source,
+        config=config,
+        output_uri=(tmp_path / "graph").as_posix(),
+        pipeline_version="v2.5",
+        schema_version="1",
+    )
+    config_module.get_config.cache_clear()
+
+    # Embedding starts while later blocks are still being read.
+    assert events.index("embed") < len(events) - 1 - events[::-1].index("block")
+    manifest = json.loads(Path(result.manifest_uri).read_text(encoding="utf-8"))
+    uris = [item["uri"] for item in manifest["files"]]
+    core_uri = next(uri for uri in uris if "/DocChunk/core/" in uri)
+    text_uri = next(uri for uri in uris if "/DocChunk/text/" in uri)
+    core = pq.read_table(core_uri).to_pydict()
+    contents = pq.read_table(text_uri).column("content").to_pylist()
+    expected = document_pipeline._chunk_text(text, 12, 4)
+    assert contents == [chunk.text for chunk in expected]
+    assert core["char_start"] == [chunk.char_start for chunk in expected]
+    assert core["token_start"] == [chunk.token_start for chunk in expected]
+    assert result.counts["DocChunk"] == len(expected)
+
+
+def test_pdf_page_texts_fall_back_inline_when_pool_breaks(tmp_path, monkeypatch):
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    import fitz
+
+    from retikon_core.ingestion import pdf_text
+
+    path = tmp_path / "pages.pdf"
+    pdf = fitz.open()
+    for page_no in range(1, 4):
+        pdf.new_page().insert_text((72, 72), f"page {page_no}")
+    pdf.save(str(path))
+    pdf.close()
+
+    class _BrokenPool:
+        def submit(self, *_args):
+            future: Future[list[str]] = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+    resets: list[bool] = []
+    monkeypatch.setattr(pdf_text, "_get_pool", lambda _workers: _BrokenPool())
+    monkeypatch.setattr(pdf_text, "_reset_pool", lambda: resets.append(True))
+
+    pages = list(pdf_text.iter_pdf_page_texts(str(path), workers=2, pages_per_task=1))
+    assert pages == list(pdf_text.iter_pdf_page_texts(str(path), workers=0))
+    assert len(pages) == 3
+    assert resets == [True]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import io
+
 from retikon_core.edge.buffer import EdgeBuffer
 
 
@@ -40,3 +43,15 @@ def test_edge_buffer_replay(tmp_path):
     assert result["success"] == 2
     assert result["failed"] == 0
     assert buf.stats().count == 0
+
+
+def test_edge_buffer_add_stream_hashes_in_chunks(tmp_path):
+    buf = EdgeBuffer(tmp_path, max_bytes=10 * 1024 * 1024, ttl_seconds=100)
+    payload = b"frame" * 500_000
+    item = buf.add_stream(io.BytesIO(payload), {"idx": 1})
+
+    assert item.size_bytes == len(payload)
+    assert item.sha256 == hashlib.sha256(payload).hexdigest()
+    with item.open() as handle:
+        assert handle.read() == payload
+    assert buf.list_items()[0].sha256 == item.sha256
@@ -21,6 +21,8 @@ def test_docchunk_schema_split():
         "source_ref_id",
         "source_time_ms",
         "ocr_conf_avg",
+        "page_start",
+        "page_end",
         "embedding_model",
         "embedding_backend",
         "embedding_artifact",
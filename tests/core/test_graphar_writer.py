@@ -1,10 +1,15 @@
+import hashlib
 from datetime import datetime
 
+import fsspec
+import pyarrow as pa
 import pyarrow.parquet as pq
+import pytest
 
+from retikon_core.compaction.io import write_parquet_tables
 from retikon_core.storage.paths import vertex_part_uri
 from retikon_core.storage.schemas import schema_for
-from retikon_core.storage.writer import write_parquet
+from retikon_core.storage.writer import StreamingParquetWriter, write_parquet
 
 
 def _vector(length: int) -> list[float]:
@@ -141,3 +146,74 @@ def test_write_parquet_roundtrip(tmp_path):
         assert result.rows == 1
         table = pq.read_table(dest_uri)
         assert table.schema.equals(schema, check_metadata=False)
+
+
+def _doc_text_rows(count: int) -> list[dict[str, str]]:
+    return [{"content": f"chunk {idx}"} for idx in range(count)]
+
+
+def test_streaming_writer_flushes_row_groups_and_hashes(tmp_path):
+    schema = schema_for("DocChunk", "text")
+    dest = tmp_path / "vertices" / "DocChunk" / "text" / "part.parquet"
+
+    with StreamingParquetWriter(
+        dest.as_posix(),
+        schema,
+        compression="none",
+        row_group_size=4,
+    ) as writer:
+        writer.write_rows(_doc_text_rows(5))
+        writer.write_rows(_doc_text_rows(5))
+    result = writer.close()
+
+    assert result.rows == 10
+    assert result.bytes_written == dest.stat().st_size
+    assert result.sha256 == hashlib.sha256(dest.read_bytes()).hexdigest()
+    parquet = pq.ParquetFile(dest)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().num_rows == 10
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["part.parquet"]
+
+
+def test_streaming_writer_uploads_remote_without_staging(tmp_path):
+    schema = schema_for("DocChunk", "text")
+    dest_uri = "memory://retikon-test/vertices/DocChunk/text/part.parquet"
+
+    result = write_parquet(_doc_text_rows(3), schema, dest_uri)
+
+    fs, path = fsspec.core.url_to_fs(dest_uri)
+    payload = fs.cat_file(path)
+    assert result.rows == 3
+    assert result.bytes_written == len(payload)
+    assert result.sha256 == hashlib.sha256(payload).hexdigest()
+    fs.rm(path)
+
+
+def test_streaming_writer_abort_leaves_no_output(tmp_path):
+    schema = schema_for("DocChunk", "text")
+    dest = tmp_path / "out" / "part.parquet"
+
+    with pytest.raises(RuntimeError):
+        with StreamingParquetWriter(dest.as_posix(), schema) as writer:
+            writer.write_rows(_doc_text_rows(2))
+            raise RuntimeError("boom")
+
+    assert list(dest.parent.iterdir()) == []
+
+
+def test_write_parquet_tables_matches_row_writer(tmp_path):
+    schema = schema_for("DocChunk", "text")
+    rows = _doc_text_rows(6)
+    table = pa.Table.from_pylist(rows, schema=schema)
+    rows_dest = (tmp_path / "rows.parquet").as_posix()
+    tables_dest = (tmp_path / "tables.parquet").as_posix()
+
+    from_rows = write_parquet(rows, schema, rows_dest)
+    from_tables = write_parquet_tables(
+        tables=[table.slice(0, 3), table.slice(3)],
+        schema=schema,
+        dest_uri=tables_dest,
+    )
+
+    assert from_tables.rows == from_rows.rows == 6
+    assert pq.read_table(tables_dest).equals(pq.read_table(rows_dest))
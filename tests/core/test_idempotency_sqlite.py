@@ -1,7 +1,17 @@
+import time
 from datetime import timedelta
 from pathlib import Path
 
-from retikon_core.ingestion.idempotency_sqlite import SqliteIdempotency
+from retikon_core.ingestion.idempotency import (
+    DedupeRecord,
+    checksum_key,
+    content_hash_key,
+    dedupe_record_keys,
+)
+from retikon_core.ingestion.idempotency_sqlite import (
+    SqliteDedupeIndex,
+    SqliteIdempotency,
+)
 
 
 def test_sqlite_idempotency_flow(tmp_path: Path) -> None:
@@ -61,3 +71,40 @@ def test_sqlite_idempotency_failed_reprocess(tmp_path: Path) -> None:
     )
     assert decision.action == "process"
     assert decision.attempt_count == 2
+
+
+def test_sqlite_dedupe_index_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "dedupe.db")
+    record = DedupeRecord(
+        scope_key="org:-:-",
+        pipeline_version="v3.0",
+        modality="document",
+        manifest_uri="/graph/manifests/run/manifest.json",
+        content_hash_sha256="a" * 64,
+        checksum="md5:abc",
+        size_bytes=123,
+        counts={"DocChunk": 2},
+    )
+    SqliteDedupeIndex(path=path).put(dedupe_record_keys(record), record)
+
+    reopened = SqliteDedupeIndex(path=path)
+    assert reopened.get(content_hash_key("org:-:-", "a" * 64)) == record
+    assert reopened.get(checksum_key("org:-:-", "md5:abc")) == record
+    assert reopened.get(content_hash_key("other:-:-", "a" * 64)) is None
+
+
+def test_sqlite_dedupe_index_expires(tmp_path: Path, monkeypatch) -> None:
+    index = SqliteDedupeIndex(path=str(tmp_path / "dedupe.db"), ttl_seconds=60)
+    record = DedupeRecord(
+        scope_key="-:-:-",
+        pipeline_version="v3.0",
+        modality="image",
+        manifest_uri="m.json",
+        content_hash_sha256="b" * 64,
+    )
+    index.put(dedupe_record_keys(record), record)
+    key = content_hash_key("-:-:-", "b" * 64)
+    assert index.get(key) == record
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert index.get(key) is None
@@ -8,7 +8,7 @@ from retikon_core import config as config_module
 from retikon_core.config import get_config
 from retikon_core.ingestion.ocr import OcrImageResult
 from retikon_core.ingestion.pipelines import image as image_pipeline
-from retikon_core.ingestion.pipelines.image import ingest_image
+from retikon_core.ingestion.pipelines.image import ingest_image, ingest_images
 from retikon_core.ingestion.pipelines.metrics import CANONICAL_STAGE_KEYS
 from retikon_core.ingestion.types import IngestSource
 
@@ -145,3 +145,124 @@ def test_image_pipeline_writes_ocr_docchunk(tmp_path, monkeypatch):
     # One image edge + one OCR doc edge.
     assert len(derived) == 2
     config_module.get_config.cache_clear()
+
+
+def test_ingest_images_writes_one_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv("OCR_IMAGES", "1")
+    monkeypatch.setenv("IMAGE_BATCH_WORKERS", "3")
+    monkeypatch.setenv("IMAGE_EMBED_BATCH_SIZE", "2")
+    monkeypatch.setattr(
+        image_pipeline,
+        "ocr_result_from_image",
+        lambda *_args, **_kwargs: OcrImageResult(
+            text="INV-12345",
+            conf_avg=91,
+            kept_tokens=1,
+            raw_tokens=1,
+        ),
+    )
+    config_module.get_config.cache_clear()
+    config = get_config()
+    fixture = Path("tests/fixtures/sample.jpg")
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not an image")
+    paths = [fixture, fixture, broken, fixture]
+    sources = [
+        IngestSource(
+            bucket="test-raw",
+            name=f"raw/images/batch-{idx}.jpg",
+            generation="1",
+            content_type="image/jpeg",
+            size_bytes=path.stat().st_size,
+            md5_hash=None,
+            crc32c=None,
+            local_path=str(path),
+            content_hash_sha256=f"sha-{idx}",
+            uri_scheme="gs",
+        )
+        for idx, path in enumerate(paths)
+    ]
+
+    result = ingest_images(
+        sources=sources,
+        config=config,
+        output_uri=(tmp_path / "graph").as_posix(),
+        pipeline_version="v2.5",
+        schema_version="1",
+    )
+
+    manifests = list((tmp_path / "graph").rglob("manifest.json"))
+    assert [path.as_posix() for path in manifests] == [result.manifest_uri]
+    payload = json.loads(Path(result.manifest_uri).read_text(encoding="utf-8"))
+    assert payload["counts"] == {
+        "MediaAsset": 3,
+        "ImageAsset": 3,
+        "DerivedFrom": 6,
+        "DocChunk": 3,
+    }
+    files = [item["uri"] for item in payload.get("files", [])]
+    vector_uris = [uri for uri in files if "vertices/ImageAsset/vector" in uri]
+    assert len(vector_uris) == 1
+    assert pq.read_table(vector_uris[0]).num_rows == 3
+    image_core_uri = next(uri for uri in files if "vertices/ImageAsset/core" in uri)
+    thumbs = pq.read_table(image_core_uri).column("thumbnail_uri").to_pylist()
+    assert all(Path(uri).exists() for uri in thumbs)
+
+    assert result.skipped.keys() == {sources[2].uri}
+    assert result.media_asset_ids[2] is None
+    assert all(result.media_asset_ids[idx] for idx in (0, 1, 3))
+    assert result.metrics is not None
+    assert result.metrics["hashes"] == {"content_sha256": ["sha-0", "sha-1", "sha-3"]}
+    _assert_stage_timings(result.metrics)
+    config_module.get_config.cache_clear()
+
+
+def test_decode_image_scales_jpeg_and_keeps_oriented_size(tmp_path, monkeypatch):
+    from PIL import Image, JpegImagePlugin
+
+    path = tmp_path / "large.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    Image.new("RGB", (4000, 3000), (200, 40, 40)).save(path, exif=exif)
+
+    drafts: list[tuple[int, int]] = []
+    original_draft = JpegImagePlugin.JpegImageFile.draft
+
+    def _spy_draft(self, mode, size):
+        drafts.append(size)
+        return original_draft(self, mode, size)
+
+    monkeypatch.setattr(JpegImagePlugin.JpegImageFile, "draft", _spy_draft)
+    decoded = image_pipeline.decode_image(str(path), 1000)
+
+    assert drafts == [(1000, 750)]
+    assert (decoded.width, decoded.height) == (3000, 4000)
+    assert decoded.image.size == (750, 1000)
+    assert decoded.image.mode == "RGB"
+
+
+def test_decode_image_reads_tiff_pyramid_level(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / "scan.tiff"
+    full = Image.new("RGB", (2400, 1600), (255, 0, 0))
+    level = Image.new("RGB", (1200, 800), (0, 0, 255))
+    full.save(path, save_all=True, append_images=[level])
+
+    decoded = image_pipeline.decode_image(str(path), 1000)
+
+    assert (decoded.width, decoded.height) == (2400, 1600)
+    assert decoded.image.size == (1000, 667)
+    assert decoded.image.getpixel((10, 10))[2] > 200
+
+
+def test_decode_target_side_takes_largest_consumer(monkeypatch):
+    config = get_config()
+    monkeypatch.setenv("IMAGE_EMBED_MAX_DIM", "512")
+    monkeypatch.setenv("OCR_MAX_SIDE", "1600")
+    assert image_pipeline.decode_target_side(config) == (
+        1600 if config.ocr_images else 512
+    )
+    monkeypatch.setenv("IMAGE_EMBED_MAX_DIM", "0")
+    monkeypatch.setenv("IMAGE_DECODE_MAX_SIDE", "1200")
+    assert image_pipeline.decode_target_side(config) == 1200
@@ -10,6 +10,7 @@ import pytest
 from retikon_core.errors import RecoverableError
 from retikon_core.query_engine import index_builder
 from retikon_core.query_engine.index_builder import build_snapshot
+from retikon_core.query_engine.query_runner import search_by_metadata, search_by_text
 from retikon_core.storage.manifest import build_manifest, write_manifest
 from retikon_core.storage.paths import GraphPaths, edge_part_uri, manifest_uri
 from retikon_core.storage.schemas import schema_for
@@ -472,6 +473,18 @@ def test_index_builder_creates_snapshot(tmp_path):
     assert "image_assets_vision_vector_v2" in index_names
     assert "audio_clips_clap_embedding" in index_names
     assert "audio_segments_clap_embedding" in index_names
+    assert "media_uri_trigrams_trigram" in index_names
+    assert report_payload["indexes"]["media_assets_uri_trigram"]["type"] == "trigram"
+
+    trace: dict[str, float | int | str] = {}
+    results = search_by_metadata(
+        snapshot_path=snapshot_uri,
+        filters={"uri": "SAMPLE.JPG"},
+        top_k=5,
+        trace=trace,
+    )
+    assert [item.uri for item in results] == ["gs://raw/raw/images/sample.jpg"]
+    assert trace["metadata_uri_path"] == "trigram"
 
 
 def test_index_builder_parses_remote_uri():
@@ -527,6 +540,172 @@ def test_index_builder_rewrites_manifest_uris_for_duckdb(tmp_path, monkeypatch):
     assert image_group.vector.startswith("gcs://")
 
 
+def test_index_builder_quantizes_vectors_and_reports_recall(tmp_path, monkeypatch):
+    graph_root = tmp_path / "graph"
+    graph_root.mkdir()
+    output_root = str(graph_root)
+    paths = GraphPaths(base_uri=output_root)
+
+    _write_doc_run(output_root, paths)
+    _write_image_run(output_root, paths)
+
+    snapshot_uri = str(tmp_path / "snapshot" / "retikon.duckdb")
+    try:
+        report = build_snapshot(
+            graph_uri=output_root,
+            snapshot_uri=snapshot_uri,
+            work_dir=str(tmp_path / "work"),
+            copy_local=False,
+            fallback_local=False,
+            allow_install=True,
+            vector_quantization="doc_chunks_text_vector=int8,"
+            "image_assets_clip_vector=binary",
+        )
+    except RecoverableError as exc:
+        if "vss" in str(exc).lower():
+            pytest.skip("DuckDB vss extension unavailable")
+        raise
+
+    quantization = report.vector_quantization
+    assert quantization is not None
+    doc_info = quantization["doc_chunks_text_vector"]
+    assert doc_info["mode"] == "int8"
+    assert doc_info["float_table"] == "doc_chunks_text_vector_float"
+    assert doc_info["recall_at_k"] == 1.0
+    assert report.index_size_delta_bytes is not None
+    assert report.index_size_delta_bytes >= doc_info["size_bytes"]
+    assert quantization["image_assets_clip_vector"]["mode"] == "binary"
+    assert report.indexes["doc_chunks_text_vector"]["status"] == "skipped_quantized"
+
+    conn = duckdb.connect(snapshot_uri, read_only=True)
+    try:
+        modes = dict(
+            conn.execute(
+                "SELECT column_name, mode FROM vector_quantization"
+            ).fetchall()
+        )
+        index_names = {
+            row[0]
+            for row in conn.execute(
+                "SELECT index_name FROM duckdb_indexes()"
+            ).fetchall()
+        }
+        doc_columns = {
+            row[1]
+            for row in conn.execute("PRAGMA table_info('doc_chunks')").fetchall()
+        }
+        float_rows = conn.execute(
+            "SELECT COUNT(*) FROM doc_chunks_text_vector_float"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert modes == {"text_vector": "int8", "clip_vector": "binary"}
+    assert "doc_chunks_text_vector" not in index_names
+    # Float vectors live only in the side table read for rescoring.
+    assert "text_vector" not in doc_columns
+    assert {"text_vector_int8", "text_vector_key"} <= doc_columns
+    assert float_rows == 1
+
+    monkeypatch.setattr(
+        "retikon_core.query_engine.query_runner._cached_text_vector",
+        lambda _text: tuple(_vector(768, 0.1)),
+    )
+    trace: dict[str, float | int | str] = {}
+    results = search_by_text(
+        snapshot_path=snapshot_uri,
+        query_text="hello",
+        top_k=3,
+        modalities=["document"],
+        trace=trace,
+    )
+    assert results
+    assert trace["doc_vector_mode"] == "int8"
+
+    monkeypatch.setenv("QUERY_VECTOR_QUANTIZATION", "off")
+    exact_results = search_by_text(
+        snapshot_path=snapshot_uri,
+        query_text="hello",
+        top_k=3,
+        modalities=["document"],
+    )
+    assert [item.uri for item in exact_results] == [item.uri for item in results]
+
+
+def test_index_builder_incremental_requantizes_from_side_table(tmp_path):
+    graph_root = tmp_path / "graph"
+    graph_root.mkdir()
+    output_root = str(graph_root)
+    paths = GraphPaths(base_uri=output_root)
+
+    _write_doc_run(output_root, paths)
+
+    snapshot_uri = str(tmp_path / "snapshot" / "retikon.duckdb")
+    try:
+        build_snapshot(
+            graph_uri=output_root,
+            snapshot_uri=snapshot_uri,
+            work_dir=str(tmp_path / "work"),
+            copy_local=False,
+            fallback_local=False,
+            allow_install=True,
+            vector_quantization="doc_chunks_text_vector=int8",
+        )
+    except RecoverableError as exc:
+        if "vss" in str(exc).lower():
+            pytest.skip("DuckDB vss extension unavailable")
+        raise
+
+    _write_doc_run(output_root, paths)
+
+    report = build_snapshot(
+        graph_uri=output_root,
+        snapshot_uri=snapshot_uri,
+        work_dir=str(tmp_path / "work2"),
+        copy_local=False,
+        fallback_local=False,
+        allow_install=True,
+        incremental=True,
+        vector_quantization="doc_chunks_text_vector=int8",
+    )
+
+    assert report.new_manifest_count == 1
+    assert report.vector_quantization is not None
+    assert report.vector_quantization["doc_chunks_text_vector"]["rows"] == 2
+    conn = duckdb.connect(snapshot_uri, read_only=True)
+    try:
+        float_rows = conn.execute(
+            "SELECT COUNT(*) FROM doc_chunks_text_vector_float"
+        ).fetchone()[0]
+        coded_rows = conn.execute(
+            "SELECT COUNT(*) FROM doc_chunks WHERE text_vector_int8 IS NOT NULL"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert float_rows == 2
+    assert coded_rows == 2
+
+    # Dropping quantization restores the float column for the HNSW index.
+    _write_doc_run(output_root, paths)
+    report = build_snapshot(
+        graph_uri=output_root,
+        snapshot_uri=snapshot_uri,
+        work_dir=str(tmp_path / "work3"),
+        copy_local=False,
+        fallback_local=False,
+        allow_install=True,
+        incremental=True,
+    )
+    assert report.indexes["doc_chunks_text_vector"].get("status") is None
+    conn = duckdb.connect(snapshot_uri, read_only=True)
+    try:
+        vector_rows = conn.execute(
+            "SELECT COUNT(*) FROM doc_chunks WHERE text_vector IS NOT NULL"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert vector_rows == 3
+
+
 def test_index_builder_skips_when_manifests_unchanged(tmp_path):
     graph_root = tmp_path / "graph"
     graph_root.mkdir()
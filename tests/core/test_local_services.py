@@ -28,6 +28,33 @@ def test_local_ingestion_service(tmp_path, monkeypatch, jwt_headers):
     get_config.cache_clear()
 
 
+def test_local_ingestion_dedupes_identical_file(tmp_path, monkeypatch, jwt_headers):
+    monkeypatch.setenv("STORAGE_BACKEND", "local")
+    monkeypatch.setenv("LOCAL_GRAPH_ROOT", tmp_path.as_posix())
+    monkeypatch.setenv("RAW_BUCKET", "local")
+    monkeypatch.setenv("USE_REAL_MODELS", "0")
+    get_config.cache_clear()
+    copy = tmp_path / "copy.csv"
+    copy.write_bytes(Path("tests/fixtures/sample.csv").read_bytes())
+
+    client = TestClient(ingestion_service.app, headers=jwt_headers)
+    first = client.post("/ingest", json={"path": "tests/fixtures/sample.csv"})
+    second = client.post("/ingest", json={"path": copy.as_posix()})
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["manifest_uri"] == first.json()["manifest_uri"]
+    assert len(list(tmp_path.rglob("manifest.json"))) == 1
+    assert (tmp_path / "_state" / "dedupe.sqlite").exists()
+
+    # Outputs deleted since the record was written are rebuilt.
+    Path(first.json()["manifest_uri"]).unlink()
+    third = client.post("/ingest", json={"path": copy.as_posix()})
+    assert third.status_code == 200
+    assert third.json()["manifest_uri"] != first.json()["manifest_uri"]
+    assert Path(third.json()["manifest_uri"]).exists()
+    get_config.cache_clear()
+
+
 def test_local_query_service_keyword(monkeypatch, tmp_path, jwt_headers):
     monkeypatch.setenv("STORAGE_BACKEND", "local")
     monkeypatch.setenv("LOCAL_GRAPH_ROOT", tmp_path.as_posix())
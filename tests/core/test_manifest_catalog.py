@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from retikon_core.compaction.gc import collect_manifests
+from retikon_core.storage import build_manifest, manifest_uri, write_manifest
+from retikon_core.storage.manifest_catalog import (
+    CATALOG_DIR,
+    CATALOG_LOCK_FILE,
+    CatalogWatermark,
+    consolidate_manifest_catalog,
+    list_manifest_uris,
+    list_manifests,
+)
+from retikon_core.storage.writer import WriteResult
+
+_BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _write_run(base_uri: str, run_id: str, minutes: int) -> None:
+    completed = _BASE_TIME + timedelta(minutes=minutes)
+    manifest = build_manifest(
+        pipeline_version="test",
+        schema_version="1",
+        counts={"DocChunk": 2},
+        files=[
+            WriteResult(
+                uri=f"{base_uri}/vertices/DocChunk/core/part-{run_id}.parquet",
+                rows=2,
+                bytes_written=10,
+                sha256="abc",
+            )
+        ],
+        started_at=completed - timedelta(seconds=5),
+        completed_at=completed,
+    )
+    write_manifest(manifest, manifest_uri(base_uri, run_id))
+
+
+def test_catalog_consolidation_matches_manifest_scan(tmp_path, monkeypatch):
+    base_uri = tmp_path.as_posix()
+    monkeypatch.setenv("MANIFEST_CATALOG_ENABLED", "0")
+    _write_run(base_uri, "run-legacy", minutes=0)
+    monkeypatch.setenv("MANIFEST_CATALOG_ENABLED", "1")
+    _write_run(base_uri, "run-1", minutes=1)
+
+    # Without a consolidated catalog, readers fall back to the JSON manifests.
+    scanned = list_manifests(base_uri)
+    assert [record.run_id for record in scanned] == ["run-legacy", "run-1"]
+
+    result = consolidate_manifest_catalog(base_uri)
+    assert result.backfilled is True
+    assert result.records == 2
+    assert result.merged_log_files == 1
+    log_dir = Path(base_uri) / "manifests" / CATALOG_DIR / "log"
+    assert list(log_dir.glob("*.parquet")) == []
+
+    _write_run(base_uri, "run-2", minutes=2)
+    records = list_manifests(base_uri)
+    assert [record.run_id for record in records] == ["run-legacy", "run-1", "run-2"]
+    assert records[0].uri == scanned[0].uri
+    by_run = {record.run_id: record for record in records}
+    assert by_run["run-1"].content_hash == scanned[1].content_hash
+    assert by_run["run-2"].files[0]["rows"] == 2
+    assert by_run["run-2"].counts == {"DocChunk": 2}
+    assert list_manifest_uris(base_uri) == sorted(record.uri for record in records)
+
+
+def test_catalog_since_watermark(tmp_path):
+    base_uri = tmp_path.as_posix()
+    for idx in range(3):
+        _write_run(base_uri, f"run-{idx}", minutes=idx)
+    consolidate_manifest_catalog(base_uri)
+    _write_run(base_uri, "run-3", minutes=3)
+
+    watermark = _BASE_TIME + timedelta(minutes=1)
+    recent = list_manifests(base_uri, since=watermark)
+
+    assert [record.run_id for record in recent] == ["run-2", "run-3"]
+    entries = collect_manifests(base_uri)
+    assert [entry.run_id for entry in entries] == [f"run-{idx}" for idx in range(4)]
+
+
+def test_catalog_sequences_runs_in_append_order(tmp_path):
+    base_uri = tmp_path.as_posix()
+    for idx in range(2):
+        _write_run(base_uri, f"run-{idx}", minutes=idx + 10)
+    consolidate_manifest_catalog(base_uri)
+    watermark = CatalogWatermark(
+        seq=max(record.seq or 0 for record in list_manifests(base_uri))
+    )
+    assert list_manifests(base_uri, after=watermark) == []
+
+    # Appended later but stamped earlier by its producer.
+    _write_run(base_uri, "run-late", minutes=0)
+    assert [r.run_id for r in list_manifests(base_uri, after=watermark)] == [
+        "run-late"
+    ]
+    consolidate_manifest_catalog(base_uri)
+    late = list_manifests(base_uri, after=watermark)
+    assert [record.run_id for record in late] == ["run-late"]
+    assert late[0].seq == watermark.seq + 1
+    pending = CatalogWatermark(seq=late[0].seq, pending=("run-0",))
+    assert [r.run_id for r in list_manifests(base_uri, after=pending)] == ["run-0"]
+
+
+def test_catalog_consolidation_reconciles_lost_appends(tmp_path, monkeypatch):
+    base_uri = tmp_path.as_posix()
+    _write_run(base_uri, "run-0", minutes=0)
+    consolidate_manifest_catalog(base_uri)
+
+    # Simulate a crash between the manifest PUT and its catalog append.
+    monkeypatch.setenv("MANIFEST_CATALOG_ENABLED", "0")
+    _write_run(base_uri, "run-1", minutes=1)
+    monkeypatch.setenv("MANIFEST_CATALOG_ENABLED", "1")
+    assert [record.run_id for record in list_manifests(base_uri)] == ["run-0"]
+
+    result = consolidate_manifest_catalog(base_uri)
+
+    assert result is not None
+    assert result.reconciled == 1
+    assert [record.run_id for record in list_manifests(base_uri)] == [
+        "run-0",
+        "run-1",
+    ]
+
+
+def test_catalog_consolidation_is_serialized(tmp_path):
+    base_uri = tmp_path.as_posix()
+    _write_run(base_uri, "run-0", minutes=0)
+    lock_path = Path(base_uri) / "manifests" / CATALOG_DIR / CATALOG_LOCK_FILE
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    lock_path.write_text(
+        json.dumps({"owner": "other", "expires_at": expires_at.isoformat()})
+    )
+
+    assert consolidate_manifest_catalog(base_uri) is None
+    assert lock_path.exists()
+
+    expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+    lock_path.write_text(
+        json.dumps({"owner": "other", "expires_at": expired.isoformat()})
+    )
+    result = consolidate_manifest_catalog(base_uri)
+
+    assert result is not None
+    assert result.records == 1
+    assert not lock_path.exists()
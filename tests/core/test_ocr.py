@@ -1,3 +1,7 @@
+import multiprocessing
+import os
+from types import SimpleNamespace
+
 from PIL import Image
 
 from retikon_core.ingestion import ocr
@@ -64,3 +68,98 @@ def test_ocr_result_from_image_honors_min_text_len(monkeypatch):
     assert result.kept_tokens == 0
     assert result.raw_tokens == 1
 
+
+def _fake_clock(monkeypatch, *, expire_after: int) -> None:
+    """Make the OCR budget expire on the given monotonic() call, not by sleeping."""
+    calls = {"count": 0}
+
+    def monotonic() -> float:
+        calls["count"] += 1
+        return 0.0 if calls["count"] <= expire_after else 3600.0
+
+    monkeypatch.setattr(ocr, "time", SimpleNamespace(monotonic=monotonic))
+
+
+def test_ocr_executor_preprocesses_and_keeps_order(monkeypatch, tmp_path):
+    seen: list[tuple[str, tuple[int, int]]] = []
+
+    class FakePytesseract:
+        class Output:
+            DICT = object()
+
+        @staticmethod
+        def image_to_data(image, output_type=None, timeout=None):
+            seen.append((image.mode, image.size))
+            if image.size[0] == 1:
+                raise RuntimeError("Tesseract process timeout")
+            return {"text": [f"W{image.size[0]}"], "conf": ["90"]}
+
+        @staticmethod
+        def image_to_string(_image, timeout=None):
+            return ""
+
+    monkeypatch.setattr(ocr, "_load_pytesseract", lambda: FakePytesseract())
+    large = tmp_path / "large.png"
+    Image.new("RGB", (400, 100), color=(255, 255, 255)).save(large)
+    sources = [
+        str(large),
+        Image.new("RGB", (1, 1)),
+        Image.new("RGB", (50, 50)),
+        Image.new("RGB", (60, 60)),
+    ]
+    executor = ocr.OcrExecutor(workers=0, max_side=200)
+    # One call sets the deadline and one precedes each job; the last job finds
+    # the budget spent.
+    _fake_clock(monkeypatch, expire_after=4)
+
+    results = ocr.ocr_results_from_keyframes(
+        sources,
+        timeout_s=1.0,
+        budget_s=0.15,
+        executor=executor,
+    )
+
+    assert seen[0] == ("L", (200, 50))
+    assert [item.text if item else None for item in results] == [
+        "W200",
+        None,
+        "W50",
+        None,
+    ]
+
+
+def test_ocr_executor_pool_returns_none_past_budget(monkeypatch):
+    manager = multiprocessing.Manager()
+    release = manager.Event()
+    executor = ocr.OcrExecutor(workers=2)
+    try:
+        # The deadline call and the first two waits see budget left; the job
+        # still blocked on the event finds it spent.
+        _fake_clock(monkeypatch, expire_after=3)
+        results = executor._run(
+            [
+                (abs, (-2,)),
+                (int, ("not-a-number",)),
+                (release.wait, ()),
+            ],
+            budget_s=60.0,
+        )
+        assert results == [2, None, None]
+    finally:
+        pool = executor._pool
+        release.set()
+        executor.close()
+        if pool is not None:
+            pool.shutdown(wait=True)
+        manager.shutdown()
+
+
+def test_ocr_executor_replaces_broken_pool():
+    executor = ocr.OcrExecutor(workers=1)
+    try:
+        results = executor._run([(os._exit, (1,)), (abs, (-2,))], budget_s=None)
+        assert results == [None, None]
+        assert executor._pool is None
+        assert executor._run([(abs, (-2,)), (abs, (-3,))], budget_s=None) == [2, 3]
+    finally:
+        executor.close()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from retikon_core.privacy import (
+    PrivacyRedactor,
     build_context,
     load_privacy_policies,
     redact_text_for_context,
@@ -98,3 +99,32 @@ def test_privacy_admin_bypass(monkeypatch):
     assert (
         redact_text_for_context(text, policies=[policy], context=context) == text
     )
+
+
+@pytest.mark.core
+def test_privacy_redactor_caches_per_context():
+    policy = PrivacyPolicy(
+        id="policy-3",
+        name="Docs",
+        org_id=None,
+        site_id=None,
+        stream_id=None,
+        modalities=("document",),
+        contexts=("query",),
+        redaction_types=("email",),
+        enabled=True,
+        created_at="now",
+        updated_at="now",
+    )
+    redactor = PrivacyRedactor([policy])
+    document = build_context(action="query", modality="document")
+    image = build_context(action="query", modality="image")
+    text = "email test@example.com ssn 123-45-6789"
+
+    assert redactor.redact(text, document) == "email [REDACTED] ssn 123-45-6789"
+    assert redactor.redact(text, image) == text
+    assert redactor.redactor_for(document) is redactor.redactor_for(document)
+    assert redactor.redactor_for(image) is None
+    assert redact_text_for_context(text, policies=redactor, context=document) == (
+        "email [REDACTED] ssn 123-45-6789"
+    )
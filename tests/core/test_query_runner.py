@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from retikon_core.embeddings import reset_rerank_score_cache
 from retikon_core.query_engine import query_runner
 from retikon_core.query_engine.query_runner import (
     QueryResult,
@@ -64,6 +65,153 @@ def test_search_by_metadata_returns_results():
     assert results
 
 
+def test_search_by_keyword_falls_back_to_ilike_without_fts_index():
+    snapshot_path = os.getenv("SNAPSHOT_URI")
+    assert snapshot_path
+    trace: dict[str, float | int | str] = {}
+    results = search_by_keyword(
+        snapshot_path=snapshot_path,
+        query_text="hello",
+        top_k=3,
+        trace=trace,
+    )
+    assert results
+    assert trace["keyword_doc_path"] == "ilike"
+    assert trace["keyword_transcript_path"] == "ilike"
+
+
+def test_search_by_keyword_uses_bm25_order_when_fts_index_exists(monkeypatch):
+    class DummyConn:
+        def close(self) -> None:
+            return None
+
+    def fake_query_rows(_conn, sql, params):
+        assert "ILIKE" not in sql
+        assert params[0] == "invoice"
+        if "fts_main_doc_chunks.match_bm25" in sql:
+            return [
+                (
+                    "gs://raw/a.pdf",
+                    "document",
+                    "asset-a",
+                    "invoice a",
+                    "a-1",
+                    "document",
+                    None,
+                    0.5,
+                )
+            ]
+        if "fts_main_transcripts.match_bm25" in sql:
+            return [
+                ("gs://raw/b.mp4", "video", "asset-b", "invoice b", 0, 1000, "b-1", 4.0)
+            ]
+        return []
+
+    monkeypatch.setattr(query_runner, "_connect", lambda *_args, **_kwargs: DummyConn())
+    monkeypatch.setattr(
+        query_runner, "_table_has_column", lambda *_args, **_kwargs: True
+    )
+    monkeypatch.setattr(query_runner, "_fts_index_exists", lambda *_args: True)
+    monkeypatch.setattr(query_runner, "_query_rows", fake_query_rows)
+    monkeypatch.setattr(query_runner, "_fts_enabled", lambda: True)
+
+    trace: dict[str, float | int | str] = {}
+    results = search_by_keyword(
+        snapshot_path="/tmp/retikon-keyword-fts-test.duckdb",
+        query_text="invoice",
+        top_k=5,
+        trace=trace,
+    )
+
+    assert [item.primary_evidence_id for item in results] == ["b-1", "a-1"]
+    assert results[0].score > results[1].score
+    assert results[0].why[0]["reason"] == "keyword_bm25"
+    assert trace["keyword_doc_path"] == "fts"
+    assert trace["keyword_transcript_path"] == "fts"
+
+
+def test_search_by_keyword_falls_back_to_ilike_when_fts_matches_nothing(
+    monkeypatch,
+):
+    class DummyConn:
+        def close(self) -> None:
+            return None
+
+    def fake_query_rows(_conn, sql, params):
+        if "fts_main_doc_chunks.match_bm25" in sql:
+            return [
+                (
+                    "gs://raw/a.pdf",
+                    "document",
+                    "asset-a",
+                    "part PN-4471/B",
+                    "a-1",
+                    "document",
+                    None,
+                    4.0,
+                )
+            ]
+        if "fts_main_transcripts.match_bm25" in sql:
+            return []
+        if "FROM transcripts t" in sql and "ILIKE" in sql:
+            assert params[:3] == ["pn-4471/b", "pn-4471/b", "%PN-4471/B%"]
+            return [
+                (
+                    "gs://raw/b.mp4",
+                    "video",
+                    "asset-b",
+                    "order PN-4471/B",
+                    0,
+                    1000,
+                    "b-1",
+                    1.0,
+                )
+            ]
+        return []
+
+    monkeypatch.setattr(query_runner, "_connect", lambda *_args, **_kwargs: DummyConn())
+    monkeypatch.setattr(
+        query_runner, "_table_has_column", lambda *_args, **_kwargs: True
+    )
+    monkeypatch.setattr(query_runner, "_fts_index_exists", lambda *_args: True)
+    monkeypatch.setattr(query_runner, "_query_rows", fake_query_rows)
+    monkeypatch.setattr(query_runner, "_fts_enabled", lambda: True)
+
+    trace: dict[str, float | int | str] = {}
+    results = search_by_keyword(
+        snapshot_path="/tmp/retikon-keyword-fts-empty-test.duckdb",
+        query_text="PN-4471/B",
+        top_k=5,
+        trace=trace,
+    )
+
+    assert trace["keyword_doc_path"] == "fts"
+    assert trace["keyword_transcript_path"] == "fts_empty_ilike"
+    # One substring hit scores like a BM25 of 1.0, below the 4.0 FTS hit.
+    assert [item.primary_evidence_id for item in results] == ["a-1", "b-1"]
+    assert results[0].score == pytest.approx(0.8)
+    assert results[1].score == pytest.approx(0.5)
+    assert results[1].why[0]["reason"] == "keyword_substring"
+
+
+def test_search_by_metadata_uri_falls_back_to_ilike_without_trigram_table():
+    snapshot_path = os.getenv("SNAPSHOT_URI")
+    assert snapshot_path
+    trace: dict[str, float | int | str] = {}
+    search_by_metadata(
+        snapshot_path=snapshot_path,
+        filters={"uri": "sample"},
+        top_k=3,
+        trace=trace,
+    )
+    assert trace["metadata_uri_path"] == "ilike"
+
+
+def test_uri_trigrams_are_lowercase_and_unique():
+    assert query_runner._uri_trigrams("ABAB") == ["aba", "bab"]
+    assert query_runner._uri_trigrams("ab") == []
+
+
 def test_fuse_results_weighted_rrf_merges_duplicate_evidence():
     rows = [
         QueryResult(
@@ -302,6 +450,62 @@ def test_rerank_text_candidates_respects_total_char_budget(monkeypatch):
     assert len(captured_docs) == 2
 
 
+def test_rerank_text_candidates_reuses_scores_per_snapshot(monkeypatch):
+    scored: list[str] = []
+
+    class DummyReranker:
+        model_name = "dummy"
+        backend = "stub"
+
+        def score(self, query, docs):
+            scored.extend(docs)
+            return [0.4 for _ in docs]
+
+    monkeypatch.setenv("RERANK_ENABLED", "1")
+    monkeypatch.setenv("RERANK_SKIP_SCORE_GAP", "10")
+    monkeypatch.setattr(
+        "retikon_core.query_engine.query_runner.get_reranker",
+        lambda: DummyReranker(),
+    )
+    reset_rerank_score_cache()
+    rows = [
+        QueryResult(
+            modality="document",
+            uri=f"gs://doc{idx}",
+            snippet=f"candidate {idx}",
+            start_ms=None,
+            end_ms=None,
+            thumbnail_uri=None,
+            score=0.9 - idx * 0.1,
+            media_asset_id=f"asset-{idx}",
+            media_type="document",
+            primary_evidence_id=f"doc-{idx}",
+            evidence_refs=[{"doc_chunk_id": f"doc-{idx}"}],
+        )
+        for idx in range(3)
+    ]
+
+    first_trace: dict[str, float | int | str] = {}
+    rerank_text_candidates(
+        query_text="Hello",
+        results=rows,
+        trace=first_trace,
+        snapshot_marker="snap-1",
+    )
+    repeat_trace: dict[str, float | int | str] = {}
+    rerank_text_candidates(
+        query_text="hello ",
+        results=rows,
+        trace=repeat_trace,
+        snapshot_marker="snap-1",
+    )
+
+    assert first_trace["rerank_cache_hits"] == 0
+    assert repeat_trace["rerank_cache_hits"] == 3
+    assert len(scored) == 3
+    reset_rerank_score_cache()
+
+
 def test_id_like_query_heuristic_avoids_plain_text():
     assert query_runner._is_id_like_query("INV-2026-001") is True
     assert query_runner._is_id_like_query("error code 500") is False
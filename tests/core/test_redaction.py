@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from retikon_core.redaction import redact_text
+from retikon_core.redaction import compile_redactor, redact_text
 
 
 @pytest.mark.core
@@ -17,3 +17,15 @@ def test_redact_text_masks_common_pii():
     assert "123-45-6789" not in redacted
     assert "4242 4242 4242 4242" not in redacted
     assert "[REDACTED]" in redacted
+
+
+@pytest.mark.core
+def test_compiled_redactor_single_pass_collapses_overlaps():
+    redactor = compile_redactor(("ssn", "credit_card"))
+    assert compile_redactor(["SSN", "credit_card"]) is redactor
+    # The card number starts with an SSN-shaped run; the longer match wins
+    # instead of leaving the card's tail digits behind.
+    text = "card 123-45-6789 0123 ok"
+    assert redactor.redact(text) == "card [REDACTED] ok"
+    assert redact_text("mail A@B.IO", redaction_types=("email",)) == "mail [REDACTED]"
+    assert compile_redactor(("unknown",)).redact("123-45-6789") == "123-45-6789"
@@ -1,8 +1,11 @@
 from retikon_core.embeddings.rerank_backend import (
     StubReranker,
     get_reranker,
+    length_bucketed_batches,
     normalize_rerank_scores,
+    reset_rerank_score_cache,
     reset_reranker_cache,
+    score_with_cache,
 )
 
 
@@ -24,3 +27,53 @@ def test_normalize_rerank_scores_handles_logits():
     normalized = normalize_rerank_scores([-2.0, 0.0, 2.0])
     assert normalized[0] < normalized[1] < normalized[2]
     assert all(0.0 <= value <= 1.0 for value in normalized)
+
+
+def test_length_bucketed_batches_group_similar_lengths():
+    lengths = [120, 5, 118, 6, 7, 119]
+    batches = length_bucketed_batches(lengths, batch_size=3, max_batch_tokens=1000)
+    assert batches == [[1, 3, 4], [2, 5, 0]]
+
+    budgeted = length_bucketed_batches(lengths, batch_size=8, max_batch_tokens=240)
+    assert budgeted == [[1, 3, 4], [2, 5], [0]]
+
+
+def test_score_with_cache_skips_repeat_pairs(monkeypatch):
+    monkeypatch.setenv("RERANK_SCORE_CACHE_SIZE", "100")
+    reset_rerank_score_cache()
+    calls: list[list[str]] = []
+
+    class CountingReranker(StubReranker):
+        def score(self, query, documents):
+            calls.append(list(documents))
+            return super().score(query, documents)
+
+    reranker = CountingReranker()
+    first, hits = score_with_cache(
+        reranker,
+        query="Alarm  Sound",
+        doc_ids=["a", "b"],
+        documents=["alarm alarm", "cat photo"],
+        snapshot_marker="snap-1",
+    )
+    assert hits == 0
+    second, hits = score_with_cache(
+        reranker,
+        query="alarm sound",
+        doc_ids=["b", "a", "c"],
+        documents=["cat photo", "alarm alarm", "alarm clock"],
+        snapshot_marker="snap-1",
+    )
+    assert hits == 2
+    assert second[:2] == [first[1], first[0]]
+    assert calls == [["alarm alarm", "cat photo"], ["alarm clock"]]
+
+    score_with_cache(
+        reranker,
+        query="alarm sound",
+        doc_ids=["a"],
+        documents=["alarm alarm"],
+        snapshot_marker="snap-2",
+    )
+    assert calls[-1] == ["alarm alarm"]
+    reset_rerank_score_cache()
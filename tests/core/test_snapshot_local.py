@@ -1,5 +1,12 @@
+import hashlib
+import json
 from pathlib import Path
 
+import fsspec
+import pytest
+
+from retikon_core.errors import RecoverableError
+from retikon_core.query_engine import snapshot as snapshot_module
 from retikon_core.query_engine.snapshot import download_snapshot
 
 
@@ -16,3 +23,106 @@ def test_download_snapshot_local(tmp_path: Path) -> None:
     assert local_path.exists()
     assert local_path.read_bytes() == b"snapshot-data"
     assert info.metadata == {"source": "local"}
+
+
+def test_local_snapshot_opens_in_place_and_verifies(tmp_path: Path, monkeypatch):
+    snapshot_path = tmp_path / "retikon.duckdb"
+    snapshot_path.write_bytes(b"snapshot-v1")
+    digest = hashlib.sha256(b"snapshot-v1").hexdigest()
+    sidecar = tmp_path / "retikon.duckdb.json"
+    sidecar.write_text(json.dumps({"snapshot_sha256": digest}), encoding="utf-8")
+    dest_dir = str(tmp_path / "out")
+
+    info = download_snapshot(str(snapshot_path), dest_dir=dest_dir)
+    assert info.local_path == str(snapshot_path)
+    assert info.sha256 == digest
+    assert not list((tmp_path / "out").rglob("*.duckdb"))
+
+    # A verified, unchanged file is not hashed again on the next load.
+    def fail_hash(_path):
+        raise AssertionError("unexpected re-hash")
+
+    monkeypatch.setattr(snapshot_module, "file_sha256", fail_hash)
+    download_snapshot(str(snapshot_path), dest_dir=dest_dir)
+    monkeypatch.undo()
+
+    snapshot_path.write_bytes(b"snapshot-tampered")
+    with pytest.raises(RecoverableError, match="checksum mismatch"):
+        download_snapshot(str(snapshot_path), dest_dir=dest_dir)
+
+
+def test_remote_snapshot_uses_content_addressed_cache(tmp_path: Path, monkeypatch):
+    fs = fsspec.filesystem("memory")
+    base = "memory://graph/snapshots/retikon.duckdb"
+    reads: list[str] = []
+    original_open = fs.open
+
+    def counting_open(path, mode="rb", **kwargs):
+        if "b" in mode and str(path).endswith(".duckdb"):
+            reads.append(path)
+        return original_open(path, mode, **kwargs)
+
+    monkeypatch.setattr(fs, "open", counting_open)
+
+    def publish(payload: bytes, checksum: str | None = None) -> None:
+        with original_open("/graph/snapshots/retikon.duckdb", "wb") as handle:
+            handle.write(payload)
+        sidecar = {"snapshot_sha256": checksum or hashlib.sha256(payload).hexdigest()}
+        with original_open("/graph/snapshots/retikon.duckdb.json", "wb") as handle:
+            handle.write(json.dumps(sidecar).encode("utf-8"))
+
+    monkeypatch.setenv("SNAPSHOT_CACHE_KEEP", "1")
+    dest_dir = str(tmp_path / "cache")
+    publish(b"snapshot-v1")
+    first = download_snapshot(base, dest_dir=dest_dir)
+    second = download_snapshot(base, dest_dir=dest_dir)
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert second.local_path == first.local_path
+    assert Path(first.local_path).read_bytes() == b"snapshot-v1"
+    assert len(reads) == 1
+
+    publish(b"snapshot-v2")
+    third = download_snapshot(base, dest_dir=dest_dir)
+    assert third.local_path != first.local_path
+    assert not Path(first.local_path).exists()
+
+    publish(b"snapshot-v3", checksum="0" * 64)
+    with pytest.raises(RecoverableError, match="checksum mismatch"):
+        download_snapshot(base, dest_dir=dest_dir)
+    assert not list(Path(dest_dir).rglob("*.partial"))
+    fs.rm("/graph", recursive=True)
+
+
+def test_snapshot_tolerates_sidecar_published_after_file(tmp_path: Path, monkeypatch):
+    fs = fsspec.filesystem("memory")
+    base = "memory://graph/publish/retikon.duckdb"
+
+    def write(path: str, payload: bytes) -> None:
+        with fs.open(path, "wb") as handle:
+            handle.write(payload)
+
+    def sidecar(payload: bytes) -> bytes:
+        checksum = hashlib.sha256(payload).hexdigest()
+        return json.dumps({"snapshot_sha256": checksum}).encode("utf-8")
+
+    # The new snapshot is uploaded but its sidecar still names the old one;
+    # the publisher finishes while the reader is downloading.
+    write("/graph/publish/retikon.duckdb", b"snapshot-v2")
+    write("/graph/publish/retikon.duckdb.json", sidecar(b"snapshot-v1"))
+    monkeypatch.setenv("SNAPSHOT_SIDECAR_RETRY_S", "0")
+    original_refresh = snapshot_module._refreshed_sidecar
+
+    def publish_then_refresh(read, actual):
+        write("/graph/publish/retikon.duckdb.json", sidecar(b"snapshot-v2"))
+        return original_refresh(read, actual)
+
+    monkeypatch.setattr(snapshot_module, "_refreshed_sidecar", publish_then_refresh)
+    try:
+        info = download_snapshot(base, dest_dir=str(tmp_path / "cache"))
+    finally:
+        fs.rm("/graph/publish", recursive=True)
+
+    assert Path(info.local_path).read_bytes() == b"snapshot-v2"
+    assert info.sha256 == hashlib.sha256(b"snapshot-v2").hexdigest()
+    assert info.metadata == {"snapshot_sha256": info.sha256}
@@ -4,6 +4,7 @@ from typing import Mapping
 
 import pytest
 
+from retikon_core.edge.policies import AdaptiveBatchPolicy, BackpressurePolicy
 from retikon_core.ingestion.streaming import (
     StreamBackpressureError,
     StreamBatcher,
@@ -101,3 +102,89 @@ def test_stream_pipeline_flushes_on_latency():
     message_ids = pipeline.flush(now=2.0)
     assert len(message_ids) == 1
     assert len(publisher.published) == 1
+
+
+def _adaptive_batcher(**overrides) -> StreamBatcher:
+    policy = AdaptiveBatchPolicy(
+        min_batch=1,
+        max_batch=8,
+        low_watermark=2,
+        high_watermark=10,
+        min_delay_ms=0,
+        max_delay_ms=1000,
+        target_latency_ms=overrides.pop("target_latency_ms", None),
+    )
+    return StreamBatcher(
+        batch_policy=policy,
+        backpressure=BackpressurePolicy(max_backlog=12, hard_limit=20),
+        **overrides,
+    )
+
+
+def test_adaptive_batcher_grows_batches_under_burst():
+    publisher = FakePublisher()
+    batcher = _adaptive_batcher()
+    pipeline = StreamIngestPipeline(
+        publisher=publisher, topic="projects/test/topics/stream", batcher=batcher
+    )
+
+    # A quiet stream publishes each event as it arrives; as the burst builds,
+    # batches grow to the policy maximum.
+    pipeline.enqueue_events([_event(idx) for idx in range(11)], now=0.0)
+    sizes = [len(decode_stream_batch(data)) for _topic, data, _ in publisher.published]
+    assert sizes == [1, 1, 1, 8]
+
+    pipeline.enqueue(_event(11), now=0.0)
+    assert batcher.backlog == 1
+    batch_size, latency_s = batcher.targets(now=0.0)
+    assert batch_size == 8
+    assert latency_s == pytest.approx(1.0)
+    assert batcher.next_flush_in(now=0.5) == pytest.approx(0.5)
+    assert pipeline.flush(now=0.5) == ()
+    assert len(pipeline.flush(now=1.0)) == 1
+
+    # Once the burst ages out of the window, events flow through immediately.
+    assert len(batcher.add(_event(12), now=5.0)) == 1
+
+
+def test_adaptive_batcher_shrinks_when_downstream_slows():
+    batcher = _adaptive_batcher(target_latency_ms=100)
+    for idx in range(10):
+        batcher._queue.append((_event(idx), 0.0))
+    assert batcher.targets(now=0.0)[0] == 8
+
+    batcher.record_downstream(400.0)
+    batch_size, latency_s = batcher.targets(now=0.0)
+    assert batch_size == 2
+    assert latency_s == pytest.approx(1.0)
+
+
+def test_adaptive_batcher_backpressure():
+    batcher = _adaptive_batcher()
+    for idx in range(12):
+        batcher._queue.append((_event(idx), 0.0))
+    assert batcher.can_accept() is False
+    with pytest.raises(StreamBackpressureError):
+        batcher.add(_event(99), now=0.0)
+
+
+def test_backpressure_hard_limit_caps_admitted_requests():
+    batcher = StreamBatcher(
+        max_batch_size=100,
+        max_latency_s=60.0,
+        backpressure=BackpressurePolicy(max_backlog=5, hard_limit=8),
+    )
+    for idx in range(4):
+        batcher.add(_event(idx), now=0.0)
+
+    # Below the soft cap a request may overshoot it, up to the hard limit.
+    assert batcher.can_accept(4) is True
+    assert batcher.can_accept(5) is False
+    with pytest.raises(StreamBackpressureError):
+        batcher.add_many([_event(idx) for idx in range(10, 15)], now=0.0)
+    assert batcher.backlog == 4
+
+    assert batcher.add_many([_event(idx) for idx in range(10, 14)], now=0.0) == []
+    assert batcher.backlog == 8
+    # At or above the soft cap, new requests are refused.
+    assert batcher.can_accept() is False
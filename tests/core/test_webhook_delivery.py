@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from retikon_core.webhooks.delivery import (
+    DeliveryOptions,
+    WebhookDeliveryEngine,
+    deliver_webhooks,
+)
+from retikon_core.webhooks.types import WebhookEvent, WebhookRegistration
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib hook name
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.hits.append((self.path, self.client_address[1]))  # type: ignore[attr-defined]
+            count = sum(1 for path, _ in server.hits if path == self.path)  # type: ignore[attr-defined]
+        status = 200
+        if self.path == "/slow":
+            time.sleep(0.4)
+        elif self.path == "/flaky" and count == 1:
+            status = 500
+        elif self.path == "/down":
+            status = 503
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture()
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.hits = []  # type: ignore[attr-defined]
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _hook(hook_id: str, url: str) -> WebhookRegistration:
+    return WebhookRegistration(
+        id=hook_id,
+        name=hook_id,
+        url=url,
+        secret="secret",
+        event_types=None,
+        enabled=True,
+        created_at="now",
+        updated_at="now",
+    )
+
+
+def _event(event_id: str) -> WebhookEvent:
+    return WebhookEvent(
+        id=event_id,
+        event_type="asset.processed",
+        created_at="2026-01-27T00:00:00Z",
+        payload={"ok": True},
+    )
+
+
+def test_delivery_runs_concurrently_and_reuses_connections(stub_server):
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    hooks = [
+        _hook("slow-1", f"{base}/slow"),
+        _hook("slow-2", f"{base}/slow"),
+        _hook("fast", f"{base}/ok"),
+    ]
+    engine = WebhookDeliveryEngine()
+    options = DeliveryOptions(timeout_s=5, max_attempts=1, max_concurrency=4)
+
+    started = time.monotonic()
+    results, records = deliver_webhooks(hooks, _event("evt-1"), options, engine=engine)
+    elapsed = time.monotonic() - started
+
+    assert [result.webhook_id for result in results] == ["slow-1", "slow-2", "fast"]
+    assert all(result.status == "success" for result in results)
+    assert len(records) == 3
+    assert elapsed < 0.75
+
+    first_ports = {port for _, port in stub_server.hits}
+    deliver_webhooks([hooks[2]], _event("evt-2"), options, engine=engine)
+    engine.close()
+    # The follow-up request rides one of the pooled keep-alive connections.
+    assert stub_server.hits[-1][1] in first_ports
+
+
+def test_delivery_retries_from_queue_and_opens_circuit(stub_server):
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    flaky = _hook("flaky", f"{base}/flaky")
+    down = _hook("down", f"{base}/down")
+    engine = WebhookDeliveryEngine()
+    options = DeliveryOptions(
+        timeout_s=5,
+        max_attempts=3,
+        backoff_s=0.01,
+        breaker_failures=2,
+        breaker_cooldown_s=60,
+    )
+
+    results, records = deliver_webhooks(
+        [flaky, down], _event("evt-1"), options, engine=engine
+    )
+
+    by_id = {result.webhook_id: result for result in results}
+    assert by_id["flaky"].status == "success"
+    assert by_id["flaky"].attempts == 2
+    assert by_id["down"].status == "failed"
+    assert by_id["down"].attempts == 3
+    assert by_id["down"].error == "circuit open"
+    assert [record.attempt for record in records if record.webhook_id == "down"] == [
+        1,
+        2,
+        3,
+    ]
+    assert engine.circuit_open(down.url)
+
+    down_hits = sum(1 for path, _ in stub_server.hits if path == "/down")
+    results, _ = deliver_webhooks([down], _event("evt-2"), options, engine=engine)
+    assert results[0].status == "failed"
+    assert sum(1 for path, _ in stub_server.hits if path == "/down") == down_hits
+    engine.close()
+
+
+def test_delivery_hands_retries_to_background_scheduler(stub_server):
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    flaky = _hook("flaky", f"{base}/flaky")
+    fast = _hook("fast", f"{base}/ok")
+    engine = WebhookDeliveryEngine()
+    engine.start()
+    options = DeliveryOptions(timeout_s=5, max_attempts=3, backoff_s=0.2, jitter=0)
+    finished = threading.Event()
+    retried: list = []
+
+    def _on_done(results, records) -> None:
+        retried.append((results, records))
+        finished.set()
+
+    try:
+        started = time.monotonic()
+        results, records = deliver_webhooks(
+            [flaky, fast],
+            _event("evt-1"),
+            options,
+            engine=engine,
+            on_retries_done=_on_done,
+        )
+        elapsed = time.monotonic() - started
+
+        # The call returns after the first round instead of sleeping through
+        # the backoff.
+        assert elapsed < 0.2
+        assert [result.status for result in results] == ["retrying", "success"]
+        assert [record.attempt for record in records] == [1, 1]
+
+        assert finished.wait(5)
+        final, retry_records = retried[0]
+        assert [(result.webhook_id, result.status) for result in final] == [
+            ("flaky", "success")
+        ]
+        assert final[0].attempts == 2
+        assert [record.attempt for record in retry_records] == [2]
+    finally:
+        engine.close()
+
+
+def test_scheduler_requeues_retries_while_circuit_is_open(stub_server):
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    flaky = _hook("flaky", f"{base}/flaky")
+    engine = WebhookDeliveryEngine()
+    engine.start()
+    options = DeliveryOptions(
+        timeout_s=5,
+        max_attempts=3,
+        backoff_s=0.01,
+        jitter=0,
+        breaker_failures=1,
+        breaker_cooldown_s=0.2,
+    )
+    finished = threading.Event()
+    retried: list = []
+
+    def _on_done(results, records) -> None:
+        retried.append((results, records))
+        finished.set()
+
+    try:
+        results, _ = deliver_webhooks(
+            [flaky], _event("evt-1"), options, engine=engine, on_retries_done=_on_done
+        )
+        assert results[0].status == "retrying"
+        assert engine.circuit_open(flaky.url)
+
+        # The retry comes due while the circuit is open; it waits for the
+        # half-open probe instead of failing with "circuit open".
+        assert finished.wait(5)
+        final, retry_records = retried[0]
+        assert final[0].status == "success"
+        assert final[0].attempts == 2
+        assert [record.status for record in retry_records] == ["success"]
+    finally:
+        engine.close()
+
+
+def test_close_drains_queued_retries(stub_server):
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    flaky = _hook("flaky", f"{base}/flaky")
+    engine = WebhookDeliveryEngine()
+    engine.start()
+    options = DeliveryOptions(timeout_s=5, max_attempts=3, backoff_s=0.05, jitter=0)
+    retried: list = []
+
+    results, _ = deliver_webhooks(
+        [flaky],
+        _event("evt-1"),
+        options,
+        engine=engine,
+        on_retries_done=lambda results, _records: retried.append(results),
+    )
+    assert results[0].status == "retrying"
+    engine.close(drain_timeout_s=5)
+
+    assert [result.status for result in retried[0]] == ["success"]
+
+
+def test_close_abandons_retries_past_the_drain_timeout(stub_server):
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    down = _hook("down", f"{base}/down")
+    engine = WebhookDeliveryEngine()
+    engine.start()
+    options = DeliveryOptions(timeout_s=5, max_attempts=3, backoff_s=60, jitter=0)
+    retried: list = []
+
+    deliver_webhooks(
+        [down],
+        _event("evt-1"),
+        options,
+        engine=engine,
+        on_retries_done=lambda results, _records: retried.append(results),
+    )
+    engine.close(drain_timeout_s=0)
+
+    assert [(result.status, result.attempts) for result in retried[0]] == [
+        ("abandoned", 1)
+    ]
@@ -9,6 +9,8 @@ from retikon_core.workflows import (
     load_workflows,
     register_workflow,
     register_workflow_run,
+    step_dependencies,
+    topological_order,
     update_workflow,
     update_workflow_run,
 )
@@ -106,3 +108,36 @@ def test_workflow_run_update(tmp_path):
     update_workflow_run(base_uri=tmp_path.as_posix(), run=updated)
     runs = list_workflow_runs(tmp_path.as_posix())
     assert runs[0].status == "completed"
+
+
+def _dag_step(step_id: str, depends_on: tuple[str, ...] | None = None) -> WorkflowStep:
+    return WorkflowStep(
+        id=step_id,
+        name=step_id,
+        kind="noop",
+        config=None,
+        retries=None,
+        timeout_seconds=None,
+        depends_on=depends_on,
+    )
+
+
+@pytest.mark.core
+def test_workflow_step_dependencies(tmp_path):
+    legacy = [_dag_step("a"), _dag_step("b"), _dag_step("c")]
+    assert step_dependencies(legacy) == {"a": (), "b": ("a",), "c": ("b",)}
+
+    dag = [_dag_step("join", ("left", "right")), _dag_step("left"), _dag_step("right")]
+    deps = step_dependencies(dag)
+    assert deps["left"] == () and deps["right"] == ()
+    assert topological_order(deps) == ["left", "right", "join"]
+
+    with pytest.raises(ValueError, match="cycle"):
+        step_dependencies([_dag_step("a", ("b",)), _dag_step("b", ("a",))])
+    with pytest.raises(ValueError, match="unknown"):
+        step_dependencies([_dag_step("a", ("missing",))])
+
+    register_workflow(base_uri=tmp_path.as_posix(), name="DAG", steps=dag)
+    loaded = load_workflows(tmp_path.as_posix())
+    assert loaded[0].steps[0].depends_on == ("left", "right")
+    assert loaded[0].steps[1].depends_on is None
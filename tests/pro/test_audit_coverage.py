@@ -22,9 +22,11 @@ def _setup_local(monkeypatch, tmp_path) -> str:
 
 
 def _audit_rows(base_uri: str) -> list[dict[str, object]]:
-    pattern = os.path.join(base_uri, "vertices", "AuditLog", "core", "*.parquet")
+    pattern = os.path.join(
+        base_uri, "vertices", "AuditLog", "core", "**", "*.parquet"
+    )
     rows: list[dict[str, object]] = []
-    for path in glob.glob(pattern):
+    for path in glob.glob(pattern, recursive=True):
         table = pq.read_table(path)
         rows.extend(table.to_pylist())
     return rows
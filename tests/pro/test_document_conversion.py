@@ -3,11 +3,35 @@ from __future__ import annotations
 import base64
 import importlib
 import json
+import sys
+import threading
+import time
+import types
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
+from gcp_adapter.office_conversion import OfficeConversionPool
 from retikon_core.config import get_config
+from retikon_core.errors import RecoverableError
+
+_FAKE_SOFFICE = '''#!{python}
+import sys, time
+from pathlib import Path
+
+args = sys.argv[1:]
+profile = next(a.split("=", 1)[1] for a in args if a.startswith("-env:"))
+out_dir = Path(args[args.index("--outdir") + 1])
+source = Path(args[-1])
+body = source.read_bytes()
+if body == b"hang":
+    time.sleep(30)
+if body == b"crash":
+    sys.exit(3)
+time.sleep(0.2)
+(out_dir / (source.stem + ".pdf")).write_text("%PDF " + profile)
+'''
 
 
 def _load_service(monkeypatch, tmp_path):
@@ -121,3 +145,160 @@ def test_document_conversion_queue_worker_and_dlq(monkeypatch, tmp_path, jwt_hea
     assert resp.status_code == 200
     assert resp.json()["status"] == "dlq"
     assert published and published[0]["topic"].endswith("dlq")
+
+
+@pytest.fixture()
+def fake_soffice(tmp_path):
+    script = tmp_path / "soffice"
+    script.write_text(_FAKE_SOFFICE.format(python=sys.executable))
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_office_pool_isolates_profiles_and_runs_concurrently(tmp_path, fake_soffice):
+    pool = OfficeConversionPool(
+        binary=fake_soffice,
+        size=2,
+        max_jobs=10,
+        timeout_s=10,
+        profile_root=str(tmp_path / "profiles"),
+        resident=False,
+    )
+    outputs: list[bytes] = []
+
+    def _convert(idx: int) -> None:
+        outputs.append(pool.convert(filename=f"deck-{idx}.pptx", content=b"slides"))
+
+    threads = [threading.Thread(target=_convert, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.close()
+
+    assert len(outputs) == 4
+    profiles = {output.decode("utf-8").split(" ", 1)[1] for output in outputs}
+    assert profiles == {
+        (tmp_path / "profiles" / "worker-0").as_uri(),
+        (tmp_path / "profiles" / "worker-1").as_uri(),
+    }
+
+
+def test_office_pool_recycles_after_timeout_and_crash(tmp_path, fake_soffice):
+    pool = OfficeConversionPool(
+        binary=fake_soffice,
+        size=1,
+        max_jobs=2,
+        timeout_s=1,
+        profile_root=str(tmp_path / "profiles"),
+        resident=False,
+    )
+    worker = pool._workers[0]
+    worker.profile_dir.mkdir(parents=True)
+
+    with pytest.raises(RecoverableError, match="timed out"):
+        pool.convert(filename="stuck.docx", content=b"hang")
+    assert not worker.profile_dir.exists()
+
+    with pytest.raises(RecoverableError, match="code 3"):
+        pool.convert(filename="bad.docx", content=b"crash")
+
+    assert pool.convert(filename="ok.docx", content=b"text").startswith(b"%PDF")
+    assert worker.jobs == 1
+    pool.convert(filename="ok.docx", content=b"text")
+    assert worker.jobs == 0
+    pool.close()
+
+
+class _FakeDocument:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.closed = False
+
+    def supportsService(self, service: str) -> bool:  # noqa: N802 - UNO API
+        return service == "com.sun.star.presentation.PresentationDocument"
+
+    def storeToURL(self, url: str, props) -> None:  # noqa: N802 - UNO API
+        filters = [prop.Value for prop in props if prop.Name == "FilterName"]
+        Path(url.removeprefix("file://")).write_text(f"%PDF {filters[0]}")
+
+    def close(self, _deliver: bool) -> None:
+        self.closed = True
+
+
+def _fake_uno(worker_ref: list):
+    desktop = types.SimpleNamespace()
+
+    def load_component(url, _target, _flags, props):
+        assert {prop.Name for prop in props} == {"Hidden", "ReadOnly"}
+        body = Path(url.removeprefix("file://")).read_bytes()
+        if body == b"hang":
+            # A real UNO call blocks until the instance dies under it.
+            while worker_ref[0].running:
+                time.sleep(0.05)
+            raise RuntimeError("DisposedException: bridge disposed")
+        return _FakeDocument(body)
+
+    desktop.loadComponentFromURL = load_component
+    remote = types.SimpleNamespace(
+        ServiceManager=types.SimpleNamespace(
+            createInstanceWithContext=lambda *_args: desktop
+        )
+    )
+    resolver = types.SimpleNamespace(resolve=lambda _url: remote)
+    local = types.SimpleNamespace(
+        ServiceManager=types.SimpleNamespace(
+            createInstanceWithContext=lambda *_args: resolver
+        )
+    )
+    module = types.ModuleType("uno")
+    module.getComponentContext = lambda: local  # type: ignore[attr-defined]
+    module.createUnoStruct = (  # type: ignore[attr-defined]
+        lambda _name: types.SimpleNamespace(Name=None, Value=None)
+    )
+    return module
+
+
+def test_office_pool_resident_worker_kills_and_wipes_on_timeout(
+    tmp_path, monkeypatch
+):
+    script = tmp_path / "soffice-resident"
+    script.write_text(f"#!{sys.executable}\nimport time\ntime.sleep(60)\n")
+    script.chmod(0o755)
+    worker_ref: list = []
+    monkeypatch.setitem(sys.modules, "uno", _fake_uno(worker_ref))
+
+    pool = OfficeConversionPool(
+        binary=str(script),
+        size=1,
+        max_jobs=10,
+        timeout_s=1,
+        profile_root=str(tmp_path / "profiles"),
+        resident=True,
+    )
+    worker = pool._workers[0]
+    worker_ref.append(worker)
+    try:
+        output = pool.convert(filename="deck.pptx", content=b"slides")
+        assert output == b"%PDF impress_pdf_Export"
+        assert worker.running
+        first_process = worker._process
+        assert worker.profile_dir.exists()
+
+        with pytest.raises(RecoverableError, match="timed out"):
+            pool.convert(filename="stuck.pptx", content=b"hang")
+        assert not worker.running
+        assert first_process is not None and first_process.poll() is not None
+        assert not worker.profile_dir.exists()
+        assert worker.jobs == 0
+
+        # The next job starts a fresh instance on a fresh profile.
+        assert pool.convert(filename="deck.pptx", content=b"slides").startswith(
+            b"%PDF"
+        )
+        assert worker.running
+        assert worker._process is not first_process
+        assert worker.jobs == 1
+    finally:
+        pool.close()
+    assert not worker.running
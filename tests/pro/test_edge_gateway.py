@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 from pathlib import Path
 
@@ -35,6 +36,36 @@ def test_edge_gateway_upload_writes_file(tmp_path, monkeypatch, jwt_headers):
     uri = payload["uri"]
     assert uri
     assert Path(uri).exists()
+    assert payload["sha256"] == hashlib.sha256(b"id,name\n1,Retikon\n").hexdigest()
+
+
+def test_edge_gateway_streams_large_uploads_and_enforces_limit(
+    tmp_path, monkeypatch, jwt_headers
+):
+    monkeypatch.setenv("MAX_RAW_BYTES", str(3 * 1024 * 1024))
+    client, _service, raw_dir = _make_client(
+        tmp_path, monkeypatch, force_buffer=False, jwt_headers=jwt_headers
+    )
+    body = bytes(range(256)) * (10 * 1024)
+
+    resp = client.post(
+        "/edge/upload",
+        files={"file": ("clip.mp4", body, "video/mp4")},
+        data={"modality": "video", "device_id": "cam-1"},
+    )
+    assert resp.status_code == 200
+    payload = resp.json()
+    assert payload["bytes_written"] == len(body)
+    assert payload["sha256"] == hashlib.sha256(body).hexdigest()
+    assert Path(payload["uri"]).read_bytes() == body
+
+    resp = client.post(
+        "/edge/upload",
+        files={"file": ("clip.mp4", body * 2, "video/mp4")},
+        data={"modality": "video", "device_id": "cam-1"},
+    )
+    assert resp.status_code == 413
+    assert len([path for path in raw_dir.rglob("*") if path.is_file()]) == 1
 
 
 def test_edge_gateway_buffer_and_replay(tmp_path, monkeypatch, jwt_headers):
@@ -50,6 +81,7 @@ def test_edge_gateway_buffer_and_replay(tmp_path, monkeypatch, jwt_headers):
     assert resp.status_code == 200
     payload = resp.json()
     assert payload["status"] == "buffered"
+    assert payload["sha256"] == hashlib.sha256(b"id,name\n2,Buffer\n").hexdigest()
 
     status = client.get("/edge/buffer/status")
     assert status.status_code == 200
@@ -11,6 +11,7 @@ def test_k8s_adapter_from_env(monkeypatch, tmp_path):
     monkeypatch.setenv("K8S_NAMESPACE", "retikon")
     monkeypatch.setenv("K8S_QUEUE_BACKEND", "memory")
     monkeypatch.setenv("K8S_STATE_BACKEND", "memory")
+    monkeypatch.setenv("K8S_STATE_DIR", str(tmp_path))
     monkeypatch.setenv("K8S_OBJECT_STORE_URI", tmp_path.as_uri())
 
     secrets_dir = tmp_path / "secrets"
@@ -37,5 +38,8 @@ def test_k8s_adapter_from_env(monkeypatch, tmp_path):
     adapter.state_store.set("k", "v")
     assert adapter.state_store.get("k") == "v"
 
+    assert (tmp_path / "dedupe.sqlite").exists()
+
     health = adapter.health()
     assert health["namespace"] == "retikon"
+    assert health["dedupe_index"] == "SqliteDedupeIndex"
@@ -53,6 +53,7 @@ def test_modalities_override_mode(monkeypatch, jwt_headers):
         modalities,
         scope,
         timings,
+        snapshot_marker=None,
     ):
         captured["modalities"] = set(modalities)
         return []
@@ -77,6 +78,7 @@ def test_query_response_has_meta_highlight_and_why(monkeypatch, jwt_headers):
         modalities,
         scope,
         timings,
+        snapshot_marker=None,
     ):
         return [_mk_result(asset_id="asset-1", evidence_id="doc-1", score=0.8)]
 
@@ -108,6 +110,7 @@ def test_query_pagination_deterministic(monkeypatch, jwt_headers):
         modalities,
         scope,
         timings,
+        snapshot_marker=None,
     ):
         return rows
 
@@ -159,6 +162,7 @@ def test_query_grouping_shape(monkeypatch, jwt_headers):
         modalities,
         scope,
         timings,
+        snapshot_marker=None,
     ):
         return rows
 
@@ -26,6 +26,7 @@ def test_query_mode_text_limits_modalities(monkeypatch, jwt_headers):
         modalities,
         scope,
         timings,
+        snapshot_marker=None,
     ):
         captured["modalities"] = modalities
         return []
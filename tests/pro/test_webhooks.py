@@ -3,12 +3,16 @@ from __future__ import annotations
 import importlib
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.error import HTTPError
 
 from fastapi.testclient import TestClient
 
 from retikon_core.config import get_config
-from retikon_core.webhooks.delivery import DeliveryOptions, deliver_webhook
+from retikon_core.webhooks.delivery import (
+    DeliveryOptions,
+    DeliveryResult,
+    WebhookDeliveryEngine,
+    deliver_webhook,
+)
 from retikon_core.webhooks.logs import WebhookDeliveryRecord
 from retikon_core.webhooks.signer import sign_payload
 from retikon_core.webhooks.types import WebhookEvent, WebhookRegistration
@@ -17,25 +21,13 @@ from retikon_core.webhooks.types import WebhookEvent, WebhookRegistration
 def test_webhook_delivery_signing(monkeypatch):
     captured: dict[str, object] = {}
 
-    def fake_urlopen(request, timeout):
-        captured["request"] = request
-        captured["body"] = request.data
+    def fake_post(_engine, delivery):
+        captured["url"] = delivery.webhook.url
+        captured["headers"] = delivery.headers
+        captured["body"] = delivery.body
+        return 200
 
-        class DummyResponse:
-            status = 200
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, exc_type, exc, tb):
-                return False
-
-            def getcode(self):
-                return 200
-
-        return DummyResponse()
-
-    monkeypatch.setattr("retikon_core.webhooks.delivery.urlopen", fake_urlopen)
+    monkeypatch.setattr(WebhookDeliveryEngine, "_post", fake_post)
 
     webhook = WebhookRegistration(
         id="wh_1",
@@ -54,51 +46,28 @@ def test_webhook_delivery_signing(monkeypatch):
         payload={"ok": True},
     )
     options = DeliveryOptions(timeout_s=1, max_attempts=1, backoff_s=0)
-    result, _records = deliver_webhook(webhook, event, options)
+    result, _records = deliver_webhook(
+        webhook, event, options, engine=WebhookDeliveryEngine()
+    )
     assert result.status == "success"
 
-    request = captured["request"]
-    body = captured["body"]
-    combined_headers = dict(request.headers)
-    combined_headers.update(getattr(request, "unredirected_hdrs", {}))
-    timestamp = (
-        combined_headers.get("X-Retikon-Timestamp")
-        or combined_headers.get("X-retikon-timestamp")
-        or combined_headers.get("x-retikon-timestamp")
-    )
-    signature = (
-        combined_headers.get("X-Retikon-Signature")
-        or combined_headers.get("X-retikon-signature")
-        or combined_headers.get("x-retikon-signature")
-    )
+    headers = captured["headers"]
+    assert isinstance(headers, dict)
+    timestamp = headers.get("X-Retikon-Timestamp")
+    signature = headers.get("X-Retikon-Signature")
     assert timestamp
     assert signature
-    assert signature == sign_payload("secret", timestamp, body)
+    assert signature == sign_payload("secret", timestamp, captured["body"])
 
 
 def test_webhook_delivery_retries(monkeypatch):
     calls: list[int] = []
 
-    def fake_urlopen(request, timeout):
+    def fake_post(_engine, _delivery):
         calls.append(1)
-        if len(calls) == 1:
-            raise HTTPError(request.full_url, 500, "boom", hdrs=None, fp=None)
-
-        class DummyResponse:
-            status = 200
-
-            def __enter__(self):
-                return self
+        return 500 if len(calls) == 1 else 200
 
-            def __exit__(self, exc_type, exc, tb):
-                return False
-
-            def getcode(self):
-                return 200
-
-        return DummyResponse()
-
-    monkeypatch.setattr("retikon_core.webhooks.delivery.urlopen", fake_urlopen)
+    monkeypatch.setattr(WebhookDeliveryEngine, "_post", fake_post)
 
     webhook = WebhookRegistration(
         id="wh_2",
@@ -117,9 +86,17 @@ def test_webhook_delivery_retries(monkeypatch):
         payload={"ok": True},
     )
     options = DeliveryOptions(timeout_s=1, max_attempts=2, backoff_s=0)
-    result, _records = deliver_webhook(webhook, event, options)
+    engine = WebhookDeliveryEngine()
+    engine.start()
+    try:
+        # Single deliveries keep their retries in the call even with the
+        # scheduler running.
+        result, records = deliver_webhook(webhook, event, options, engine=engine)
+    finally:
+        engine.close()
     assert result.status == "success"
     assert result.attempts == 2
+    assert [record.status_code for record in records] == [500, 200]
 
 
 def test_webhook_service_dispatch_writes_log(tmp_path, monkeypatch, jwt_headers):
@@ -131,29 +108,36 @@ def test_webhook_service_dispatch_writes_log(tmp_path, monkeypatch, jwt_headers)
 
     importlib.reload(service)
 
-    def fake_deliver(webhook, event, options):
-        record = WebhookDeliveryRecord(
-            delivery_id="delivery-1",
-            event_id=event.id,
-            webhook_id=webhook.id,
-            attempt=1,
-            status="success",
-            status_code=200,
-            error=None,
-            duration_ms=5,
-            delivered_at=datetime.now(timezone.utc).isoformat(),
-        )
-        result = service.DeliveryResult(
-            webhook_id=webhook.id,
-            event_id=event.id,
-            status="success",
-            status_code=200,
-            attempts=1,
-            duration_ms=5,
-        )
-        return result, [record]
-
-    monkeypatch.setattr(service, "deliver_webhook", fake_deliver)
+    def fake_deliver(webhooks, event, options, **_kwargs):
+        results = []
+        records = []
+        for webhook in webhooks:
+            records.append(
+                WebhookDeliveryRecord(
+                    delivery_id="delivery-1",
+                    event_id=event.id,
+                    webhook_id=webhook.id,
+                    attempt=1,
+                    status="success",
+                    status_code=200,
+                    error=None,
+                    duration_ms=5,
+                    delivered_at=datetime.now(timezone.utc).isoformat(),
+                )
+            )
+            results.append(
+                DeliveryResult(
+                    webhook_id=webhook.id,
+                    event_id=event.id,
+                    status="success",
+                    status_code=200,
+                    attempts=1,
+                    duration_ms=5,
+                )
+            )
+        return results, records
+
+    monkeypatch.setattr(service, "deliver_webhooks", fake_deliver)
 
     client = TestClient(service.app, headers=jwt_headers)
     resp = client.post(
@@ -175,3 +159,52 @@ def test_webhook_service_dispatch_writes_log(tmp_path, monkeypatch, jwt_headers)
     log_path = Path(payload["log_uri"])
     assert log_path.exists()
     get_config.cache_clear()
+
+
+def test_webhook_service_caches_compiled_alert_rules(
+    tmp_path, monkeypatch, jwt_headers
+):
+    monkeypatch.setenv("STORAGE_BACKEND", "local")
+    monkeypatch.setenv("LOCAL_GRAPH_ROOT", tmp_path.as_posix())
+    get_config.cache_clear()
+
+    import gcp_adapter.webhook_service as service
+
+    importlib.reload(service)
+
+    compiled: list[int] = []
+    real_compile = service.compile_rules
+
+    def counting_compile(rules):
+        compiled.append(len(rules))
+        return real_compile(rules)
+
+    monkeypatch.setattr(service, "compile_rules", counting_compile)
+    monkeypatch.setattr(
+        service, "deliver_webhooks", lambda *_args, **_kwargs: ([], [])
+    )
+
+    client = TestClient(service.app, headers=jwt_headers)
+    for _ in range(2):
+        resp = client.post(
+            "/events", json={"event_type": "asset.ready", "payload": {}}
+        )
+        assert resp.status_code == 202
+    assert compiled == [0]
+
+    resp = client.post(
+        "/alerts",
+        json={
+            "name": "Ready",
+            "event_types": ["asset.ready"],
+            "destinations": [{"kind": "webhook", "target": "wh-1"}],
+        },
+    )
+    assert resp.status_code == 201
+    for _ in range(2):
+        resp = client.post(
+            "/events", json={"event_type": "asset.ready", "payload": {}}
+        )
+        assert resp.status_code == 202
+    assert compiled == [0, 1]
+    get_config.cache_clear()
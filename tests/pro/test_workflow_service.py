@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import importlib
 import json
+from datetime import datetime
 
 from fastapi.testclient import TestClient
 
@@ -117,3 +118,113 @@ def test_workflow_service_queue(monkeypatch, tmp_path, jwt_headers):
     resp = client.post("/workflows/runner", json=body)
     assert resp.status_code == 200
     assert resp.json()["status"] == "completed"
+
+
+def test_workflow_service_dag(monkeypatch, tmp_path, jwt_headers):
+    monkeypatch.setenv("ENV", "dev")
+    monkeypatch.setenv("STORAGE_BACKEND", "local")
+    monkeypatch.setenv("LOCAL_GRAPH_ROOT", tmp_path.as_posix())
+    monkeypatch.setenv("WORKFLOW_RUN_MODE", "inline")
+    monkeypatch.setenv("WORKFLOW_MAX_PARALLEL_STEPS", "4")
+    get_config.cache_clear()
+
+    import gcp_adapter.workflow_service as service
+
+    importlib.reload(service)
+
+    client = TestClient(service.app, headers=jwt_headers)
+
+    resp = client.post(
+        "/workflows",
+        json={
+            "name": "Cycle",
+            "steps": [
+                {"id": "a", "name": "A", "kind": "noop", "depends_on": ["b"]},
+                {"id": "b", "name": "B", "kind": "noop", "depends_on": ["a"]},
+            ],
+        },
+    )
+    assert resp.status_code == 400
+
+    resp = client.post(
+        "/workflows",
+        json={
+            "name": "Fan out",
+            "steps": [
+                {
+                    "id": "left",
+                    "name": "L",
+                    "kind": "delay",
+                    "config": {"seconds": 0.3},
+                },
+                {
+                    "id": "right",
+                    "name": "R",
+                    "kind": "delay",
+                    "config": {"seconds": 0.3},
+                },
+                {"id": "bad", "name": "Bad", "kind": "webhook"},
+                {
+                    "id": "join",
+                    "name": "Join",
+                    "kind": "noop",
+                    "depends_on": ["left", "right"],
+                },
+                {
+                    "id": "after-bad",
+                    "name": "After",
+                    "kind": "noop",
+                    "depends_on": ["bad"],
+                },
+            ],
+        },
+    )
+    assert resp.status_code == 201
+    assert resp.json()["steps"][3]["depends_on"] == ["left", "right"]
+    workflow_id = resp.json()["id"]
+
+    resp = client.post(f"/workflows/{workflow_id}/runs", json={"execute": True})
+    payload = resp.json()
+    statuses = {step["id"]: step["status"] for step in payload["output"]["steps"]}
+    assert payload["status"] == "failed"
+    assert statuses == {
+        "left": "completed",
+        "right": "completed",
+        "bad": "failed",
+        "join": "completed",
+        "after-bad": "skipped",
+    }
+    # Independent steps run side by side: each started before the other
+    # finished, and the join waited for both.
+    spans = {
+        step["id"]: (
+            datetime.fromisoformat(step["started_at"]),
+            datetime.fromisoformat(step["finished_at"]),
+        )
+        for step in payload["output"]["steps"]
+        if step.get("started_at")
+    }
+    assert spans["left"][0] < spans["right"][1]
+    assert spans["right"][0] < spans["left"][1]
+    assert spans["join"][0] >= max(spans["left"][1], spans["right"][1])
+
+    # A redelivered run keeps completed steps from its persisted progress.
+    workflow = service._find_workflow(
+        service._stores().workflows.load_workflows(), workflow_id
+    )
+    run = service._stores().workflows.register_workflow_run(
+        workflow_id=workflow_id,
+        status="running",
+        output={
+            "steps": [
+                {"id": "bad", "status": "completed", "attempts": 1, "output": {}},
+            ]
+        },
+    )
+    resumed = service._execute_workflow_run(
+        base_uri=get_config().graph_root_uri(), workflow=workflow, run=run
+    )
+    assert resumed.status == "completed"
+    steps = {step["id"]: step for step in resumed.output["steps"]}
+    assert steps["bad"]["attempts"] == 1
+    assert steps["after-bad"]["status"] == "completed"